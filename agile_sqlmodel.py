@@ -23,6 +23,8 @@ if __name__ == "__main__":
 
 # Re-export model symbols from their new package locations and ensure SQLModel
 # metadata is populated when this compatibility shim is imported or executed.
+from models.blobs import ContentBlob
+from models.changes import EntityChange
 from models.core import (
     Epic,
     Feature,
@@ -53,7 +55,9 @@ from models.events import (
     StoryCompletionLog,
     TaskExecutionLog,
     WorkflowEvent,
+    WorkflowEventRollup,
 )
+from models.packets import PacketCacheEntry
 from models.specs import (
     CompiledSpecAuthority,
     SpecAuthorityAcceptance,
@@ -62,8 +66,11 @@ from models.specs import (
 
 __all__ = [
     "CompiledSpecAuthority",
+    "ContentBlob",
+    "EntityChange",
     "Epic",
     "Feature",
+    "PacketCacheEntry",
     "Product",
     "ProductPersona",
     "ProductTeam",
@@ -88,6 +95,7 @@ __all__ = [
     "TimeFrame",
     "UserStory",
     "WorkflowEvent",
+    "WorkflowEventRollup",
     "WorkflowEventType",
 ]
 
@@ -7,33 +7,32 @@ roadmap planning, user story creation, and sprint execution.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import json
 import logging
-import re
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
     Literal,
-    Protocol,
     cast,
-    runtime_checkable,
 )
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import RedirectResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import RedirectResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import QueryableAttribute
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from models.core import Product, Sprint, SprintStory, Task, UserStory
@@ -46,7 +45,7 @@ from models.enums import (
     WorkflowEventType,
 )
 from models.events import StoryCompletionLog, TaskExecutionLog, WorkflowEvent
-from models.specs import CompiledSpecAuthority
+from orchestrator_agent.agent_registry import agent_registry
 from orchestrator_agent.agent_tools.backlog_primer.tools import (
     save_backlog_tool,
 )
@@ -64,9 +63,24 @@ from orchestrator_agent.agent_tools.user_story_writer_tool.tools import (
 )
 from orchestrator_agent.fsm.states import OrchestratorState
 from repositories.product import ProductRepository
+from repositories.session import SessionStateConflictError
 from repositories.story import StoryRepository
+from repositories.workflow_metrics import (
+    WorkflowMetricsRepository,
+    summarize_rollups,
+    timeseries_from_rollups,
+)
 from routers.sprint import register_sprint_routes
 from services.backlog_runtime import run_backlog_agent_from_state
+from services.changes import (
+    DEFAULT_CHANGE_PAGE_SIZE,
+    MAX_CHANGE_PAGE_SIZE,
+    MAX_CHANGE_WAIT_SECONDS,
+    wait_for_entity_changes,
+)
+from services.generation_jobs import GenerationJobManager
+from services.generation_stream import stream_generation_events
+from services.http_delivery import FingerprintedStaticFiles, HttpDeliveryMiddleware
 from services.interview_runtime import (
     append_attempt,
     append_feedback_entry,
@@ -75,7 +89,41 @@ from services.interview_runtime import (
     reset_subject_working_set,
     set_request_projection,
 )
+from services.json_responses import ORJSONResponse, ORJSONRoute
+from services.live_updates import iter_project_event_frames, live_updates
 from services.packet_renderer import render_packet
+from services.packets.packet_builder import (
+    build_story_packet as _build_story_packet,
+)
+from services.packets.packet_builder import (
+    build_task_packet as _build_task_packet,
+)
+from services.packets.packet_builder import (
+    iter_sprint_packets,
+    load_sprint_packet_graph,
+)
+from services.packets.packet_builder import (
+    serialize_sprint_task as _serialize_sprint_task,
+)
+from services.packets.packet_builder import (
+    serialize_temporal as _serialize_temporal,
+)
+from services.packets.packet_bundle import (
+    BUNDLE_FILE_SUFFIXES,
+    BUNDLE_MEDIA_TYPES,
+    BundleFormat,
+    iter_packet_bundle,
+)
+from services.packets.packet_cache import (
+    PacketCacheKey,
+    etag_matches,
+    get_or_build_packet,
+    packet_etag,
+)
+from services.packets.packet_fingerprint import (
+    story_packet_fingerprint,
+    task_packet_fingerprint,
+)
 from services.packets.packet_service import (
     PacketServiceError,
 )
@@ -85,6 +133,9 @@ from services.packets.packet_service import (
 from services.packets.packet_service import (
     get_task_packet as get_task_packet_service,
 )
+from services.packets.packet_service import (
+    iter_sprint_packets as iter_sprint_packets_service,
+)
 from services.phases.backlog_service import (
     BacklogPhaseError,
 )
@@ -148,6 +199,9 @@ from services.phases.story_service import (
 from services.phases.story_service import (
     delete_story_requirement as delete_story_requirement_service,
 )
+from services.phases.story_service import (
+    generate_pending_story_drafts as generate_pending_story_drafts_service,
+)
 from services.phases.story_service import (
     generate_story_draft as generate_story_draft_service,
 )
@@ -178,17 +232,19 @@ from services.phases.vision_service import (
 from services.phases.vision_service import (
     save_vision_draft as save_vision_draft_service,
 )
+from services.phases.workflow_state import (
+    failure_meta as _failure_meta,
+)
+from services.project_locks import ProjectWriteLockMiddleware, project_locks
 from services.roadmap_runtime import run_roadmap_agent_from_state
 from services.setup_service import (
     run_project_setup as run_project_setup_service,
 )
-from services.specs.compiler_service import load_compiled_artifact
 from services.specs.lifecycle_service import link_spec_to_product
-from services.specs.story_validation_service import (
-    compute_story_input_hash,
-)
+from services.specs.revalidation import revalidate_stale_stories
 from services.sprint_input import load_sprint_candidates
 from services.sprint_runtime import run_sprint_agent_from_state
+from services.state_blobs import sweep_unreferenced_blobs
 from services.story_close_service import (
     StoryCloseServiceError,
 )
@@ -214,6 +270,7 @@ from services.task_execution_service import (
 from services.vision_runtime import run_vision_agent_from_state
 from services.workflow import WorkflowService
 from tools.orchestrator_tools import select_project
+from utils.adk_runner import report_agent_progress
 from utils.api_schemas import (
     SprintCloseReadiness,
     SprintCloseReadResponse,
@@ -224,15 +281,24 @@ from utils.api_schemas import (
     TaskExecutionReadResponse,
     TaskExecutionWriteRequest,
 )
-from utils.failure_artifacts import read_failure_artifact
-from utils.logging_config import configure_logging
-from utils.runtime_config import get_api_host, get_api_port, get_api_reload
-from utils.spec_schemas import ValidationEvidence
-from utils.task_metadata import (
-    TaskMetadata,
-    hash_task_metadata,
-    parse_task_metadata,
+from utils.failure_artifacts import (
+    list_failure_artifacts,
+    read_failure_artifact,
+    sweep_failure_artifacts,
+)
+from utils.logging_config import CorrelationIdMiddleware, configure_logging
+from utils.model_config import get_story_pipeline_max_concurrency
+from utils.runtime_config import (
+    get_api_host,
+    get_api_port,
+    get_api_reload,
+    get_failure_artifact_max_age_days,
+    get_failure_artifact_max_bytes,
+    get_generation_job_workers,
+    get_prewarm_agents,
 )
+from utils.runtime_metrics import runtime_metrics
+from utils.task_metadata import parse_task_metadata
 
 if TYPE_CHECKING:
     from google.adk.tools import ToolContext
@@ -243,12 +309,12 @@ configure_logging()
 logger = logging.getLogger(__name__)
 
 product_repo = ProductRepository()
+workflow_metrics_repo = WorkflowMetricsRepository()
 workflow_service = WorkflowService()
-
-
-@runtime_checkable
-class _SupportsIsoFormat(Protocol):
-    def isoformat(self) -> str: ...
+generation_jobs = GenerationJobManager(max_workers=get_generation_job_workers())
+_session_versions: ContextVar[dict[str, int] | None] = ContextVar(
+    "api_session_versions", default=None
+)
 
 
 def _queryable_attr(attr: object) -> QueryableAttribute[object]:
@@ -287,12 +353,46 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             "Migrated %s legacy sessions from ROUTING_MODE to SETUP_REQUIRED",
             migrated,
         )
+    swept = sweep_failure_artifacts(
+        max_age_days=get_failure_artifact_max_age_days(),
+        max_total_bytes=get_failure_artifact_max_bytes(),
+    )
+    if swept["removed"]:
+        logger.info(
+            "Swept %s failure artifacts (%s bytes)",
+            swept["removed"],
+            swept["freed_bytes"],
+        )
+    swept_blobs = sweep_unreferenced_blobs()
+    if swept_blobs:
+        logger.info("Swept %s unreferenced content blobs", swept_blobs)
+    generation_jobs.recover_interrupted_jobs()
+    prewarm_agents = get_prewarm_agents()
+    if prewarm_agents is None or prewarm_agents:
+        timings = agent_registry.prewarm(prewarm_agents)
+        logger.info(
+            "Pre-warmed agents: %s",
+            ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items()),
+        )
     yield
+    await generation_jobs.close()
 
 
-app = FastAPI(title="AgenticFlow API", lifespan=lifespan)
-
-app.mount("/dashboard", StaticFiles(directory="frontend", html=True), name="frontend")
+app = FastAPI(
+    title="AgenticFlow API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.router.route_class = ORJSONRoute
+
+app.add_middleware(HttpDeliveryMiddleware)
+app.add_middleware(ProjectWriteLockMiddleware, locks=project_locks)
+app.add_middleware(CorrelationIdMiddleware)
+app.mount(
+    "/dashboard",
+    FingerprintedStaticFiles(directory="frontend", html=True),
+    name="frontend",
+)
 
 
 class CreateProjectRequest(BaseModel):
@@ -332,6 +432,19 @@ class StoryGenerateRequest(BaseModel):
     user_input: str | None = None
 
 
+class StoryRevalidateRequest(BaseModel):
+    """Request body for re-validating stories with stale validation evidence."""
+
+    mode: Literal["deterministic", "llm", "hybrid"] | None = None
+    limit: int | None = Field(default=None, ge=1)
+
+
+class StoryBatchGenerateRequest(BaseModel):
+    """Request body for generating drafts for all pending requirements."""
+
+    max_concurrency: int | None = Field(default=None, ge=1, le=16)
+
+
 class SprintGenerateRequest(BaseModel):
     """Request body for generating sprint plans."""
 
@@ -415,6 +528,7 @@ FAILURE_META_FIELDS = (
     "raw_output_preview",
     "has_full_artifact",
 )
+MAX_FAILURE_PAGE_SIZE = 200
 
 
 def _now_iso() -> str:
@@ -438,21 +552,6 @@ def _normalize_shell_fsm_state(value: str | None) -> str:
     return state
 
 
-def _failure_meta(
-    source: dict[str, Any] | None,
-    *,
-    fallback_summary: str | None = None,
-) -> dict[str, Any]:
-    payload = source or {}
-    return {
-        "failure_artifact_id": payload.get("failure_artifact_id"),
-        "failure_stage": payload.get("failure_stage"),
-        "failure_summary": payload.get("failure_summary") or fallback_summary,
-        "raw_output_preview": payload.get("raw_output_preview"),
-        "has_full_artifact": bool(payload.get("has_full_artifact", False)),
-    }
-
-
 def _setup_blocker(product: object) -> str | None:
     if not product:
         return "Project not found."
@@ -464,19 +563,30 @@ def _setup_blocker(product: object) -> str | None:
     if not Path(spec_file_path).exists():
         return "Specification file path does not exist on disk."
 
-    compiled_authority = getattr(product, "compiled_authority_json", None)
-    if not compiled_authority:
+    has_authority = getattr(product, "has_compiled_authority", None)
+    if has_authority is None:
+        has_authority = bool(getattr(product, "compiled_authority_json", None))
+    if not has_authority:
         return "Specification authority is missing. Run setup retry."
 
     return None
 
 
 async def _ensure_session(session_id: str) -> dict[str, Any]:
-    state = workflow_service.get_session_status(session_id) or {}
+    state, version = workflow_service.get_session_status_with_version(session_id)
     if not state.get("fsm_state"):
         await workflow_service.initialize_session(session_id=session_id)
-        state = workflow_service.get_session_status(session_id) or {}
-    return state
+        state, version = workflow_service.get_session_status_with_version(session_id)
+    _remember_session_version(session_id, version)
+    return state or {}
+
+
+def _remember_session_version(session_id: str, version: int) -> None:
+    versions = _session_versions.get()
+    if versions is None:
+        versions = {}
+        _session_versions.set(versions)
+    versions[session_id] = version
 
 
 def _build_tool_context(
@@ -494,28 +604,53 @@ async def _hydrate_context(session_id: str, project_id: int) -> SimpleNamespace:
 
 
 def _save_session_state(session_id: str, state: dict[str, Any]) -> None:
-    workflow_service.update_session_status(session_id, state)
+    """Persist state with a compare-and-swap against the version last loaded."""
+    expected_version = (_session_versions.get() or {}).get(session_id)
+    try:
+        version = workflow_service.update_session_status(
+            session_id, state, expected_version=expected_version
+        )
+    except SessionStateConflictError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail="Project state changed in another request; reload and retry.",
+        ) from exc
+    _remember_session_version(session_id, version)
 
 
-def _serialize_sprint_task(task: Task) -> dict[str, Any]:
-    meta = parse_task_metadata(task.metadata_json)
-    return {
-        "id": task.task_id,
-        "description": task.description,
-        "status": task.status.value if hasattr(task.status, "value") else task.status,
-        "task_kind": meta.task_kind,
-        "artifact_targets": meta.artifact_targets,
-        "workstream_tags": meta.workstream_tags,
-        "checklist_items": meta.checklist_items,
-        "is_executable": bool(meta.checklist_items),
-    }
+def _generation_stream_response(
+    project_id: int,
+    *,
+    phase: str,
+    operation: Callable[[], Awaitable[dict[str, Any]]],
+) -> StreamingResponse:
+    """Wrap a generate handler in a server-sent event stream."""
+    if not product_repo.get_by_id(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    return StreamingResponse(
+        stream_generation_events(operation, phase=phase, project_id=project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
-def _build_story_task_plan(story: UserStory) -> list[dict[str, Any]]:
-    return sorted(
-        [_serialize_sprint_task(task) for task in story.tasks],
-        key=lambda item: (item["description"].lower(), item["id"]),
+async def _submit_generation_job(
+    project_id: int,
+    *,
+    phase: str,
+    payload: dict[str, Any],
+    operation: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Queue a generate handler as a background job and return its status."""
+    if not product_repo.get_by_id(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    job, coalesced = await generation_jobs.submit(
+        project_id=project_id,
+        phase=phase,
+        payload=payload,
+        operation=operation,
     )
+    return {"status": "success", "data": {**job, "coalesced": coalesced}}
 
 
 def _story_task_progress(tasks: Sequence[Task]) -> tuple[int, int, int, bool]:
@@ -612,7 +747,7 @@ def _load_sprint_close_snapshot(sprint: Sprint) -> dict[str, Any] | None:
 
 
 def _build_sprint_runtime_summary(
-    sprints: Sequence[Sprint],
+    sprints: Sequence[Any],
 ) -> dict[str, Any]:
     active = next(
         (sprint for sprint in sprints if sprint.status == SprintStatus.ACTIVE),
@@ -675,18 +810,87 @@ def _allowed_actions_for_sprint(
     }
 
 
+@dataclass(frozen=True)
+class _SprintAggregates:
+    story_count: int = 0
+    task_count: int = 0
+    done_task_count: int = 0
+    cancelled_task_count: int = 0
+
+
+def _sprint_aggregates_from_graph(sprint: Sprint) -> _SprintAggregates:
+    tasks = [task for story in sprint.stories for task in story.tasks]
+    return _SprintAggregates(
+        story_count=len(sprint.stories),
+        task_count=len(tasks),
+        done_task_count=sum(1 for task in tasks if task.status == TaskStatus.DONE),
+        cancelled_task_count=sum(
+            1 for task in tasks if task.status == TaskStatus.CANCELLED
+        ),
+    )
+
+
+def _load_sprint_aggregates(
+    session: Session, project_id: int
+) -> dict[int, _SprintAggregates]:
+    """Count stories and tasks per sprint with grouped SQL, not the ORM graph."""
+    sprint_id = _queryable_attr(SprintStory.sprint_id)
+    in_project = (
+        select(Sprint.sprint_id)
+        .where(Sprint.product_id == project_id)
+        .scalar_subquery()
+    )
+    story_counts = dict(
+        session.exec(
+            select(sprint_id, func.count())
+            .where(sprint_id.in_(in_project))
+            .group_by(sprint_id)
+        ).all()
+    )
+    task_counts: dict[int, dict[TaskStatus, int]] = {}
+    for row_sprint_id, status, count in session.exec(
+        select(sprint_id, Task.status, func.count())
+        .join(Task, _queryable_attr(Task.story_id) == SprintStory.story_id)
+        .where(sprint_id.in_(in_project))
+        .group_by(sprint_id, _queryable_attr(Task.status))
+    ).all():
+        task_counts.setdefault(row_sprint_id, {})[status] = count
+    return {
+        key: _SprintAggregates(
+            story_count=story_counts.get(key, 0),
+            task_count=sum(task_counts.get(key, {}).values()),
+            done_task_count=task_counts.get(key, {}).get(TaskStatus.DONE, 0),
+            cancelled_task_count=task_counts.get(key, {}).get(TaskStatus.CANCELLED, 0),
+        )
+        for key in story_counts.keys() | task_counts.keys()
+    }
+
+
+def _load_sprint_runtime_rows(session: Session, project_id: int) -> Sequence[Any]:
+    """Load just the columns ``_build_sprint_runtime_summary`` reads."""
+    # SQLModel's select() overloads stop at four columns.
+    columns: tuple[Any, ...] = (
+        col(Sprint.sprint_id),
+        col(Sprint.status),
+        col(Sprint.completed_at),
+        col(Sprint.updated_at),
+        col(Sprint.created_at),
+    )
+    return session.exec(
+        select(*columns)
+        .where(Sprint.product_id == project_id)
+        .order_by(desc(_queryable_attr(Sprint.created_at)))
+    ).all()
+
+
 def _serialize_sprint_list_item(
     sprint: Sprint,
     *,
     runtime_summary: dict[str, Any],
+    aggregates: _SprintAggregates | None = None,
 ) -> dict[str, Any]:
-    stories = sorted(
-        sprint.stories,
-        key=lambda story: (
-            story.rank or "",
-            story.story_id or 0,
-        ),
-    )
+    if aggregates is None:
+        aggregates = _sprint_aggregates_from_graph(sprint)
     return {
         "id": sprint.sprint_id,
         "goal": sprint.goal,
@@ -699,7 +903,12 @@ def _serialize_sprint_list_item(
         "end_date": _serialize_temporal(sprint.end_date),
         "team_id": sprint.team_id,
         "team_name": sprint.team.name if sprint.team else None,
-        "story_count": len(stories),
+        "story_count": aggregates.story_count,
+        "task_progress": {
+            "total": aggregates.task_count,
+            "done": aggregates.done_task_count,
+            "cancelled": aggregates.cancelled_task_count,
+        },
         "history_fidelity": _history_fidelity(sprint),
         "allowed_actions": _allowed_actions_for_sprint(
             sprint,
@@ -735,6 +944,10 @@ def _saved_sprint_query() -> SelectOfScalar[Sprint]:
     )
 
 
+def _sprint_list_query() -> SelectOfScalar[Sprint]:
+    return select(Sprint).options(selectinload(_queryable_attr(Sprint.team)))
+
+
 def _get_saved_sprint(
     session: Session, project_id: int, sprint_id: int
 ) -> Sprint | None:
@@ -746,591 +959,6 @@ def _get_saved_sprint(
     ).first()
 
 
-def _serialize_temporal(value: object) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, datetime):
-        if value.tzinfo is not None:
-            return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
-        return value.isoformat()
-    if isinstance(value, _SupportsIsoFormat):
-        return value.isoformat()
-    return str(value)
-
-
-def _hash_payload(payload: object) -> str:
-    serialized = json.dumps(
-        payload,
-        sort_keys=True,
-        ensure_ascii=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(serialized.encode()).hexdigest()
-
-
-def _truncate_text(text: str, max_length: int) -> str:
-    normalized = " ".join((text or "").split())
-    if len(normalized) <= max_length:
-        return normalized
-    return f"{normalized[: max_length - 3].rstrip()}..."
-
-
-def _build_task_label(description: str) -> str:
-    normalized = _truncate_text(description or "Task", 80)
-    return normalized or "Task"
-
-
-def _extract_vision_excerpt(vision: str | None) -> str | None:
-    if not vision or not vision.strip():
-        return None
-    for paragraph in re.split(r"\n\s*\n", vision.strip()):
-        normalized = " ".join(paragraph.split())
-        if normalized:
-            return _truncate_text(normalized, 500)
-    return None
-
-
-def _normalize_acceptance_criteria(text: str | None) -> list[str]:
-    if not text or not text.strip():
-        return []
-
-    items: list[str] = []
-    for raw_line in text.splitlines():
-        stripped = raw_line.strip()
-        if not stripped:
-            continue
-        normalized = re.sub(r"^\s*(?:[-*•]+|\d+[.)])\s*", "", stripped).strip()
-        if normalized:
-            items.append(normalized)
-
-    if items:
-        return items
-
-    collapsed = " ".join(text.split())
-    return [collapsed] if collapsed else []
-
-
-def _load_validation_evidence(
-    raw_value: str | None,
-) -> ValidationEvidence | None:
-    if not raw_value:
-        return None
-    try:
-        return ValidationEvidence.model_validate_json(raw_value)
-    except Exception as exc:  # pragma: no cover - legacy malformed evidence
-        logger.warning("Failed to parse validation evidence: %s", exc)
-        return None
-
-
-def _load_pinned_authority(
-    session: Session,
-    accepted_spec_version_id: int | None,
-) -> CompiledSpecAuthority | None:
-    if accepted_spec_version_id is None:
-        return None
-    return session.exec(
-        select(CompiledSpecAuthority).where(
-            CompiledSpecAuthority.spec_version_id == accepted_spec_version_id
-        )
-    ).first()
-
-
-def _build_packet_findings(
-    evidence: ValidationEvidence | None,
-) -> list[dict[str, str | None]]:
-    if not evidence:
-        return []
-
-    findings: list[dict[str, str | None]] = [
-        {
-            "severity": "failure",
-            "source": "validation_failure",
-            "code": failure.rule,
-            "message": failure.message,
-            "invariant_id": None,
-            "rule": failure.rule,
-            "capability": None,
-        }
-        for failure in evidence.failures
-    ]
-    findings.extend(
-        {
-            "severity": "warning",
-            "source": "validation_warning",
-            "code": warning,
-            "message": warning,
-            "invariant_id": None,
-            "rule": None,
-            "capability": None,
-        }
-        for warning in evidence.warnings
-    )
-    findings.extend(
-        {
-            "severity": finding.severity,
-            "source": "alignment_warning",
-            "code": finding.code,
-            "message": finding.message,
-            "invariant_id": finding.invariant,
-            "rule": None,
-            "capability": finding.capability,
-        }
-        for finding in evidence.alignment_warnings
-    )
-    findings.extend(
-        {
-            "severity": finding.severity,
-            "source": "alignment_failure",
-            "code": finding.code,
-            "message": finding.message,
-            "invariant_id": finding.invariant,
-            "rule": None,
-            "capability": finding.capability,
-        }
-        for finding in evidence.alignment_failures
-    )
-    return findings
-
-
-def _build_story_compliance_boundaries(
-    authority: CompiledSpecAuthority | None,
-    evidence: ValidationEvidence | None,
-) -> list[dict[str, Any]]:
-    if not authority or not evidence:
-        return []
-
-    artifact = load_compiled_artifact(authority)
-    if not artifact:
-        return []
-
-    referenced_ids = set()
-    if hasattr(evidence, "finding_invariant_ids") and evidence.finding_invariant_ids:
-        referenced_ids.update(evidence.finding_invariant_ids)
-
-    if not referenced_ids:
-        return []
-
-    source_map: dict[str, Any] = {}
-    for entry in artifact.source_map:
-        source_map.setdefault(entry.invariant_id, entry)
-
-    relevant: list[dict[str, Any]] = []
-    for invariant in artifact.invariants:
-        if invariant.id not in referenced_ids:
-            continue
-
-        source_entry = source_map.get(invariant.id)
-        parameters = invariant.parameters.model_dump(mode="json")
-        relevant.append(
-            {
-                "invariant_id": invariant.id,
-                "type": invariant.type.value,
-                "parameters": parameters,
-                "source_excerpt": source_entry.excerpt if source_entry else None,
-                "source_location": source_entry.location if source_entry else None,
-            }
-        )
-    return relevant
-
-
-def _build_task_hard_constraints(
-    authority: CompiledSpecAuthority | None,
-    *,
-    task_metadata: TaskMetadata,
-) -> list[dict[str, Any]]:
-    if not authority or not task_metadata.relevant_invariant_ids:
-        return []
-
-    artifact = load_compiled_artifact(authority)
-    if not artifact:
-        return []
-
-    source_map: dict[str, Any] = {}
-    for entry in artifact.source_map:
-        source_map.setdefault(entry.invariant_id, entry)
-
-    invariant_map = {invariant.id: invariant for invariant in artifact.invariants}
-    constraints: list[dict[str, Any]] = []
-    for invariant_id in task_metadata.relevant_invariant_ids:
-        invariant = invariant_map.get(invariant_id)
-        if invariant is None:
-            logger.warning(
-                "Ignoring unknown invariant id '%s' while building "
-                "task packet hard constraints.",
-                invariant_id,
-            )
-            continue
-        source_entry = source_map.get(invariant.id)
-        constraints.append(
-            {
-                "invariant_id": invariant.id,
-                "type": invariant.type.value,
-                "parameters": invariant.parameters.model_dump(mode="json"),
-                "source_excerpt": source_entry.excerpt if source_entry else None,
-                "source_location": source_entry.location if source_entry else None,
-            }
-        )
-    return constraints
-
-
-def _load_packet_story_context(
-    session: Session,
-    *,
-    project_id: int,
-    sprint_id: int,
-    story_id: int | None = None,
-    task_id: int | None = None,
-) -> SimpleNamespace | None:
-    task = None
-    if task_id is not None:
-        task = session.exec(
-            select(Task)
-            .options(
-                selectinload(_queryable_attr(Task.assignee)),
-                selectinload(_queryable_attr(Task.story)).selectinload(
-                    _queryable_attr(UserStory.product)
-                ),
-                selectinload(_queryable_attr(Task.story)).selectinload(
-                    _queryable_attr(UserStory.tasks)
-                ),
-            )
-            .where(Task.task_id == task_id)
-        ).first()
-        if not task or not task.story or task.story.product_id != project_id:
-            return None
-        story = task.story
-    else:
-        story = session.exec(
-            select(UserStory)
-            .options(
-                selectinload(_queryable_attr(UserStory.product)),
-                selectinload(_queryable_attr(UserStory.tasks)),
-            )
-            .where(UserStory.story_id == story_id)
-        ).first()
-        if not story or story.product_id != project_id:
-            return None
-
-    sprint = session.exec(
-        select(Sprint)
-        .options(selectinload(_queryable_attr(Sprint.team)))
-        .where(
-            Sprint.product_id == project_id,
-            Sprint.sprint_id == sprint_id,
-        )
-    ).first()
-    if not sprint:
-        return None
-
-    sprint_story = session.exec(
-        select(SprintStory).where(
-            SprintStory.sprint_id == sprint_id,
-            SprintStory.story_id == story.story_id,
-        )
-    ).first()
-    if not sprint_story:
-        return None
-
-    product = story.product
-    if not product or product.product_id != project_id:
-        product = session.get(Product, project_id)
-        if not product:
-            return None
-
-    evidence = _load_validation_evidence(story.validation_evidence)
-    current_story_input_hash = compute_story_input_hash(story)
-    validation_input_hash = evidence.input_hash if evidence else None
-    input_hash_matches = (
-        current_story_input_hash == validation_input_hash
-        if validation_input_hash is not None
-        else None
-    )
-    validation_freshness = (
-        "missing" if evidence is None else "current" if input_hash_matches else "stale"
-    )
-
-    authority = _load_pinned_authority(session, story.accepted_spec_version_id)
-    compiled_artifact = load_compiled_artifact(authority) if authority else None
-    spec_binding_status = (
-        "pinned" if story.accepted_spec_version_id is not None else "unpinned"
-    )
-    authority_status = "available" if compiled_artifact is not None else "missing"
-
-    task_metadata = None
-    if task is not None:
-        task_metadata = parse_task_metadata(
-            task.metadata_json,
-            logger=logger,
-            task_id=task.task_id,
-        )
-
-    return SimpleNamespace(
-        task=task,
-        task_metadata=task_metadata,
-        story=story,
-        sprint=sprint,
-        sprint_story=sprint_story,
-        product=product,
-        evidence=evidence,
-        current_story_input_hash=current_story_input_hash,
-        validation_input_hash=validation_input_hash,
-        input_hash_matches=input_hash_matches,
-        validation_freshness=validation_freshness,
-        authority=authority,
-        spec_binding_status=spec_binding_status,
-        authority_status=authority_status,
-    )
-
-
-def _build_story_packet(
-    session: Session,
-    *,
-    project_id: int,
-    sprint_id: int,
-    story_id: int,
-) -> dict[str, Any] | None:
-    context = _load_packet_story_context(
-        session,
-        project_id=project_id,
-        sprint_id=sprint_id,
-        story_id=story_id,
-    )
-    if not context:
-        return None
-
-    story = context.story
-    sprint = context.sprint
-    sprint_story = context.sprint_story
-    product = context.product
-    evidence = context.evidence
-    task_plan_tasks = _build_story_task_plan(story)
-
-    source_snapshot = {
-        "product_id": project_id,
-        "sprint_id": sprint_id,
-        "story_id": story.story_id,
-        "product_updated_at": _serialize_temporal(product.updated_at),
-        "sprint_updated_at": _serialize_temporal(sprint.updated_at),
-        "sprint_story_added_at": _serialize_temporal(sprint_story.added_at),
-        "story_updated_at": _serialize_temporal(story.updated_at),
-        "story_ac_updated_at": _serialize_temporal(story.ac_updated_at),
-        "accepted_spec_version_id": story.accepted_spec_version_id,
-        "validation_validated_at": _serialize_temporal(
-            evidence.validated_at if evidence else None
-        ),
-        "validation_input_hash": context.validation_input_hash,
-        "compiled_authority_compiled_at": _serialize_temporal(
-            context.authority.compiled_at if context.authority else None
-        ),
-        "task_plan_hash": _hash_payload(task_plan_tasks),
-    }
-
-    packet_id_hash = hashlib.sha256(
-        f"story_packet.v1:{sprint_id}:{story_id}".encode()
-    ).hexdigest()[:16]
-
-    return {
-        "schema_version": "story_packet.v1",
-        "metadata": {
-            "packet_id": f"sp_{packet_id_hash}",
-            "generated_at": _serialize_temporal(datetime.now(UTC)),
-            "generator_version": "v1",
-            "source_fingerprint": _hash_payload(source_snapshot),
-        },
-        "source_snapshot": source_snapshot,
-        "story": {
-            "story_id": story.story_id,
-            "title": story.title,
-            "persona": story.persona,
-            "story_description": story.story_description,
-            "status": story.status.value,
-            "story_points": story.story_points,
-            "rank": story.rank,
-            "source_requirement": story.source_requirement,
-        },
-        "task_plan": {"tasks": task_plan_tasks},
-        "context": {
-            "sprint": {
-                "sprint_id": sprint.sprint_id,
-                "goal": sprint.goal,
-                "status": sprint.status.value,
-                "started_at": _serialize_temporal(sprint.started_at),
-                "start_date": _serialize_temporal(sprint.start_date),
-                "end_date": _serialize_temporal(sprint.end_date),
-                "team_id": sprint.team_id,
-                "team_name": sprint.team.name if sprint.team else None,
-            },
-            "product": {
-                "product_id": product.product_id,
-                "name": product.name,
-                "vision_excerpt": _extract_vision_excerpt(product.vision),
-            },
-        },
-        "constraints": {
-            "story_acceptance_criteria_text": story.acceptance_criteria,
-            "story_acceptance_criteria_items": _normalize_acceptance_criteria(
-                story.acceptance_criteria
-            ),
-            "spec_binding": {
-                "mode": "pinned_story_authority",
-                "binding_status": context.spec_binding_status,
-                "spec_version_id": story.accepted_spec_version_id,
-                "authority_artifact_status": context.authority_status,
-            },
-            "validation": {
-                "present": evidence is not None,
-                "passed": evidence.passed if evidence else None,
-                "freshness_status": context.validation_freshness,
-                "validated_at": _serialize_temporal(
-                    evidence.validated_at if evidence else None
-                ),
-                "validator_version": evidence.validator_version if evidence else None,
-                "current_story_input_hash": context.current_story_input_hash,
-                "validation_input_hash": context.validation_input_hash,
-                "input_hash_matches": context.input_hash_matches,
-                "rules_checked": list(evidence.rules_checked) if evidence else [],
-            },
-            "story_compliance_boundaries": _build_story_compliance_boundaries(
-                context.authority,
-                evidence,
-            ),
-            "findings": _build_packet_findings(evidence),
-        },
-    }
-
-
-def _build_task_packet(
-    session: Session,
-    *,
-    project_id: int,
-    sprint_id: int,
-    task_id: int,
-) -> dict[str, Any] | None:
-    context = _load_packet_story_context(
-        session,
-        project_id=project_id,
-        sprint_id=sprint_id,
-        task_id=task_id,
-    )
-    if not context or context.task is None or context.task_metadata is None:
-        return None
-
-    task = context.task
-    task_metadata = context.task_metadata
-    story = context.story
-    sprint = context.sprint
-    sprint_story = context.sprint_story
-    product = context.product
-    evidence = context.evidence
-
-    source_snapshot = {
-        "product_id": project_id,
-        "sprint_id": sprint_id,
-        "story_id": story.story_id,
-        "task_id": task_id,
-        "product_updated_at": _serialize_temporal(product.updated_at),
-        "sprint_updated_at": _serialize_temporal(sprint.updated_at),
-        "sprint_story_added_at": _serialize_temporal(sprint_story.added_at),
-        "story_updated_at": _serialize_temporal(story.updated_at),
-        "story_ac_updated_at": _serialize_temporal(story.ac_updated_at),
-        "task_updated_at": _serialize_temporal(task.updated_at),
-        "task_metadata_hash": hash_task_metadata(task_metadata),
-        "accepted_spec_version_id": story.accepted_spec_version_id,
-        "validation_validated_at": _serialize_temporal(
-            evidence.validated_at if evidence else None
-        ),
-        "validation_input_hash": context.validation_input_hash,
-        "compiled_authority_compiled_at": _serialize_temporal(
-            context.authority.compiled_at if context.authority else None
-        ),
-    }
-
-    packet_id_hash = hashlib.sha256(
-        f"task_packet.v2:{sprint_id}:{task_id}".encode()
-    ).hexdigest()[:16]
-
-    return {
-        "schema_version": "task_packet.v2",
-        "metadata": {
-            "packet_id": f"tp_{packet_id_hash}",
-            "generated_at": _serialize_temporal(datetime.now(UTC)),
-            "generator_version": "v2",
-            "source_fingerprint": _hash_payload(source_snapshot),
-        },
-        "source_snapshot": source_snapshot,
-        "task": {
-            "task_id": task.task_id,
-            "label": _build_task_label(task.description),
-            "description": task.description,
-            "status": task.status.value,
-            "assignee_member_id": task.assigned_to_member_id,
-            "assignee_name": task.assignee.name if task.assignee else None,
-            "task_kind": task_metadata.task_kind,
-            "artifact_targets": list(task_metadata.artifact_targets),
-            "workstream_tags": list(task_metadata.workstream_tags),
-            "checklist_items": list(task_metadata.checklist_items),
-            "is_executable": bool(task_metadata.checklist_items),
-        },
-        "context": {
-            "story": {
-                "story_id": story.story_id,
-                "title": story.title,
-                "persona": story.persona,
-                "story_description": story.story_description,
-                "status": story.status.value,
-                "story_points": story.story_points,
-                "rank": story.rank,
-                "source_requirement": story.source_requirement,
-            },
-            "sprint": {
-                "sprint_id": sprint.sprint_id,
-                "goal": sprint.goal,
-                "status": sprint.status.value,
-                "started_at": _serialize_temporal(sprint.started_at),
-                "start_date": _serialize_temporal(sprint.start_date),
-                "end_date": _serialize_temporal(sprint.end_date),
-                "team_id": sprint.team_id,
-                "team_name": sprint.team.name if sprint.team else None,
-            },
-            "product": {
-                "product_id": product.product_id,
-                "name": product.name,
-                "vision_excerpt": _extract_vision_excerpt(product.vision),
-            },
-        },
-        "constraints": {
-            "spec_binding": {
-                "mode": "pinned_story_authority",
-                "binding_status": context.spec_binding_status,
-                "spec_version_id": story.accepted_spec_version_id,
-                "authority_artifact_status": context.authority_status,
-            },
-            "validation": {
-                "present": evidence is not None,
-                "passed": evidence.passed if evidence else None,
-                "freshness_status": context.validation_freshness,
-                "validated_at": _serialize_temporal(
-                    evidence.validated_at if evidence else None
-                ),
-                "validator_version": evidence.validator_version if evidence else None,
-                "current_story_input_hash": context.current_story_input_hash,
-                "validation_input_hash": context.validation_input_hash,
-                "input_hash_matches": context.input_hash_matches,
-                "rules_checked": list(evidence.rules_checked) if evidence else [],
-            },
-            "task_hard_constraints": _build_task_hard_constraints(
-                context.authority,
-                task_metadata=task_metadata,
-            ),
-            "story_compliance_boundaries": _build_story_compliance_boundaries(
-                context.authority,
-                evidence,
-            ),
-            "findings": _build_packet_findings(evidence),
-        },
-    }
-
-
 async def _run_setup(
     session_id: str, project_id: int, spec_file_path: str
 ) -> dict[str, Any]:
@@ -1380,12 +1008,87 @@ def _effective_project_state(
     return state
 
 
+def _state_changes(stored: dict[str, Any], effective: dict[str, Any]) -> dict[str, Any]:
+    """Return the keys whose effective value differs from the stored state."""
+    return {
+        key: value
+        for key, value in effective.items()
+        if key not in stored or stored[key] != value
+    }
+
+
+def _persist_state_normalization(
+    session_id: str, stored: dict[str, Any], effective: dict[str, Any]
+) -> None:
+    """Write back only the normalized keys that changed, if any.
+
+    Read endpoints are polled by the dashboard, so an unconditional save turned
+    every refresh into a write transaction. A lost compare-and-swap here is
+    harmless: the next read recomputes the same projection.
+    """
+    changes = _state_changes(stored, effective)
+    if not changes:
+        runtime_metrics.increment(
+            "session_state.writes_skipped", labels={"source": "project_state"}
+        )
+        return
+    runtime_metrics.increment(
+        "session_state.writes", labels={"source": "project_state"}
+    )
+    runtime_metrics.increment(
+        "session_state.write_keys", len(changes), labels={"source": "project_state"}
+    )
+    try:
+        _save_session_state(session_id, changes)
+    except HTTPException as exc:
+        if exc.status_code != 409:  # noqa: PLR2004
+            raise
+        logger.info("Skipped state normalization for %s: concurrent write", session_id)
+
+
 @app.get("/")
 def root() -> RedirectResponse:
     """Redirect the application root to the dashboard UI."""
     return RedirectResponse(url="/dashboard")
 
 
+@app.get("/api/metrics")
+def get_runtime_metrics() -> dict[str, object]:
+    """Return in-process runtime counters and latency timings."""
+    return {"status": "success", "data": runtime_metrics.snapshot()}
+
+
+@app.get("/api/jobs/{job_id}")
+def get_generation_job(job_id: str) -> dict[str, object]:
+    """Return the status and, once finished, the result of a generate job."""
+    job = generation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"status": "success", "data": job}
+
+
+@app.get("/api/changes")
+async def get_entity_changes(
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_CHANGE_PAGE_SIZE)
+    ] = DEFAULT_CHANGE_PAGE_SIZE,
+    project_id: int | None = None,
+    wait: Annotated[float, Query(ge=0, le=MAX_CHANGE_WAIT_SECONDS)] = 0,
+) -> dict[str, Any]:
+    """Return entity change records after ``since``, long-polling up to ``wait``."""
+    return {
+        "status": "success",
+        "data": await wait_for_entity_changes(
+            get_engine(),
+            since=since,
+            limit=limit,
+            project_id=project_id,
+            wait_seconds=wait,
+        ),
+    }
+
+
 @app.get("/api/dashboard/config")
 def get_dashboard_config() -> dict[str, object]:
     """Return static dashboard workflow configuration for the frontend."""
@@ -1401,7 +1104,7 @@ def get_dashboard_config() -> dict[str, object]:
 def get_projects() -> dict[str, object]:
     """Return a list of all projects."""
     try:
-        products = product_repo.get_all()
+        products = product_repo.list_summaries()
         raw_states = workflow_service.get_session_statuses(
             [str(product.product_id) for product in products]
         )
@@ -1536,12 +1239,53 @@ async def get_project_state(project_id: int) -> dict[str, object]:
     session_id = str(project_id)
     state = await _ensure_session(session_id)
     effective_state = _effective_project_state(product, state)
-
-    _save_session_state(session_id, effective_state)
+    _persist_state_normalization(session_id, state, effective_state)
 
     return {"status": "success", "data": effective_state}
 
 
+@app.get("/api/projects/{project_id}/events")
+async def stream_project_events(
+    project_id: int,
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> StreamingResponse:
+    """Push project state deltas, FSM transitions and entity changes over SSE."""
+    if not product_repo.get_by_id(project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    session_id = str(project_id)
+
+    def _shape_state(raw_state: dict[str, Any]) -> dict[str, Any]:
+        return _effective_project_state(product_repo.get_by_id(project_id), raw_state)
+
+    return StreamingResponse(
+        iter_project_event_frames(
+            live_updates,
+            project_id,
+            engine=get_engine(),
+            load_state=lambda: _ensure_session(session_id),
+            shape_state=_shape_state,
+            last_event_id=last_event_id,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/projects/{project_id}/debug/failures")
+async def list_project_failure_artifacts(
+    project_id: int, limit: int = 50, offset: int = 0
+) -> dict[str, object]:
+    """List a project's failure artifacts, newest first."""
+    product = product_repo.get_by_id(project_id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not 1 <= limit <= MAX_FAILURE_PAGE_SIZE or offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid pagination parameters")
+
+    page = list_failure_artifacts(project_id, limit=limit, offset=offset)
+    return {"status": "success", "data": page}
+
+
 @app.get("/api/projects/{project_id}/debug/failures/{artifact_id}")
 async def get_project_failure_artifact(
     project_id: int, artifact_id: str
@@ -1563,6 +1307,42 @@ async def get_project_failure_artifact(
     return {"status": "success", "data": artifact}
 
 
+@app.get("/api/projects/{project_id}/workflow-metrics")
+async def get_project_workflow_metrics(
+    project_id: int,
+    granularity: Literal["hour", "day"] = "day",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    event_type: WorkflowEventType | None = None,
+) -> dict[str, object]:
+    """Get workflow event metrics for a project from the hourly/daily rollups."""
+    product = product_repo.get_by_id(project_id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    event_types = [event_type] if event_type is not None else None
+    rows = workflow_metrics_repo.rollups(
+        product_id=project_id,
+        granularity=granularity,
+        since=since,
+        until=until,
+        event_types=event_types,
+    )
+    buckets = [
+        {**asdict(metric), "bucket_start": _serialize_temporal(metric.bucket_start)}
+        for metric in timeseries_from_rollups(rows)
+    ]
+    return {
+        "status": "success",
+        "data": {
+            "project_id": project_id,
+            "granularity": granularity,
+            "summary": [asdict(metric) for metric in summarize_rollups(rows)],
+            "buckets": buckets,
+        },
+    }
+
+
 @app.post("/api/projects/{project_id}/vision/generate")
 async def generate_project_vision(
     project_id: int, req: VisionGenerateRequest
@@ -1593,6 +1373,31 @@ async def generate_project_vision(
     }
 
 
+@app.post("/api/projects/{project_id}/vision/generate/stream")
+async def stream_project_vision_generation(
+    project_id: int, req: VisionGenerateRequest
+) -> StreamingResponse:
+    """Stream vision generation progress as server-sent events."""
+    return _generation_stream_response(
+        project_id,
+        phase="vision",
+        operation=lambda: generate_project_vision(project_id, req),
+    )
+
+
+@app.post("/api/projects/{project_id}/vision/generate/jobs", status_code=202)
+async def submit_project_vision_job(
+    project_id: int, req: VisionGenerateRequest
+) -> dict[str, Any]:
+    """Queue vision generation as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="vision",
+        payload=req.model_dump(mode="json"),
+        operation=lambda: generate_project_vision(project_id, req),
+    )
+
+
 @app.get("/api/projects/{project_id}/vision/history")
 async def get_project_vision_history(project_id: int) -> dict[str, Any]:
     """Get the history of vision generation attempts for a project."""
@@ -1673,6 +1478,31 @@ async def generate_project_backlog(
     }
 
 
+@app.post("/api/projects/{project_id}/backlog/generate/stream")
+async def stream_project_backlog_generation(
+    project_id: int, req: BacklogGenerateRequest
+) -> StreamingResponse:
+    """Stream backlog generation progress as server-sent events."""
+    return _generation_stream_response(
+        project_id,
+        phase="backlog",
+        operation=lambda: generate_project_backlog(project_id, req),
+    )
+
+
+@app.post("/api/projects/{project_id}/backlog/generate/jobs", status_code=202)
+async def submit_project_backlog_job(
+    project_id: int, req: BacklogGenerateRequest
+) -> dict[str, Any]:
+    """Queue backlog generation as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="backlog",
+        payload=req.model_dump(mode="json"),
+        operation=lambda: generate_project_backlog(project_id, req),
+    )
+
+
 @app.get("/api/projects/{project_id}/backlog/history")
 async def get_project_backlog_history(project_id: int) -> dict[str, Any]:
     """Get the history of backlog generation attempts for a project."""
@@ -1749,6 +1579,31 @@ async def generate_project_roadmap(
     }
 
 
+@app.post("/api/projects/{project_id}/roadmap/generate/stream")
+async def stream_project_roadmap_generation(
+    project_id: int, req: RoadmapGenerateRequest
+) -> StreamingResponse:
+    """Stream roadmap generation progress as server-sent events."""
+    return _generation_stream_response(
+        project_id,
+        phase="roadmap",
+        operation=lambda: generate_project_roadmap(project_id, req),
+    )
+
+
+@app.post("/api/projects/{project_id}/roadmap/generate/jobs", status_code=202)
+async def submit_project_roadmap_job(
+    project_id: int, req: RoadmapGenerateRequest
+) -> dict[str, Any]:
+    """Queue roadmap generation as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="roadmap",
+        payload=req.model_dump(mode="json"),
+        operation=lambda: generate_project_roadmap(project_id, req),
+    )
+
+
 @app.get("/api/projects/{project_id}/roadmap/history")
 async def get_project_roadmap_history(project_id: int) -> dict[str, Any]:
     """Get the history of roadmap generation attempts for a project."""
@@ -1857,6 +1712,117 @@ async def generate_project_story(
     }
 
 
+@app.post("/api/projects/{project_id}/story/generate/stream")
+async def stream_project_story_generation(
+    project_id: int, parent_requirement: str, req: StoryGenerateRequest
+) -> StreamingResponse:
+    """Stream story generation progress as server-sent events."""
+    return _generation_stream_response(
+        project_id,
+        phase="story",
+        operation=lambda: generate_project_story(project_id, parent_requirement, req),
+    )
+
+
+@app.post("/api/projects/{project_id}/story/generate/jobs", status_code=202)
+async def submit_project_story_job(
+    project_id: int, parent_requirement: str, req: StoryGenerateRequest
+) -> dict[str, Any]:
+    """Queue story generation for one requirement as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="story",
+        payload={
+            "parent_requirement": parent_requirement,
+            **req.model_dump(mode="json"),
+        },
+        operation=lambda: generate_project_story(project_id, parent_requirement, req),
+    )
+
+
+@app.post("/api/projects/{project_id}/stories/revalidate/jobs", status_code=202)
+async def submit_stale_story_revalidation_job(
+    project_id: int, req: StoryRevalidateRequest
+) -> dict[str, Any]:
+    """Queue re-validation of the project's stale stories as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="story_revalidation",
+        payload=req.model_dump(mode="json"),
+        operation=lambda: asyncio.to_thread(
+            revalidate_stale_stories,
+            project_id=project_id,
+            mode=req.mode,
+            limit=req.limit,
+        ),
+    )
+
+
+@app.post("/api/projects/{project_id}/story/generate_batch")
+async def generate_project_story_batch(
+    project_id: int, req: StoryBatchGenerateRequest
+) -> dict[str, Any]:
+    """Generate first story drafts for all pending requirements concurrently."""
+    product = product_repo.get_by_id(project_id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    session_id = str(project_id)
+
+    def _report_progress(event: dict[str, Any]) -> None:
+        logger.info(
+            "Story batch %s for project %s: %s (%s/%s)",
+            event["event"],
+            project_id,
+            event["parent_requirement"],
+            event["completed_count"],
+            event["total_count"],
+        )
+        report_agent_progress("story_batch_progress", event)
+
+    try:
+        result = await generate_pending_story_drafts_service(
+            project_id=project_id,
+            max_concurrency=req.max_concurrency or get_story_pipeline_max_concurrency(),
+            load_state=lambda: _ensure_session(session_id),
+            save_state=lambda updated: _save_session_state(session_id, updated),
+            now_iso=_now_iso,
+            run_story_agent_from_state=run_story_agent_from_state,
+            set_request_projection=set_request_projection,
+            append_attempt=append_attempt,
+            promote_reusable_draft=promote_reusable_draft,
+            mark_feedback_absorbed=mark_feedback_absorbed,
+            failure_meta=_failure_meta,
+            report_progress=_report_progress,
+        )
+    except StoryPhaseError as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail=exc.detail,
+        ) from exc
+
+    return {
+        "status": "success",
+        **result,
+    }
+
+
+@app.post("/api/projects/{project_id}/story/generate_batch/stream")
+async def stream_project_story_batch(
+    project_id: int, req: StoryBatchGenerateRequest
+) -> StreamingResponse:
+    """Stream batch story generation as server-sent events.
+
+    Besides the usual agent events, a ``story_batch_progress`` event reports
+    each requirement as it starts and finishes.
+    """
+    return _generation_stream_response(
+        project_id,
+        phase="story_batch",
+        operation=lambda: generate_project_story_batch(project_id, req),
+    )
+
+
 @app.post("/api/projects/{project_id}/story/retry")
 async def retry_project_story(
     project_id: int, parent_requirement: str
@@ -2124,6 +2090,29 @@ async def generate_project_sprint(
     }
 
 
+async def stream_project_sprint_generation(
+    project_id: int, req: SprintGenerateRequest
+) -> StreamingResponse:
+    """Stream sprint generation progress as server-sent events."""
+    return _generation_stream_response(
+        project_id,
+        phase="sprint",
+        operation=lambda: generate_project_sprint(project_id, req),
+    )
+
+
+async def submit_project_sprint_job(
+    project_id: int, req: SprintGenerateRequest
+) -> dict[str, Any]:
+    """Queue sprint generation as a background job."""
+    return await _submit_generation_job(
+        project_id,
+        phase="sprint",
+        payload=req.model_dump(mode="json"),
+        operation=lambda: generate_project_sprint(project_id, req),
+    )
+
+
 async def get_project_sprint_history(project_id: int) -> dict[str, Any]:
     """Get the history of sprint planning attempts for a project."""
     product = product_repo.get_by_id(project_id)
@@ -2175,9 +2164,10 @@ async def list_project_sprints(project_id: int) -> dict[str, Any]:
         raise HTTPException(status_code=404, detail="Project not found")
 
     with Session(get_engine()) as session:
+        aggregates = _load_sprint_aggregates(session, project_id)
         payload = list_saved_sprints_service(
             load_sprints=lambda: session.exec(
-                _saved_sprint_query()
+                _sprint_list_query()
                 .where(Sprint.product_id == project_id)
                 .order_by(desc(_queryable_attr(Sprint.created_at)))
             ).all(),
@@ -2186,6 +2176,7 @@ async def list_project_sprints(project_id: int) -> dict[str, Any]:
                 _serialize_sprint_list_item(
                     sprint,
                     runtime_summary=runtime_summary,
+                    aggregates=aggregates.get(sprint.sprint_id, _SprintAggregates()),
                 )
             ),
         )
@@ -2206,11 +2197,7 @@ async def get_project_sprint(project_id: int, sprint_id: int) -> dict[str, Any]:
         try:
             data = get_saved_sprint_detail_service(
                 load_sprint=lambda: _get_saved_sprint(session, project_id, sprint_id),
-                load_sprints=lambda: session.exec(
-                    _saved_sprint_query()
-                    .where(Sprint.product_id == project_id)
-                    .order_by(desc(_queryable_attr(Sprint.created_at)))
-                ).all(),
+                load_sprints=lambda: _load_sprint_runtime_rows(session, project_id),
                 build_runtime_summary=_build_sprint_runtime_summary,
                 serialize_sprint_detail=lambda sprint, runtime_summary: (
                     _serialize_sprint_detail(
@@ -2302,25 +2289,51 @@ def post_sprint_close(
         return SprintCloseReadResponse(**data)
 
 
-async def get_project_task_packet(
-    project_id: int, sprint_id: int, task_id: int, flavor: str | None = None
-) -> dict[str, Any]:
-    """Get the execution context packet for a specific sprint task."""
+async def get_project_task_packet(  # noqa: PLR0913
+    project_id: int,
+    sprint_id: int,
+    task_id: int,
+    response: Response,
+    flavor: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> dict[str, Any] | Response:
+    """Get the execution context packet for a specific sprint task.
+
+    Packets are served from the packet cache while their fingerprint holds, and
+    a matching ``If-None-Match`` answers ``304 Not Modified``.
+    """
     product = product_repo.get_by_id(project_id)
     if not product:
         raise HTTPException(status_code=404, detail="Project not found")
 
     with Session(get_engine()) as session:
+        fingerprint = task_packet_fingerprint(
+            session,
+            project_id=project_id,
+            sprint_id=sprint_id,
+            task_id=task_id,
+        )
+        if fingerprint is not None:
+            etag = packet_etag(fingerprint)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
         try:
-            data = get_task_packet_service(
-                load_packet=lambda: _build_task_packet(
-                    session,
-                    project_id=project_id,
-                    sprint_id=sprint_id,
-                    task_id=task_id,
+            data = get_or_build_packet(
+                session,
+                key=PacketCacheKey("task", project_id, sprint_id, task_id, flavor),
+                fingerprint=fingerprint,
+                build=lambda: get_task_packet_service(
+                    load_packet=lambda: _build_task_packet(
+                        session,
+                        project_id=project_id,
+                        sprint_id=sprint_id,
+                        task_id=task_id,
+                    ),
+                    flavor=flavor,
+                    render_packet=render_packet,
                 ),
-                flavor=flavor,
-                render_packet=render_packet,
             )
         except PacketServiceError as exc:
             raise HTTPException(
@@ -2334,28 +2347,50 @@ async def get_project_task_packet(
         }
 
 
-async def get_project_story_packet(
+async def get_project_story_packet(  # noqa: PLR0913
     project_id: int,
     sprint_id: int,
     story_id: int,
+    response: Response,
     flavor: str | None = None,
-) -> dict[str, Any]:
-    """Get the context packet for a specific user story in a sprint."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> dict[str, Any] | Response:
+    """Get the context packet for a specific user story in a sprint.
+
+    Cached and revalidated like task packets.
+    """
     product = product_repo.get_by_id(project_id)
     if not product:
         raise HTTPException(status_code=404, detail="Project not found")
 
     with Session(get_engine()) as session:
+        fingerprint = story_packet_fingerprint(
+            session,
+            project_id=project_id,
+            sprint_id=sprint_id,
+            story_id=story_id,
+        )
+        if fingerprint is not None:
+            etag = packet_etag(fingerprint)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
         try:
-            data = get_story_packet_service(
-                load_packet=lambda: _build_story_packet(
-                    session,
-                    project_id=project_id,
-                    sprint_id=sprint_id,
-                    story_id=story_id,
+            data = get_or_build_packet(
+                session,
+                key=PacketCacheKey("story", project_id, sprint_id, story_id, flavor),
+                fingerprint=fingerprint,
+                build=lambda: get_story_packet_service(
+                    load_packet=lambda: _build_story_packet(
+                        session,
+                        project_id=project_id,
+                        sprint_id=sprint_id,
+                        story_id=story_id,
+                    ),
+                    flavor=flavor,
+                    render_packet=render_packet,
                 ),
-                flavor=flavor,
-                render_packet=render_packet,
             )
         except PacketServiceError as exc:
             raise HTTPException(
@@ -2369,6 +2404,58 @@ async def get_project_story_packet(
         }
 
 
+async def get_project_sprint_packet_bundle(
+    project_id: int,
+    sprint_id: int,
+    bundle_format: Annotated[BundleFormat, Query(alias="format")] = "ndjson",
+    flavor: str | None = None,
+) -> StreamingResponse:
+    """Stream every story and task packet of a sprint as NDJSON or a tarball."""
+    product = product_repo.get_by_id(project_id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    session = Session(get_engine())
+    try:
+        graph = load_sprint_packet_graph(
+            session,
+            project_id=project_id,
+            sprint_id=sprint_id,
+        )
+    except Exception:
+        session.close()
+        raise
+    if graph is None:
+        session.close()
+        raise HTTPException(status_code=404, detail="Sprint not found")
+
+    root = f"sprint-{sprint_id}-packets"
+
+    def _stream() -> Iterator[bytes]:
+        try:
+            yield from iter_packet_bundle(
+                iter_sprint_packets_service(
+                    packets=iter_sprint_packets(session, graph),
+                    flavor=flavor,
+                    render_packet=render_packet,
+                ),
+                bundle_format=bundle_format,
+                root=root,
+            )
+        finally:
+            session.close()
+
+    filename = f"{root}{BUNDLE_FILE_SUFFIXES[bundle_format]}"
+    return StreamingResponse(
+        _stream(),
+        media_type=BUNDLE_MEDIA_TYPES[bundle_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Packet-Count": str(graph.story_count + graph.task_count),
+        },
+    )
+
+
 def get_task_execution(
     project_id: int, sprint_id: int, task_id: int
 ) -> TaskExecutionReadResponse:
@@ -2687,11 +2774,7 @@ async def start_project_sprint(project_id: int, sprint_id: int) -> dict[str, Any
                 ).first(),
                 persist_started_sprint=_persist_started_sprint,
                 build_runtime_summary=lambda: _build_sprint_runtime_summary(
-                    session.exec(
-                        _saved_sprint_query()
-                        .where(Sprint.product_id == project_id)
-                        .order_by(desc(_queryable_attr(Sprint.created_at)))
-                    ).all()
+                    _load_sprint_runtime_rows(session, project_id)
                 ),
                 serialize_sprint=lambda sprint, runtime_summary: (
                     _serialize_sprint_detail(
@@ -2716,6 +2799,8 @@ register_sprint_routes(
     app,
     get_project_sprint_candidates=get_project_sprint_candidates,
     generate_project_sprint=generate_project_sprint,
+    stream_project_sprint_generation=stream_project_sprint_generation,
+    submit_project_sprint_job=submit_project_sprint_job,
     get_project_sprint_history=get_project_sprint_history,
     reset_project_sprint_planner=reset_project_sprint_planner,
     list_project_sprints=list_project_sprints,
@@ -2726,6 +2811,7 @@ register_sprint_routes(
     post_sprint_close=post_sprint_close,
     get_project_task_packet=get_project_task_packet,
     get_project_story_packet=get_project_story_packet,
+    get_project_sprint_packet_bundle=get_project_sprint_packet_bundle,
     get_task_execution=get_task_execution,
     post_task_execution=post_task_execution,
     get_story_close=get_story_close,
@@ -16,7 +16,7 @@ from services.agent_workbench.envelope import (
     error_envelope,
     success_envelope,
 )
-from utils.logging_config import configure_logging
+from utils.logging_config import bind_correlation_id, configure_logging
 
 DEFAULT_CONTEXT_PHASE: str = "overview"
 INVALID_COMMAND_EXIT_CODE: int = 2
@@ -30,8 +30,11 @@ Examples:
   agileforge status --project-id 1
   agileforge workflow state --project-id 1
   agileforge authority status --project-id 1
+  agileforge story generate-batch --project-id 1 --max-concurrency 4
   agileforge sprint candidates --project-id 1
+  agileforge sprint packets --project-id 1 --sprint-id 2 --format tar
   agileforge context pack --project-id 1 --phase sprint-planning
+  agileforge changes --since 120 --project-id 1
 """
 type JsonObject = dict[str, object]
 type JsonList = list[object]
@@ -118,10 +121,41 @@ class _Application(Protocol):
         """Return story detail projection."""
         ...
 
+    def story_generate_batch(
+        self,
+        *,
+        project_id: int,
+        max_concurrency: int | None = None,
+    ) -> JsonObject:
+        """Draft stories for every pending requirement of a project."""
+        ...
+
     def sprint_candidates(self, *, project_id: int) -> JsonObject:
         """Return sprint candidate projection."""
         ...
 
+    def sprint_packets(
+        self,
+        *,
+        project_id: int,
+        sprint_id: int,
+        output: str | None = None,
+        bundle_format: str = "ndjson",
+        flavor: str | None = None,
+    ) -> JsonObject:
+        """Write a sprint packet bundle file."""
+        ...
+
+    def changes(
+        self,
+        *,
+        since: int = 0,
+        project_id: int | None = None,
+        limit: int = 500,
+    ) -> JsonObject:
+        """Return entity change records after a cursor."""
+        ...
+
     def context_pack(
         self,
         *,
@@ -471,7 +505,7 @@ def build_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
     authority_invariants.add_argument("--spec-version-id", type=int)
     authority_invariants.set_defaults(command_handler=_authority_invariants)
 
-    story = subparsers.add_parser("story", help="Inspect user stories.")
+    story = subparsers.add_parser("story", help="Inspect and draft user stories.")
     story_sub = story.add_subparsers(
         dest="action",
         required=True,
@@ -480,6 +514,13 @@ def build_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
     story_show = story_sub.add_parser("show", help="Show one story.")
     story_show.add_argument("--story-id", type=int, required=True)
     story_show.set_defaults(command_handler=_story_show)
+    story_generate_batch = story_sub.add_parser(
+        "generate-batch",
+        help="Draft stories for every pending roadmap requirement.",
+    )
+    story_generate_batch.add_argument("--project-id", type=int, required=True)
+    story_generate_batch.add_argument("--max-concurrency", type=int)
+    story_generate_batch.set_defaults(command_handler=_story_generate_batch)
 
     sprint = subparsers.add_parser("sprint", help="Inspect sprint planning inputs.")
     sprint_sub = sprint.add_subparsers(
@@ -493,6 +534,30 @@ def build_parser() -> argparse.ArgumentParser:  # noqa: PLR0915
     )
     sprint_candidates.add_argument("--project-id", type=int, required=True)
     sprint_candidates.set_defaults(command_handler=_sprint_candidates)
+    sprint_packets = sprint_sub.add_parser(
+        "packets",
+        help="Export every story and task packet of a sprint.",
+    )
+    sprint_packets.add_argument("--project-id", type=int, required=True)
+    sprint_packets.add_argument("--sprint-id", type=int, required=True)
+    sprint_packets.add_argument(
+        "--format",
+        dest="bundle_format",
+        choices=("ndjson", "tar"),
+        default="ndjson",
+    )
+    sprint_packets.add_argument("--flavor")
+    sprint_packets.add_argument("--output")
+    sprint_packets.set_defaults(command_handler=_sprint_packets)
+
+    changes = subparsers.add_parser(
+        "changes",
+        help="List entity changes recorded after a change-log cursor.",
+    )
+    changes.add_argument("--since", type=int, default=0)
+    changes.add_argument("--project-id", type=int)
+    changes.add_argument("--limit", type=int, default=500)
+    changes.set_defaults(command_handler=_changes)
 
     context = subparsers.add_parser("context", help="Build bounded agent context.")
     context_sub = context.add_subparsers(
@@ -699,6 +764,17 @@ def _story_show(args: argparse.Namespace, application: _Application) -> CommandR
     return "agileforge story show", application.story_show(story_id=args.story_id)
 
 
+def _story_generate_batch(
+    args: argparse.Namespace,
+    application: _Application,
+) -> CommandResult:
+    """Route batch story generation to the application facade."""
+    return "agileforge story generate-batch", application.story_generate_batch(
+        project_id=args.project_id,
+        max_concurrency=args.max_concurrency,
+    )
+
+
 def _sprint_candidates(
     args: argparse.Namespace,
     application: _Application,
@@ -709,6 +785,29 @@ def _sprint_candidates(
     )
 
 
+def _sprint_packets(
+    args: argparse.Namespace,
+    application: _Application,
+) -> CommandResult:
+    """Route sprint packet bundle export to the application facade."""
+    return "agileforge sprint packets", application.sprint_packets(
+        project_id=args.project_id,
+        sprint_id=args.sprint_id,
+        output=args.output,
+        bundle_format=args.bundle_format,
+        flavor=args.flavor,
+    )
+
+
+def _changes(args: argparse.Namespace, application: _Application) -> CommandResult:
+    """Route change-log reads to the application facade."""
+    return "agileforge changes", application.changes(
+        since=args.since,
+        project_id=args.project_id,
+        limit=args.limit,
+    )
+
+
 def _context_pack(args: argparse.Namespace, application: _Application) -> CommandResult:
     """Route context pack to the application facade."""
     return "agileforge context pack", application.context_pack(
@@ -815,6 +914,7 @@ def _dispatch(args: argparse.Namespace, application: _Application) -> CommandRes
 def main(argv: list[str] | None = None, *, application: object | None = None) -> int:
     """Run the CLI and return a process exit code."""
     configure_logging(console=False)
+    bind_correlation_id()
     parser = build_parser()
     try:
         args = parser.parse_args(argv)
@@ -7,7 +7,8 @@ and safely handle schema drift without data loss.
 
 Design:
 - All migrations are idempotent (safe to run multiple times).
-- Migrations only ADD columns/tables, never DROP or modify existing data.
+- Migrations only ADD columns/tables, never DROP or modify existing data
+  (the one exception, a retired derived counter, is documented in place).
 - Each migration logs its action for observability.
 - Failures are raised as RuntimeError with clear messages.
 
@@ -21,7 +22,14 @@ import logging
 from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 
+from utils.story_inputs import compute_story_input_hash, evidence_input_hash
 from utils.task_metadata import canonical_task_metadata_json
+from utils.workflow_rollups import (
+    NO_PRODUCT_ID,
+    RollupTotals,
+    dump_histogram,
+    duration_bucket_sql,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -274,6 +282,100 @@ def migrate_performance_indexes(engine: Engine) -> list[str]:
     ):
         actions.append("created index: ix_user_stories_refinement_linkage")
 
+    # Sprint list/runtime summary filters sprints by product and status.
+    if _ensure_index_exists(
+        engine,
+        "sprints",
+        "ix_sprints_product_id_status",
+        ["product_id", "status"],
+    ):
+        actions.append("created index: ix_sprints_product_id_status")
+
+    return actions
+
+
+# =============================================================================
+# ROADMAP HIERARCHY MIGRATION
+# =============================================================================
+
+# (table, canonical index name, columns) for hierarchy lookups by parent.
+_HIERARCHY_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ("epics", "ix_epics_product_id", ["product_id"]),
+    ("features", "ix_features_product_id", ["product_id"]),
+    ("user_stories", "ix_user_stories_feature_id", ["feature_id"]),
+    ("tasks", "ix_tasks_story_id", ["story_id"]),
+    ("sprint_stories", "ix_sprint_stories_story_id", ["story_id"]),
+)
+
+
+def migrate_roadmap_hierarchy(engine: Engine) -> list[str]:
+    """Denormalize product_id onto epics/features and index hierarchy links."""
+    actions: list[str] = []
+    existing_tables = _get_existing_tables(engine)
+
+    if "epics" in existing_tables and _ensure_column_exists(
+        engine, "epics", "product_id", "INTEGER"
+    ):
+        actions.append("added column: epics.product_id")
+
+    if "features" in existing_tables and _ensure_column_exists(
+        engine, "features", "product_id", "INTEGER"
+    ):
+        actions.append("added column: features.product_id")
+
+    if {"themes", "epics", "features"}.issubset(existing_tables):
+        with engine.begin() as conn:
+            epics = conn.execute(
+                text(
+                    """
+                    UPDATE epics
+                    SET product_id = (
+                        SELECT themes.product_id FROM themes
+                        WHERE themes.theme_id = epics.theme_id
+                    )
+                    WHERE product_id IS NULL
+                    """
+                )
+            ).rowcount
+            features = conn.execute(
+                text(
+                    """
+                    UPDATE features
+                    SET product_id = (
+                        SELECT epics.product_id FROM epics
+                        WHERE epics.epic_id = features.epic_id
+                    )
+                    WHERE product_id IS NULL
+                    """
+                )
+            ).rowcount
+        if epics:
+            actions.append(f"backfilled epics.product_id on {epics} row(s)")
+        if features:
+            actions.append(f"backfilled features.product_id on {features} row(s)")
+
+    for table_name, index_name, column_names in _HIERARCHY_INDEXES:
+        existing_columns = _get_existing_columns(engine, table_name)
+        if set(column_names).issubset(existing_columns) and _ensure_index_exists(
+            engine, table_name, index_name, column_names
+        ):
+            actions.append(f"created index: {index_name}")
+
+    return actions
+
+
+def migrate_product_structure_version(engine: Engine) -> list[str]:
+    """Ensure products carry the structure summary cache version."""
+    actions: list[str] = []
+
+    if "products" in _get_existing_tables(engine) and _ensure_column_exists(
+        engine,
+        "products",
+        "structure_version",
+        "INTEGER NOT NULL DEFAULT 0",
+    ):
+        actions.append("added column: products.structure_version")
+
     return actions
 
 
@@ -357,6 +459,97 @@ def migrate_user_story_refinement_linkage(engine: Engine) -> list[str]:
     return actions
 
 
+# =============================================================================
+# STORY VALIDATION FRESHNESS MIGRATION
+# =============================================================================
+
+
+_STORY_HASH_SOURCE_COLUMNS = (
+    "title",
+    "story_description",
+    "acceptance_criteria",
+    "validation_evidence",
+)
+
+
+def _backfill_story_input_hashes(engine: Engine) -> int:
+    """Hash stories written before ``story_input_hash`` existed.
+
+    Returns the number of stories backfilled.
+    """
+    existing = _get_existing_columns(engine, "user_stories")
+    selected = ", ".join(
+        column if column in existing else f"NULL AS {column}"
+        for column in _STORY_HASH_SOURCE_COLUMNS
+    )
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                f"SELECT story_id, {selected} FROM user_stories "  # noqa: S608
+                "WHERE story_input_hash IS NULL"
+            )
+        ).all()
+        if not rows:
+            return 0
+        updates = []
+        for row in rows:
+            input_hash = compute_story_input_hash(row)
+            recorded_hash = evidence_input_hash(row.validation_evidence)
+            updates.append(
+                {
+                    "story_id": row.story_id,
+                    "story_input_hash": input_hash,
+                    "validation_stale": recorded_hash is not None
+                    and recorded_hash != input_hash,
+                }
+            )
+        conn.execute(
+            text(
+                """
+                UPDATE user_stories
+                SET story_input_hash = :story_input_hash,
+                    validation_stale = :validation_stale
+                WHERE story_id = :story_id
+                """
+            ),
+            updates,
+        )
+    return len(updates)
+
+
+def migrate_story_validation_freshness(engine: Engine) -> list[str]:
+    """Ensure stories track their input hash and validation staleness."""
+    actions: list[str] = []
+
+    if "user_stories" not in _get_existing_tables(engine):
+        return actions
+
+    if _ensure_column_exists(engine, "user_stories", "story_input_hash", "VARCHAR"):
+        actions.append("added column: user_stories.story_input_hash")
+
+    if _ensure_column_exists(
+        engine,
+        "user_stories",
+        "validation_stale",
+        "BOOLEAN NOT NULL DEFAULT 0",
+    ):
+        actions.append("added column: user_stories.validation_stale")
+
+    if _ensure_index_exists(
+        engine,
+        "user_stories",
+        "ix_user_stories_validation_stale",
+        ["validation_stale"],
+    ):
+        actions.append("created index: ix_user_stories_validation_stale")
+
+    backfilled = _backfill_story_input_hashes(engine)
+    if backfilled:
+        actions.append(f"backfilled user_stories.story_input_hash rows: {backfilled}")
+
+    return actions
+
+
 # =============================================================================
 # SPRINT LIFECYCLE MIGRATION
 # =============================================================================
@@ -587,6 +780,223 @@ def migrate_agent_workbench_contract_tables(engine: Engine) -> list[str]:
     return actions
 
 
+# =============================================================================
+# WORKFLOW EVENT ROLLUPS MIGRATION
+# =============================================================================
+
+WORKFLOW_EVENT_ROLLUPS_CREATE_SQL = f"""
+CREATE TABLE IF NOT EXISTS workflow_event_rollups (
+    rollup_id INTEGER PRIMARY KEY,
+    granularity VARCHAR(8) NOT NULL,
+    bucket_start DATETIME NOT NULL,
+    product_id INTEGER NOT NULL DEFAULT {NO_PRODUCT_ID},
+    event_type VARCHAR(20) NOT NULL,
+    state VARCHAR(100) NOT NULL DEFAULT '',
+    event_count INTEGER NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    duration_total FLOAT NOT NULL DEFAULT 0,
+    duration_min FLOAT,
+    duration_max FLOAT,
+    duration_histogram TEXT NOT NULL DEFAULT '{{}}',
+    turn_count_total INTEGER NOT NULL DEFAULT 0,
+    turn_count_events INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT uq_workflow_event_rollups_key
+        UNIQUE (granularity, bucket_start, product_id, event_type, state)
+)
+"""
+
+# strftime formats matching SQLAlchemy's SQLite DATETIME storage format, so
+# backfilled buckets compare equal to the ones written by the ORM listener.
+_ROLLUP_BUCKET_FORMATS: dict[str, str] = {
+    "hour": "%Y-%m-%d %H:00:00.000000",
+    "day": "%Y-%m-%d 00:00:00.000000",
+}
+
+_ROLLUP_BACKFILL_SELECT_SQL = """
+SELECT
+    strftime('{bucket_format}', timestamp),
+    COALESCE(product_id, {no_product_id}),
+    event_type,
+    CASE
+        WHEN event_type = 'FSM_STATE_DWELL'
+            AND json_valid(event_metadata)
+            AND json_type(event_metadata, '$.from_state') = 'text'
+        THEN substr(json_extract(event_metadata, '$.from_state'), 1, 100)
+        ELSE ''
+    END,
+    CASE WHEN duration_seconds IS NULL THEN NULL ELSE {duration_bucket} END,
+    COUNT(*),
+    COUNT(duration_seconds),
+    COALESCE(SUM(duration_seconds), 0),
+    MIN(duration_seconds),
+    MAX(duration_seconds),
+    COALESCE(SUM(turn_count), 0),
+    COUNT(turn_count)
+FROM workflow_events
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _backfill_workflow_event_rollups(engine: Engine) -> int:
+    """Build rollups from existing events when the rollup table is empty.
+
+    Returns the number of rollup rows written.
+    """
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT 1 FROM workflow_event_rollups LIMIT 1")).first():
+            return 0
+        rollups: dict[tuple[object, ...], RollupTotals] = {}
+        for granularity, bucket_format in _ROLLUP_BUCKET_FORMATS.items():
+            result = conn.execute(
+                text(
+                    _ROLLUP_BACKFILL_SELECT_SQL.format(
+                        bucket_format=bucket_format,
+                        no_product_id=NO_PRODUCT_ID,
+                        duration_bucket=duration_bucket_sql("duration_seconds"),
+                    )
+                )
+            )
+            for row in result:
+                key = (granularity, *row[:4])
+                bucket_index = row[4]
+                rollups.setdefault(key, RollupTotals()).merge(
+                    RollupTotals(
+                        event_count=row[5],
+                        duration_count=row[6],
+                        duration_total=row[7],
+                        duration_min=row[8],
+                        duration_max=row[9],
+                        histogram=(
+                            {} if bucket_index is None else {bucket_index: row[6]}
+                        ),
+                        turn_count_total=row[10],
+                        turn_count_events=row[11],
+                    )
+                )
+        if not rollups:
+            return 0
+        conn.execute(
+            text(
+                """
+                INSERT INTO workflow_event_rollups (
+                    granularity, bucket_start, product_id, event_type, state,
+                    event_count, duration_count, duration_total, duration_min,
+                    duration_max, duration_histogram, turn_count_total,
+                    turn_count_events
+                ) VALUES (
+                    :granularity, :bucket_start, :product_id, :event_type, :state,
+                    :event_count, :duration_count, :duration_total, :duration_min,
+                    :duration_max, :duration_histogram, :turn_count_total,
+                    :turn_count_events
+                )
+                """
+            ),
+            [
+                {
+                    "granularity": granularity,
+                    "bucket_start": bucket_start,
+                    "product_id": product_id,
+                    "event_type": event_type,
+                    "state": state,
+                    "event_count": totals.event_count,
+                    "duration_count": totals.duration_count,
+                    "duration_total": totals.duration_total,
+                    "duration_min": totals.duration_min,
+                    "duration_max": totals.duration_max,
+                    "duration_histogram": dump_histogram(totals.histogram),
+                    "turn_count_total": totals.turn_count_total,
+                    "turn_count_events": totals.turn_count_events,
+                }
+                for (
+                    granularity,
+                    bucket_start,
+                    product_id,
+                    event_type,
+                    state,
+                ), totals in rollups.items()
+            ],
+        )
+    return len(rollups)
+
+
+def migrate_workflow_event_rollups(engine: Engine) -> list[str]:
+    """Ensure workflow event indexes and rollups exist, backfilling rollups."""
+    actions: list[str] = []
+
+    if "workflow_events" not in _get_existing_tables(engine):
+        return actions
+
+    if _ensure_index_exists(
+        engine,
+        "workflow_events",
+        "ix_workflow_events_product_type_timestamp",
+        ["product_id", "event_type", "timestamp"],
+    ):
+        actions.append("created index: ix_workflow_events_product_type_timestamp")
+
+    if _ensure_table_exists(
+        engine, "workflow_event_rollups", WORKFLOW_EVENT_ROLLUPS_CREATE_SQL
+    ):
+        actions.append("created table: workflow_event_rollups")
+
+    if _ensure_index_exists(
+        engine,
+        "workflow_event_rollups",
+        "ix_workflow_event_rollups_product_bucket",
+        ["product_id", "granularity", "bucket_start"],
+    ):
+        actions.append("created index: ix_workflow_event_rollups_product_bucket")
+
+    # Rows keyed on a NULL product_id never conflicted, so they may be split;
+    # rollups are derived, so rebuild them under the NO_PRODUCT_ID key.
+    with engine.begin() as conn:
+        if conn.execute(
+            text(
+                "SELECT 1 FROM workflow_event_rollups WHERE product_id IS NULL LIMIT 1"
+            )
+        ).first():
+            conn.execute(text("DELETE FROM workflow_event_rollups"))
+            actions.append("cleared workflow_event_rollups keyed on NULL product_id")
+
+    backfilled = _backfill_workflow_event_rollups(engine)
+    if backfilled:
+        actions.append(f"backfilled {backfilled} workflow_event_rollups row(s)")
+
+    return actions
+
+
+# =============================================================================
+# CONTENT BLOB SWEEP MIGRATION
+# =============================================================================
+
+
+def migrate_content_blob_sweep(engine: Engine) -> list[str]:
+    """Replace blob reference counts with the ``touched_at`` sweep marker.
+
+    ``ref_count`` was a derived counter with no default, so rows written
+    without it would be rejected; it is the one column this module drops.
+    """
+    actions: list[str] = []
+
+    if "content_blobs" not in _get_existing_tables(engine):
+        return actions
+
+    if _ensure_column_exists(
+        engine,
+        "content_blobs",
+        "touched_at",
+        "DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00'",
+    ):
+        actions.append("added column: content_blobs.touched_at")
+
+    if "ref_count" in _get_existing_columns(engine, "content_blobs"):
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE content_blobs DROP COLUMN ref_count"))
+        actions.append("dropped column: content_blobs.ref_count")
+
+    return actions
+
+
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
@@ -611,10 +1021,15 @@ def ensure_schema_current(engine: Engine) -> None:
         actions = migrate_spec_authority_tables(engine)
         actions.extend(migrate_product_spec_cache(engine))
         actions.extend(migrate_user_story_refinement_linkage(engine))
+        actions.extend(migrate_story_validation_freshness(engine))
         actions.extend(migrate_sprint_lifecycle(engine))
         actions.extend(migrate_task_metadata(engine))
         actions.extend(migrate_task_execution_logs(engine))
         actions.extend(migrate_agent_workbench_contract_tables(engine))
+        actions.extend(migrate_roadmap_hierarchy(engine))
+        actions.extend(migrate_product_structure_version(engine))
+        actions.extend(migrate_workflow_event_rollups(engine))
+        actions.extend(migrate_content_blob_sweep(engine))
         actions.extend(migrate_performance_indexes(engine))
 
         if actions:
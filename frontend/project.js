@@ -63,6 +63,11 @@ let currentSprintClosePreview = null;
 let sprintMode = null;
 let showSprintPlanner = false;
 
+// Live update channel: state snapshot kept in sync by pushed deltas
+let liveEvents = null;
+let liveProjectState = null;
+let liveSprintRefreshTimer = null;
+
 let latestVisionIsComplete = false;
 let visionAttemptCount = 0;
 
@@ -128,6 +133,7 @@ window.addEventListener('DOMContentLoaded', async () => {
     await loadInitialProjectMetadata();
     await loadSavedSprints();
     await fetchProjectFSMState(selectedProjectId);
+    connectLiveUpdates(selectedProjectId);
     await loadVisionHistory();
     await loadBacklogHistory();
     await loadRoadmapHistory();
@@ -621,65 +627,212 @@ function updateProjectNavUI() {
     });
 }
 
+const GENERATION_STREAM_LABELS = {
+    queued: 'Queued...',
+    invoking_model: 'Calling model...',
+    token: 'Streaming...',
+    validating: 'Validating...',
+    persisted: 'Saving...',
+};
+
+function parseSseFrame(frame) {
+    let eventName = 'message';
+    const dataLines = [];
+    frame.split('\n').forEach((line) => {
+        if (line.startsWith('event:')) {
+            eventName = line.slice(6).trim();
+        } else if (line.startsWith('data:')) {
+            dataLines.push(line.slice(5).trimStart());
+        }
+    });
+    if (dataLines.length === 0) return null;
+    return { event: eventName, data: JSON.parse(dataLines.join('\n')) };
+}
+
+function ensureGenerationPreview(button) {
+    const anchor = button?.parentElement;
+    if (!anchor) return null;
+    let preview = anchor.parentElement?.querySelector('[data-generation-preview]');
+    if (!preview) {
+        preview = document.createElement('pre');
+        preview.dataset.generationPreview = 'true';
+        preview.className = 'mt-3 max-h-48 overflow-y-auto whitespace-pre-wrap rounded-lg border border-slate-200 bg-slate-50 p-3 text-[11px] font-mono text-slate-600 dark:border-slate-700 dark:bg-slate-900 dark:text-slate-300';
+        anchor.insertAdjacentElement('afterend', preview);
+    }
+    preview.textContent = '';
+    return preview;
+}
+
+async function streamGeneration(url, body, button) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+        body: JSON.stringify(body),
+    });
+    if (response.status >= 400 || !response.body) {
+        const errorBody = await response.json().catch(() => ({}));
+        throw new Error(errorBody.detail || 'Generation failed');
+    }
+
+    const preview = ensureGenerationPreview(button);
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+    try {
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            let boundary = buffer.indexOf('\n\n');
+            while (boundary !== -1) {
+                const message = parseSseFrame(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                boundary = buffer.indexOf('\n\n');
+                if (!message) continue;
+
+                const label = GENERATION_STREAM_LABELS[message.event];
+                if (label && button) {
+                    button.innerHTML = `<span class="material-symbols-outlined text-sm animate-spin">cycle</span> ${label}`;
+                }
+                if (message.event === 'token' && preview) {
+                    preview.textContent += message.data.text || '';
+                    preview.scrollTop = preview.scrollHeight;
+                } else if (message.event === 'persisted') {
+                    result = message.data.result;
+                } else if (message.event === 'error') {
+                    throw new Error(message.data.detail || 'Generation failed');
+                }
+            }
+        }
+    } finally {
+        preview?.remove();
+    }
+
+    if (!result) throw new Error('Generation stream ended without a result');
+    return result;
+}
+
 async function fetchProjectFSMState(projectId, options = {}) {
-    const { preserveView = false } = options;
     try {
         const response = await fetch(`/api/projects/${projectId}/state`);
         const data = await response.json();
 
         if (data.status !== 'success') throw new Error('Failed to load state');
 
-        const state = data.data || {};
-        currentProjectState = {
-            setup_status: state.setup_status || 'failed',
-            setup_error: state.setup_error || null,
-        };
+        liveProjectState = data.data || {};
+        applyProjectState(liveProjectState, options);
+    } catch (error) {
+        console.error('Error fetching project state:', error);
+        currentProjectState = { setup_status: 'failed', setup_error: 'Failed to load state.' };
+        currentSprintId = null;
+        sprintMode = null;
+        showSprintPlanner = false;
+        setPhaseState('SETUP_REQUIRED', 'setup');
+        updateSetupStatusBanner();
+    }
+}
 
-        const stateKey = normalizeStateKey(state.fsm_state);
-        const landing = resolveProjectLanding(stateKey);
-
-        const specInput = document.getElementById('setup-spec-path');
-        if (specInput) {
-            specInput.value = state.setup_spec_file_path || '';
-            // Only unlock edits if setup completely failed
-            specInput.readOnly = currentProjectState.setup_status !== 'failed';
-            if (!specInput.readOnly) {
-                specInput.classList.remove('bg-white', 'dark:bg-slate-900', 'cursor-not-allowed', 'border-slate-300', 'dark:border-slate-600');
-                specInput.classList.add('bg-amber-50', 'dark:bg-amber-900/40', 'border-amber-400');
-            } else {
-                specInput.classList.add('bg-white', 'dark:bg-slate-900', 'cursor-not-allowed', 'border-slate-300', 'dark:border-slate-600');
-                specInput.classList.remove('bg-amber-50', 'dark:bg-amber-900/40', 'border-amber-400');
-            }
-        }
+function applyProjectState(state, options = {}) {
+    const { preserveView = false } = options;
+    currentProjectState = {
+        setup_status: state.setup_status || 'failed',
+        setup_error: state.setup_error || null,
+    };
 
-        if (currentProjectState.setup_status === 'failed') {
-            currentSprintId = null;
-            sprintMode = null;
-            showSprintPlanner = false;
-            setPhaseState('SETUP_REQUIRED', 'setup');
-        } else if (preserveView) {
-            const selectedSprint = ensureCurrentSprintSelection();
-            if (selectedSprint) {
-                sprintMode = getSprintMode(selectedSprint);
-            }
-            setPhaseState(stateKey, viewPhaseId);
+    const stateKey = normalizeStateKey(state.fsm_state);
+    const landing = resolveProjectLanding(stateKey);
+
+    const specInput = document.getElementById('setup-spec-path');
+    if (specInput) {
+        specInput.value = state.setup_spec_file_path || '';
+        // Only unlock edits if setup completely failed
+        specInput.readOnly = currentProjectState.setup_status !== 'failed';
+        if (!specInput.readOnly) {
+            specInput.classList.remove('bg-white', 'dark:bg-slate-900', 'cursor-not-allowed', 'border-slate-300', 'dark:border-slate-600');
+            specInput.classList.add('bg-amber-50', 'dark:bg-amber-900/40', 'border-amber-400');
         } else {
-            applyResolvedLanding(stateKey, landing);
-            setTimeout(runAutoLoadForVisiblePhase, 500);
+            specInput.classList.add('bg-white', 'dark:bg-slate-900', 'cursor-not-allowed', 'border-slate-300', 'dark:border-slate-600');
+            specInput.classList.remove('bg-amber-50', 'dark:bg-amber-900/40', 'border-amber-400');
         }
+    }
 
-        updateSetupStatusBanner();
-        updateRetryButton();
-        updateNextButton();
-    } catch (error) {
-        console.error('Error fetching project state:', error);
-        currentProjectState = { setup_status: 'failed', setup_error: 'Failed to load state.' };
+    if (currentProjectState.setup_status === 'failed') {
         currentSprintId = null;
         sprintMode = null;
         showSprintPlanner = false;
         setPhaseState('SETUP_REQUIRED', 'setup');
-        updateSetupStatusBanner();
+    } else if (preserveView) {
+        const selectedSprint = ensureCurrentSprintSelection();
+        if (selectedSprint) {
+            sprintMode = getSprintMode(selectedSprint);
+        }
+        setPhaseState(stateKey, viewPhaseId);
+    } else {
+        applyResolvedLanding(stateKey, landing);
+        setTimeout(runAutoLoadForVisiblePhase, 500);
     }
+
+    updateSetupStatusBanner();
+    updateRetryButton();
+    updateNextButton();
+}
+
+const LIVE_SPRINT_ENTITIES = new Set([
+    'sprints',
+    'sprint_stories',
+    'tasks',
+    'task_execution_logs',
+    'story_completion_logs',
+]);
+
+function mergeProjectStateEvent(snapshot, payload) {
+    if (payload.full) return { ...(payload.state || {}) };
+    return { ...(snapshot || {}), ...(payload.changes || {}) };
+}
+
+function isLiveChannelOpen() {
+    return liveEvents !== null && liveEvents.readyState === EventSource.OPEN;
+}
+
+function scheduleLiveSprintRefresh() {
+    clearTimeout(liveSprintRefreshTimer);
+    liveSprintRefreshTimer = setTimeout(() => {
+        loadSavedSprints();
+    }, 300);
+}
+
+function connectLiveUpdates(projectId) {
+    if (typeof EventSource === 'undefined' || liveEvents) return;
+    liveEvents = new EventSource(`/api/projects/${projectId}/events`);
+
+    liveEvents.addEventListener('state', (event) => {
+        const payload = JSON.parse(event.data);
+        const previous = liveProjectState;
+        liveProjectState = mergeProjectStateEvent(previous, payload);
+        // The opening snapshot matches the state we just fetched.
+        const unchanged = payload.full && previous
+            && JSON.stringify(previous) === JSON.stringify(liveProjectState);
+        if (!unchanged) applyProjectState(liveProjectState, { preserveView: true });
+    });
+    liveEvents.addEventListener('entity_change', (event) => {
+        const change = JSON.parse(event.data);
+        if (LIVE_SPRINT_ENTITIES.has(change.entity)) {
+            scheduleLiveSprintRefresh();
+        } else if (change.entity === 'products') {
+            // The effective setup state also depends on the project row.
+            fetchProjectFSMState(projectId, { preserveView: true });
+        }
+    });
+    liveEvents.addEventListener('resync', () => {
+        scheduleLiveSprintRefresh();
+    });
+}
+
+async function refreshProjectStateAfterAction() {
+    // With the live channel open the server pushes the resulting state delta.
+    if (isLiveChannelOpen()) return;
+    await fetchProjectFSMState(selectedProjectId, { preserveView: true });
 }
 
 async function retryProjectSetup() {
@@ -998,18 +1151,11 @@ async function generateVisionDraft() {
     }
 
     try {
-        const response = await fetch(`/api/projects/${selectedProjectId}/vision/generate`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ user_input: userInput }),
-        });
-
-        if (response.status >= 400) {
-            const errorBody = await response.json();
-            throw new Error(errorBody.detail || 'Vision generation failed');
-        }
-
-        const data = await response.json();
+        const data = await streamGeneration(
+            `/api/projects/${selectedProjectId}/vision/generate/stream`,
+            { user_input: userInput },
+            button,
+        );
         if (data.status !== 'success') {
             throw new Error('Vision generation failed');
         }
@@ -1067,7 +1213,7 @@ async function saveVisionDraft() {
         latestVisionIsComplete = true;
         success = true;
 
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
 
         if (button) {
             button.innerHTML = '<span class="material-symbols-outlined text-sm">check_circle</span> Saved Successfully!';
@@ -1304,18 +1450,11 @@ async function generateBacklogDraft() {
     }
 
     try {
-        const response = await fetch(`/api/projects/${selectedProjectId}/backlog/generate`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ user_input: userInput }),
-        });
-
-        if (response.status >= 400) {
-            const errorBody = await response.json();
-            throw new Error(errorBody.detail || 'Backlog generation failed');
-        }
-
-        const data = await response.json();
+        const data = await streamGeneration(
+            `/api/projects/${selectedProjectId}/backlog/generate/stream`,
+            { user_input: userInput },
+            button,
+        );
         if (data.status !== 'success') {
             throw new Error('Backlog generation failed');
         }
@@ -1373,7 +1512,7 @@ async function saveBacklogDraft() {
         latestBacklogIsComplete = true;
         success = true;
 
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
 
         if (button) {
             button.innerHTML = '<span class="material-symbols-outlined text-sm">check_circle</span> Saved Successfully!';
@@ -1630,18 +1769,11 @@ async function generateRoadmapDraft() {
     }
 
     try {
-        const response = await fetch(`/api/projects/${selectedProjectId}/roadmap/generate`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ user_input: userInput }),
-        });
-
-        if (response.status >= 400) {
-            const errorBody = await response.json();
-            throw new Error(errorBody.detail || 'Roadmap generation failed');
-        }
-
-        const data = await response.json();
+        const data = await streamGeneration(
+            `/api/projects/${selectedProjectId}/roadmap/generate/stream`,
+            { user_input: userInput },
+            button,
+        );
         if (data.status !== 'success') {
             throw new Error('Roadmap generation failed');
         }
@@ -1699,7 +1831,7 @@ async function saveRoadmapDraft() {
         latestRoadmapIsComplete = true;
         success = true;
 
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
 
         if (button) {
             button.innerHTML = '<span class="material-symbols-outlined text-sm">check_circle</span> Saved Successfully!';
@@ -2262,18 +2394,11 @@ async function generateStoryDraft() {
     }
 
     try {
-        const response = await fetch(`/api/projects/${selectedProjectId}/story/generate?parent_requirement=${encodeURIComponent(activeStoryReq)}`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ user_input: userInput }),
-        });
-
-        if (response.status >= 400) {
-            const errorBody = await response.json();
-            throw new Error(errorBody.detail || 'Generation failed');
-        }
-
-        const data = await response.json();
+        const data = await streamGeneration(
+            `/api/projects/${selectedProjectId}/story/generate/stream?parent_requirement=${encodeURIComponent(activeStoryReq)}`,
+            { user_input: userInput },
+            button,
+        );
         if (data.status !== 'success') throw new Error('Generation failed');
 
         // reload data
@@ -3046,7 +3171,7 @@ async function startCurrentSprint() {
         }
 
         await loadSavedSprints();
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
         await selectSavedSprintById(savedSprint.id);
     } catch (error) {
         console.error(error);
@@ -3122,7 +3247,7 @@ async function confirmSprintClose() {
         }
 
         await loadSavedSprints();
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
         await selectSavedSprintById(currentSprintId);
     } catch (error) {
         console.error(error);
@@ -3366,18 +3491,11 @@ async function generateSprintDraft() {
             payload.selected_story_ids = selectedStoryIds;
         }
 
-        const response = await fetch(`/api/projects/${selectedProjectId}/sprint/generate`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(payload),
-        });
-
-        if (response.status >= 400) {
-            const errorBody = await response.json();
-            throw new Error(errorBody.detail || 'Sprint generation failed');
-        }
-
-        const data = await response.json();
+        const data = await streamGeneration(
+            `/api/projects/${selectedProjectId}/sprint/generate/stream`,
+            payload,
+            button,
+        );
         if (data.status !== 'success') throw new Error('Sprint generation failed');
 
         latestSprintIsComplete = Boolean(data.data?.is_complete);
@@ -3457,7 +3575,7 @@ async function saveSprintDraft() {
         success = true;
 
         await loadSavedSprints();
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
         if (currentSprintId) {
             await selectSavedSprintById(currentSprintId);
         }
@@ -4137,7 +4255,7 @@ async function submitTaskExecution(event, sprintId, taskId) {
         
         const data = await res.json();
         if (!res.ok) throw new Error(data.detail?.map(d => d.msg).join(' ') || data.detail || "Failed to save execution");
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
         await loadSavedSprints();
         await selectSavedSprintById(sprintId);
     } catch (err) {
@@ -4295,7 +4413,7 @@ async function submitStoryClose(event, sprintId, storyId) {
         const data = await res.json();
         if (!res.ok) throw new Error(data.detail?.map ? data.detail.map(d => d.msg).join(' ') : data.detail || "Failed to close story");
         
-        await fetchProjectFSMState(selectedProjectId, { preserveView: true });
+        await refreshProjectStateAfterAction();
         await loadSavedSprints();
         await selectSavedSprintById(sprintId);
     } catch (err) {
@@ -4,7 +4,17 @@ from __future__ import annotations
 
 from importlib import import_module
 
-__all__ = ["agent_workbench", "core", "db", "enums", "events", "specs"]
+__all__ = [
+    "agent_workbench",
+    "blobs",
+    "changes",
+    "core",
+    "db",
+    "enums",
+    "events",
+    "packets",
+    "specs",
+]
 
 
 def __getattr__(name: str) -> object:
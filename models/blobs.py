@@ -0,0 +1,59 @@
+"""Content-addressed blob storage SQLModel classes."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from datetime import UTC, datetime
+
+from sqlalchemy import func
+from sqlalchemy.types import LargeBinary
+from sqlmodel import Field, SQLModel
+
+BLOB_REF_PREFIX = "blob:sha256:"
+BLOB_REF_PATTERN = re.compile(rf"{re.escape(BLOB_REF_PREFIX)}([0-9a-f]{{64}})")
+_DIGEST_LENGTH = 64
+
+
+def content_digest(text: str) -> str:
+    """Return the SHA-256 hex digest addressing ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def blob_ref(digest: str) -> str:
+    """Return the reference string stored in place of the blob's text."""
+    return f"{BLOB_REF_PREFIX}{digest}"
+
+
+def blob_ref_digest(value: object) -> str | None:
+    """Return the digest when ``value`` is a blob reference, else ``None``."""
+    if not isinstance(value, str) or not value.startswith(BLOB_REF_PREFIX):
+        return None
+    digest = value.removeprefix(BLOB_REF_PREFIX)
+    return digest if len(digest) == _DIGEST_LENGTH else None
+
+
+class ContentBlob(SQLModel, table=True):
+    """Compressed text keyed by its SHA-256, shared by every referrer.
+
+    Rows are not reference counted: ``touched_at`` moves whenever a slot is
+    pointed at the blob, and rows no saved session state references are swept
+    once they are older than a grace period.
+    """
+
+    __tablename__ = "content_blobs"  # type: ignore[assignment]
+
+    digest: str = Field(primary_key=True, max_length=64)
+    compression: str = Field(default="zlib", max_length=16)
+    size_bytes: int = Field(description="Uncompressed UTF-8 size")
+    data: bytes = Field(sa_type=LargeBinary)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+    touched_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
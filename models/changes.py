@@ -0,0 +1,243 @@
+"""Change-data-capture log of business entity writes.
+
+Every ORM flush that inserts, updates or deletes a row of a ``models.core``,
+``models.specs`` or ``models.events`` class appends one compact record per row
+to ``entity_changes``. ``seq`` is the table's autoincrement key, so readers
+resume from the last ``seq`` they saw; ``version`` counts changes per entity.
+Bulk ORM ``update()``/``delete()`` statements are captured from their WHERE
+criteria before they run; raw SQL writers call ``record_entity_changes``.
+
+``product_id`` is the owning product: the row's own column, or for child rows
+without one (tasks, sprint links, compiled authorities, logs) the product of
+the parent reached through ``_OWNER_LINKS``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from functools import cache
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
+
+from sqlalchemy import Index, event, func, select, text
+from sqlalchemy.orm import Mapper, Session, object_mapper
+from sqlmodel import Field, SQLModel
+from sqlmodel.main import default_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.engine import Connection, Result
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlalchemy.sql.dml import Delete, Update
+
+type ChangeOp = Literal["insert", "update", "delete"]
+
+_TRACKED_MODULES: Final = frozenset({"models.core", "models.specs", "models.events"})
+# Tracked tables without ``product_id``: the foreign key column leading to the
+# row that owns them, and that row's table.
+_OWNER_LINKS: Final[dict[str, tuple[str, str]]] = {
+    "tasks": ("story_id", "user_stories"),
+    "sprint_stories": ("sprint_id", "sprints"),
+    "story_completion_logs": ("story_id", "user_stories"),
+    "task_execution_logs": ("task_id", "tasks"),
+    "compiled_spec_authority": ("spec_version_id", "spec_registry"),
+}
+
+
+class EntityChange(SQLModel, table=True):
+    """One committed insert, update or delete of a tracked entity row."""
+
+    __tablename__ = "entity_changes"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_entity_changes_entity_id", "entity", "entity_id", "version"),
+    )
+
+    seq: int | None = Field(default=None, primary_key=True)
+    entity: str = Field(max_length=64, description="Table name of the changed row")
+    entity_id: str = Field(
+        max_length=128,
+        description="Primary key, colon-joined for composite keys",
+    )
+    op: str = Field(max_length=8, description="insert | update | delete")
+    version: int = Field(description="Per-entity change counter, starting at 1")
+    product_id: int | None = Field(default=None, index=True)
+    changed_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+
+
+_APPEND_CHANGE = text(
+    "INSERT INTO entity_changes (entity, entity_id, op, version, product_id) "
+    "SELECT :entity, :entity_id, :op, COALESCE(MAX(version), 0) + 1, :product_id "
+    "FROM entity_changes WHERE entity = :entity AND entity_id = :entity_id"
+)
+
+
+@cache
+def _mapper_for_table(table: str) -> Mapper[Any] | None:
+    return next(
+        (
+            mapper
+            for mapper in default_registry.mappers
+            if getattr(mapper.class_, "__tablename__", None) == table
+        ),
+        None,
+    )
+
+
+def _owner_column(table: str) -> str | None:
+    if table in _OWNER_LINKS:
+        return _OWNER_LINKS[table][0]
+    mapper = _mapper_for_table(table)
+    return "product_id" if mapper and "product_id" in mapper.columns else None
+
+
+class _ProductResolver:
+    """Resolve the product owning a tracked row, caching parent lookups."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._parents: dict[tuple[str, object], int | None] = {}
+
+    def resolve(self, table: str, owner: object) -> int | None:
+        """Return the product for a row whose owner column holds ``owner``."""
+        if table not in _OWNER_LINKS:
+            return owner if isinstance(owner, int) else None
+        parent_table = _OWNER_LINKS[table][1]
+        if owner is None:
+            return None
+        key = (parent_table, owner)
+        if key not in self._parents:
+            self._parents[key] = self.resolve(
+                parent_table, self._parent_owner(parent_table, owner)
+            )
+        return self._parents[key]
+
+    def _parent_owner(self, table: str, key: object) -> object:
+        column = _owner_column(table)
+        mapper = _mapper_for_table(table)
+        if column is None or mapper is None:
+            return None
+        # Checked first: parents deleted in this flush are gone from the table.
+        parent = self._session.identity_map.get(
+            mapper.identity_key_from_primary_key((key,))
+        )
+        if parent is not None:
+            return getattr(parent, column, None)
+        primary_key = mapper.primary_key[0]
+        return (
+            self._session.connection()
+            .execute(select(mapper.columns[column]).where(primary_key == key))
+            .scalar()
+        )
+
+
+def _change_record(
+    obj: object, op: ChangeOp, products: _ProductResolver
+) -> dict[str, object] | None:
+    if type(obj).__module__ not in _TRACKED_MODULES:
+        return None
+    table = getattr(obj, "__tablename__", None)
+    if not isinstance(table, str):
+        return None
+    key = object_mapper(obj).primary_key_from_instance(obj)
+    if any(value is None for value in key):
+        return None
+    column = _owner_column(table)
+    return {
+        "entity": table,
+        "entity_id": ":".join(str(value) for value in key),
+        "op": op,
+        "product_id": products.resolve(
+            table, getattr(obj, column, None) if column else None
+        ),
+    }
+
+
+def record_entity_changes(
+    connection: Connection,
+    table: str,
+    op: ChangeOp,
+    rows: Iterable[Sequence[object]],
+) -> None:
+    """Append change records for rows written by raw SQL.
+
+    Each row is the primary key values followed by ``product_id``.
+    """
+    records = [
+        {
+            "entity": table,
+            "entity_id": ":".join(str(value) for value in row[:-1]),
+            "op": op,
+            "product_id": row[-1],
+        }
+        for row in rows
+    ]
+    if records:
+        connection.execute(_APPEND_CHANGE, records)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_entity_changes(session: Session, _flush_context: object) -> None:
+    """Append a change record for every tracked row written by this flush.
+
+    Runs inside the flush transaction, so records commit or roll back together
+    with the rows they describe.
+    """
+    candidates: list[tuple[object, ChangeOp]] = [
+        *((obj, "insert") for obj in session.new),
+        *(
+            (obj, "update")
+            for obj in session.dirty
+            if session.is_modified(obj, include_collections=False)
+        ),
+        *((obj, "delete") for obj in session.deleted),
+    ]
+    products = _ProductResolver(session)
+    records = [
+        record
+        for obj, op in candidates
+        if (record := _change_record(obj, op, products)) is not None
+    ]
+    if records:
+        session.connection().execute(_APPEND_CHANGE, records)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_entity_changes(
+    orm_execute_state: ORMExecuteState,
+) -> Result[Any] | None:
+    """Append change records for rows hit by a bulk UPDATE or DELETE.
+
+    The rows are read with the statement's own criteria before it runs, so
+    deleted rows and their owners can still be resolved.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_.__module__ not in _TRACKED_MODULES:
+        return None
+    table = cast("str", mapper.class_.__tablename__)
+    column = _owner_column(table)
+    owner = [mapper.columns[column]] if column else []
+    statement = cast("Update | Delete", orm_execute_state.statement)
+    affected = select(*mapper.primary_key, *owner)
+    if statement.whereclause is not None:
+        affected = affected.where(statement.whereclause)
+    session = orm_execute_state.session
+    products = _ProductResolver(session)
+    width = len(mapper.primary_key)
+    rows = [
+        (*row[:width], products.resolve(table, row[width] if column else None))
+        for row in session.connection().execute(affected)
+    ]
+    result = orm_execute_state.invoke_statement()
+    record_entity_changes(
+        session.connection(),
+        table,
+        "update" if orm_execute_state.is_update else "delete",
+        rows,
+    )
+    return result
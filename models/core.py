@@ -1,13 +1,16 @@
 """Core SQLModel classes extracted from the legacy shim."""
 
 from datetime import UTC, date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import func
-from sqlalchemy.schema import UniqueConstraint
+from sqlalchemy import bindparam, event, func, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.schema import Index, UniqueConstraint
 from sqlalchemy.types import Date, Text
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, col
 
+from models.changes import record_entity_changes
 from models.enums import (
     SprintStatus,
     StoryResolution,
@@ -16,9 +19,14 @@ from models.enums import (
     TeamRole,
     TimeFrame,
 )
+from utils.story_inputs import compute_story_input_hash, evidence_input_hash
 from utils.task_metadata import canonical_task_metadata_json
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Result
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlalchemy.sql.dml import Delete, Update
+
     from models.specs import SpecRegistry
 
 
@@ -66,6 +74,12 @@ class Product(SQLModel, table=True):
         default=None,
         description="When the specification was saved to this product",
     )
+    structure_version: int = Field(
+        default=0,
+        nullable=False,
+        sa_column_kwargs={"server_default": "0"},
+        description="Bumped on every hierarchy, story, sprint or spec write",
+    )
 
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
@@ -152,7 +166,9 @@ class SprintStory(SQLModel, table=True):
 
     __tablename__ = "sprint_stories"  # type: ignore[assignment]
     sprint_id: int = Field(foreign_key="sprints.sprint_id", primary_key=True)
-    story_id: int = Field(foreign_key="user_stories.story_id", primary_key=True)
+    story_id: int = Field(
+        foreign_key="user_stories.story_id", primary_key=True, index=True
+    )
     added_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         sa_column_kwargs={"server_default": func.now()},
@@ -164,6 +180,7 @@ class Sprint(SQLModel, table=True):
     """A time-boxed iteration of work for a team."""
 
     __tablename__ = "sprints"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_sprints_product_id_status", "product_id", "status"),)
     sprint_id: int | None = Field(default=None, primary_key=True)
     goal: str | None = Field(default=None, sa_type=Text)
     start_date: date = Field(sa_type=Date)
@@ -248,6 +265,10 @@ class Epic(SQLModel, table=True):
     )
 
     theme_id: int = Field(foreign_key="themes.theme_id")
+    # Denormalized from the theme (see _denormalize_roadmap_product_ids).
+    product_id: int | None = Field(
+        default=None, foreign_key="products.product_id", index=True
+    )
 
     theme: "Theme" = Relationship(back_populates="epics")
     features: list["Feature"] = Relationship(back_populates="epic")
@@ -275,6 +296,10 @@ class Feature(SQLModel, table=True):
     )
 
     epic_id: int = Field(foreign_key="epics.epic_id")
+    # Denormalized from the epic (see _denormalize_roadmap_product_ids).
+    product_id: int | None = Field(
+        default=None, foreign_key="products.product_id", index=True
+    )
 
     epic: "Epic" = Relationship(back_populates="features")
     stories: list["UserStory"] = Relationship(back_populates="feature")
@@ -346,6 +371,17 @@ class UserStory(SQLModel, table=True):
         sa_type=Text,
         description="JSON: validation results, rules checked, invariants applied",
     )
+    story_input_hash: str | None = Field(
+        default=None,
+        max_length=64,
+        description="SHA-256 of title, description and acceptance criteria",
+    )
+    validation_stale: bool = Field(
+        default=False,
+        nullable=False,
+        index=True,
+        description="Evidence predates the current story text or pinned authority",
+    )
 
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
@@ -362,7 +398,9 @@ class UserStory(SQLModel, table=True):
     )
 
     product_id: int = Field(foreign_key="products.product_id", index=True)
-    feature_id: int | None = Field(default=None, foreign_key="features.feature_id")
+    feature_id: int | None = Field(
+        default=None, foreign_key="features.feature_id", index=True
+    )
 
     product: "Product" = Relationship(back_populates="stories")
     feature: Feature | None = Relationship(back_populates="stories")
@@ -400,7 +438,7 @@ class Task(SQLModel, table=True):
         nullable=False,
     )
 
-    story_id: int = Field(foreign_key="user_stories.story_id")
+    story_id: int = Field(foreign_key="user_stories.story_id", index=True)
     assigned_to_member_id: int | None = Field(
         default=None, foreign_key="team_members.member_id"
     )
@@ -433,6 +471,153 @@ class ProductPersona(SQLModel, table=True):
     )
 
 
+_SELECT_MOVED_FEATURES = text(
+    "SELECT feature_id, :product_id FROM features "
+    "WHERE epic_id = :epic_id AND product_id IS NOT :product_id"
+)
+_MOVE_EPIC_FEATURES = text(
+    "UPDATE features SET product_id = :product_id "
+    "WHERE epic_id = :epic_id AND product_id IS NOT :product_id"
+)
+
+
+@event.listens_for(Epic, "before_insert")
+@event.listens_for(Epic, "before_update")
+def _denormalize_epic_product_id(
+    _mapper: object, connection: "Connection", epic: Epic
+) -> None:
+    """Copy ``product_id`` from the theme onto new or re-parented epics.
+
+    A re-parented epic carries its features to the new product.
+    """
+    reparented = get_history(epic, "theme_id").has_changes()
+    if epic.product_id is not None and not reparented:
+        return
+    epic.product_id = connection.execute(
+        select(col(Theme.product_id)).where(col(Theme.theme_id) == epic.theme_id)
+    ).scalar()
+    if epic.epic_id is None:
+        return
+    params = {"product_id": epic.product_id, "epic_id": epic.epic_id}
+    features = connection.execute(_SELECT_MOVED_FEATURES, params).all()
+    if features:
+        connection.execute(_MOVE_EPIC_FEATURES, params)
+        record_entity_changes(connection, "features", "update", features)
+
+
+@event.listens_for(Feature, "before_insert")
+@event.listens_for(Feature, "before_update")
+def _denormalize_feature_product_id(
+    _mapper: object, connection: "Connection", feature: Feature
+) -> None:
+    """Copy ``product_id`` from the epic onto new or re-parented features."""
+    if feature.product_id is None or get_history(feature, "epic_id").has_changes():
+        feature.product_id = connection.execute(
+            select(col(Epic.product_id)).where(col(Epic.epic_id) == feature.epic_id)
+        ).scalar()
+
+
+_STORY_INPUT_FIELDS = ("title", "story_description", "acceptance_criteria")
+
+
+@event.listens_for(UserStory, "before_insert")
+@event.listens_for(UserStory, "before_update")
+def _track_story_validation_freshness(
+    _mapper: object, _connection: "Connection", story: UserStory
+) -> None:
+    """Maintain ``story_input_hash`` and flag evidence the story has outgrown.
+
+    New evidence is stale only when it was computed for other text. Without
+    new evidence, a text edit or a re-pin marks the existing evidence stale
+    until validation replaces it (see ``services.specs.revalidation``).
+    """
+    text_changed = story.story_input_hash is None or any(
+        get_history(story, field).has_changes() for field in _STORY_INPUT_FIELDS
+    )
+    if text_changed:
+        story.story_input_hash = compute_story_input_hash(story)
+
+    if story.validation_evidence is None:
+        story.validation_stale = False
+    elif get_history(story, "validation_evidence").has_changes():
+        story.validation_stale = (
+            evidence_input_hash(story.validation_evidence) != story.story_input_hash
+        )
+    elif get_history(story, "accepted_spec_version_id").has_changes():
+        story.validation_stale = True
+    elif text_changed:
+        story.validation_stale = story.validation_stale or (
+            evidence_input_hash(story.validation_evidence) != story.story_input_hash
+        )
+
+
+# Tables whose writes change a product's structure summary; see
+# services.project_structure.
+_STRUCTURE_TABLES = frozenset(
+    {"themes", "epics", "features", "user_stories", "sprints", "spec_registry"}
+)
+_BUMP_STRUCTURE_VERSION = text(
+    "UPDATE products SET structure_version = structure_version + 1 "
+    "WHERE product_id IN :product_ids"
+).bindparams(bindparam("product_ids", expanding=True))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_product_structure_versions(session: Session, _flush_context: object) -> None:
+    """Bump ``structure_version`` for products whose structure rows changed.
+
+    Runs after the flush so keys of rows linked only through relationships
+    are populated, and inside its transaction so the bump commits with them.
+    """
+    product_ids: set[object] = set()
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        if getattr(obj, "__tablename__", None) in _STRUCTURE_TABLES:
+            # A re-parented row also changes the product it left.
+            product_ids.update(get_history(obj, "product_id").sum())
+    product_ids.discard(None)
+    if product_ids:
+        session.connection().execute(
+            _BUMP_STRUCTURE_VERSION, {"product_ids": sorted(product_ids)}
+        )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_structure_versions_for_bulk_writes(
+    orm_execute_state: "ORMExecuteState",
+) -> "Result[Any] | None":
+    """Bump ``structure_version`` for bulk UPDATE/DELETE of structure rows.
+
+    Bulk statements bypass the unit of work, so the affected products are read
+    with the statement's own criteria before it runs.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    table = getattr(mapper, "local_table", None)
+    if (
+        table is None
+        or table.name not in _STRUCTURE_TABLES
+        or "product_id" not in table.c
+    ):
+        return None
+    statement = cast("Update | Delete", orm_execute_state.statement)
+    affected = select(table.c.product_id).distinct()
+    if statement.whereclause is not None:
+        affected = affected.where(statement.whereclause)
+    session = orm_execute_state.session
+    product_ids = {
+        product_id
+        for product_id in session.connection().execute(affected).scalars()
+        if product_id is not None
+    }
+    result = orm_execute_state.invoke_statement()
+    if product_ids:
+        session.connection().execute(
+            _BUMP_STRUCTURE_VERSION, {"product_ids": sorted(product_ids)}
+        )
+    return result
+
+
 # Import the compatibility shim after defining core models so direct
 # `import models.core` remains safe and legacy re-exports stay wired up.
 import agile_sqlmodel  # noqa: E402,F401  pylint: disable=wrong-import-position,unused-import
@@ -14,6 +14,9 @@ from sqlmodel import SQLModel, create_engine
 
 from db.migrations import ensure_schema_current
 from models import agent_workbench as _agent_workbench_models  # noqa: F401
+from models import blobs as _blob_models  # noqa: F401
+from models import changes as _change_models  # noqa: F401
+from models import packets as _packet_models  # noqa: F401
 from utils.runtime_config import get_business_db_target, get_database_echo
 
 if TYPE_CHECKING:
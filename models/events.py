@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import func
+from sqlalchemy import Index, UniqueConstraint, event, func, literal_column
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 from sqlalchemy.types import Text
 from sqlmodel import Field, SQLModel
 
@@ -15,6 +19,19 @@ from models.enums import (
     TaskStatus,
     WorkflowEventType,
 )
+from utils.workflow_rollups import (
+    GRANULARITIES,
+    NO_PRODUCT_ID,
+    RollupTotals,
+    bucket_start,
+    dump_histogram,
+    merge_histograms_sql,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.dialects.sqlite import Insert
 
 
 class TaskExecutionLog(SQLModel, table=True):
@@ -67,6 +84,15 @@ class WorkflowEvent(SQLModel, table=True):
     """Workflow event metrics and audit history."""
 
     __tablename__ = "workflow_events"  # type: ignore[assignment]
+    __table_args__ = (
+        # Per-product metric windows filter on product and type, then time.
+        Index(
+            "ix_workflow_events_product_type_timestamp",
+            "product_id",
+            "event_type",
+            "timestamp",
+        ),
+    )
     event_id: int | None = Field(default=None, primary_key=True)
     event_type: WorkflowEventType = Field(nullable=False, index=True)
     timestamp: datetime = Field(
@@ -80,3 +106,165 @@ class WorkflowEvent(SQLModel, table=True):
     sprint_id: int | None = Field(default=None, foreign_key="sprints.sprint_id")
     session_id: str | None = Field(default=None, index=True)
     event_metadata: str | None = Field(default=None, sa_type=Text)
+
+
+class WorkflowEventRollup(SQLModel, table=True):
+    """Hourly and daily workflow event aggregates, maintained on insert.
+
+    ``state`` is the ``from_state`` of ``FSM_STATE_DWELL`` events (empty for
+    other types) so dwell metrics need no JSON decoding at read time. Events
+    without a product roll up under ``product_id`` ``NO_PRODUCT_ID``.
+    """
+
+    __tablename__ = "workflow_event_rollups"  # type: ignore[assignment]
+    __table_args__ = (
+        UniqueConstraint(
+            "granularity",
+            "bucket_start",
+            "product_id",
+            "event_type",
+            "state",
+            name="uq_workflow_event_rollups_key",
+        ),
+        Index(
+            "ix_workflow_event_rollups_product_bucket",
+            "product_id",
+            "granularity",
+            "bucket_start",
+        ),
+    )
+    rollup_id: int | None = Field(default=None, primary_key=True)
+    granularity: str = Field(max_length=8)
+    bucket_start: datetime
+    product_id: int = Field(default=NO_PRODUCT_ID)
+    event_type: WorkflowEventType
+    state: str = Field(default="", max_length=100)
+    event_count: int = Field(default=0)
+    duration_count: int = Field(default=0)
+    duration_total: float = Field(default=0.0)
+    duration_min: float | None = Field(default=None)
+    duration_max: float | None = Field(default=None)
+    duration_histogram: str = Field(default="{}", sa_type=Text)
+    turn_count_total: int = Field(default=0)
+    turn_count_events: int = Field(default=0)
+
+
+type _RollupKey = tuple[str, datetime, int, WorkflowEventType, str]
+
+
+def workflow_event_state(event_type: object, metadata: str | None) -> str:
+    """Return the rollup ``state`` dimension for one event."""
+    if event_type != WorkflowEventType.FSM_STATE_DWELL or not metadata:
+        return ""
+    try:
+        from_state = json.loads(metadata).get("from_state")
+    except (ValueError, AttributeError):
+        return ""
+    return from_state[:100] if isinstance(from_state, str) else ""
+
+
+def _rollup_keys(event: WorkflowEvent) -> list[_RollupKey]:
+    timestamp = event.timestamp or datetime.now(UTC)
+    state = workflow_event_state(event.event_type, event.event_metadata)
+    return [
+        (
+            granularity,
+            bucket_start(timestamp, granularity),
+            NO_PRODUCT_ID if event.product_id is None else event.product_id,
+            event.event_type,
+            state,
+        )
+        for granularity in GRANULARITIES
+    ]
+
+
+def _rollup_upsert() -> Insert:
+    table = cast("Any", WorkflowEventRollup).__table__
+    statement = sqlite_insert(table)
+    existing, excluded = table.c, statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=[
+            existing.granularity,
+            existing.bucket_start,
+            existing.product_id,
+            existing.event_type,
+            existing.state,
+        ],
+        set_={
+            "event_count": existing.event_count + excluded.event_count,
+            "duration_count": existing.duration_count + excluded.duration_count,
+            "duration_total": existing.duration_total + excluded.duration_total,
+            # SQLite's scalar min()/max() return NULL if either side is NULL.
+            "duration_min": func.coalesce(
+                func.min(existing.duration_min, excluded.duration_min),
+                existing.duration_min,
+                excluded.duration_min,
+            ),
+            "duration_max": func.coalesce(
+                func.max(existing.duration_max, excluded.duration_max),
+                existing.duration_max,
+                excluded.duration_max,
+            ),
+            "duration_histogram": literal_column(
+                merge_histograms_sql(
+                    f"{table.name}.duration_histogram", "excluded.duration_histogram"
+                )
+            ),
+            "turn_count_total": existing.turn_count_total + excluded.turn_count_total,
+            "turn_count_events": (
+                existing.turn_count_events + excluded.turn_count_events
+            ),
+        },
+    )
+
+
+def apply_workflow_event_rollups(
+    session: Session, events: Iterable[WorkflowEvent]
+) -> None:
+    """Fold ``events`` into their hourly and daily rollup rows in ``session``.
+
+    Each bucket is an ``INSERT ... ON CONFLICT DO UPDATE`` of additive
+    columns, so concurrent writers opening the same bucket both land without
+    reading the row first.
+    """
+    deltas: dict[_RollupKey, RollupTotals] = {}
+    for workflow_event in events:
+        for key in _rollup_keys(workflow_event):
+            deltas.setdefault(key, RollupTotals()).add_event(
+                workflow_event.duration_seconds, workflow_event.turn_count
+            )
+    if not deltas:
+        return
+
+    session.connection().execute(
+        _rollup_upsert(),
+        [
+            {
+                "granularity": granularity,
+                "bucket_start": start,
+                "product_id": product_id,
+                "event_type": event_type,
+                "state": state,
+                "event_count": delta.event_count,
+                "duration_count": delta.duration_count,
+                "duration_total": delta.duration_total,
+                "duration_min": delta.duration_min,
+                "duration_max": delta.duration_max,
+                "duration_histogram": dump_histogram(delta.histogram),
+                "turn_count_total": delta.turn_count_total,
+                "turn_count_events": delta.turn_count_events,
+            }
+            for (granularity, start, product_id, event_type, state), delta in (
+                deltas.items()
+            )
+        ],
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _roll_up_new_workflow_events(
+    session: Session, _flush_context: object, _instances: object
+) -> None:
+    new_events = [obj for obj in session.new if isinstance(obj, WorkflowEvent)]
+    if new_events:
+        apply_workflow_event_rollups(session, new_events)
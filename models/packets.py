@@ -0,0 +1,28 @@
+"""Persisted packet cache SQLModel classes."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import func
+from sqlalchemy.types import LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class PacketCacheEntry(SQLModel, table=True):
+    """The latest built packet for one kind, id set and render flavor.
+
+    The entry is served only while ``fingerprint`` still matches the packet's
+    sources; a rebuild overwrites it in place.
+    """
+
+    __tablename__ = "packet_cache_entries"  # type: ignore[assignment]
+
+    cache_key: str = Field(primary_key=True, max_length=255)
+    fingerprint: str = Field(max_length=64)
+    data: bytes = Field(sa_type=LargeBinary, description="zlib-compressed JSON")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
@@ -5,10 +5,15 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import event, text
 from sqlalchemy.types import Text
 from sqlmodel import Field, Relationship, SQLModel
 
+from models.changes import record_entity_changes
+
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
     from models.core import Product
 
 
@@ -136,3 +141,29 @@ class SpecAuthorityAcceptance(SQLModel, table=True):
     compiler_version: str = Field(description="Compiler version at decision time")
     prompt_hash: str = Field(description="Prompt hash at decision time")
     spec_hash: str = Field(description="Spec hash at decision time")
+
+
+_PINNED_STORIES_WHERE = (
+    "WHERE accepted_spec_version_id = :spec_version_id "
+    "AND validation_evidence IS NOT NULL AND validation_stale IS NOT :stale"
+)
+_SELECT_PINNED_STORIES = text(
+    f"SELECT story_id, product_id FROM user_stories {_PINNED_STORIES_WHERE}"  # noqa: S608
+)
+_MARK_PINNED_STORIES_STALE = text(
+    f"UPDATE user_stories SET validation_stale = :stale {_PINNED_STORIES_WHERE}"  # noqa: S608
+)
+
+
+@event.listens_for(CompiledSpecAuthority, "after_insert")
+@event.listens_for(CompiledSpecAuthority, "after_update")
+@event.listens_for(CompiledSpecAuthority, "after_delete")
+def _mark_pinned_story_validation_stale(
+    _mapper: object, connection: Connection, authority: CompiledSpecAuthority
+) -> None:
+    """Flag validation evidence of stories pinned to a recompiled authority."""
+    params = {"stale": True, "spec_version_id": authority.spec_version_id}
+    stories = connection.execute(_SELECT_PINNED_STORIES, params).all()
+    if stories:
+        connection.execute(_MARK_PINNED_STORIES_STALE, params)
+        record_entity_changes(connection, "user_stories", "update", stories)
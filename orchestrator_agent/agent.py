@@ -7,33 +7,19 @@ from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.agent_tool import AgentTool
 
-from orchestrator_agent.agent_tools.backlog_primer.agent import (
-    root_agent as backlog_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.backlog_primer.tools import (
     save_backlog_tool,
 )
-from orchestrator_agent.agent_tools.product_vision_tool.agent import (
-    root_agent as vision_agent,
-)
 from orchestrator_agent.agent_tools.product_vision_tool.tools import (
     save_vision_tool,
 )
-from orchestrator_agent.agent_tools.roadmap_builder.agent import (
-    root_agent as roadmap_agent,
-)
 from orchestrator_agent.agent_tools.roadmap_builder.tools import (
     save_roadmap_tool,
 )
-from orchestrator_agent.agent_tools.sprint_planner_tool.agent import (
-    root_agent as sprint_planner_agent,
-)
 from orchestrator_agent.agent_tools.sprint_planner_tool.tools import (
     save_sprint_plan_tool,
 )
-from orchestrator_agent.agent_tools.user_story_writer_tool.agent import (
-    root_agent as story_writer_agent,
-)
 from orchestrator_agent.agent_tools.user_story_writer_tool.tools import (
     save_stories_tool,
 )
@@ -110,11 +96,11 @@ orchestrator_agent = Agent(
         # Story tools
         save_stories_tool,
         # Agent tools
-        AgentTool(agent=vision_agent),
-        AgentTool(agent=backlog_agent),
-        AgentTool(agent=roadmap_agent),
-        AgentTool(agent=sprint_planner_agent),
-        AgentTool(agent=story_writer_agent),
+        AgentTool(agent=get_agent("product_vision")),
+        AgentTool(agent=get_agent("backlog_primer")),
+        AgentTool(agent=get_agent("roadmap_builder")),
+        AgentTool(agent=get_agent("sprint_planner")),
+        AgentTool(agent=get_agent("user_story_writer")),
     ],
     instruction=instruction_text,
     output_key="orchestrator_response",
@@ -0,0 +1,150 @@
+"""Lazy registry for the ADK sub-agents.
+
+Agent modules used to build ``root_agent`` at import time: reading instruction
+files, resolving model config and constructing ``LiteLlm`` clients. Importing
+``api`` or any service therefore paid for every agent. The registry maps a
+stable agent name to its factory, builds each agent on first use and caches it.
+``prewarm`` lets the API build a chosen subset during startup instead.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from utils.runtime_metrics import RuntimeMetrics, runtime_metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from google.adk.agents import LlmAgent
+
+_TOOLS_PACKAGE = "orchestrator_agent.agent_tools"
+
+AGENT_FACTORIES: dict[str, str] = {
+    "product_vision": (
+        f"{_TOOLS_PACKAGE}.product_vision_tool.agent:create_product_vision_agent"
+    ),
+    "backlog_primer": (
+        f"{_TOOLS_PACKAGE}.backlog_primer.agent:create_backlog_primer_agent"
+    ),
+    "roadmap_builder": (
+        f"{_TOOLS_PACKAGE}.roadmap_builder.agent:create_roadmap_builder_agent"
+    ),
+    "sprint_planner": (
+        f"{_TOOLS_PACKAGE}.sprint_planner_tool.agent:create_sprint_planner_agent"
+    ),
+    "user_story_writer": (
+        f"{_TOOLS_PACKAGE}.user_story_writer_tool.agent:create_user_story_writer_agent"
+    ),
+    "spec_authority_compiler": (
+        f"{_TOOLS_PACKAGE}.spec_authority_compiler_agent.agent:"
+        "create_spec_authority_compiler_agent"
+    ),
+    "spec_validator": (
+        f"{_TOOLS_PACKAGE}.spec_validator_agent.agent:create_spec_validator_agent"
+    ),
+}
+
+
+class UnknownAgentError(KeyError):
+    """Raised when a caller asks for an agent name that is not registered."""
+
+
+class AgentRegistry:
+    """Build agents from their factories on first use and cache them."""
+
+    def __init__(
+        self,
+        factories: Mapping[str, str] | None = None,
+        *,
+        metrics: RuntimeMetrics = runtime_metrics,
+    ) -> None:
+        """Register ``module:function`` factory paths keyed by agent name."""
+        self._factories = dict(AGENT_FACTORIES if factories is None else factories)
+        self._metrics = metrics
+        self._agents: dict[str, LlmAgent] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return the registered agent names."""
+        return tuple(self._factories)
+
+    def get(self, name: str) -> LlmAgent:
+        """Return the cached agent, building it on the first call."""
+        agent = self._agents.get(name)
+        if agent is not None:
+            return agent
+        with self._lock:
+            agent = self._agents.get(name)
+            if agent is None:
+                agent = self._build(name)
+                self._agents[name] = agent
+        return agent
+
+    def is_built(self, name: str) -> bool:
+        """Return whether ``name`` has already been constructed."""
+        return name in self._agents
+
+    def prewarm(self, names: Iterable[str] | None = None) -> dict[str, float]:
+        """Build the given agents (all when ``None``) and return times in ms.
+
+        Agents that are already cached return immediately.
+        """
+        timings: dict[str, float] = {}
+        for name in self.names if names is None else names:
+            started = time.perf_counter()
+            self.get(name)
+            timings[name] = (time.perf_counter() - started) * 1000
+        return timings
+
+    def reset(self) -> None:
+        """Drop every cached agent so the next ``get`` rebuilds it."""
+        with self._lock:
+            self._agents.clear()
+
+    def _build(self, name: str) -> LlmAgent:
+        try:
+            target = self._factories[name]
+        except KeyError:
+            msg = f"Unknown agent {name!r}; expected one of {sorted(self._factories)}"
+            raise UnknownAgentError(msg) from None
+        module_name, _, factory_name = target.partition(":")
+        started = time.perf_counter()
+        factory: Callable[[], LlmAgent] = getattr(
+            importlib.import_module(module_name), factory_name
+        )
+        agent = factory()
+        self._metrics.observe_ms(
+            "agent_registry.build_ms",
+            (time.perf_counter() - started) * 1000,
+            labels={"agent": name},
+        )
+        return agent
+
+
+agent_registry = AgentRegistry()
+
+
+def get_agent(name: str) -> LlmAgent:
+    """Return the shared instance of a registered agent."""
+    return agent_registry.get(name)
+
+
+def root_agent_getattr(agent_name: str, module_name: str) -> Callable[[str], LlmAgent]:
+    """Return a module ``__getattr__`` exposing ``root_agent`` lazily.
+
+    ADK discovery and older imports still read ``<package>.root_agent``; this
+    keeps that attribute working without constructing the agent at import.
+    """
+
+    def __getattr__(name: str) -> LlmAgent:  # noqa: N807
+        if name == "root_agent":
+            return get_agent(agent_name)
+        msg = f"module {module_name!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    return __getattr__
@@ -1,5 +1,7 @@
 """Backlog primer agent tool package."""
 
-from orchestrator_agent.agent_tools.backlog_primer.agent import root_agent
+from orchestrator_agent.agent_registry import root_agent_getattr
 
 __all__ = ["root_agent"]
+
+__getattr__ = root_agent_getattr("backlog_primer", __name__)
@@ -11,6 +11,7 @@ from pathlib import Path
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+from orchestrator_agent.agent_registry import root_agent_getattr
 from utils.helper import load_instruction
 from utils.model_config import get_model_id, get_openrouter_extra_body
 from utils.runtime_config import get_backlog_primer_max_tokens, get_openrouter_api_key
@@ -18,28 +19,32 @@ from utils.runtime_config import get_backlog_primer_max_tokens, get_openrouter_a
 from .schemes import InputSchema, OutputSchema
 
 INSTRUCTIONS_PATH: Path = Path(__file__).parent / "instructions.txt"
-BACKLOG_INSTRUCTIONS = load_instruction(INSTRUCTIONS_PATH)
-
-_max_tokens = get_backlog_primer_max_tokens()
-model: LiteLlm = LiteLlm(
-    model=get_model_id("backlog_primer"),
-    api_key=get_openrouter_api_key(),
-    drop_params=True,
-    extra_body=get_openrouter_extra_body(),
-    max_tokens=_max_tokens,
-)
-
-root_agent: Agent = Agent(
-    name="backlog_primer_tool",
-    description=(
-        "An agent that produces an initial high-level product backlog "
-        "from a product vision and user input."
-    ),
-    model=model,
-    input_schema=InputSchema,
-    output_schema=OutputSchema,
-    output_key="product_backlog",
-    instruction=BACKLOG_INSTRUCTIONS,
-    disallow_transfer_to_parent=True,
-    disallow_transfer_to_peers=True,
-)
+
+
+def create_backlog_primer_agent() -> Agent:
+    """Create a fresh Backlog Primer agent instance."""
+    model: LiteLlm = LiteLlm(
+        model=get_model_id("backlog_primer"),
+        api_key=get_openrouter_api_key(),
+        drop_params=True,
+        extra_body=get_openrouter_extra_body(),
+        max_tokens=get_backlog_primer_max_tokens(),
+    )
+    return Agent(
+        name="backlog_primer_tool",
+        description=(
+            "An agent that produces an initial high-level product backlog "
+            "from a product vision and user input."
+        ),
+        model=model,
+        input_schema=InputSchema,
+        output_schema=OutputSchema,
+        output_key="product_backlog",
+        instruction=load_instruction(INSTRUCTIONS_PATH),
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+
+
+# Shared instance is built on first access through the agent registry.
+__getattr__ = root_agent_getattr("backlog_primer", __name__)
@@ -18,6 +18,7 @@ from models.core import Product
 from models.db import get_engine
 from models.enums import WorkflowEventType
 from models.events import WorkflowEvent
+from services.state_blobs import set_state_text
 from tools.spec_tools import (
     UpdateSpecAndCompileAuthorityInput,
     update_spec_and_compile_authority,
@@ -160,18 +161,14 @@ def save_vision_tool(
             # Also set it as the active selection.
             # Simplified Update: We only set what we know. We do not attempt to preserve 'structure'
             # or other fields from potentially non-existent previous state, as this caused crashes.
-            tool_context.state["active_project"] = {
+            active_project: dict[str, Any] = {
                 "product_id": p_id,
                 "name": vision_input.project_name,
                 "description": active_record.description if active_record else None,
                 "vision": vision_input.product_vision_statement,
                 "roadmap": roadmap_content,
-                "technical_spec": active_record.technical_spec
-                if active_record
-                else None,
-                "compiled_authority_json": active_record.compiled_authority_json
-                if active_record
-                else None,
+                "technical_spec": None,
+                "compiled_authority_json": None,
                 "spec_file_path": active_record.spec_file_path
                 if active_record
                 else None,
@@ -188,6 +185,15 @@ def save_vision_tool(
                     "user_stories": 0,
                 },
             }
+            if active_record:
+                # Spec text lives in content blobs; the state keeps references.
+                for key, text in (
+                    ("technical_spec", active_record.technical_spec),
+                    ("compiled_authority_json", active_record.compiled_authority_json),
+                ):
+                    set_state_text(active_project, key, text)
+                    active_project.setdefault(key, None)
+            tool_context.state["active_project"] = active_project
 
             # --- Link spec & compile authority (Pre-Phase completion) ---
             _link_spec_if_pending(p_id, tool_context)
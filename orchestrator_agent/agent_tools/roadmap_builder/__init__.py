@@ -1,5 +1,7 @@
 """Roadmap Builder Agent Package."""
 
-from .agent import root_agent
+from orchestrator_agent.agent_registry import root_agent_getattr
 
 __all__ = ["root_agent"]
+
+__getattr__ = root_agent_getattr("roadmap_builder", __name__)
@@ -5,6 +5,7 @@ from pathlib import Path
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+from orchestrator_agent.agent_registry import root_agent_getattr
 from utils.helper import load_instruction
 from utils.model_config import get_model_id, get_openrouter_extra_body
 from utils.runtime_config import get_openrouter_api_key, get_roadmap_builder_max_tokens
@@ -13,27 +14,29 @@ from .schemes import RoadmapBuilderInput, RoadmapBuilderOutput
 
 # Load instruction text
 INSTRUCTIONS_PATH: Path = Path(__file__).parent / "instructions.txt"
-ROADMAP_INSTRUCTIONS = load_instruction(INSTRUCTIONS_PATH)
-
-# Initialize Model
-_max_tokens = get_roadmap_builder_max_tokens()
-model: LiteLlm = LiteLlm(
-    model=get_model_id("roadmap_builder"),
-    api_key=get_openrouter_api_key(),
-    drop_params=True,
-    extra_body=get_openrouter_extra_body(),
-    max_tokens=_max_tokens,
-)
-
-# Initialize Agent
-root_agent: Agent = Agent(
-    name="roadmap_builder_tool",
-    description="Constructs a roadmap from the prioritized backlog and context.",
-    model=model,
-    input_schema=RoadmapBuilderInput,
-    output_schema=RoadmapBuilderOutput,
-    output_key="roadmap_result",
-    instruction=ROADMAP_INSTRUCTIONS,
-    disallow_transfer_to_parent=True,
-    disallow_transfer_to_peers=True,
-)
+
+
+def create_roadmap_builder_agent() -> Agent:
+    """Create a fresh Roadmap Builder agent instance."""
+    model: LiteLlm = LiteLlm(
+        model=get_model_id("roadmap_builder"),
+        api_key=get_openrouter_api_key(),
+        drop_params=True,
+        extra_body=get_openrouter_extra_body(),
+        max_tokens=get_roadmap_builder_max_tokens(),
+    )
+    return Agent(
+        name="roadmap_builder_tool",
+        description="Constructs a roadmap from the prioritized backlog and context.",
+        model=model,
+        input_schema=RoadmapBuilderInput,
+        output_schema=RoadmapBuilderOutput,
+        output_key="roadmap_result",
+        instruction=load_instruction(INSTRUCTIONS_PATH),
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+
+
+# Shared instance is built on first access through the agent registry.
+__getattr__ = root_agent_getattr("roadmap_builder", __name__)
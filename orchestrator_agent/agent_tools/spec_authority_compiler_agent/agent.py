@@ -3,6 +3,7 @@
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+from orchestrator_agent.agent_registry import root_agent_getattr
 from orchestrator_agent.agent_tools.spec_authority_compiler_agent.instructions_source import (
     SPEC_AUTHORITY_COMPILER_INSTRUCTIONS,
 )
@@ -13,26 +14,30 @@ from utils.runtime_config import (
 )
 from utils.spec_schemas import SpecAuthorityCompilerEnvelope, SpecAuthorityCompilerInput
 
-# --- Initialize Model ---
-model = LiteLlm(
-    model=get_model_id("spec_authority_compiler"),
-    api_key=get_openrouter_api_key(),
-    drop_params=True,
-    extra_body=get_openrouter_extra_body(),
-)
 
-# --- Create Agent ---
-disable_schema = is_spec_compiler_schema_disabled()
-output_schema = None if disable_schema else SpecAuthorityCompilerEnvelope
+def create_spec_authority_compiler_agent() -> Agent:
+    """Create a fresh spec authority compiler agent instance."""
+    model = LiteLlm(
+        model=get_model_id("spec_authority_compiler"),
+        api_key=get_openrouter_api_key(),
+        drop_params=True,
+        extra_body=get_openrouter_extra_body(),
+    )
+    disable_schema = is_spec_compiler_schema_disabled()
+    return Agent(
+        name="spec_authority_compiler_agent",
+        description=(
+            "Compiler-style agent that extracts spec authority in strict JSON."
+        ),
+        model=model,
+        input_schema=SpecAuthorityCompilerInput,
+        output_schema=None if disable_schema else SpecAuthorityCompilerEnvelope,
+        instruction=SPEC_AUTHORITY_COMPILER_INSTRUCTIONS,
+        output_key="spec_authority_compilation",
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
 
-root_agent = Agent(
-    name="spec_authority_compiler_agent",
-    description="Compiler-style agent that extracts spec authority in strict JSON.",
-    model=model,
-    input_schema=SpecAuthorityCompilerInput,
-    output_schema=output_schema,
-    instruction=SPEC_AUTHORITY_COMPILER_INSTRUCTIONS,
-    output_key="spec_authority_compilation",
-    disallow_transfer_to_parent=True,
-    disallow_transfer_to_peers=True,
-)
+
+# Shared instance is built on first access through the agent registry.
+__getattr__ = root_agent_getattr("spec_authority_compiler", __name__)
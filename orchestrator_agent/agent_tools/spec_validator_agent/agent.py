@@ -2,23 +2,29 @@ from pathlib import Path
 
 from google.adk.agents import LlmAgent
 
+from orchestrator_agent.agent_registry import root_agent_getattr
 from utils.helper import load_instruction
 
 from .schemes import SpecValidationResult
-from .tools import model
+from .tools import create_spec_validator_model
 
 # --- Agent Definition ---
 INSTRUCTIONS_PATH: Path = Path(__file__).parent / "instructions.txt"
 
-spec_validator_agent = LlmAgent(
-    name="SpecValidatorAgent",
-    model=model,
-    instruction=load_instruction(INSTRUCTIONS_PATH),
-    description="Validates story compliance with technical specifications using Pydantic-enforced logic checks.",
-    output_key="spec_validation_result",
-    output_schema=SpecValidationResult,
-    disallow_transfer_to_parent=True,
-    disallow_transfer_to_peers=True,
-)
-
-root_agent = spec_validator_agent
+
+def create_spec_validator_agent() -> LlmAgent:
+    """Create a fresh spec validator agent instance."""
+    return LlmAgent(
+        name="SpecValidatorAgent",
+        model=create_spec_validator_model(),
+        instruction=load_instruction(INSTRUCTIONS_PATH),
+        description="Validates story compliance with technical specifications using Pydantic-enforced logic checks.",
+        output_key="spec_validation_result",
+        output_schema=SpecValidationResult,
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+
+
+# Shared instance is built on first access through the agent registry.
+__getattr__ = root_agent_getattr("spec_validator", __name__)
@@ -1,5 +1,7 @@
 """Sprint planner tool package."""
 
-from .agent import root_agent
+from orchestrator_agent.agent_registry import root_agent_getattr
 
 __all__ = ["root_agent"]
+
+__getattr__ = root_agent_getattr("sprint_planner", __name__)
@@ -1,5 +1,7 @@
 """User Story Writer Agent Package."""
 
-from .agent import root_agent
+from orchestrator_agent.agent_registry import root_agent_getattr
 
 __all__ = ["root_agent"]
+
+__getattr__ = root_agent_getattr("user_story_writer", __name__)
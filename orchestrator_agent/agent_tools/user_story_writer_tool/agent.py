@@ -5,6 +5,7 @@ from pathlib import Path
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+from orchestrator_agent.agent_registry import root_agent_getattr
 from utils.helper import load_instruction
 from utils.model_config import get_model_id, get_openrouter_extra_body
 from utils.runtime_config import get_openrouter_api_key, get_story_writer_max_tokens
@@ -13,7 +14,6 @@ from .schemes import UserStoryWriterInput, UserStoryWriterOutput
 
 # Load instruction text
 INSTRUCTIONS_PATH: Path = Path(__file__).parent / "instructions.txt"
-USER_STORY_WRITER_INSTRUCTIONS = load_instruction(INSTRUCTIONS_PATH)
 
 
 def create_user_story_writer_agent() -> Agent:
@@ -36,11 +36,11 @@ def create_user_story_writer_agent() -> Agent:
         input_schema=UserStoryWriterInput,
         output_schema=UserStoryWriterOutput,
         output_key="story_output",
-        instruction=USER_STORY_WRITER_INSTRUCTIONS,
+        instruction=load_instruction(INSTRUCTIONS_PATH),
         disallow_transfer_to_parent=True,
         disallow_transfer_to_peers=True,
     )
 
 
-# Module-level singleton (used by AgentTool wrapping)
-root_agent: Agent = create_user_story_writer_agent()
+# Shared instance is built on first access through the agent registry.
+__getattr__ = root_agent_getattr("user_story_writer", __name__)
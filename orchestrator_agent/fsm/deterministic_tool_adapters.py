@@ -13,29 +13,38 @@ from typing import Any, Optional, cast
 
 from google.adk.tools import AgentTool, ToolContext
 
-from orchestrator_agent.agent_tools.backlog_primer.agent import (
-    root_agent as backlog_agent,
-)
-from orchestrator_agent.agent_tools.product_vision_tool.agent import (
-    root_agent as vision_agent,
-)
-from orchestrator_agent.agent_tools.roadmap_builder.agent import (
-    root_agent as roadmap_agent,
-)
-from orchestrator_agent.agent_tools.sprint_planner_tool.agent import (
-    root_agent as sprint_planner_agent,
-)
-from orchestrator_agent.agent_tools.user_story_writer_tool.agent import (
-    root_agent as story_writer_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from services.sprint_input import prepare_sprint_input_context
+from services.state_blobs import state_text
 from tools.orchestrator_tools import fetch_sprint_candidates
 
-_PRODUCT_VISION_TOOL = AgentTool(agent=vision_agent)
-_BACKLOG_PRIMER_TOOL = AgentTool(agent=backlog_agent)
-_ROADMAP_BUILDER_TOOL = AgentTool(agent=roadmap_agent)
-_SPRINT_PLANNER_TOOL = AgentTool(agent=sprint_planner_agent)
-_USER_STORY_WRITER_TOOL = AgentTool(agent=story_writer_agent)
+# AgentTool wrappers are built on first use so importing the FSM definitions
+# does not construct every sub-agent.
+_AGENT_TOOL_NAMES: dict[str, str] = {
+    "_PRODUCT_VISION_TOOL": "product_vision",
+    "_BACKLOG_PRIMER_TOOL": "backlog_primer",
+    "_ROADMAP_BUILDER_TOOL": "roadmap_builder",
+    "_SPRINT_PLANNER_TOOL": "sprint_planner",
+    "_USER_STORY_WRITER_TOOL": "user_story_writer",
+}
+_agent_tools: dict[str, AgentTool] = {}
+
+
+def _agent_tool(agent_name: str) -> AgentTool:
+    """Return the cached AgentTool wrapping the registry agent ``agent_name``."""
+    tool = _agent_tools.get(agent_name)
+    if tool is None:
+        tool = _agent_tools[agent_name] = AgentTool(agent=get_agent(agent_name))
+    return tool
+
+
+def __getattr__(name: str) -> AgentTool:
+    """Resolve the legacy ``_*_TOOL`` module attributes lazily."""
+    agent_name = _AGENT_TOOL_NAMES.get(name)
+    if agent_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return _agent_tool(agent_name)
 
 
 def _state(tool_context: ToolContext | None) -> dict[str, Any]:
@@ -248,11 +257,13 @@ async def product_vision_tool(
     state = _state(tool_context)
     args = {
         "user_raw_text": user_raw_text,
-        "specification_content": _as_text(state.get("pending_spec_content")),
-        "compiled_authority": _as_text(state.get("compiled_authority_cached")),
+        "specification_content": _as_text(state_text(state, "pending_spec_content")),
+        "compiled_authority": _as_text(state_text(state, "compiled_authority_cached")),
         "prior_vision_state": _json_or_no_history(state.get("vision_components")),
     }
-    result = await _PRODUCT_VISION_TOOL.run_async(args=args, tool_context=tool_context)
+    result = await _agent_tool("product_vision").run_async(
+        args=args, tool_context=tool_context
+    )
     return cast("dict[str, Any]", result)
 
 
@@ -274,8 +285,10 @@ async def backlog_primer_tool(
     if isinstance(active_project, dict):
         vision = _as_text(active_project.get("vision")).strip()
 
-    technical_spec = _as_text(state.get("pending_spec_content")).strip()
-    compiled_authority = _as_text(state.get("compiled_authority_cached")).strip()
+    technical_spec = _as_text(state_text(state, "pending_spec_content")).strip()
+    compiled_authority = _as_text(
+        state_text(state, "compiled_authority_cached")
+    ).strip()
 
     missing: list[str] = []
     if not vision:
@@ -302,7 +315,9 @@ async def backlog_primer_tool(
         "prior_backlog_state": _json_or_no_history(state.get("product_backlog")),
         "user_input": user_input,
     }
-    result = await _BACKLOG_PRIMER_TOOL.run_async(args=args, tool_context=tool_context)
+    result = await _agent_tool("backlog_primer").run_async(
+        args=args, tool_context=tool_context
+    )
     return cast("dict[str, Any]", result)
 
 
@@ -332,8 +347,10 @@ async def roadmap_builder_tool(
     ):
         backlog_items = cast("list[dict[str, Any]]", approved_backlog["items"])
 
-    technical_spec = _as_text(state.get("pending_spec_content")).strip()
-    compiled_authority = _as_text(state.get("compiled_authority_cached")).strip()
+    technical_spec = _as_text(state_text(state, "pending_spec_content")).strip()
+    compiled_authority = _as_text(
+        state_text(state, "compiled_authority_cached")
+    ).strip()
 
     missing: list[str] = []
     if not vision:
@@ -364,7 +381,9 @@ async def roadmap_builder_tool(
         "prior_roadmap_state": _json_or_no_history(state.get("roadmap_result")),
         "user_input": user_input,
     }
-    result = await _ROADMAP_BUILDER_TOOL.run_async(args=args, tool_context=tool_context)
+    result = await _agent_tool("roadmap_builder").run_async(
+        args=args, tool_context=tool_context
+    )
     return cast("dict[str, Any]", result)
 
 
@@ -427,7 +446,7 @@ async def sprint_planner_tool(
             ),
         )
 
-    result = await _SPRINT_PLANNER_TOOL.run_async(
+    result = await _agent_tool("sprint_planner").run_async(
         args=cast("dict[str, Any]", prepared["input_context"]),
         tool_context=tool_context,
     )
@@ -448,8 +467,10 @@ async def user_story_writer_tool(
         )
 
     state = _state(tool_context)
-    technical_spec = _as_text(state.get("pending_spec_content")).strip()
-    compiled_authority = _as_text(state.get("compiled_authority_cached")).strip()
+    technical_spec = _as_text(state_text(state, "pending_spec_content")).strip()
+    compiled_authority = _as_text(
+        state_text(state, "compiled_authority_cached")
+    ).strip()
 
     derived_context = _derive_requirement_context(
         state=state, parent_requirement=parent_requirement
@@ -480,7 +501,7 @@ async def user_story_writer_tool(
         "technical_spec": technical_spec,
         "compiled_authority": compiled_authority,
     }
-    result = await _USER_STORY_WRITER_TOOL.run_async(
+    result = await _agent_tool("user_story_writer").run_async(
         args=args, tool_context=tool_context
     )
     return cast("dict[str, Any]", result)
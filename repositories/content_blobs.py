@@ -0,0 +1,107 @@
+"""Content-addressed storage for large text payloads, swept when unreferenced."""
+
+from __future__ import annotations
+
+import zlib
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select
+
+from models.blobs import ContentBlob, content_digest
+from models.db import get_engine
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+
+class ContentBlobRepository:
+    """Store text once per SHA-256 and delete rows nothing references."""
+
+    def __init__(self, session: Session | None = None) -> None:
+        """Use ``session`` when given, otherwise one short session per call."""
+        self._session = session
+
+    def _get_session(self) -> Session:
+        return self._session if self._session else Session(get_engine())
+
+    def put(self, text: str) -> str:
+        """Store ``text`` (or mark the stored copy as in use) and return its digest."""
+        digest = content_digest(text)
+        raw = text.encode("utf-8")
+        session = self._get_session()
+        try:
+            if not self._touch(session, digest):
+                session.add(
+                    ContentBlob(
+                        digest=digest,
+                        size_bytes=len(raw),
+                        data=zlib.compress(raw),
+                    )
+                )
+                try:
+                    session.commit()
+                except IntegrityError:
+                    # Another writer inserted the same content first.
+                    session.rollback()
+                    self._touch(session, digest)
+        finally:
+            if self._session is None:
+                session.close()
+        return digest
+
+    @staticmethod
+    def _touch(session: Session, digest: str) -> bool:
+        result = session.exec(
+            update(ContentBlob)
+            .where(col(ContentBlob.digest) == digest)
+            .values(touched_at=datetime.now(UTC))
+        )
+        session.commit()
+        return bool(result.rowcount)
+
+    def get(self, digest: str) -> str | None:
+        """Return the text stored under ``digest``, or ``None`` when absent."""
+        session = self._get_session()
+        try:
+            blob = session.get(ContentBlob, digest)
+            if blob is None:
+                return None
+            return zlib.decompress(blob.data).decode("utf-8")
+        finally:
+            if self._session is None:
+                session.close()
+
+    def delete_unreferenced(
+        self,
+        referenced: Collection[str],
+        *,
+        touched_before: datetime,
+        chunk_size: int = 500,
+    ) -> int:
+        """Delete blobs outside ``referenced`` last touched before the cutoff."""
+        session = self._get_session()
+        try:
+            stale = [
+                digest
+                for digest in session.exec(
+                    select(ContentBlob.digest).where(
+                        col(ContentBlob.touched_at) < touched_before
+                    )
+                ).all()
+                if digest not in referenced
+            ]
+            for start in range(0, len(stale), chunk_size):
+                session.exec(
+                    delete(ContentBlob).where(
+                        col(ContentBlob.digest).in_(stale[start : start + chunk_size]),
+                        col(ContentBlob.touched_at) < touched_before,
+                    )
+                )
+            session.commit()
+            return len(stale)
+        finally:
+            if self._session is None:
+                session.close()
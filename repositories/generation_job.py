@@ -0,0 +1,251 @@
+"""SQLite persistence for background phase generation jobs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+from utils.runtime_config import DatabaseTarget, get_session_db_target
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+ACTIVE_JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+
+_JOB_COLUMNS = (
+    "job_id",
+    "project_id",
+    "phase",
+    "input_hash",
+    "status",
+    "attempts",
+    "result_json",
+    "error",
+    "status_code",
+    "created_at",
+    "started_at",
+    "finished_at",
+)
+
+
+class GenerationJobRepository:
+    """Repository for the ``generation_jobs`` table in the session database.
+
+    Jobs are volatile workflow bookkeeping, so they live next to the ADK
+    session state rather than in the business database.
+    """
+
+    def __init__(self, db_target: DatabaseTarget | None = None) -> None:
+        """Bind the repository to the session database target."""
+        self.db_target = db_target or get_session_db_target()
+        self.db_path = self.db_target.sqlite_connect_target
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def ensure_schema(self) -> None:
+        """Create the jobs table and its coalescing index if missing."""
+        if self._schema_ready:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS generation_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    project_id INTEGER NOT NULL,
+                    phase TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result_json TEXT,
+                    error TEXT,
+                    status_code INTEGER,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT
+                )
+                """
+            )
+            columns = {
+                row["name"]
+                for row in conn.execute("PRAGMA table_info(generation_jobs)")
+            }
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE generation_jobs ADD COLUMN owner TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_generation_jobs_lookup "
+                "ON generation_jobs (project_id, phase, input_hash, status)"
+            )
+            conn.commit()
+        self._schema_ready = True
+
+    def insert(  # noqa: PLR0913
+        self,
+        *,
+        job_id: str,
+        project_id: int,
+        phase: str,
+        input_hash: str,
+        created_at: str,
+        owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Insert a queued job owned by the ``owner`` process and return its row."""
+        self.ensure_schema()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO generation_jobs
+                    (job_id, project_id, phase, input_hash, status, created_at, owner)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    project_id,
+                    phase,
+                    input_hash,
+                    JOB_STATUS_QUEUED,
+                    created_at,
+                    owner,
+                ),
+            )
+            conn.commit()
+        job = self.get(job_id)
+        if job is None:  # pragma: no cover - insert guarantees the row
+            msg = f"Generation job {job_id} was not persisted"
+            raise RuntimeError(msg)
+        return job
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return one job row, or ``None`` when it does not exist."""
+        self.ensure_schema()
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM generation_jobs "  # noqa: S608
+                "WHERE job_id=?",
+                (job_id,),
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def find_active(
+        self, *, project_id: int, phase: str, input_hash: str
+    ) -> dict[str, Any] | None:
+        """Return the oldest queued or running job for the same input."""
+        self.ensure_schema()
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM generation_jobs "  # noqa: S608
+                "WHERE project_id=? AND phase=? AND input_hash=? "
+                "AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (project_id, phase, input_hash, *ACTIVE_JOB_STATUSES),
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def mark_running(self, job_id: str, *, started_at: str) -> None:
+        """Move a queued job to running."""
+        self._update(job_id, status=JOB_STATUS_RUNNING, started_at=started_at)
+
+    def record_attempt(self, job_id: str, attempts: int) -> None:
+        """Store the number of invocation attempts made so far."""
+        self._update(job_id, attempts=attempts)
+
+    def mark_succeeded(
+        self, job_id: str, *, result: dict[str, Any], finished_at: str
+    ) -> None:
+        """Store the job result payload and finish the job."""
+        self._update(
+            job_id,
+            status=JOB_STATUS_SUCCEEDED,
+            result_json=json.dumps(result, default=str),
+            finished_at=finished_at,
+        )
+
+    def mark_failed(
+        self,
+        job_id: str,
+        *,
+        error: str,
+        status_code: int,
+        finished_at: str,
+    ) -> None:
+        """Record a terminal job failure."""
+        self._update(
+            job_id,
+            status=JOB_STATUS_FAILED,
+            error=error,
+            status_code=status_code,
+            finished_at=finished_at,
+        )
+
+    def active_owners(self) -> set[str | None]:
+        """Return the owners of queued or running jobs."""
+        self.ensure_schema()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT owner FROM generation_jobs WHERE status IN (?, ?)",
+                ACTIVE_JOB_STATUSES,
+            ).fetchall()
+        return {row["owner"] for row in rows}
+
+    def fail_incomplete(
+        self, *, error: str, finished_at: str, owners: Collection[str | None]
+    ) -> int:
+        """Fail jobs left queued or running by the given exited ``owners``.
+
+        ``None`` covers jobs recorded before owners were tracked.
+        """
+        self.ensure_schema()
+        named = [owner for owner in owners if owner is not None]
+        conditions = []
+        if named:
+            conditions.append(f"owner IN ({', '.join('?' * len(named))})")
+        if None in owners:
+            conditions.append("owner IS NULL")
+        if not conditions:
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE generation_jobs SET status=?, error=?, status_code=?, "  # noqa: S608
+                f"finished_at=? WHERE status IN (?, ?) AND ({' OR '.join(conditions)})",
+                (
+                    JOB_STATUS_FAILED,
+                    error,
+                    503,
+                    finished_at,
+                    *ACTIVE_JOB_STATUSES,
+                    *named,
+                ),
+            )
+            conn.commit()
+            count = cursor.rowcount
+        if count:
+            logger.warning("Marked %s interrupted generation jobs as failed", count)
+        return count
+
+    def _update(self, job_id: str, **fields: object) -> None:
+        self.ensure_schema()
+        assignments = ", ".join(f"{name}=?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE generation_jobs SET {assignments} WHERE job_id=?",  # noqa: S608
+                (*fields.values(), job_id),
+            )
+            conn.commit()
+
+
+def _row_to_job(row: sqlite3.Row) -> dict[str, Any]:
+    job = {column: row[column] for column in _JOB_COLUMNS}
+    result_json = job.pop("result_json")
+    job["result"] = json.loads(result_json) if result_json else None
+    return job
@@ -1,5 +1,9 @@
 import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, cast
 
+from sqlalchemy import and_
 from sqlmodel import Session, select
 
 from models.core import (
@@ -15,12 +19,28 @@ from models.core import (
     UserStory,
 )
 from models.db import get_engine
-from models.events import StoryCompletionLog, WorkflowEvent
+from models.events import StoryCompletionLog, WorkflowEvent, WorkflowEventRollup
 from models.specs import CompiledSpecAuthority, SpecAuthorityAcceptance, SpecRegistry
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ProductSummary:
+    """Column projection of ``Product`` for list views.
+
+    Carries everything the project cards and setup checks need without
+    loading the spec, compiled authority, vision or roadmap text blobs.
+    """
+
+    product_id: int
+    name: str
+    description: str | None
+    spec_file_path: str | None
+    has_compiled_authority: bool
+    updated_at: datetime | None = None
+
+
 class ProductRepository:
     """Repository handling database operations for the Product entity."""
 
@@ -38,6 +58,39 @@ class ProductRepository:
             statement = select(Product)
             return list(session.exec(statement).all())
 
+    def list_summaries(self) -> list[ProductSummary]:
+        """Fetch list-view columns for all products, skipping text blobs."""
+        authority = cast("Any", Product.compiled_authority_json)
+        # SQLModel's select() overloads stop at four columns.
+        columns: tuple[Any, ...] = (
+            Product.product_id,
+            Product.name,
+            Product.description,
+            Product.spec_file_path,
+            and_(authority.is_not(None), authority != ""),
+            Product.updated_at,
+        )
+        statement = select(*columns).order_by(cast("Any", Product.product_id))
+        with self._get_session() as session:
+            return [
+                ProductSummary(
+                    product_id=product_id,
+                    name=name,
+                    description=description,
+                    spec_file_path=spec_file_path,
+                    has_compiled_authority=bool(has_authority),
+                    updated_at=updated_at,
+                )
+                for (
+                    product_id,
+                    name,
+                    description,
+                    spec_file_path,
+                    has_authority,
+                    updated_at,
+                ) in session.exec(statement).all()
+            ]
+
     def get_by_id(self, product_id: int) -> Product | None:
         """Fetch a specific product by its ID."""
         with self._get_session() as session:
@@ -118,6 +171,12 @@ class ProductRepository:
                 select(WorkflowEvent).where(WorkflowEvent.product_id == product_id)
             ).all():
                 session.delete(event)
+            for rollup in session.exec(
+                select(WorkflowEventRollup).where(
+                    WorkflowEventRollup.product_id == product_id
+                )
+            ).all():
+                session.delete(rollup)
 
             # Delete SpecAuthorityAcceptance records
             session.exec(
@@ -3,11 +3,27 @@ import logging
 import sqlite3
 from typing import Any
 
+from models.blobs import BLOB_REF_PATTERN
 from utils.runtime_config import DatabaseTarget, get_session_db_target
 
 logger = logging.getLogger(__name__)
 
 
+class SessionStateConflictError(RuntimeError):
+    """Raised when a compare-and-swap write finds a newer session version."""
+
+    def __init__(
+        self, session_id: str, *, expected_version: int, actual_version: int
+    ) -> None:
+        super().__init__(
+            f"Session {session_id} is at version {actual_version}, "
+            f"expected {expected_version}."
+        )
+        self.session_id = session_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
 class WorkflowSessionRepository:
     """Repository handling volatile session state using sqlite3."""
 
@@ -15,6 +31,7 @@ class WorkflowSessionRepository:
         self.db_target = db_target or get_session_db_target()
         self.db_path = self.db_target.sqlite_connect_target
         self.db_url = self.db_target.sqlite_url
+        self._version_column_ready = False
 
     def has_sessions_table(self) -> bool:
         """Return whether the ADK session schema has been initialized."""
@@ -25,6 +42,37 @@ class WorkflowSessionRepository:
             )
             return cursor.fetchone() is not None
 
+    def _ensure_version_column(self, conn: sqlite3.Connection) -> None:
+        """Add the optimistic-locking ``state_version`` column on first use."""
+        if self._version_column_ready:
+            return
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+        if "state_version" not in columns:
+            conn.execute(
+                "ALTER TABLE sessions ADD COLUMN state_version "
+                "INTEGER NOT NULL DEFAULT 0"
+            )
+        self._version_column_ready = True
+
+    def get_session_state_with_version(
+        self, app_name: str, user_id: str, session_id: str
+    ) -> tuple[dict[str, Any], int]:
+        """Fetch the state dict together with its compare-and-swap version."""
+        if not self.has_sessions_table():
+            return {}, 0
+
+        with sqlite3.connect(self.db_path) as conn:
+            self._ensure_version_column(conn)
+            row = conn.execute(
+                "SELECT state, state_version FROM sessions "
+                "WHERE app_name=? AND user_id=? AND id=?",
+                (app_name, user_id, session_id),
+            ).fetchone()
+
+        if not row:
+            return {}, 0
+        return json.loads(row[0]), int(row[1])
+
     def get_session_state(
         self, app_name: str, user_id: str, session_id: str
     ) -> dict[str, Any]:
@@ -104,30 +152,113 @@ class WorkflowSessionRepository:
         logger.debug("Retrieved %s session states in batch (redacted).", len(state_map))
         return state_map
 
+    def referenced_blob_digests(self) -> set[str]:
+        """Return every content-blob digest referenced by a saved session state."""
+        if not self.has_sessions_table():
+            return set()
+
+        digests: set[str] = set()
+        with sqlite3.connect(self.db_path) as conn:
+            for (state_json,) in conn.execute("SELECT state FROM sessions"):
+                digests.update(BLOB_REF_PATTERN.findall(state_json or ""))
+        return digests
+
     def update_session_state(
         self,
         app_name: str,
         user_id: str,
         session_id: str,
         partial_update: dict[str, Any],
-    ) -> None:
-        """Updates the Volatile State with a partial update dict."""
+        *,
+        expected_version: int | None = None,
+    ) -> int:
+        """Merge a partial update into the state and return the new version.
+
+        The read, merge and write run in one ``BEGIN IMMEDIATE`` transaction so
+        concurrent writers cannot drop each other's keys. When
+        ``expected_version`` is given the write is a compare-and-swap and
+        raises ``SessionStateConflictError`` if another writer got there first.
+        """
+        version, _changes = self.update_session_state_with_changes(
+            app_name,
+            user_id,
+            session_id,
+            partial_update,
+            expected_version=expected_version,
+        )
+        return version
+
+    def update_session_state_with_changes(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        partial_update: dict[str, Any],
+        *,
+        expected_version: int | None = None,
+    ) -> tuple[int, dict[str, Any]]:
+        """Merge like ``update_session_state`` and also return the changed keys.
+
+        The second item holds the keys of ``partial_update`` whose values
+        differed from the stored state, so callers can publish a delta.
+        """
         if not self.has_sessions_table():
             raise RuntimeError(
                 "Session store is not initialized: sessions table is missing."
             )
 
-        current_state = self.get_session_state(app_name, user_id, session_id)
-        current_state.update(partial_update)
+        with sqlite3.connect(self.db_path, isolation_level=None) as conn:
+            self._ensure_version_column(conn)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current_state, current_version = self._read_for_update(
+                    conn,
+                    (app_name, user_id, session_id),
+                    expected_version=expected_version,
+                )
+                changes = {
+                    key: value
+                    for key, value in partial_update.items()
+                    if key not in current_state or current_state[key] != value
+                }
+                current_state.update(partial_update)
+                conn.execute(
+                    "UPDATE sessions SET state=?, state_version=? "
+                    "WHERE app_name=? AND user_id=? AND id=?",
+                    (
+                        json.dumps(current_state),
+                        current_version + 1,
+                        app_name,
+                        user_id,
+                        session_id,
+                    ),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        logger.info("Session state updated successfully in DB")
+        return current_version + 1, changes
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE sessions SET state=? WHERE app_name=? AND user_id=? AND id=?",
-                (json.dumps(current_state), app_name, user_id, session_id),
+    @staticmethod
+    def _read_for_update(
+        conn: sqlite3.Connection,
+        key: tuple[str, str, str],
+        *,
+        expected_version: int | None,
+    ) -> tuple[dict[str, Any], int]:
+        row = conn.execute(
+            "SELECT state, state_version FROM sessions "
+            "WHERE app_name=? AND user_id=? AND id=?",
+            key,
+        ).fetchone()
+        state: dict[str, Any] = json.loads(row[0]) if row else {}
+        version = int(row[1]) if row else 0
+        if expected_version is not None and expected_version != version:
+            raise SessionStateConflictError(
+                key[2], expected_version=expected_version, actual_version=version
             )
-            conn.commit()
-        logger.info("Session state updated successfully in DB")
+        return state, version
 
     def delete_session(self, app_name: str, user_id: str, session_id: str) -> bool:
         """Deletes the session state from the volatile store."""
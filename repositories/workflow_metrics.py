@@ -0,0 +1,206 @@
+"""Read workflow metrics from the hourly/daily event rollups."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlmodel import Session, select
+
+from models.db import get_engine
+from models.events import WorkflowEventRollup
+from utils.workflow_rollups import (
+    RollupTotals,
+    bucket_start,
+    histogram_percentile,
+    load_histogram,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import datetime
+
+    from models.enums import WorkflowEventType
+    from utils.workflow_rollups import Granularity
+
+
+@dataclass(frozen=True)
+class WorkflowMetric:
+    """Aggregated metrics for one event type/state, per bucket or per window.
+
+    Percentiles are histogram upper bounds (see ``utils.workflow_rollups``).
+    """
+
+    event_type: str
+    state: str
+    bucket_start: datetime | None
+    event_count: int
+    duration_count: int
+    total_duration_sec: float
+    avg_duration_sec: float | None
+    min_duration_sec: float | None
+    max_duration_sec: float | None
+    p50_duration_sec: float | None
+    p90_duration_sec: float | None
+    p95_duration_sec: float | None
+    avg_turn_count: float | None
+
+
+def _metric(
+    event_type: object,
+    state: str,
+    start: datetime | None,
+    totals: RollupTotals,
+) -> WorkflowMetric:
+    def percentile(quantile: float) -> float | None:
+        return histogram_percentile(
+            totals.histogram, quantile, maximum=totals.duration_max
+        )
+
+    return WorkflowMetric(
+        event_type=str(getattr(event_type, "value", event_type)),
+        state=state,
+        bucket_start=start,
+        event_count=totals.event_count,
+        duration_count=totals.duration_count,
+        total_duration_sec=round(totals.duration_total, 2),
+        avg_duration_sec=(
+            round(totals.duration_total / totals.duration_count, 2)
+            if totals.duration_count
+            else None
+        ),
+        min_duration_sec=totals.duration_min,
+        max_duration_sec=totals.duration_max,
+        p50_duration_sec=percentile(0.5),
+        p90_duration_sec=percentile(0.9),
+        p95_duration_sec=percentile(0.95),
+        avg_turn_count=(
+            round(totals.turn_count_total / totals.turn_count_events, 2)
+            if totals.turn_count_events
+            else None
+        ),
+    )
+
+
+def _totals(rollup: WorkflowEventRollup) -> RollupTotals:
+    return RollupTotals(
+        event_count=rollup.event_count,
+        duration_count=rollup.duration_count,
+        duration_total=rollup.duration_total,
+        duration_min=rollup.duration_min,
+        duration_max=rollup.duration_max,
+        histogram=load_histogram(rollup.duration_histogram),
+        turn_count_total=rollup.turn_count_total,
+        turn_count_events=rollup.turn_count_events,
+    )
+
+
+class WorkflowMetricsRepository:
+    """Serve per-product and per-window workflow metrics from rollups."""
+
+    def __init__(self, session: Session | None = None) -> None:
+        """Use ``session`` when given, otherwise one short session per call."""
+        self._session = session
+
+    def _get_session(self) -> Session:
+        return self._session if self._session else Session(get_engine())
+
+    def rollups(
+        self,
+        *,
+        product_id: int | None = None,
+        granularity: Granularity = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        event_types: Sequence[WorkflowEventType] | None = None,
+    ) -> list[WorkflowEventRollup]:
+        """Return rollup rows for a product (all products when ``None``).
+
+        ``since`` is rounded down to its bucket; ``until`` is exclusive.
+        """
+        columns = cast("Any", WorkflowEventRollup)
+        statement = select(WorkflowEventRollup).where(
+            columns.granularity == granularity
+        )
+        if product_id is not None:
+            statement = statement.where(columns.product_id == product_id)
+        if since is not None:
+            statement = statement.where(
+                columns.bucket_start >= bucket_start(since, granularity)
+            )
+        if until is not None:
+            statement = statement.where(
+                columns.bucket_start < bucket_start(until, granularity)
+            )
+        if event_types:
+            statement = statement.where(columns.event_type.in_(list(event_types)))
+        statement = statement.order_by(
+            columns.bucket_start, columns.event_type, columns.state
+        )
+        with self._get_session() as session:
+            return list(session.exec(statement).all())
+
+    def timeseries(
+        self,
+        *,
+        product_id: int | None = None,
+        granularity: Granularity = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        event_types: Sequence[WorkflowEventType] | None = None,
+    ) -> list[WorkflowMetric]:
+        """Return one metric per bucket, event type and state."""
+        rows = self.rollups(
+            product_id=product_id,
+            granularity=granularity,
+            since=since,
+            until=until,
+            event_types=event_types,
+        )
+        return timeseries_from_rollups(rows)
+
+    def summary(
+        self,
+        *,
+        product_id: int | None = None,
+        granularity: Granularity = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        event_types: Sequence[WorkflowEventType] | None = None,
+    ) -> list[WorkflowMetric]:
+        """Return one metric per event type and state over the whole window."""
+        rows = self.rollups(
+            product_id=product_id,
+            granularity=granularity,
+            since=since,
+            until=until,
+            event_types=event_types,
+        )
+        return summarize_rollups(rows)
+
+
+def summarize_rollups(rows: Iterable[WorkflowEventRollup]) -> list[WorkflowMetric]:
+    """Merge rollup rows into one metric per event type and state."""
+    merged: dict[tuple[str, str], tuple[object, RollupTotals]] = {}
+    for row in rows:
+        key = (str(row.event_type), row.state)
+        _event_type, totals = merged.setdefault(key, (row.event_type, RollupTotals()))
+        totals.merge(_totals(row))
+    return [
+        _metric(event_type, state, None, totals)
+        for (_key, state), (event_type, totals) in sorted(merged.items())
+    ]
+
+
+def timeseries_from_rollups(
+    rows: Iterable[WorkflowEventRollup],
+) -> list[WorkflowMetric]:
+    """Turn rollup rows into one metric per bucket, event type and state."""
+    merged: dict[tuple[datetime, object, str], RollupTotals] = {}
+    for row in rows:
+        key = (row.bucket_start, row.event_type, row.state)
+        merged.setdefault(key, RollupTotals()).merge(_totals(row))
+    return [
+        _metric(event_type, state, start, totals)
+        for (start, event_type, state), totals in merged.items()
+    ]
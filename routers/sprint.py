@@ -20,6 +20,7 @@ class _ManualSprintRouteHandlers(TypedDict):
     post_sprint_close: Handler
     get_project_task_packet: Handler
     get_project_story_packet: Handler
+    get_project_sprint_packet_bundle: Handler
     get_task_execution: Handler
     post_task_execution: Handler
     get_story_close: Handler
@@ -29,6 +30,8 @@ class _ManualSprintRouteHandlers(TypedDict):
 class _SprintRouteHandlers(_ManualSprintRouteHandlers):
     get_project_sprint_candidates: Handler
     generate_project_sprint: Handler
+    stream_project_sprint_generation: Handler
+    submit_project_sprint_job: Handler
     get_project_sprint_history: Handler
     reset_project_sprint_planner: Handler
     list_project_sprints: Handler
@@ -56,11 +59,18 @@ def register_manual_sprint_routes(
         "/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/packet",
         handlers["get_project_task_packet"],
         methods=["GET"],
+        response_model=None,
     )
     app.add_api_route(
         "/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet",
         handlers["get_project_story_packet"],
         methods=["GET"],
+        response_model=None,
+    )
+    app.add_api_route(
+        "/api/projects/{project_id}/sprints/{sprint_id}/packets",
+        handlers["get_project_sprint_packet_bundle"],
+        methods=["GET"],
     )
     app.add_api_route(
         "/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/execution",
@@ -99,6 +109,17 @@ def register_sprint_routes(
         handlers["generate_project_sprint"],
         methods=["POST"],
     )
+    app.add_api_route(
+        "/api/projects/{project_id}/sprint/generate/stream",
+        handlers["stream_project_sprint_generation"],
+        methods=["POST"],
+    )
+    app.add_api_route(
+        "/api/projects/{project_id}/sprint/generate/jobs",
+        handlers["submit_project_sprint_job"],
+        methods=["POST"],
+        status_code=202,
+    )
     app.add_api_route(
         "/api/projects/{project_id}/sprint/history",
         handlers["get_project_sprint_history"],
@@ -135,6 +156,7 @@ def register_sprint_routes(
         post_sprint_close=handlers["post_sprint_close"],
         get_project_task_packet=handlers["get_project_task_packet"],
         get_project_story_packet=handlers["get_project_story_packet"],
+        get_project_sprint_packet_bundle=handlers["get_project_sprint_packet_bundle"],
         get_task_execution=handlers["get_task_execution"],
         post_task_execution=handlers["post_task_execution"],
         get_story_close=handlers["get_story_close"],
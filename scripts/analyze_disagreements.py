@@ -1,11 +1,17 @@
 """Script for analyze disagreements."""
 
+import argparse
 import collections
 import json
+import sys
 from pathlib import Path
 
+from utils.branch_trace import BranchTracer
 from utils.cli_output import emit
 
+TRACE = BranchTracer()
+DEFAULT_RAW_PATH = "artifacts/validation_eval/raw_20260216_210438.jsonl"
+
 
 def analyze_disagreements(raw_path: str | Path) -> None:
     """Return analyze disagreements."""
@@ -23,7 +29,9 @@ def analyze_disagreements(raw_path: str | Path) -> None:
         llm = modes.get("llm", {}).get("predicted_pass")
         hyb = modes.get("hybrid", {}).get("predicted_pass")
 
-        if len({det, llm, hyb}) > 1:
+        if TRACE.branch(
+            "analyze_disagreements.modes_disagree", len({det, llm, hyb}) > 1
+        ):
             disagreements.append(
                 {
                     "case_id": case_id,
@@ -54,5 +62,22 @@ def analyze_disagreements(raw_path: str | Path) -> None:
         emit(f"  Hyb: {d['hybrid']} {d['hyb_reasons']}")
 
 
+def main() -> None:
+    """Parse CLI arguments and print disagreements for one raw results file."""
+    parser = argparse.ArgumentParser(description="Show cross-mode disagreements")
+    parser.add_argument("raw_path", nargs="?", default=DEFAULT_RAW_PATH)
+    parser.add_argument(
+        "--trace-branches",
+        action="store_true",
+        help="Print a branch-coverage summary to stderr after the report.",
+    )
+    args = parser.parse_args()
+    TRACE.enable(args.trace_branches)
+    analyze_disagreements(args.raw_path)
+    if TRACE.enabled:
+        for line in TRACE.summary_lines():
+            emit(line, file=sys.stderr)
+
+
 if __name__ == "__main__":
-    analyze_disagreements("artifacts/validation_eval/raw_20260216_210438.jsonl")
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark evaluation runtime with branch tracing off versus on.
+
+Runs the metric and disagreement stages of ``eval_spec_validation`` over
+synthetic labeled records, first with ``TRACE`` disabled (passthrough) and then
+with aggregated branch counters enabled, and prints the coverage summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts import eval_spec_validation as eval_script
+from utils.cli_output import emit
+
+
+def build_records(case_count: int) -> list[dict[str, Any]]:
+    """Return one synthetic record per case and mode."""
+    records: list[dict[str, Any]] = []
+    for index in range(case_count):
+        for mode in eval_script.VALID_MODES:
+            expected_pass = index % 3 != 0
+            records.append(
+                {
+                    "case_id": f"case-{index}",
+                    "mode": mode,
+                    "expected_pass": expected_pass,
+                    "predicted_pass": (index + len(mode)) % 4 != 0,
+                    "predicted_fail": (index + len(mode)) % 4 == 0,
+                    "latency_ms": 10 + index % 7,
+                    "expected_fail_reasons": [] if expected_pass else ["RULE_A"],
+                    "predicted_reason_codes": ["RULE_A"] if index % 4 == 0 else [],
+                    "error_class": "semantic",
+                }
+            )
+    return records
+
+
+def run_evaluation(records: list[dict[str, Any]]) -> None:
+    """Run the per-mode metric and disagreement stages once."""
+    for mode in eval_script.VALID_MODES:
+        eval_script._compute_mode_metrics(
+            [record for record in records if record["mode"] == mode]
+        )
+    eval_script._compute_disagreements(records)
+
+
+def _time_runs(records: list[dict[str, Any]], runs: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_evaluation(records)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run_benchmark(case_count: int, runs: int) -> dict[str, list[float]]:
+    """Time the evaluation with tracing disabled and enabled."""
+    records = build_records(case_count)
+    results: dict[str, list[float]] = {}
+    for label, enabled in (("tracing off", False), ("tracing on", True)):
+        eval_script.TRACE.reset()
+        eval_script.TRACE.enable(enabled)
+        samples = _time_runs(records, runs)
+        results[label] = samples
+        emit(
+            f"{label:<12} median={statistics.median(samples):8.2f}ms "
+            f"min={min(samples):8.2f}ms ({case_count} cases x "
+            f"{len(eval_script.VALID_MODES)} modes, n={runs})"
+        )
+    for line in eval_script.TRACE.summary_lines():
+        emit(line)
+    eval_script.TRACE.enable(False)
+    return results
+
+
+def main() -> None:
+    """Parse CLI arguments and run the tracing benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark evaluation runtime with branch tracing off versus on."
+    )
+    parser.add_argument("--cases", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.cases, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark JSON serialization of large API responses and hashes.
+
+A synthetic payload shaped like story and sprint history (attempt arrays of
+nested dicts with timezone-aware datetimes, enums and free text) is grown to
+``--megabytes`` of encoded JSON and measured two ways:
+
+* ``api``: a request to an in-process ``-> dict[str, Any]`` route returning the
+  payload, served by FastAPI's default route class (response model
+  serialization plus ``JSONResponse``) and by ``ORJSONRoute``;
+* ``canonical``: ``canonical_json`` against the stdlib call it replaces.
+
+The ``canonical`` case uses the payload as a JSON-ready projection
+(ISO strings and enum values), which is what workbench commands produce.
+
+The one-pass paths use ``orjson`` when it is installed and the stdlib encoder
+otherwise; the report says which.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.agent_workbench.fingerprints import canonical_json, normalize_for_hash
+from services.json_responses import ORJSONResponse, ORJSONRoute
+from utils.cli_output import emit
+from utils.json_encoding import dumps, orjson_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_RNG = random.Random(50)  # noqa: S311
+_VOCABULARY = (
+    "user team sprint story backlog roadmap vision feature epic theme release "
+    "dashboard report export import account billing invoice payment search "
+    "filter notify review approve reject assign schedule deadline priority "
+    "estimate risk metric latency audit permission role admin customer "
+    "the a of to and with for when so that can should must without each"
+)
+_EPOCH = datetime(2026, 1, 5, 9, tzinfo=UTC)
+
+
+class _AttemptStatus(StrEnum):
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+    PENDING = "pending"
+
+
+def _prose(words: int) -> str:
+    vocabulary = _VOCABULARY.split()
+    return " ".join(_RNG.choice(vocabulary) for _ in range(words))
+
+
+def _attempt(index: int) -> dict[str, Any]:
+    created_at = _EPOCH + timedelta(minutes=index * 7)
+    return {
+        "attempt_id": index,
+        "status": _RNG.choice(list(_AttemptStatus)),
+        "created_at": created_at,
+        "completed_at": created_at + timedelta(seconds=_RNG.randint(5, 600)),
+        "score": round(_RNG.uniform(0, 1), 4),
+        "input": {"instructions": _prose(40), "refs": [index, index + 1]},
+        "output": {
+            "title": _prose(6).capitalize(),
+            "description": _prose(60),
+            "acceptance_criteria": [_prose(12) for _ in range(4)],
+            "story_points": _RNG.choice([1, 2, 3, 5, 8]),
+        },
+    }
+
+
+def build_payload(megabytes: float) -> dict[str, Any]:
+    """Return a history payload whose encoded size reaches ``megabytes``."""
+    target = int(megabytes * 1024 * 1024)
+    attempts: list[dict[str, Any]] = []
+    size = 0
+    while size < target:
+        batch = [_attempt(len(attempts) + offset) for offset in range(200)]
+        attempts.extend(batch)
+        size += len(json.dumps(batch, default=str))
+    return {"project_id": 1, "generated_at": _EPOCH, "attempts": attempts}
+
+
+def _build_app(payload: dict[str, Any], *, one_pass: bool) -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse) if one_pass else FastAPI()
+    if one_pass:
+        app.router.route_class = ORJSONRoute
+
+    @app.get("/history")
+    def history() -> dict[str, Any]:
+        return payload
+
+    return app
+
+
+def _time_ms(operation: Callable[[], object], runs: int) -> list[float]:
+    operation()
+    samples: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    return (
+        f"median={statistics.median(samples):.1f}ms "
+        f"min={min(samples):.1f}ms max={max(samples):.1f}ms (n={len(samples)})"
+    )
+
+
+def run_benchmark(megabytes: float, runs: int) -> dict[str, dict[str, float]]:
+    """Measure every serialization path and print one summary line each."""
+    payload = build_payload(megabytes)
+    # Workbench projections are JSON-ready: ISO strings and enum values.
+    projection = json.loads(dumps(payload))
+    default_client = TestClient(_build_app(payload, one_pass=False))
+    one_pass_client = TestClient(_build_app(payload, one_pass=True))
+
+    cases: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "api": (
+            lambda: default_client.get("/history").content,
+            lambda: one_pass_client.get("/history").content,
+        ),
+        "canonical": (
+            lambda: json.dumps(
+                normalize_for_hash(projection),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=True,
+            ),
+            lambda: canonical_json(projection),
+        ),
+    }
+
+    response_bytes = len(one_pass_client.get("/history").content)
+    emit(
+        f"payload: {len(payload['attempts'])} attempts, {response_bytes / 1e6:.1f} MB "
+        f"response, {len(canonical_json(projection)) / 1e6:.1f} MB canonical; "
+        f"encoder: {'orjson' if orjson_available() else 'stdlib json'}"
+    )
+    results: dict[str, dict[str, float]] = {}
+    for name, (baseline, candidate) in cases.items():
+        before = _time_ms(baseline, runs)
+        after = _time_ms(candidate, runs)
+        results[name] = {
+            "baseline_ms": statistics.median(before),
+            "one_pass_ms": statistics.median(after),
+        }
+        emit(f"{name:>9} baseline: {_summary(before)}")
+        emit(
+            f"{name:>9} one-pass: {_summary(after)} "
+            f"({statistics.median(before) / statistics.median(after):.1f}x)"
+        )
+    return results
+
+
+def main() -> None:
+    """Parse CLI arguments and run the JSON encoding benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSON serialization of large API responses."
+    )
+    parser.add_argument("--megabytes", type=float, default=5.0)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    run_benchmark(args.megabytes, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,46 @@
-"""Script for benchmark list sprints."""
+"""Benchmark the saved-sprint list and detail read paths.
 
-import importlib
-import os
+Seeds one product with hundreds of sprints, each carrying stories and tasks,
+then compares the legacy eager-loading path (every sprint's stories and tasks
+via ``_saved_sprint_query``) with the aggregate path used by
+``GET /api/projects/{id}/sprints`` and the runtime-summary query used by the
+sprint detail view. Importing ``api`` needs the usual ``AGILEFORGE_*`` env.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
 import sys
+import tempfile
+import time
 from datetime import date, timedelta
-from sqlite3 import Connection
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy import desc, event
 from sqlmodel import Session, SQLModel, create_engine
 
-from utils.cli_output import emit
-
-# Add repo root to path
-sys.path.append(os.getcwd())  # noqa: PTH109
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+import api
 from agile_sqlmodel import (
     Product,
     Sprint,
     SprintStatus,
     SprintStory,
     StoryStatus,
+    Task,
+    TaskStatus,
     UserStory,
 )
 from models.core import Team
+from utils.cli_output import emit
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def _load_legacy_sprint_query_tools() -> Any:  # noqa: ANN401
-    module_name = "orchestrator_agent.agent_tools.sprint_planning.sprint_query_tools"
-    try:
-        return importlib.import_module(module_name)
-    except ModuleNotFoundError as exc:
-        msg = (
-            "The list-sprints benchmark targets legacy module "
-            f"{module_name!r}, which is not present in this checkout."
-        )
-        raise RuntimeError(msg) from exc
-
-
-sprint_query_tools = _load_legacy_sprint_query_tools()
+    from sqlalchemy import Engine
 
 
 def _require_id(value: int | None, name: str) -> int:
@@ -49,129 +50,189 @@ def _require_id(value: int | None, name: str) -> int:
     return value
 
 
-class QueryCounter:
-    """Test helper for query counter."""
-
-    def __init__(self) -> None:
-        """Initialize the test helper."""
-        self.count = 0
-
-    def __call__(  # noqa: PLR0913
-        self,
-        conn: object,
-        cursor: object,
-        statement: object,
-        parameters: object,
-        context: object,
-        executemany: object,
-    ) -> None:
-        """Implement __call__ for the test helper."""
-        del conn, cursor, statement, parameters, context, executemany
-        self.count += 1
-
-
-def setup_data(session: Session, product_id: int) -> None:
-    # Create 5 teams
-    """Return setup data."""
-    teams = []
-    for i in range(5):
-        team = Team(name=f"Team {i}")
-        session.add(team)
-        teams.append(team)
-    session.commit()
-    for team in teams:
-        session.refresh(team)
-    team_ids = [
-        _require_id(team.team_id, f"Team {index} ID")
-        for index, team in enumerate(teams)
-    ]
-
-    # Create 20 sprints (4 per team)
-    sprints = []
+def seed(
+    engine: Engine, *, sprint_count: int, stories_per_sprint: int, tasks_per_story: int
+) -> int:
+    """Create one product with ``sprint_count`` sprints and return its id."""
     base_date = date(2024, 1, 1)
-    for i in range(20):
-        team_id = team_ids[i % 5]
-        sprint = Sprint(
-            goal=f"Sprint {i}",
-            start_date=base_date + timedelta(days=i * 14),
-            end_date=base_date + timedelta(days=(i + 1) * 14 - 1),
-            status=SprintStatus.ACTIVE,
-            product_id=product_id,
-            team_id=team_id,
-        )
-        session.add(sprint)
-        sprints.append(sprint)
-    session.commit()
-    for sprint in sprints:
-        session.refresh(sprint)
-    sprint_ids = [
-        _require_id(sprint.sprint_id, f"Sprint {index} ID")
-        for index, sprint in enumerate(sprints)
-    ]
-
-    # Create 50 stories distributed across sprints
-    for i in range(50):
-        story = UserStory(
-            title=f"Story {i}",
-            product_id=product_id,
-            status=StoryStatus.TO_DO,
-            story_points=3,
-        )
-        session.add(story)
-        session.commit()  # Get ID
-        session.refresh(story)
-        story_id = _require_id(story.story_id, f"Story {i} ID")
-
-        # Assign to a sprint
-        sprint_id = sprint_ids[i % 20]
-        session.add(SprintStory(sprint_id=sprint_id, story_id=story_id))
-    session.commit()
-
-
-def run_benchmark() -> int:
-    # Setup DB
-    """Return run benchmark."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-
-    # Enforce foreign keys
-    @event.listens_for(Engine, "connect")
-    def set_sqlite_pragma(
-        dbapi_connection: Connection, _connection_record: object
-    ) -> None:
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-
-    SQLModel.metadata.create_all(engine)
-
-    # Patch module engine
-    sprint_query_tools.engine = engine
-
-    # Setup data
     with Session(engine) as session:
         product = Product(name="Benchmark Product")
+        team = Team(name="Benchmark Team")
         session.add(product)
-        session.commit()
-        session.refresh(product)
+        session.add(team)
+        session.flush()
         product_id = _require_id(product.product_id, "Product ID")
+        team_id = _require_id(team.team_id, "Team ID")
+        for index in range(sprint_count):
+            status = (
+                SprintStatus.COMPLETED
+                if index < sprint_count - 2
+                else SprintStatus.ACTIVE
+                if index == sprint_count - 2
+                else SprintStatus.PLANNED
+            )
+            sprint = Sprint(
+                goal=f"Sprint {index}",
+                start_date=base_date + timedelta(days=index * 14),
+                end_date=base_date + timedelta(days=(index + 1) * 14 - 1),
+                status=status,
+                product_id=product_id,
+                team_id=team_id,
+            )
+            session.add(sprint)
+            stories = [
+                UserStory(
+                    title=f"Sprint {index} story {n}",
+                    product_id=product_id,
+                    status=StoryStatus.TO_DO,
+                    story_points=3,
+                )
+                for n in range(stories_per_sprint)
+            ]
+            session.add_all(stories)
+            session.flush()
+            sprint_id = _require_id(sprint.sprint_id, "Sprint ID")
+            for story in stories:
+                story_id = _require_id(story.story_id, "Story ID")
+                session.add(SprintStory(sprint_id=sprint_id, story_id=story_id))
+                session.add_all(
+                    Task(
+                        description=f"Task {n}",
+                        story_id=story_id,
+                        status=TaskStatus.DONE if n % 2 else TaskStatus.TO_DO,
+                    )
+                    for n in range(tasks_per_story)
+                )
+        session.commit()
+    return product_id
 
-        setup_data(session, product_id)
 
-    # Measure
-    query_counter = QueryCounter()
-    event.listen(engine, "before_cursor_execute", query_counter)
+def legacy_list(engine: Engine, product_id: int) -> int:
+    """Serialize the list the old way: full story/task graph per sprint."""
+    with Session(engine) as session:
+        sprints = session.exec(
+            api._saved_sprint_query()
+            .where(Sprint.product_id == product_id)
+            .order_by(desc(api._queryable_attr(Sprint.created_at)))
+        ).all()
+        summary = api._build_sprint_runtime_summary(sprints)
+        return len(
+            [
+                api._serialize_sprint_list_item(sprint, runtime_summary=summary)
+                for sprint in sprints
+            ]
+        )
 
-    emit(f"Running list_sprints for product {product_id}...")
-    result = sprint_query_tools.list_sprints(product_id)
 
-    event.remove(engine, "before_cursor_execute", query_counter)
+def aggregate_list(engine: Engine, product_id: int) -> int:
+    """Serialize the list from sprint rows plus grouped SQL counts."""
+    with Session(engine) as session:
+        aggregates = api._load_sprint_aggregates(session, product_id)
+        sprints = session.exec(
+            api._sprint_list_query()
+            .where(Sprint.product_id == product_id)
+            .order_by(desc(api._queryable_attr(Sprint.created_at)))
+        ).all()
+        summary = api._build_sprint_runtime_summary(sprints)
+        return len(
+            [
+                api._serialize_sprint_list_item(
+                    sprint,
+                    runtime_summary=summary,
+                    aggregates=aggregates.get(
+                        _require_id(sprint.sprint_id, "Sprint ID"),
+                        api._SprintAggregates(),
+                    ),
+                )
+                for sprint in sprints
+            ]
+        )
+
+
+def legacy_runtime_summary(engine: Engine, product_id: int) -> int:
+    """Build the detail view's runtime summary from every loaded sprint graph."""
+    with Session(engine) as session:
+        sprints = session.exec(
+            api._saved_sprint_query().where(Sprint.product_id == product_id)
+        ).all()
+        return len(api._build_sprint_runtime_summary(sprints))
 
-    emit(f"Result success: {result.get('success')}")
-    emit(f"Sprints found: {len(result.get('sprints', []))}")
-    emit(f"Total queries executed: {query_counter.count}")
 
-    return query_counter.count
+def indexed_runtime_summary(engine: Engine, product_id: int) -> int:
+    """Build the detail view's runtime summary from status columns only."""
+    with Session(engine) as session:
+        rows = api._load_sprint_runtime_rows(session, product_id)
+        return len(api._build_sprint_runtime_summary(rows))
+
+
+def _measure(
+    engine: Engine, action: Callable[[Engine, int], int], product_id: int, runs: int
+) -> tuple[list[float], int]:
+    queries = 0
+
+    def count(*_args: object) -> None:
+        nonlocal queries
+        queries += 1
+
+    samples: list[float] = []
+    for _ in range(runs):
+        queries = 0
+        event.listen(engine, "before_cursor_execute", count)
+        started = time.perf_counter()
+        action(engine, product_id)
+        samples.append((time.perf_counter() - started) * 1000)
+        event.remove(engine, "before_cursor_execute", count)
+    return samples, queries
+
+
+def run_benchmark(
+    *, sprint_count: int, stories_per_sprint: int, tasks_per_story: int, runs: int
+) -> None:
+    """Seed a temporary database and print timings for each read path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'sprints.db'}")
+        SQLModel.metadata.create_all(engine)
+        product_id = seed(
+            engine,
+            sprint_count=sprint_count,
+            stories_per_sprint=stories_per_sprint,
+            tasks_per_story=tasks_per_story,
+        )
+        emit(
+            f"{sprint_count} sprints x {stories_per_sprint} stories x "
+            f"{tasks_per_story} tasks"
+        )
+        for label, action in (
+            ("list: eager story/task graph", legacy_list),
+            ("list: grouped SQL aggregates", aggregate_list),
+            ("detail summary: all sprint graphs", legacy_runtime_summary),
+            ("detail summary: status columns", indexed_runtime_summary),
+        ):
+            samples, queries = _measure(engine, action, product_id, runs)
+            emit(
+                f"{label:<36} median={statistics.median(samples):8.2f}ms "
+                f"min={min(samples):8.2f}ms queries={queries}"
+            )
+        engine.dispose()
+
+
+def main() -> None:
+    """Parse CLI arguments and run the sprint list benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the saved-sprint list and detail read paths."
+    )
+    parser.add_argument("--sprints", type=int, default=300)
+    parser.add_argument("--stories-per-sprint", type=int, default=8)
+    parser.add_argument("--tasks-per-story", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(
+        sprint_count=args.sprints,
+        stories_per_sprint=args.stories_per_sprint,
+        tasks_per_story=args.tasks_per_story,
+        runs=args.runs,
+    )
 
 
 if __name__ == "__main__":
-    run_benchmark()
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark API request latency with file logging off, synchronous, or queued.
+
+A minimal FastAPI app (with the correlation-ID middleware) logs ``--lines``
+INFO records per request. Each mode serves ``--requests`` requests in-process:
+
+* ``off``: no file handlers, so log calls are filtered out by level;
+* ``sync``: ``RotatingFileHandler`` on the root logger (the previous setup),
+  so every log call writes to disk on the request path;
+* ``queued``: the bounded ``QueueHandler`` / ``QueueListener`` pipeline from
+  ``utils.logging_config``; the listener thread does the file writes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.cli_output import emit
+from utils.logging_config import CorrelationIdMiddleware, file_log_queue
+
+MODES = ("off", "sync", "queued")
+_logger = logging.getLogger("benchmark.logging")
+
+
+def _build_app(lines: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CorrelationIdMiddleware)
+
+    @app.get("/work")
+    async def work() -> dict[str, int]:
+        for index in range(lines):
+            _logger.info("request step %s of %s", index + 1, lines)
+        return {"lines": lines}
+
+    return app
+
+
+def _file_handler(path: Path) -> RotatingFileHandler:
+    handler = RotatingFileHandler(
+        path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+    )
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    return handler
+
+
+def _configure(mode: str, log_dir: Path) -> list[logging.Handler]:
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    if mode == "off":
+        root.setLevel(logging.WARNING)
+        return []
+    root.setLevel(logging.INFO)
+    file_handler = _file_handler(log_dir / f"{mode}.log")
+    if mode == "sync":
+        root.addHandler(file_handler)
+        return [file_handler]
+    queue_handler = file_log_queue.start([file_handler], max_size=10000, block=True)
+    root.addHandler(queue_handler)
+    return [queue_handler]
+
+
+def measure_mode(mode: str, *, requests: int, lines: int) -> dict[str, float]:
+    """Return request latency percentiles (ms) for one logging mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        handlers = _configure(mode, Path(tmp))
+        client = TestClient(_build_app(lines))
+        client.get("/work")
+        samples: list[float] = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            client.get("/work")
+            samples.append((time.perf_counter() - started) * 1000)
+        flush_started = time.perf_counter()
+        file_log_queue.stop()
+        flush_ms = (time.perf_counter() - flush_started) * 1000
+        root = logging.getLogger()
+        for handler in handlers:
+            root.removeHandler(handler)
+            handler.close()
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "flush_ms": flush_ms,
+    }
+
+
+def run_benchmark(requests: int, lines: int) -> dict[str, dict[str, float]]:
+    """Measure every logging mode and print one summary line each."""
+    results: dict[str, dict[str, float]] = {}
+    for mode in MODES:
+        result = measure_mode(mode, requests=requests, lines=lines)
+        results[mode] = result
+        emit(
+            f"{mode:>6}: mean={result['mean_ms']:.3f}ms "
+            f"p50={result['p50_ms']:.3f}ms p95={result['p95_ms']:.3f}ms "
+            f"(shutdown flush {result['flush_ms']:.1f}ms)"
+        )
+    return results
+
+
+def main() -> None:
+    """Parse CLI arguments and run the logging benchmark."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark API request latency with file logging off, "
+            "synchronous, or queued."
+        )
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=20)
+    args = parser.parse_args()
+    run_benchmark(args.requests, args.lines)
+
+
+if __name__ == "__main__":
+    main()
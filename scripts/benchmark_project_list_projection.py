@@ -0,0 +1,119 @@
+"""Benchmark project list queries with large spec blobs.
+
+Seeds a file-backed SQLite database with products carrying ~500 KB
+``technical_spec`` and compiled-authority payloads, then times:
+
+* the legacy full-row ``select(Product)`` load used by list views;
+* ``ProductRepository.list_summaries`` (column projection);
+* ``_query_products`` (``load_only`` for the projects cache).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from agile_sqlmodel import Product
+from repositories.product import ProductRepository
+from services.orchestrator_query_service import _query_products
+from utils.cli_output import emit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Engine
+
+
+def seed(engine: Engine, product_count: int, spec_bytes: int) -> None:
+    """Insert ``product_count`` products with ``spec_bytes``-sized blobs."""
+    spec = "s" * spec_bytes
+    authority = '{"invariants": ["' + "a" * (spec_bytes - 20) + '"]}'
+    with Session(engine) as session:
+        for index in range(product_count):
+            session.add(
+                Product(
+                    name=f"Product {index}",
+                    description="Description",
+                    vision="Vision",
+                    technical_spec=spec,
+                    spec_file_path=f"specs/product_{index}.md",
+                    compiled_authority_json=authority,
+                )
+            )
+        session.commit()
+
+
+def _measure(action: Callable[[], int], runs: int) -> tuple[list[float], int, int]:
+    samples: list[float] = []
+    rows = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = action()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    action()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, rows, peak
+
+
+def run_benchmark(product_count: int, spec_bytes: int, runs: int) -> None:
+    """Seed a temporary database and print timings for each list query."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'projects.db'}")
+        SQLModel.metadata.create_all(engine)
+        seed(engine, product_count, spec_bytes)
+        repository = ProductRepository(Session(engine))
+
+        def full_rows() -> int:
+            with Session(engine) as session:
+                return len(session.exec(select(Product)).all())
+
+        def summaries() -> int:
+            return len(repository.list_summaries())
+
+        def cache_rows() -> int:
+            with Session(engine) as session:
+                return len(_query_products(session))
+
+        emit(
+            f"{product_count} products, ~{spec_bytes // 1024} KB spec + authority each"
+        )
+        for label, action in (
+            ("select(Product) full rows", full_rows),
+            ("list_summaries projection", summaries),
+            ("_query_products load_only", cache_rows),
+        ):
+            samples, rows, peak = _measure(action, runs)
+            emit(
+                f"{label:<28} median={statistics.median(samples):8.2f}ms "
+                f"min={min(samples):8.2f}ms rows={rows} "
+                f"peak_alloc={peak / 1024 / 1024:.1f}MB"
+            )
+        engine.dispose()
+
+
+def main() -> None:
+    """Parse CLI arguments and run the projection benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark project list queries with large spec blobs."
+    )
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--spec-bytes", type=int, default=500 * 1024)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.products, args.spec_bytes, args.runs)
+
+
+if __name__ == "__main__":
+    main()
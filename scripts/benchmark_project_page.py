@@ -0,0 +1,437 @@
+"""Benchmark bytes on the wire and time-to-interactive for the project page.
+
+A temporary database is seeded with a realistic project: a backlog of user
+stories under themes, epics and features, a planned sprint holding a share of
+them, and session state with vision, backlog and roadmap attempt arrays.
+``uvicorn api:app`` then serves it and the benchmark reports:
+
+* for the page, its script and every API read it issues on load, the body size
+  with ``Accept-Encoding: identity``, the size with ``gzip, br`` and the status
+  of a revalidation carrying the returned ETag;
+* when Playwright and a Chromium build are installed, time-to-interactive of
+  cold and warm (cached) loads, optionally under a throttled network. It is
+  taken as the later of ``DOMContentLoaded`` and the end of the last ``fetch``
+  issued while the page loads; requests to other hosts (the Tailwind CDN,
+  fonts) are blocked so the numbers only cover this server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from utils.cli_output import emit
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SETTLE_MS = 2000
+_RNG = random.Random(49)  # noqa: S311
+_VOCABULARY = (
+    "user team sprint story backlog roadmap vision feature epic theme release "
+    "dashboard report export import account billing invoice payment search "
+    "filter notify review approve reject assign schedule deadline priority "
+    "estimate risk metric latency audit permission role admin customer "
+    "partner mobile offline sync upload archive restore history comment "
+    "the a of to and with for when so that can should must without each"
+)
+_THROTTLED_NETWORK = {
+    "offline": False,
+    "latency": 150,
+    "downloadThroughput": 1.6 * 1024 * 1024 / 8,
+    "uploadThroughput": 750 * 1024 / 8,
+}
+_TTI_PROBE = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fetches = performance.getEntriesByType('resource')
+        .filter((entry) => entry.initiatorType === 'fetch');
+    const ends = fetches.map((entry) => entry.responseEnd);
+    return {
+        tti: Math.max(nav.domContentLoadedEventEnd, ...ends),
+        transfer: [nav, ...performance.getEntriesByType('resource')]
+            .reduce((total, entry) => total + (entry.transferSize || 0), 0),
+        fetches: fetches.length,
+    };
+}"""
+
+
+def _benchmark_env(tmp_dir: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env["AGILEFORGE_DB_URL"] = f"sqlite:///{tmp_dir / 'business.db'}"
+    env["AGILEFORGE_SESSION_DB_URL"] = f"sqlite:///{tmp_dir / 'sessions.db'}"
+    env.setdefault("MODEL_CONFIG_PATH", str(ROOT / "config" / "models.test.yaml"))
+    env["PYTHONPATH"] = str(ROOT)
+    env.pop("AGILEFORGE_PREWARM_AGENTS", None)
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _prose(words: int) -> str:
+    """Return varied text so compression ratios resemble generated content."""
+    return " ".join(_RNG.choices(_VOCABULARY.split(), k=words)).capitalize()
+
+
+def _attempt_artifact(phase: str, index: int, stories: int) -> dict[str, Any]:
+    return {
+        "is_complete": index % 3 == 0,
+        "summary": f"{phase} draft {index}: {_prose(60)}",
+        "items": [
+            {
+                "title": f"{phase} item {item}: {_prose(5)}",
+                "description": _prose(45),
+                "acceptance_criteria": [_prose(12) for _ in range(4)],
+            }
+            for item in range(max(stories // 4, 10))
+        ],
+    }
+
+
+def _require_id(value: int | None, name: str) -> int:
+    if value is None:
+        msg = f"{name} was not generated"
+        raise RuntimeError(msg)
+    return value
+
+
+def _seed_backlog(stories: int) -> int:
+    from sqlmodel import Session  # noqa: PLC0415
+
+    from models.core import (  # noqa: PLC0415
+        Epic,
+        Feature,
+        Product,
+        Sprint,
+        SprintStory,
+        Team,
+        Theme,
+        UserStory,
+    )
+    from models.db import ensure_business_db_ready, get_engine  # noqa: PLC0415
+
+    ensure_business_db_ready()
+    today = datetime.now(UTC).date()
+    with Session(get_engine()) as session:
+        product = Product(
+            name="Benchmark project",
+            vision=_prose(120),
+            description="Project seeded for the project page benchmark.",
+        )
+        team = Team(name="Benchmark team")
+        session.add(product)
+        session.add(team)
+        session.flush()
+        product_id = _require_id(product.product_id, "Product ID")
+        sprint = Sprint(
+            goal="Ship the first increment",
+            start_date=today,
+            end_date=today + timedelta(days=14),
+            product_id=product_id,
+            team_id=_require_id(team.team_id, "Team ID"),
+        )
+        session.add(sprint)
+        session.flush()
+        sprint_id = _require_id(sprint.sprint_id, "Sprint ID")
+
+        features: list[int] = []
+        for theme_index in range(5):
+            theme = Theme(title=f"Theme {theme_index}", product_id=product_id)
+            session.add(theme)
+            session.flush()
+            for epic_index in range(4):
+                epic = Epic(
+                    title=f"Epic {epic_index}",
+                    theme_id=_require_id(theme.theme_id, "Theme ID"),
+                )
+                session.add(epic)
+                session.flush()
+                for feature_index in range(3):
+                    feature = Feature(
+                        title=f"Feature {feature_index}",
+                        epic_id=_require_id(epic.epic_id, "Epic ID"),
+                    )
+                    session.add(feature)
+                    session.flush()
+                    features.append(_require_id(feature.feature_id, "Feature ID"))
+
+        for index in range(stories):
+            story = UserStory(
+                product_id=product_id,
+                feature_id=features[index % len(features)],
+                title=f"Story {index}: {_prose(6)}",
+                story_description=_prose(40),
+                acceptance_criteria="\n".join(f"- {_prose(12)}" for _ in range(5)),
+                story_points=index % 8 + 1,
+            )
+            session.add(story)
+            session.flush()
+            if index % 5 == 0:
+                story_id = _require_id(story.story_id, "Story ID")
+                session.add(SprintStory(sprint_id=sprint_id, story_id=story_id))
+        session.commit()
+    return product_id
+
+
+def _seed_session_state(product_id: int, stories: int, attempts: int) -> None:
+    import asyncio  # noqa: PLC0415
+
+    from services.phases import workflow_state  # noqa: PLC0415
+    from services.workflow import WorkflowService  # noqa: PLC0415
+
+    workflow = WorkflowService()
+    session_id = str(product_id)
+    asyncio.run(workflow.initialize_session(session_id))
+    state = workflow.get_session_status(session_id)
+    started = datetime.now(UTC) - timedelta(minutes=attempts)
+    for index in range(attempts):
+        created_at = (started + timedelta(minutes=index)).isoformat()
+        for phase in ("vision", "backlog", "roadmap"):
+            workflow_state.record_phase_attempt(
+                state,
+                attempts_key=f"{phase}_attempts",
+                last_input_context_key=f"{phase}_last_input_context",
+                assessment_key=f"product_{phase}_assessment",
+                trigger="manual_refine",
+                input_context={"user_input": f"{phase} feedback {index}"},
+                output_artifact=_attempt_artifact(phase, index, stories),
+                is_complete=index == attempts - 1,
+                created_at=created_at.replace("+00:00", "Z"),
+            )
+    state["fsm_state"] = "SPRINT_SETUP"
+    state["setup_status"] = "passed"
+    workflow.update_session_status(session_id, state)
+
+
+def seed_project(stories: int, attempts: int) -> int:
+    """Create the benchmark project and its session state; return its id."""
+    product_id = _seed_backlog(stories)
+    _seed_session_state(product_id, stories, attempts)
+    return product_id
+
+
+def _start_server(env: dict[str, str], port: int) -> subprocess.Popen[bytes]:
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "uvicorn", "api:app", "--port", str(port)],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.perf_counter() + 180
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            msg = f"uvicorn exited early with code {process.returncode}"
+            raise RuntimeError(msg)
+        try:
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}/api/metrics", timeout=1
+            ):
+                return process
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.05)
+    process.terminate()
+    msg = "uvicorn did not answer within 180s"
+    raise TimeoutError(msg)
+
+
+def _get(url: str, headers: dict[str, str]) -> tuple[int, bytes, dict[str, str]]:
+    request = urllib.request.Request(url, headers=headers)  # noqa: S310
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:  # noqa: S310
+            return response.status, response.read(), dict(response.headers)
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read(), dict(exc.headers)
+
+
+def measure_wire_bytes(base_url: str, project_id: int) -> list[dict[str, Any]]:
+    """Return identity, encoded and revalidated sizes of the page's resources."""
+    _, page, _ = _get(
+        f"{base_url}/dashboard/project.html", {"Accept-Encoding": "identity"}
+    )
+    scripts = re.findall(r'src="(/dashboard/[^"]+\.js[^"]*)"', page.decode())
+    paths = [
+        "/dashboard/project.html",
+        *scripts,
+        "/api/dashboard/config",
+        "/api/projects",
+        f"/api/projects/{project_id}/state",
+        f"/api/projects/{project_id}/sprints",
+        f"/api/projects/{project_id}/vision/history",
+        f"/api/projects/{project_id}/backlog/history",
+        f"/api/projects/{project_id}/roadmap/history",
+        f"/api/projects/{project_id}/story/pending",
+    ]
+    rows = []
+    for path in paths:
+        url = f"{base_url}{path}"
+        status, identity, _ = _get(url, {"Accept-Encoding": "identity"})
+        _, encoded, headers = _get(url, {"Accept-Encoding": "gzip, br"})
+        etag = headers.get("etag")
+        revalidated = (
+            _get(url, {"If-None-Match": etag})[0] if etag is not None else None
+        )
+        rows.append(
+            {
+                "path": path,
+                "status": status,
+                "identity_bytes": len(identity),
+                "encoded_bytes": len(encoded),
+                "encoding": headers.get("content-encoding", "identity"),
+                "revalidate_status": revalidated,
+                "cache_control": headers.get("cache-control"),
+            }
+        )
+    return rows
+
+
+def measure_time_to_interactive(
+    base_url: str, project_id: int, *, runs: int, throttle: bool
+) -> dict[str, list[dict[str, float]]] | None:
+    """Return cold and warm page loads measured in Chromium, if available."""
+    try:
+        from playwright.sync_api import Error, sync_playwright  # noqa: PLC0415
+    except ModuleNotFoundError:
+        emit("time-to-interactive: skipped (playwright is not installed)")
+        return None
+
+    url = f"{base_url}/dashboard/project.html?id={project_id}"
+    results: dict[str, list[dict[str, float]]] = {"cold": [], "warm": []}
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Error as exc:
+            emit(f"time-to-interactive: skipped ({str(exc).splitlines()[0]})")
+            return None
+        try:
+            for _ in range(runs):
+                context = browser.new_context()
+                context.route(
+                    re.compile(r"^https?://(?!127\.0\.0\.1)"),
+                    lambda route: route.abort(),
+                )
+                page = context.new_page()
+                if throttle:
+                    cdp = context.new_cdp_session(page)
+                    cdp.send("Network.enable")
+                    cdp.send("Network.emulateNetworkConditions", _THROTTLED_NETWORK)
+                for label in ("cold", "warm"):
+                    page.goto(url, wait_until="load")
+                    page.wait_for_timeout(_SETTLE_MS)
+                    results[label].append(page.evaluate(_TTI_PROBE))
+                context.close()
+        finally:
+            browser.close()
+    return results
+
+
+def _summary(samples: list[float], unit: str) -> str:
+    return (
+        f"median={statistics.median(samples):.0f}{unit} "
+        f"min={min(samples):.0f}{unit} max={max(samples):.0f}{unit} (n={len(samples)})"
+    )
+
+
+def run_benchmark(
+    *, stories: int, attempts: int, runs: int, throttle: bool
+) -> dict[str, object]:
+    """Seed, serve and measure the project page; print a summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _benchmark_env(Path(tmp))
+        seeded = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--seed-only",
+                "--stories",
+                str(stories),
+                "--attempts",
+                str(attempts),
+            ],
+            cwd=ROOT,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        project_id = int(json.loads(seeded.stdout.strip().splitlines()[-1]))
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = _start_server(env, port)
+        try:
+            rows = measure_wire_bytes(base_url, project_id)
+            tti = measure_time_to_interactive(
+                base_url, project_id, runs=runs, throttle=throttle
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    emit(f"project {project_id}: {stories} stories, {attempts} attempts per phase")
+    for row in rows:
+        emit(
+            f"{row['path']}: {row['identity_bytes']}B identity -> "
+            f"{row['encoded_bytes']}B {row['encoding']}, "
+            f"revalidate={row['revalidate_status']}, "
+            f"cache-control={row['cache_control']}"
+        )
+    identity_total = sum(row["identity_bytes"] for row in rows)
+    encoded_total = sum(row["encoded_bytes"] for row in rows)
+    emit(
+        f"total: {identity_total}B identity -> {encoded_total}B encoded "
+        f"({encoded_total / identity_total:.1%})"
+    )
+    if tti is not None:
+        for label, samples in tti.items():
+            emit(
+                f"time-to-interactive ({label}): "
+                f"{_summary([sample['tti'] for sample in samples], 'ms')}, "
+                f"transfer {_summary([sample['transfer'] for sample in samples], 'B')}"
+            )
+    return {"project_id": project_id, "resources": rows, "time_to_interactive": tti}
+
+
+def main() -> None:
+    """Parse CLI arguments and run the project page benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark bytes on the wire and time-to-interactive."
+    )
+    parser.add_argument("--stories", type=int, default=300)
+    parser.add_argument("--attempts", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--throttle",
+        action="store_true",
+        help="Emulate a 1.6 Mbps, 150 ms latency network in the browser.",
+    )
+    parser.add_argument("--seed-only", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.seed_only:
+        sys.stdout.write(f"{seed_project(args.stories, args.attempts)}\n")
+        return
+    run_benchmark(
+        stories=args.stories,
+        attempts=args.attempts,
+        runs=args.runs,
+        throttle=args.throttle,
+    )
+
+
+if __name__ == "__main__":
+    main()
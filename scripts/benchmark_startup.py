@@ -0,0 +1,178 @@
+"""Benchmark API startup and test-suite import time.
+
+Each measurement runs in a fresh interpreter so module caches do not carry over:
+
+* ``import api`` wall time, plus whether LiteLLM and any agents were loaded;
+* ``uvicorn api:app`` time until ``GET /api/metrics`` answers, with and
+  without ``AGILEFORGE_PREWARM_AGENTS=all``;
+* ``pytest --collect-only`` time, i.e. the import phase of the test suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from utils.cli_output import emit
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import api
+elapsed = time.perf_counter() - started
+from orchestrator_agent.agent_registry import agent_registry
+print(json.dumps({
+    "seconds": elapsed,
+    "litellm_loaded": "litellm" in sys.modules,
+    "agents_built": [n for n in agent_registry.names if agent_registry.is_built(n)],
+}))
+"""
+
+
+def _benchmark_env(tmp_dir: Path, *, prewarm: bool = False) -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("AGILEFORGE_DB_URL", f"sqlite:///{tmp_dir / 'business.db'}")
+    env.setdefault("AGILEFORGE_SESSION_DB_URL", f"sqlite:///{tmp_dir / 'sessions.db'}")
+    env.setdefault("MODEL_CONFIG_PATH", str(ROOT / "config" / "models.test.yaml"))
+    env["PYTHONPATH"] = str(ROOT)
+    if prewarm:
+        env["AGILEFORGE_PREWARM_AGENTS"] = "all"
+    else:
+        env.pop("AGILEFORGE_PREWARM_AGENTS", None)
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def measure_import(env: dict[str, str]) -> dict[str, object]:
+    """Return import timing and laziness flags for one fresh interpreter."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _IMPORT_PROBE],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_uvicorn_startup(env: dict[str, str], *, timeout: float = 180.0) -> float:
+    """Return seconds from launching uvicorn until the API answers."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/api/metrics"
+    started = time.perf_counter()
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "uvicorn", "api:app", "--port", str(port)],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                msg = f"uvicorn exited early with code {process.returncode}"
+                raise RuntimeError(msg)
+            try:
+                with urllib.request.urlopen(url, timeout=1):  # noqa: S310
+                    return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.05)
+        msg = f"uvicorn did not answer within {timeout:.0f}s"
+        raise TimeoutError(msg)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def measure_test_collection(env: dict[str, str]) -> float:
+    """Return seconds spent collecting (importing) the test suite."""
+    started = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+        ],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - started
+
+
+def _summary(samples: list[float]) -> str:
+    return (
+        f"median={statistics.median(samples):.2f}s "
+        f"min={min(samples):.2f}s max={max(samples):.2f}s (n={len(samples)})"
+    )
+
+
+def run_benchmark(runs: int, *, skip_tests: bool = False) -> dict[str, object]:
+    """Run every startup measurement ``runs`` times and print a summary."""
+    with tempfile.TemporaryDirectory() as tmp:
+        lazy_env = _benchmark_env(Path(tmp))
+        prewarm_env = _benchmark_env(Path(tmp), prewarm=True)
+
+        imports = [measure_import(lazy_env) for _ in range(runs)]
+        import_seconds = [float(str(sample["seconds"])) for sample in imports]
+        emit(f"import api: {_summary(import_seconds)}")
+        emit(f"  litellm loaded at import: {imports[-1]['litellm_loaded']}")
+        emit(f"  agents built at import: {imports[-1]['agents_built'] or 'none'}")
+
+        lazy = [measure_uvicorn_startup(lazy_env) for _ in range(runs)]
+        emit(f"uvicorn api:app (lazy agents): {_summary(lazy)}")
+        warm = [measure_uvicorn_startup(prewarm_env) for _ in range(runs)]
+        emit(f"uvicorn api:app (prewarm all): {_summary(warm)}")
+
+        results: dict[str, object] = {
+            "import_seconds": import_seconds,
+            "uvicorn_lazy_seconds": lazy,
+            "uvicorn_prewarm_seconds": warm,
+        }
+        if not skip_tests:
+            collection = [measure_test_collection(lazy_env) for _ in range(runs)]
+            emit(f"pytest --collect-only: {_summary(collection)}")
+            results["test_collection_seconds"] = collection
+    return results
+
+
+def main() -> None:
+    """Parse CLI arguments and run the startup benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark API startup and test-suite import time."
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--skip-tests",
+        action="store_true",
+        help="Skip the pytest --collect-only measurement.",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.runs, skip_tests=args.skip_tests)
+
+
+if __name__ == "__main__":
+    main()
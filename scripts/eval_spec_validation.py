@@ -8,28 +8,38 @@ import asyncio
 import json
 import logging
 import math
+import multiprocessing
 import random
 import secrets
 import statistics
 import sys
+import tempfile
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from utils.branch_trace import BranchTracer
 from utils.cli_output import emit
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.append(str(REPO_ROOT))
 
+from services.specs.story_validation_service import (  # noqa: E402
+    shared_validator_loop,  # pylint: disable=wrong-import-position
+)
 from tools.spec_tools import (  # noqa: E402
     validate_story_with_spec_authority,  # pylint: disable=wrong-import-position
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 ValidationMode = str
 VALID_MODES: tuple[ValidationMode, ...] = ("deterministic", "llm", "hybrid")
@@ -38,9 +48,7 @@ DEFAULT_CONCURRENCY = 20
 RETRY_ATTEMPTS = 2
 RETRY_BASE_DELAY_SECONDS = 1.0
 RETRY_JITTER_SECONDS = 0.25
-BRANCH_LOG_LIMIT = 20
-_BRANCH_LOG_COUNTS: dict[str, int] = {}
-_BRANCH_LOG_SUPPRESSED: set[str] = set()
+TRACE = BranchTracer()
 _RETRY_JITTER_RANDOM = secrets.SystemRandom()
 _PROVIDER_ERROR_PATTERNS: tuple[str, ...] = (
     "requires more credits",
@@ -64,24 +72,6 @@ _RETRYABLE_ERROR_PATTERNS: tuple[str, ...] = (
 )
 
 
-def _branch(name: str, condition: bool, when_true: str, when_false: str) -> bool:
-    count = _BRANCH_LOG_COUNTS.get(name, 0) + 1
-    _BRANCH_LOG_COUNTS[name] = count
-    if count <= BRANCH_LOG_LIMIT:
-        if condition:
-            LOGGER.debug("[if:%s] TRUE - %s", name, when_true)
-        else:
-            LOGGER.debug("[if:%s] FALSE - %s", name, when_false)
-    elif name not in _BRANCH_LOG_SUPPRESSED:
-        _BRANCH_LOG_SUPPRESSED.add(name)
-        LOGGER.debug(
-            "[if:%s] log limit reached; suppressing further repeats (limit=%d)",
-            name,
-            BRANCH_LOG_LIMIT,
-        )
-    return bool(condition)
-
-
 def _retry_jitter_seconds() -> float:
     return _RETRY_JITTER_RANDOM.uniform(0, RETRY_JITTER_SECONDS)
 
@@ -92,12 +82,7 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
     with path.open("r", encoding="utf-8") as handle:
         for idx, line in enumerate(handle, start=1):
             line = line.strip()  # noqa: PLW2901
-            if _branch(
-                "read_jsonl.empty_line",
-                not line,
-                f"Skipping empty line {idx}",
-                f"Parsing line {idx}",
-            ):
+            if TRACE.branch("read_jsonl.empty_line", not line):
                 continue
             try:
                 row = json.loads(line)
@@ -129,39 +114,31 @@ def _read_cases(path: Path, include_disabled: bool) -> list[dict[str, Any]]:
     for idx, case in enumerate(cases, start=1):
         case_id = case.get("case_id") or f"case-{idx}"
         enabled = case.get("enabled", True)
-        if _branch(
+        if TRACE.branch(
             "read_cases.skip_disabled",
-            (not include_disabled and enabled is False),
-            f"Skipping disabled case_id={case_id}",
-            f"Keeping case_id={case_id}",
+            not include_disabled and enabled is False,
         ):
             continue
         story_id = case.get("story_id")
         spec_version_id = case.get("spec_version_id")
-        if _branch(
+        if TRACE.branch(
             "read_cases.invalid_story_or_spec",
-            (not isinstance(story_id, int) or not isinstance(spec_version_id, int)),
-            f"Invalid IDs for case_id={case_id}; raising",
-            f"Valid IDs for case_id={case_id}",
+            not isinstance(story_id, int) or not isinstance(spec_version_id, int),
         ):
             msg = f"Case {case_id} must include integer story_id and spec_version_id"
             raise ValueError(
                 msg
             )
         expected_pass = case.get("expected_pass")
-        if _branch(
+        if TRACE.branch(
             "read_cases.expected_pass_not_bool",
             not isinstance(expected_pass, bool),
-            f"case_id={case_id} expected_pass is unlabeled",
-            f"case_id={case_id} expected_pass is labeled",
         ):
             expected_pass = None
         expected_fail_reasons = case.get("expected_fail_reasons") or []
-        if _branch(
+        if TRACE.branch(
             "read_cases.expected_fail_reasons_not_list",
             not isinstance(expected_fail_reasons, list),
-            f"case_id={case_id} fail reasons not list; defaulting to []",
-            f"case_id={case_id} fail reasons list accepted",
         ):
             expected_fail_reasons = []
         expected_fail_reasons = [str(v) for v in expected_fail_reasons]
@@ -186,18 +163,14 @@ def _read_cases(path: Path, include_disabled: bool) -> list[dict[str, Any]]:
 def _extract_reason_codes(result: dict[str, Any]) -> list[str]:
     codes = set()
     for failure in result.get("failures", []):
-        if _branch(
+        if TRACE.branch(
             "extract_reason_codes.failure_is_dict",
             isinstance(failure, dict),
-            "Failure entry is dict",
-            "Failure entry ignored (non-dict)",
         ):
             rule = failure.get("rule")
-            if _branch(
+            if TRACE.branch(
                 "extract_reason_codes.rule_is_nonempty_str",
                 isinstance(rule, str) and bool(rule.strip()),
-                f"Recording rule={rule!r}",
-                f"Ignoring invalid/empty rule={rule!r}",
             ):
                 codes.add(rule.strip())
     return sorted(codes)
@@ -221,27 +194,26 @@ def _is_retryable_error_text(text: str) -> bool:
 
 
 def _safe_mean(values: Sequence[float]) -> float | None:
-    if _branch(
-        "safe_mean.empty_values",
-        not values,
-        "Returning None for empty mean input",
-        f"Computing mean over n={len(values)}",
-    ):
+    if TRACE.branch("safe_mean.empty_values", not values):
         return None
     return float(sum(values) / len(values))
 
 
 def _safe_median(values: Sequence[float]) -> float | None:
-    if _branch(
-        "safe_median.empty_values",
-        not values,
-        "Returning None for empty median input",
-        f"Computing median over n={len(values)}",
-    ):
+    if TRACE.branch("safe_median.empty_values", not values):
         return None
     return float(statistics.median(values))
 
 
+def _resample_indices(
+    size: int, *, n_resamples: int, seed: int
+) -> np.ndarray[Any, np.dtype[np.intp]]:
+    """Draw every bootstrap resample as one ``(n_resamples, size)`` index matrix."""
+    # Bootstrap sampling is intentionally deterministic for reproducible metrics.
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, size, size=(n_resamples, size))
+
+
 def _bootstrap_ci(
     values: Sequence[float],
     *,
@@ -249,78 +221,46 @@ def _bootstrap_ci(
     seed: int = 42,
 ) -> tuple[float, float] | None:
     """Compute bootstrap percentile CI for a list of scalar values."""
-    if _branch(
-        "bootstrap_ci.empty_values",
-        not values,
-        "Returning None for empty bootstrap input",
-        f"Running bootstrap_ci n={len(values)} resamples={n_resamples} seed={seed}",
-    ):
+    if TRACE.branch("bootstrap_ci.empty_values", not values):
         return None
-    # Bootstrap sampling is intentionally deterministic for reproducible metrics.
-    rng = random.Random(seed)  # noqa: S311  # nosec B311
-    samples: list[float] = []
-    value_list = list(values)
-    for _ in range(n_resamples):
-        sample = [rng.choice(value_list) for _ in range(len(value_list))]
-        samples.append(sum(sample) / len(sample))
-    samples.sort()
+    value_array = np.asarray(values, dtype=float)
+    indices = _resample_indices(len(value_array), n_resamples=n_resamples, seed=seed)
+    samples = np.sort(value_array[indices].mean(axis=1))
     low_idx = int(0.025 * (len(samples) - 1))
     high_idx = int(0.975 * (len(samples) - 1))
-    return samples[low_idx], samples[high_idx]
+    return float(samples[low_idx]), float(samples[high_idx])
 
 
 def _precision(tp: int, fp: int) -> float | None:
     denom = tp + fp
-    if _branch(
-        "precision.zero_denominator",
-        denom == 0,
-        f"tp={tp}, fp={fp} -> None",
-        f"tp={tp}, fp={fp} -> compute",
-    ):
+    if TRACE.branch("precision.zero_denominator", denom == 0):
         return None
     return tp / denom
 
 
 def _recall(tp: int, fn: int) -> float | None:
     denom = tp + fn
-    if _branch(
-        "recall.zero_denominator",
-        denom == 0,
-        f"tp={tp}, fn={fn} -> None",
-        f"tp={tp}, fn={fn} -> compute",
-    ):
+    if TRACE.branch("recall.zero_denominator", denom == 0):
         return None
     return tp / denom
 
 
 def _f1(precision: float | None, recall: float | None) -> float | None:
-    if _branch(
+    if TRACE.branch(
         "f1.missing_precision_or_recall",
         precision is None or recall is None,
-        f"precision={precision}, recall={recall} -> None",
-        f"precision={precision}, recall={recall} -> continue",
     ):
         return None
     if precision is None or recall is None:
         return None
     denom = precision + recall
-    if _branch(
-        "f1.zero_denominator",
-        math.isclose(denom, 0.0),
-        "precision+recall ~= 0 -> None",
-        "precision+recall valid -> compute",
-    ):
+    if TRACE.branch("f1.zero_denominator", math.isclose(denom, 0.0)):
         return None
     return 2 * precision * recall / denom
 
 
 def _fmt_ci(ci: tuple[float, float] | None) -> str:
-    if _branch(
-        "fmt_ci.none_ci",
-        ci is None,
-        "CI missing -> '-'",
-        "CI present -> format range",
-    ):
+    if TRACE.branch("fmt_ci.none_ci", ci is None):
         return "-"
     if ci is None:
         return "-"
@@ -333,37 +273,88 @@ def _confusion_from_rows(rows: Sequence[dict[str, Any]]) -> dict[str, int]:
         expected_pass = bool(row["expected_pass"])
         predicted_fail = bool(row["predicted_fail"])
         expected_fail = not expected_pass
-        if _branch(
-            "confusion.tp",
-            expected_fail and predicted_fail,
-            f"case contributes TP (expected_fail={expected_fail}, predicted_fail={predicted_fail})",  # noqa: E501
-            "not TP",
-        ):
+        if TRACE.branch("confusion.tp", expected_fail and predicted_fail):
             tp += 1
-        elif _branch(
-            "confusion.fp",
-            (not expected_fail and predicted_fail),
-            f"case contributes FP (expected_fail={expected_fail}, predicted_fail={predicted_fail})",  # noqa: E501
-            "not FP",
-        ):
+        elif TRACE.branch("confusion.fp", not expected_fail and predicted_fail):
             fp += 1
-        elif _branch(
-            "confusion.tn",
-            (not expected_fail and not predicted_fail),
-            f"case contributes TN (expected_fail={expected_fail}, predicted_fail={predicted_fail})",  # noqa: E501
-            "not TN",
-        ):
+        elif TRACE.branch("confusion.tn", not expected_fail and not predicted_fail):
             tn += 1
-        elif _branch(
-            "confusion.fn",
-            (expected_fail and not predicted_fail),
-            f"case contributes FN (expected_fail={expected_fail}, predicted_fail={predicted_fail})",  # noqa: E501
-            "not FN",
-        ):
+        elif TRACE.branch("confusion.fn", expected_fail and not predicted_fail):
             fn += 1
     return {"tp": tp, "fp": fp, "tn": tn, "fn": fn}
 
 
+def _bootstrap_confusion(
+    rows: Sequence[dict[str, Any]], *, n_resamples: int, seed: int
+) -> dict[str, np.ndarray[Any, np.dtype[np.int64]]]:
+    """Return TP/FP/TN/FN counts for every bootstrap resample of ``rows``."""
+    expected_fail = np.fromiter(
+        (not row["expected_pass"] for row in rows), dtype=bool, count=len(rows)
+    )
+    predicted_fail = np.fromiter(
+        (bool(row["predicted_fail"]) for row in rows), dtype=bool, count=len(rows)
+    )
+    indices = _resample_indices(len(rows), n_resamples=n_resamples, seed=seed)
+    sampled_expected = expected_fail[indices]
+    sampled_predicted = predicted_fail[indices]
+    return {
+        "tp": np.count_nonzero(sampled_expected & sampled_predicted, axis=1),
+        "fp": np.count_nonzero(~sampled_expected & sampled_predicted, axis=1),
+        "tn": np.count_nonzero(~sampled_expected & ~sampled_predicted, axis=1),
+        "fn": np.count_nonzero(sampled_expected & ~sampled_predicted, axis=1),
+    }
+
+
+def _metric_from_confusion(
+    metric_name: str, cm: dict[str, np.ndarray[Any, np.dtype[np.int64]]], size: int
+) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """Vectorized ``_precision``/``_recall``/``_f1``/accuracy; NaN marks None."""
+    tp = cm["tp"].astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(
+            cm["tp"] + cm["fp"] > 0, tp / (cm["tp"] + cm["fp"]), np.nan
+        )
+        recall = np.where(cm["tp"] + cm["fn"] > 0, tp / (cm["tp"] + cm["fn"]), np.nan)
+        if metric_name == "precision_fail":
+            return precision
+        if metric_name == "recall_fail":
+            return recall
+        if metric_name == "f1_fail":
+            denom = precision + recall
+            return np.where(
+                np.isclose(denom, 0.0), np.nan, 2 * precision * recall / denom
+            )
+        if metric_name == "accuracy":
+            return (tp + cm["tn"]) / size
+    msg = f"Unsupported metric for CI: {metric_name}"
+    raise ValueError(msg)
+
+
+def _bootstrap_metric_cis(
+    rows: Sequence[dict[str, Any]],
+    metric_names: Sequence[str],
+    *,
+    n_resamples: int = 1000,
+    seed: int = 42,
+) -> dict[str, tuple[float, float] | None]:
+    """Bootstrap CIs for several confusion-derived metrics from one resample pass.
+
+    Resampled metrics that are undefined (``None`` in the scalar helpers) are
+    dropped before the percentile step, as in the per-row implementation.
+    """
+    if TRACE.branch("bootstrap_metric_ci.empty_rows", not rows):
+        return dict.fromkeys(metric_names)
+    cm = _bootstrap_confusion(rows, n_resamples=n_resamples, seed=seed)
+    cis: dict[str, tuple[float, float] | None] = {}
+    for metric_name in metric_names:
+        values = _metric_from_confusion(metric_name, cm, len(rows))
+        defined = values[~np.isnan(values)]
+        cis[metric_name] = _bootstrap_ci(
+            defined.tolist(), n_resamples=n_resamples, seed=seed
+        )
+    return cis
+
+
 def _bootstrap_metric_ci(
     rows: Sequence[dict[str, Any]],
     metric_name: str,
@@ -372,68 +363,9 @@ def _bootstrap_metric_ci(
     seed: int = 42,
 ) -> tuple[float, float] | None:
     """Bootstrap CI for confusion-derived metrics."""
-    if _branch(
-        "bootstrap_metric_ci.empty_rows",
-        not rows,
-        "No rows -> CI None",
-        f"Bootstrapping metric={metric_name} with n={len(rows)}",
-    ):
-        return None
-    # Metric resampling is intentionally deterministic for reproducible reports.
-    rng = random.Random(seed)  # noqa: S311  # nosec B311
-    values: list[float] = []
-    for _ in range(n_resamples):
-        sample = [rng.choice(rows) for _ in range(len(rows))]
-        cm = _confusion_from_rows(sample)
-        precision = _precision(cm["tp"], cm["fp"])
-        recall = _recall(cm["tp"], cm["fn"])
-        if _branch(
-            "bootstrap_metric_ci.metric_precision_fail",
-            metric_name == "precision_fail",
-            "Selecting precision metric",
-            "Not precision metric",
-        ):
-            metric = precision
-        elif _branch(
-            "bootstrap_metric_ci.metric_recall_fail",
-            metric_name == "recall_fail",
-            "Selecting recall metric",
-            "Not recall metric",
-        ):
-            metric = recall
-        elif _branch(
-            "bootstrap_metric_ci.metric_f1_fail",
-            metric_name == "f1_fail",
-            "Selecting f1 metric",
-            "Not f1 metric",
-        ):
-            metric = _f1(precision, recall)
-        elif _branch(
-            "bootstrap_metric_ci.metric_accuracy",
-            metric_name == "accuracy",
-            "Selecting accuracy metric",
-            "Not accuracy metric",
-        ):
-            metric = (cm["tp"] + cm["tn"]) / len(sample) if sample else None
-        else:
-            msg = f"Unsupported metric for CI: {metric_name}"
-            raise ValueError(msg)
-        if metric is None:
-            _branch(
-                "bootstrap_metric_ci.metric_not_none",
-                False,
-                f"Appending metric value={metric}",
-                "Skipping None metric value",
-            )
-        else:
-            _branch(
-                "bootstrap_metric_ci.metric_not_none",
-                True,
-                f"Appending metric value={metric}",
-                "Skipping None metric value",
-            )
-            values.append(metric)
-    return _bootstrap_ci(values, n_resamples=n_resamples, seed=seed)
+    return _bootstrap_metric_cis(
+        rows, [metric_name], n_resamples=n_resamples, seed=seed
+    )[metric_name]
 
 
 def _run_case_mode(  # noqa: C901, PLR0915
@@ -612,34 +544,26 @@ def _compute_mode_metrics(records: list[dict[str, Any]]) -> dict[str, Any]:
     for row in labeled:
         expected_reasons = set(row.get("expected_fail_reasons", []))
         predicted_reasons = set(row.get("predicted_reason_codes", []))
-        if _branch(
+        if TRACE.branch(
             "compute_mode_metrics.has_expected_reasons",
             bool(expected_reasons),
-            f"case_id={row.get('case_id')} has expected reasons",
-            f"case_id={row.get('case_id')} has no expected reasons",
         ):
             reason_recall_values.append(
                 len(expected_reasons.intersection(predicted_reasons))
                 / len(expected_reasons)
             )
-            if _branch(
+            if TRACE.branch(
                 "compute_mode_metrics.over_flagging",
                 len(predicted_reasons) > 2 * len(expected_reasons),
-                f"case_id={row.get('case_id')} counted as over-flagging",
-                f"case_id={row.get('case_id')} not over-flagging",
             ):
                 over_flagging_count += 1
-        if _branch(
+        if TRACE.branch(
             "compute_mode_metrics.has_predicted_reasons",
             bool(predicted_reasons),
-            f"case_id={row.get('case_id')} has predicted reasons",
-            f"case_id={row.get('case_id')} has no predicted reasons",
         ):
-            if _branch(
+            if TRACE.branch(
                 "compute_mode_metrics.predicted_and_expected_reasons",
                 bool(expected_reasons),
-                f"case_id={row.get('case_id')} precision computed against expected reasons",  # noqa: E501
-                f"case_id={row.get('case_id')} precision forced to 0.0",
             ):
                 reason_precision_values.append(
                     len(expected_reasons.intersection(predicted_reasons))
@@ -654,36 +578,29 @@ def _compute_mode_metrics(records: list[dict[str, Any]]) -> dict[str, Any]:
     clean_recall = _recall(clean_tp, clean_fn)
     accuracy = None
     clean_accuracy = None
-    if _branch(
-        "compute_mode_metrics.has_labeled",
-        bool(labeled),
-        f"Computing accuracy with labeled_count={len(labeled)}",
-        "No labeled rows; accuracy=None",
-    ):
+    if TRACE.branch("compute_mode_metrics.has_labeled", bool(labeled)):
         accuracy = (tp + tn) / len(labeled)
-    if _branch(
-        "compute_mode_metrics.has_clean_rows",
-        bool(clean_rows),
-        f"Computing clean accuracy with clean_count={len(clean_rows)}",
-        "No clean rows; clean_accuracy=None",
-    ):
+    if TRACE.branch("compute_mode_metrics.has_clean_rows", bool(clean_rows)):
         clean_accuracy = (clean_tp + clean_tn) / len(clean_rows)
     reason_recall_macro = _safe_mean(reason_recall_values)
     reason_precision_macro = _safe_mean(reason_precision_values)
     reason_f1_macro = _f1(reason_precision_macro, reason_recall_macro)
+    cis = _bootstrap_metric_cis(
+        labeled, ("precision_fail", "recall_fail", "f1_fail", "accuracy")
+    )
 
     return {
         "num_cases": len(records),
         "num_labeled_cases": len(labeled),
         "confusion_matrix_fail_class": cm,
         "precision_fail": precision,
-        "precision_fail_ci_95": _bootstrap_metric_ci(labeled, "precision_fail"),
+        "precision_fail_ci_95": cis["precision_fail"],
         "recall_fail": recall,
-        "recall_fail_ci_95": _bootstrap_metric_ci(labeled, "recall_fail"),
+        "recall_fail_ci_95": cis["recall_fail"],
         "f1_fail": _f1(precision, recall),
-        "f1_fail_ci_95": _bootstrap_metric_ci(labeled, "f1_fail"),
+        "f1_fail_ci_95": cis["f1_fail"],
         "accuracy": accuracy,
-        "accuracy_ci_95": _bootstrap_metric_ci(labeled, "accuracy"),
+        "accuracy_ci_95": cis["accuracy"],
         "provider_error_count": len(error_rows),
         "clean_cases": len(clean_rows),
         "clean_confusion_matrix": clean_cm,
@@ -713,25 +630,18 @@ def _compute_disagreements(raw: list[dict[str, Any]]) -> dict[str, list[str]]:
         key = f"{left}_vs_{right}"
         disagreements[key] = []
         for case_id, decisions in by_case.items():
-            if _branch(
+            if TRACE.branch(
                 "compute_disagreements.pair_disagree",
                 left in decisions
                 and right in decisions
                 and decisions[left] != decisions[right],
-                f"case_id={case_id} disagreement for {left} vs {right}",
-                f"case_id={case_id} no disagreement for {left} vs {right}",
             ):
                 disagreements[key].append(case_id)
     return disagreements
 
 
 def _fmt_pct(value: float | None) -> str:
-    if _branch(
-        "fmt_pct.none_value",
-        value is None,
-        "Formatting None as '-'",
-        "Formatting percent",
-    ):
+    if TRACE.branch("fmt_pct.none_value", value is None):
         return "-"
     if value is None:
         return "-"
@@ -739,12 +649,7 @@ def _fmt_pct(value: float | None) -> str:
 
 
 def _fmt_float(value: float | None) -> str:
-    if _branch(
-        "fmt_float.none_value",
-        value is None,
-        "Formatting None as '-'",
-        "Formatting float",
-    ):
+    if TRACE.branch("fmt_float.none_value", value is None):
         return "-"
     return f"{value:.2f}"
 
@@ -821,11 +726,9 @@ def _build_summary_markdown(
     lines.append("## Disagreements")
     for pair, case_ids in disagreements.items():
         lines.append(f"- `{pair}`: {len(case_ids)} case(s)")
-        if _branch(
+        if TRACE.branch(
             "build_summary_markdown.has_disagreement_sample",
             bool(case_ids),
-            f"Adding disagreement sample for pair={pair}",
-            f"No disagreement sample for pair={pair}",
         ):
             preview = ", ".join(case_ids[:20])
             lines.append(f"  - Sample: {preview}")
@@ -833,81 +736,281 @@ def _build_summary_markdown(
     return "\n".join(lines) + "\n"
 
 
-def evaluate_cases(  # noqa: C901
+type _TaskKey = tuple[str, str, int]
+type _PendingTask = tuple[dict[str, Any], str]
+
+
+@dataclass(frozen=True)
+class _RunOptions:
+    """Per-task settings shared by the sequential, async and sharded paths."""
+
+    consensus_runs: int
+    max_concurrency: int
+    requests_per_second: float | None = None
+
+
+class _RateLimiter:
+    """Space awaited calls at least ``1 / per_second`` seconds apart."""
+
+    def __init__(self, per_second: float) -> None:
+        self._interval = 1.0 / per_second
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _task_key(case_id: object, mode: str, consensus_runs: int) -> _TaskKey:
+    return (str(case_id), mode, consensus_runs)
+
+
+def _row_key(row: dict[str, Any]) -> _TaskKey:
+    return _task_key(row["case_id"], row["mode"], int(row.get("consensus_runs", 1)))
+
+
+def _load_checkpoint(path: Path) -> list[dict[str, Any]]:
+    """Return the rows already streamed to ``path``.
+
+    A process killed mid-write leaves a truncated last line; it is cut off so
+    the next append starts on a clean line.
+    """
+    if not path.exists():
+        return []
+    rows: list[dict[str, Any]] = []
+    offset = 0
+    with path.open("rb") as handle:
+        for idx, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if line:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as exc:
+                    if raw_line.endswith(b"\n"):
+                        msg = f"Invalid JSON on line {idx} of {path}"
+                        raise ValueError(msg) from exc
+                    LOGGER.warning("Dropping truncated last line of %s", path)
+                    with path.open("r+b") as writable:
+                        writable.truncate(offset)
+                    break
+            offset += len(raw_line)
+    LOGGER.info("Loaded %d checkpointed row(s) from %s", len(rows), path)
+    return rows
+
+
+def _shard_checkpoint_paths(path: Path) -> list[Path]:
+    return sorted(path.parent.glob(f"{path.stem}.shard*{path.suffix}"))
+
+
+def _absorb_shard_checkpoints(path: Path) -> list[dict[str, Any]]:
+    """Move rows left in shard checkpoints into ``path`` and return them."""
+    absorbed: list[dict[str, Any]] = []
+    for shard_path in _shard_checkpoint_paths(path):
+        rows = _load_checkpoint(shard_path)
+        with path.open("a", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+        shard_path.unlink()
+        absorbed.extend(rows)
+    return absorbed
+
+
+def _run_pending_tasks(
+    tasks: Sequence[_PendingTask],
+    options: _RunOptions,
+    checkpoint_path: Path | None,
+) -> list[dict[str, Any]]:
+    """Evaluate ``tasks``, appending each row to the checkpoint as it finishes."""
+    rows: list[dict[str, Any]] = []
+    handle = None
+    if checkpoint_path is not None:
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = checkpoint_path.open("a", encoding="utf-8")
+
+    def _record(row: dict[str, Any]) -> None:
+        row = {**row, "consensus_runs": options.consensus_runs}
+        rows.append(row)
+        if handle is not None:
+            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+            handle.flush()
+
+    try:
+        if options.max_concurrency <= 1:
+            for case, mode in tasks:
+                _record(_run_case_mode(case, mode, options.consensus_runs))
+        else:
+            asyncio.run(_run_tasks_async(tasks, options, on_row=_record))
+    finally:
+        if handle is not None:
+            handle.close()
+    return rows
+
+
+async def _run_tasks_async(
+    tasks: Sequence[_PendingTask],
+    options: _RunOptions,
+    *,
+    on_row: Callable[[dict[str, Any]], None],
+) -> None:
+    """Run tasks in worker threads whose LLM calls share this event loop."""
+    LOGGER.info("Running with async concurrency=%d", options.max_concurrency)
+    total_tasks = len(tasks)
+    progress_every = max(1, total_tasks // 10)
+    semaphore = asyncio.Semaphore(options.max_concurrency)
+    limiter = (
+        _RateLimiter(options.requests_per_second)
+        if options.requests_per_second
+        else None
+    )
+
+    async def _run_task(case: dict[str, Any], mode: str) -> dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _run_case_mode, case, mode, options.consensus_runs
+            )
+
+    with shared_validator_loop(
+        asyncio.get_running_loop(),
+        before_call=limiter.acquire if limiter is not None else None,
+    ):
+        async_tasks = [
+            asyncio.create_task(_run_task(case, mode)) for case, mode in tasks
+        ]
+    for completed_count, finished in enumerate(
+        asyncio.as_completed(async_tasks), start=1
+    ):
+        on_row(await finished)
+        if completed_count == total_tasks or completed_count % progress_every == 0:
+            LOGGER.info("Completed %d/%d tasks", completed_count, total_tasks)
+
+
+def _run_shard(
+    tasks: Sequence[_PendingTask],
+    options: _RunOptions,
+    checkpoint_path: Path,
+    log_level: int,
+) -> int:
+    """Worker-process entry point: evaluate one shard into its own checkpoint."""
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    LOGGER.setLevel(log_level)
+    return len(_run_pending_tasks(tasks, options, checkpoint_path))
+
+
+def _run_sharded(
+    tasks: Sequence[_PendingTask],
+    options: _RunOptions,
+    *,
+    shards: int,
+    checkpoint_path: Path,
+) -> None:
+    """Split ``tasks`` by case across ``shards`` processes, then merge results.
+
+    Each shard streams into ``<checkpoint>.shard<N>.jsonl``; the rows are folded
+    into the main checkpoint once every shard has finished (or on the next
+    resume, if the run died first). The request budget is split evenly.
+    """
+    case_ids = list(dict.fromkeys(str(case["case_id"]) for case, _mode in tasks))
+    shard_of = {case_id: index % shards for index, case_id in enumerate(case_ids)}
+    shard_tasks: list[list[_PendingTask]] = [[] for _ in range(shards)]
+    for case, mode in tasks:
+        shard_tasks[shard_of[str(case["case_id"])]].append((case, mode))
+    shard_options = replace(
+        options,
+        requests_per_second=(
+            options.requests_per_second / shards
+            if options.requests_per_second
+            else None
+        ),
+    )
+    LOGGER.info("Running %d task(s) across %d shard process(es)", len(tasks), shards)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=shards, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _run_shard,
+                chunk,
+                shard_options,
+                checkpoint_path.with_name(
+                    f"{checkpoint_path.stem}.shard{index}{checkpoint_path.suffix}"
+                ),
+                LOGGER.getEffectiveLevel(),
+            )
+            for index, chunk in enumerate(shard_tasks)
+            if chunk
+        ]
+        for future in as_completed(futures):
+            LOGGER.info("Shard finished %d task(s)", future.result())
+    _absorb_shard_checkpoints(checkpoint_path)
+
+
+def evaluate_cases(  # noqa: PLR0913
     cases: list[dict[str, Any]],
     modes: Sequence[str],
     consensus_runs: int = 1,  # Backward compatibility: default to 1
     max_concurrency: int = 1,
+    *,
+    checkpoint_path: Path | None = None,
+    requests_per_second: float | None = None,
+    shards: int = 1,
 ) -> dict[str, Any]:
-    """Return evaluate cases."""
+    """Evaluate every case/mode pair and compute per-mode metrics.
+
+    With ``checkpoint_path`` each row is appended to that JSONL file as soon as
+    it finishes, and rows already in the file for the same
+    ``(case_id, mode, consensus_runs)`` are reused instead of re-evaluated.
+    ``requests_per_second`` caps LLM validator calls; ``shards`` > 1 spreads
+    the remaining cases over that many worker processes.
+    """
     LOGGER.info(
         "Evaluating %d case(s) across mode(s): %s", len(cases), ", ".join(modes)
     )
-    raw_rows: list[dict[str, Any]] = []
-    by_mode: dict[str, list[dict[str, Any]]] = {mode: [] for mode in modes}
-    tasks: list[tuple[int, int, dict[str, Any], str]] = []
-    for case_idx, case in enumerate(cases, start=1):
+    completed: dict[_TaskKey, dict[str, Any]] = {}
+    if checkpoint_path is not None:
+        rows = _load_checkpoint(checkpoint_path)
+        rows.extend(_absorb_shard_checkpoints(checkpoint_path))
+        completed = {_row_key(row): row for row in rows}
+    tasks: list[_PendingTask] = [
+        (case, mode)
+        for case in cases
+        for mode in modes
+        if _task_key(case["case_id"], mode, consensus_runs) not in completed
+    ]
+    options = _RunOptions(
+        consensus_runs=consensus_runs,
+        max_concurrency=max_concurrency,
+        requests_per_second=requests_per_second,
+    )
+    if completed:
         LOGGER.info(
-            "Evaluating case %d/%d case_id=%s",
-            case_idx,
-            len(cases),
-            case.get("case_id"),
+            "Resuming: %d task(s) already checkpointed, %d pending",
+            len(cases) * len(modes) - len(tasks),
+            len(tasks),
         )
-        for mode_idx, mode in enumerate(modes):
-            tasks.append((case_idx - 1, mode_idx, case, mode))
 
-    if max_concurrency <= 1:
-        for _, _, case, mode in tasks:
-            row = _run_case_mode(case, mode, consensus_runs)
+    if TRACE.branch("evaluate_cases.sharded", shards > 1 and len(tasks) > 1):
+        with tempfile.TemporaryDirectory() as tmp:
+            shard_checkpoint = checkpoint_path or Path(tmp) / "checkpoint.jsonl"
+            _run_sharded(
+                tasks, options, shards=shards, checkpoint_path=shard_checkpoint
+            )
+            fresh_rows = _load_checkpoint(shard_checkpoint)
+    else:
+        fresh_rows = _run_pending_tasks(tasks, options, checkpoint_path)
+    completed.update((_row_key(row), row) for row in fresh_rows)
+
+    raw_rows: list[dict[str, Any]] = []
+    by_mode: dict[str, list[dict[str, Any]]] = {mode: [] for mode in modes}
+    for case in cases:
+        for mode in modes:
+            row = completed[_task_key(case["case_id"], mode, consensus_runs)]
             raw_rows.append(row)
             by_mode[mode].append(row)
-    else:
-        LOGGER.info("Running with async concurrency=%d", max_concurrency)
-        total_tasks = len(tasks)
-        progress_every = max(1, total_tasks // 10)
-        ordered_rows: dict[tuple[int, int], dict[str, Any]] = {}
-
-        async def _evaluate_cases_async() -> dict[tuple[int, int], dict[str, Any]]:
-            semaphore = asyncio.Semaphore(max_concurrency)
-            completed_count = 0
-
-            async def _run_task(
-                case_order: int,
-                mode_order: int,
-                case: dict[str, Any],
-                mode: str,
-            ) -> tuple[int, int, dict[str, Any]]:
-                async with semaphore:
-                    row = await asyncio.to_thread(
-                        _run_case_mode, case, mode, consensus_runs
-                    )
-                    return case_order, mode_order, row
-
-            async_tasks = [
-                asyncio.create_task(_run_task(case_order, mode_order, case, mode))
-                for case_order, mode_order, case, mode in tasks
-            ]
-
-            ordered: dict[tuple[int, int], dict[str, Any]] = {}
-            for finished in asyncio.as_completed(async_tasks):
-                case_order, mode_order, row = await finished
-                ordered[(case_order, mode_order)] = row
-                completed_count += 1  # noqa: SIM113
-                if (
-                    completed_count == total_tasks
-                    or completed_count % progress_every == 0
-                ):
-                    LOGGER.info("Completed %d/%d tasks", completed_count, total_tasks)
-
-            return ordered
-
-        ordered_rows = asyncio.run(_evaluate_cases_async())
-
-        for case_order in range(len(cases)):
-            for mode_order, mode in enumerate(modes):
-                row = ordered_rows[(case_order, mode_order)]
-                raw_rows.append(row)
-                by_mode[mode].append(row)
 
     mode_metrics = {mode: _compute_mode_metrics(rows) for mode, rows in by_mode.items()}
     disagreements = _compute_disagreements(raw_rows)
@@ -933,19 +1036,9 @@ def _limit_cases(
         stratify,
         seed,
     )
-    if _branch(
-        "limit_cases.no_limit_needed",
-        (limit <= 0 or len(cases) <= limit),
-        "Returning all cases without sampling",
-        "Proceeding with limiting/sampling",
-    ):
+    if TRACE.branch("limit_cases.no_limit_needed", limit <= 0 or len(cases) <= limit):
         return cases
-    if _branch(
-        "limit_cases.non_stratified",
-        not stratify,
-        f"Returning first {limit} cases (non-stratified)",
-        "Using stratified sampling",
-    ):
+    if TRACE.branch("limit_cases.non_stratified", not stratify):
         return cases[:limit]
 
     # Case sampling is intentionally deterministic for reproducible evaluations.
@@ -955,12 +1048,7 @@ def _limit_cases(
     unlabeled = [c for c in cases if c.get("expected_pass") is None]  # noqa: F841
 
     labeled_count = len(positives) + len(negatives)
-    if _branch(
-        "limit_cases.no_labeled_cases",
-        labeled_count == 0,
-        f"No labeled cases; fallback to first {limit}",
-        "Labeled cases present; computing stratified targets",
-    ):
+    if TRACE.branch("limit_cases.no_labeled_cases", labeled_count == 0):
         return cases[:limit]
 
     target_pos = round(limit * (len(positives) / labeled_count))
@@ -974,18 +1062,8 @@ def _limit_cases(
 
     remaining = limit - len(selected)
     leftovers = [c for c in cases if c not in selected]
-    if _branch(
-        "limit_cases.fill_remaining",
-        (remaining > 0 and bool(leftovers)),
-        f"Need to fill remaining={remaining} from leftovers={len(leftovers)}",
-        "No fill from leftovers needed",
-    ):
-        if _branch(
-            "limit_cases.leftovers_fit",
-            len(leftovers) <= remaining,
-            "Taking all leftovers",
-            "Sampling leftovers",
-        ):
+    if TRACE.branch("limit_cases.fill_remaining", remaining > 0 and bool(leftovers)):
+        if TRACE.branch("limit_cases.leftovers_fit", len(leftovers) <= remaining):
             selected.extend(leftovers)
         else:
             selected.extend(rng.sample(leftovers, remaining))
@@ -1000,19 +1078,12 @@ def _validate_min_positive_cases(
     min_positive_cases: int,
 ) -> None:
     LOGGER.info("Validating min positive cases: threshold=%d", min_positive_cases)
-    if _branch(
-        "validate_min_positive_cases.skip_check",
-        min_positive_cases <= 0,
-        "Threshold disabled; skipping check",
-        "Threshold enabled; checking count",
-    ):
+    if TRACE.branch("validate_min_positive_cases.skip_check", min_positive_cases <= 0):
         return
     positive_count = sum(1 for case in cases if case.get("expected_pass") is True)
-    if _branch(
+    if TRACE.branch(
         "validate_min_positive_cases.too_few_positives",
         positive_count < min_positive_cases,
-        f"Too few positives ({positive_count} < {min_positive_cases}); raising",
-        f"Positive coverage ok ({positive_count} >= {min_positive_cases})",
     ):
         msg = f"Expected at least {min_positive_cases} expected-pass cases, got {positive_count}."  # noqa: E501
         raise SystemExit(
@@ -1023,37 +1094,28 @@ def _validate_min_positive_cases(
 def parse_modes(raw_modes: str) -> list[str]:
     """Return parse modes."""
     LOGGER.info("Parsing modes from input: %s", raw_modes)
-    if _branch(
-        "parse_modes.all",
-        raw_modes == "all",
-        "Using all valid modes",
-        "Parsing explicit mode list",
-    ):
+    if TRACE.branch("parse_modes.all", raw_modes == "all"):
         return list(VALID_MODES)
     modes = [m.strip() for m in raw_modes.split(",") if m.strip()]
     invalid = [m for m in modes if m not in VALID_MODES]
-    if _branch(
-        "parse_modes.has_invalid",
-        bool(invalid),
-        f"Invalid modes found: {invalid}",
-        "No invalid modes found",
-    ):
+    if TRACE.branch("parse_modes.has_invalid", bool(invalid)):
         msg = f"Invalid mode(s): {invalid}. Valid: {list(VALID_MODES)} or all"
         raise ValueError(
             msg
         )
-    if _branch(
-        "parse_modes.empty_modes",
-        not modes,
-        "No modes after parsing; raising",
-        f"Using parsed modes: {modes}",
-    ):
+    if TRACE.branch("parse_modes.empty_modes", not modes):
         msg = "At least one mode is required"
         raise ValueError(msg)
     return modes
 
 
-def main() -> None:
+def _emit_branch_summary() -> None:
+    if TRACE.enabled:
+        for line in TRACE.summary_lines():
+            emit(line, file=sys.stderr)
+
+
+def main() -> None:  # noqa: PLR0915
     """Return main."""
     parser = argparse.ArgumentParser(
         description="Evaluate spec validation quality across deterministic/llm/hybrid modes"  # noqa: E501
@@ -1119,12 +1181,39 @@ def main() -> None:
             f"(default: {DEFAULT_CONCURRENCY}; set 1 for sequential)."
         ),
     )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help=(
+            "JSONL file each finished row is appended to. Re-running with the "
+            "same file skips case/mode pairs it already holds "
+            "(default: <output-dir>/checkpoint_<timestamp>.jsonl)."
+        ),
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="Cap on LLM validator calls per second across all workers.",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Number of worker processes to split cases across (default: 1).",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
         default="INFO",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        help="Logging verbosity. Use DEBUG for branch-level trace logs.",
+        help="Logging verbosity. DEBUG also enables --trace-branches.",
+    )
+    parser.add_argument(
+        "--trace-branches",
+        action="store_true",
+        help="Count branch outcomes and print a branch-coverage summary at the end.",
     )
     args = parser.parse_args()
     logging.basicConfig(
@@ -1132,11 +1221,15 @@ def main() -> None:
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
     LOGGER.setLevel(getattr(logging, args.log_level))
+    TRACE.enable(args.trace_branches or args.log_level == "DEBUG")
     LOGGER.info("Starting eval_spec_validation")
     LOGGER.info("CLI args: %s", vars(args))
     if args.concurrency < 1:
         msg = "--concurrency must be >= 1"
         raise SystemExit(msg)
+    if args.shards < 1:
+        msg = "--shards must be >= 1"
+        raise SystemExit(msg)
 
     modes = parse_modes(args.modes)
     cases = _read_cases(args.cases, include_disabled=args.include_disabled)
@@ -1147,21 +1240,23 @@ def main() -> None:
         seed=args.seed,
     )
     _validate_min_positive_cases(cases, min_positive_cases=args.min_positive_cases)
-    if _branch(
-        "main.no_cases",
-        not cases,
-        "No cases found after filtering/limiting; exiting",
-        f"Proceeding with {len(cases)} case(s)",
-    ):
+    if TRACE.branch("main.no_cases", not cases):
         msg = "No benchmark cases found. Build or provide cases first."
         raise SystemExit(msg)
 
     run_timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    checkpoint_path = args.checkpoint or (
+        args.output_dir / f"checkpoint_{run_timestamp}.jsonl"
+    )
+    LOGGER.info("Streaming rows to checkpoint: %s", checkpoint_path)
     evaluated = evaluate_cases(
         cases,
         modes,
         consensus_runs=args.consensus_runs,
         max_concurrency=args.concurrency,
+        checkpoint_path=checkpoint_path,
+        requests_per_second=args.requests_per_second,
+        shards=args.shards,
     )
 
     output_dir = args.output_dir
@@ -1177,6 +1272,7 @@ def main() -> None:
         "modes": modes,
         "num_cases": len(cases),
         "consensus_runs": args.consensus_runs,
+        "checkpoint_path": str(checkpoint_path),
         "mode_metrics": evaluated["mode_metrics"],
         "disagreements": evaluated["disagreements"],
         "raw_path": str(raw_path),
@@ -1204,11 +1300,9 @@ def main() -> None:
 
     for mode in modes:
         cm = evaluated["mode_metrics"][mode]["confusion_matrix_fail_class"]
-        if _branch(
+        if TRACE.branch(
             "main.no_expected_pass_coverage_warning",
             cm.get("tn") == 0 and cm.get("fp") == 0,
-            f"Mode {mode} has no expected-pass coverage; emitting warning",
-            f"Mode {mode} has expected-pass coverage",
         ):
             emit(
                 (
@@ -1222,6 +1316,7 @@ def main() -> None:
     emit(f"Raw results: {raw_path}")
     emit(f"Metrics JSON: {results_path}")
     emit(f"Summary MD: {summary_path}")
+    _emit_branch_summary()
     LOGGER.info("Evaluation completed")
 
 
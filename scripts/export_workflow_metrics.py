@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""Incrementally export workflow metrics into a columnar store.
+
+``extract_tcc_metrics`` scans the live business DB row by row on every run.
+This exporter instead copies only rows appended since the previous run into
+part files under ``--store``, tracked by a per-table high-water mark on the
+primary key (``event_id`` / ``log_id``). Summaries are then computed from the
+store with vectorized pandas group-bys, so the API database is only touched by
+one short, read-only snapshot per run:
+
+* event counts and durations per ``event_type``;
+* per-FSM-state dwell time (``FSM_STATE_DWELL`` events);
+* per-phase durations between the first milestone event of each phase;
+* task and story cycle times from the execution/completion logs.
+
+Needs the ``metrics`` extra (pandas). Parts are Parquet (or Arrow/Feather)
+when ``pyarrow`` is installed (the ``parquet`` extra) and gzip-compressed CSV
+otherwise; the fallback is logged. ``--since`` summarizes only the rows
+exported by the current run.
+
+Usage:
+    python -m scripts.export_workflow_metrics [db_path] --store artifacts/metrics_store
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from utils.cli_output import emit
+from utils.runtime_config import resolve_database_target
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+DEFAULT_CHUNK_SIZE = 50_000
+STORE_FORMATS: tuple[str, ...] = ("parquet", "feather", "csv")
+_FORMAT_SUFFIXES: dict[str, str] = {
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "csv": ".csv.gz",
+}
+
+# First event of each phase, in workflow order (enum names, as stored).
+PHASE_MILESTONES: tuple[str, ...] = (
+    "VISION_SAVED",
+    "SPEC_COMPILED",
+    "BACKLOG_SAVED",
+    "ROADMAP_SAVED",
+    "STORIES_SAVED",
+    "SPRINT_PLAN_SAVED",
+    "SPRINT_STARTED",
+    "SPRINT_COMPLETED",
+)
+_DONE_STORY_STATUSES = ("DONE", "ACCEPTED")
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """A source table copied into the store by increasing primary key."""
+
+    name: str
+    key: str
+    timestamp_column: str
+    columns: tuple[str, ...]
+
+
+EXPORT_TABLES: tuple[ExportTable, ...] = (
+    ExportTable(
+        name="workflow_events",
+        key="event_id",
+        timestamp_column="timestamp",
+        columns=(
+            "event_id",
+            "event_type",
+            "timestamp",
+            "duration_seconds",
+            "turn_count",
+            "product_id",
+            "sprint_id",
+            "session_id",
+            "event_metadata",
+        ),
+    ),
+    ExportTable(
+        name="task_execution_logs",
+        key="log_id",
+        timestamp_column="changed_at",
+        columns=(
+            "log_id",
+            "task_id",
+            "sprint_id",
+            "old_status",
+            "new_status",
+            "acceptance_result",
+            "changed_by",
+            "changed_at",
+        ),
+    ),
+    ExportTable(
+        name="story_completion_logs",
+        key="log_id",
+        timestamp_column="changed_at",
+        columns=(
+            "log_id",
+            "story_id",
+            "old_status",
+            "new_status",
+            "resolution",
+            "changed_by",
+            "changed_at",
+        ),
+    ),
+)
+
+
+@dataclass
+class ExportResult:
+    """What one export run copied and the summaries computed afterwards."""
+
+    store_dir: Path
+    store_format: str
+    exported_rows: dict[str, int] = field(default_factory=dict)
+    high_water: dict[str, int] = field(default_factory=dict)
+    summaries: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+def resolve_store_format(requested: str) -> str:
+    """Return the part-file format, falling back to CSV without pyarrow."""
+    has_pyarrow = importlib.util.find_spec("pyarrow") is not None
+    if requested == "auto":
+        if has_pyarrow:
+            return "parquet"
+        LOGGER.warning(
+            "pyarrow is not installed; writing gzip-compressed CSV parts. "
+            "Install the 'parquet' extra for Parquet parts."
+        )
+        return "csv"
+    if requested in {"parquet", "feather"} and not has_pyarrow:
+        msg = f"pyarrow is required to write {requested} files."
+        raise RuntimeError(msg)
+    if requested not in STORE_FORMATS:
+        msg = f"Unknown store format {requested!r}; expected one of {STORE_FORMATS}"
+        raise ValueError(msg)
+    return requested
+
+
+def _write_part(frame: pd.DataFrame, path: Path, store_format: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if store_format == "parquet":
+        frame.to_parquet(tmp_path, index=False)
+    elif store_format == "feather":
+        frame.reset_index(drop=True).to_feather(tmp_path)
+    else:
+        frame.to_csv(tmp_path, index=False, compression="gzip")
+    tmp_path.replace(path)
+
+
+def _read_part(path: Path, store_format: str) -> pd.DataFrame:
+    if store_format == "parquet":
+        return pd.read_parquet(path)
+    if store_format == "feather":
+        return pd.read_feather(path)
+    return pd.read_csv(path, compression="gzip")
+
+
+def load_manifest(store_dir: Path) -> dict[str, Any]:
+    """Return the store manifest, or an empty one for a new store."""
+    path = store_dir / MANIFEST_NAME
+    if not path.exists():
+        return {"format": None, "tables": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_manifest(store_dir: Path, manifest: dict[str, Any]) -> None:
+    path = store_dir / MANIFEST_NAME
+    tmp_path = path.with_name(f".{MANIFEST_NAME}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _connect_read_only(db_path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _existing_columns(conn: sqlite3.Connection, table: ExportTable) -> list[str]:
+    present = {
+        row[1] for row in conn.execute(f"PRAGMA table_info({table.name})").fetchall()
+    }
+    return [column for column in table.columns if column in present]
+
+
+def snapshot_table(  # noqa: PLR0913
+    conn: sqlite3.Connection,
+    table: ExportTable,
+    *,
+    store_dir: Path,
+    store_format: str,
+    table_state: dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """Copy rows above the table's high-water mark into new part files.
+
+    ``table_state`` (the manifest entry) is updated in place with the new
+    high-water mark and part names. Returns the exported delta.
+    """
+    columns = _existing_columns(conn, table)
+    if table.key not in columns:
+        return pd.DataFrame(columns=pd.Index(table.columns))
+    high_water = int(table_state.get("high_water", 0))
+    table_dir = store_dir / table.name
+    table_dir.mkdir(parents=True, exist_ok=True)
+    query = (
+        f"SELECT {', '.join(columns)} FROM {table.name} "  # noqa: S608
+        f"WHERE {table.key} > ? ORDER BY {table.key}"
+    )
+    chunks: list[pd.DataFrame] = []
+    parts: list[str] = table_state.setdefault("parts", [])
+    for chunk in pd.read_sql_query(
+        query, conn, params=[high_water], chunksize=chunk_size
+    ):
+        if chunk.empty:
+            continue
+        first, last = int(chunk[table.key].iloc[0]), int(chunk[table.key].iloc[-1])
+        name = f"part-{first:012d}-{last:012d}{_FORMAT_SUFFIXES[store_format]}"
+        _write_part(chunk, table_dir / name, store_format)
+        parts.append(name)
+        chunks.append(chunk)
+        high_water = last
+    table_state["high_water"] = high_water
+    table_state["key"] = table.key
+    if not chunks:
+        return pd.DataFrame(columns=pd.Index(columns))
+    return pd.concat(chunks, ignore_index=True)
+
+
+def read_store_table(
+    store_dir: Path, table: ExportTable, manifest: dict[str, Any]
+) -> pd.DataFrame:
+    """Load every exported part of ``table`` into one frame."""
+    state = manifest["tables"].get(table.name, {})
+    frames = [
+        _read_part(store_dir / table.name / name, manifest["format"])
+        for name in state.get("parts", [])
+    ]
+    if not frames:
+        return pd.DataFrame(columns=pd.Index(table.columns))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _with_timestamps(frame: pd.DataFrame, column: str) -> pd.DataFrame:
+    frame = frame.copy()
+    frame[column] = pd.to_datetime(
+        frame[column], format="ISO8601", utc=True, errors="coerce"
+    )
+    return frame
+
+
+def summarize_event_types(events: pd.DataFrame) -> pd.DataFrame:
+    """Return counts, durations and first/last timestamp per event type."""
+    events = _with_timestamps(events, "timestamp")
+    summary = events.groupby("event_type", sort=True).agg(
+        count=("event_type", "size"),
+        avg_duration_sec=("duration_seconds", "mean"),
+        total_duration_sec=("duration_seconds", "sum"),
+        first_event=("timestamp", "min"),
+        last_event=("timestamp", "max"),
+    )
+    return summary.reset_index().round({"avg_duration_sec": 2, "total_duration_sec": 2})
+
+
+def summarize_state_dwell(events: pd.DataFrame) -> pd.DataFrame:
+    """Return dwell statistics per FSM state from ``FSM_STATE_DWELL`` events."""
+    dwell = events.loc[
+        (events["event_type"] == "FSM_STATE_DWELL")
+        & events["duration_seconds"].notna(),
+        ["event_metadata", "duration_seconds"],
+    ]
+    from_state = (
+        dwell["event_metadata"]
+        .astype("string")
+        .str.extract(r'"from_state"\s*:\s*"([^"]+)"', expand=False)
+        .fillna("UNKNOWN")
+    )
+    durations = dwell["duration_seconds"].astype(float)
+    summary = durations.groupby(from_state.rename("from_state"), sort=True).agg(
+        count="size",
+        avg_duration_sec="mean",
+        median_duration_sec="median",
+        p90_duration_sec=lambda values: values.quantile(0.9),
+        total_duration_sec="sum",
+    )
+    return summary.reset_index().round(2)
+
+
+def summarize_phase_durations(events: pd.DataFrame) -> pd.DataFrame:
+    """Return hours spent per phase, per product.
+
+    A phase starts at the first milestone event of the previous phase and
+    ends at its own first milestone; phases a product skipped are left empty.
+    """
+    events = _with_timestamps(events, "timestamp")
+    milestones = events.loc[
+        events["event_type"].isin(PHASE_MILESTONES) & events["product_id"].notna()
+    ]
+    firsts = (
+        milestones.pivot_table(
+            index="product_id",
+            columns="event_type",
+            values="timestamp",
+            aggfunc="min",
+        )
+        .reindex(columns=list(PHASE_MILESTONES))
+        .apply(pd.to_datetime, utc=True)
+    )
+    hours = pd.DataFrame(
+        {
+            f"{current.lower()}_hours": (firsts[current] - firsts[previous])
+            .dt.total_seconds()
+            .div(3600)
+            for previous, current in pairwise(PHASE_MILESTONES)
+        },
+        index=firsts.index.astype(int),
+    )
+    return hours.reset_index().round(2)
+
+
+def _cycle_times(
+    logs: pd.DataFrame,
+    *,
+    entity: str,
+    started: pd.Series,
+    finished: pd.Series,
+    group: str | None = None,
+) -> pd.DataFrame:
+    logs = _with_timestamps(logs, "changed_at")
+    by_entity = logs.groupby(entity)["changed_at"]
+    first_seen = by_entity.min()
+    start = logs.loc[started].groupby(entity)["changed_at"].min()
+    end = logs.loc[finished].groupby(entity)["changed_at"].min()
+    start = start.reindex(end.index).fillna(first_seen.reindex(end.index))
+    frame = pd.DataFrame(
+        {"cycle_hours": (end - start).dt.total_seconds() / 3600}, index=end.index
+    )
+    if group is not None:
+        frame[group] = logs.groupby(entity)[group].last().reindex(end.index)
+        summary = frame.groupby(group)["cycle_hours"].agg(
+            ["count", "mean", "median", "max"]
+        )
+        return summary.reset_index().round(2)
+    return (
+        frame["cycle_hours"]
+        .agg(["count", "mean", "median", "max"])
+        .to_frame()
+        .T.round(2)
+    )
+
+
+def summarize_task_cycle_times(task_logs: pd.DataFrame) -> pd.DataFrame:
+    """Return task cycle time (first In Progress to first Done) per sprint."""
+    return _cycle_times(
+        task_logs,
+        entity="task_id",
+        started=task_logs["new_status"] == "IN_PROGRESS",
+        finished=task_logs["new_status"] == "DONE",
+        group="sprint_id",
+    )
+
+
+def summarize_story_cycle_times(story_logs: pd.DataFrame) -> pd.DataFrame:
+    """Return story cycle time (first In Progress to first Done/Accepted)."""
+    return _cycle_times(
+        story_logs,
+        entity="story_id",
+        started=story_logs["new_status"] == "IN_PROGRESS",
+        finished=story_logs["new_status"].isin(_DONE_STORY_STATUSES),
+    )
+
+
+_SUMMARIES: dict[str, tuple[str, Callable[[pd.DataFrame], pd.DataFrame]]] = {
+    "event_types": ("workflow_events", summarize_event_types),
+    "state_dwell": ("workflow_events", summarize_state_dwell),
+    "phase_durations": ("workflow_events", summarize_phase_durations),
+    "task_cycle_times": ("task_execution_logs", summarize_task_cycle_times),
+    "story_cycle_times": ("story_completion_logs", summarize_story_cycle_times),
+}
+
+
+def export_metrics(
+    db_path: Path,
+    store_dir: Path,
+    *,
+    store_format: str = "auto",
+    since: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ExportResult:
+    """Snapshot new rows into ``store_dir`` and compute the summaries.
+
+    The three tables are read inside one read transaction so their
+    high-water marks describe the same database snapshot. With ``since`` the
+    summaries cover only this run's delta instead of the whole store.
+    """
+    store_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(store_dir)
+    resolved = resolve_store_format(store_format)
+    if manifest["format"] not in {None, resolved}:
+        msg = (
+            f"Store {store_dir} holds {manifest['format']} parts; "
+            f"cannot append {resolved} parts."
+        )
+        raise ValueError(msg)
+    manifest["format"] = resolved
+
+    deltas: dict[str, pd.DataFrame] = {}
+    conn = _connect_read_only(db_path)
+    try:
+        conn.execute("BEGIN")
+        for table in EXPORT_TABLES:
+            deltas[table.name] = snapshot_table(
+                conn,
+                table,
+                store_dir=store_dir,
+                store_format=resolved,
+                table_state=manifest["tables"].setdefault(table.name, {}),
+                chunk_size=chunk_size,
+            )
+        conn.rollback()
+    finally:
+        conn.close()
+    manifest["exported_at"] = datetime.now(UTC).isoformat()
+    _save_manifest(store_dir, manifest)
+
+    result = ExportResult(store_dir=store_dir, store_format=resolved)
+    sources: dict[str, pd.DataFrame] = {}
+    for table in EXPORT_TABLES:
+        result.exported_rows[table.name] = len(deltas[table.name])
+        result.high_water[table.name] = manifest["tables"][table.name]["high_water"]
+        sources[table.name] = (
+            deltas[table.name]
+            if since
+            else read_store_table(store_dir, table, manifest)
+        )
+    for name, (source, summarize) in _SUMMARIES.items():
+        frame = sources[source]
+        result.summaries[name] = summarize(frame) if not frame.empty else frame
+    return result
+
+
+def write_summaries(result: ExportResult, output_dir: Path) -> list[Path]:
+    """Write each summary as CSV and return the written paths."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for name, frame in result.summaries.items():
+        path = output_dir / f"{name}.csv"
+        frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Parse CLI arguments and run one incremental export."""
+    parser = argparse.ArgumentParser(
+        description="Incrementally export workflow metrics into a columnar store."
+    )
+    parser.add_argument(
+        "db_path",
+        nargs="?",
+        help="SQLite database path or sqlite:/// URL. Defaults to AGILEFORGE_DB_URL.",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=Path("artifacts") / "metrics_store",
+        help="Directory holding the exported part files and manifest.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("auto", *STORE_FORMATS),
+        default="auto",
+        help="Part file format (default: parquet if pyarrow is installed, else csv).",
+    )
+    parser.add_argument(
+        "--since",
+        action="store_true",
+        help="Summarize only rows exported by this run (the delta).",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    db_target = resolve_database_target(args.db_path, env_name="AGILEFORGE_DB_URL")
+    if db_target.sqlite_path is None or not db_target.sqlite_path.exists():
+        emit(
+            "ERROR: Metrics export requires an existing file-backed SQLite database.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    result = export_metrics(
+        db_target.sqlite_path,
+        args.store,
+        store_format=args.format,
+        since=args.since,
+        chunk_size=args.chunk_size,
+    )
+    for name, count in result.exported_rows.items():
+        emit(
+            f"{name}: +{count} row(s), high-water "
+            f"{result.high_water[name]} ({result.store_format})",
+            file=sys.stderr,
+        )
+    scope = "delta" if args.since else "all"
+    summary_dir = args.store / "summaries" / scope
+    for path in write_summaries(result, summary_dir):
+        emit(f"Wrote {path}", file=sys.stderr)
+    with pd.option_context("display.width", 120):
+        for name, frame in result.summaries.items():
+            emit(f"\n## {name}\n{frame.to_string(index=False) if len(frame) else '-'}")
+
+
+if __name__ == "__main__":
+    main()
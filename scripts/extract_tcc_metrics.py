@@ -32,9 +32,11 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from utils.branch_trace import BranchTracer
 from utils.cli_output import emit
 from utils.runtime_config import resolve_database_target
 
+TRACE = BranchTracer()
 _SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _REFINED_STORY_COUNT_QUERIES: dict[tuple[bool, bool, bool], str] = {
     (True, True, True): (
@@ -313,7 +315,10 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
         )
         metrics.stories_refined = cursor.fetchone()[0]
 
-        if "accepted_spec_version_id" in columns:
+        if TRACE.branch(
+            "product_metrics.has_accepted_spec_version_id",
+            "accepted_spec_version_id" in columns,
+        ):
             cursor.execute(
                 """
                 SELECT COUNT(*) FROM user_stories
@@ -331,7 +336,10 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
             cursor.execute(query, (product_id,))
             metrics.refined_stories_with_spec_version_id = cursor.fetchone()[0]
 
-        if "validation_evidence" in columns:
+        if TRACE.branch(
+            "product_metrics.has_validation_evidence",
+            "validation_evidence" in columns,
+        ):
             cursor.execute(
                 """
                 SELECT COUNT(*) FROM user_stories
@@ -414,7 +422,7 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
                 setattr(metrics, attr, round(avg_val, 2))
 
         # Flow Efficiency (Cycle Time)
-        if "completed_at" in columns:
+        if TRACE.branch("product_metrics.has_completed_at", "completed_at" in columns):
             cursor.execute(
                 """
                 SELECT AVG((julianday(completed_at) - julianday(created_at)) * 24)
@@ -428,7 +436,9 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
                 metrics.avg_story_cycle_time_hours = round(cycle_time, 2)
 
         # Execution Evidence (DoD)
-        if "evidence_links" in columns:
+        if TRACE.branch(
+            "product_metrics.has_evidence_links", "evidence_links" in columns
+        ):
             cursor.execute(
                 """
                 SELECT COUNT(*) FROM user_stories
@@ -442,7 +452,7 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
         )
-        if cursor.fetchone():
+        if TRACE.branch("product_metrics.has_tasks_table", cursor.fetchone()):
             cursor.execute(
                 """
                 SELECT COUNT(*), SUM(CASE WHEN t.status = 'DONE' THEN 1 ELSE 0 END)
@@ -461,7 +471,7 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='spec_registry'"
         )
-        if cursor.fetchone():
+        if TRACE.branch("product_metrics.has_spec_registry", cursor.fetchone()):
             cursor.execute(
                 """
                 SELECT COUNT(*) FROM spec_registry WHERE product_id = ?
@@ -482,7 +492,9 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='compiled_spec_authority'"
         )
-        if cursor.fetchone():
+        if TRACE.branch(
+            "product_metrics.has_compiled_spec_authority", cursor.fetchone()
+        ):
             cursor.execute(
                 """
                 SELECT COUNT(*) FROM compiled_spec_authority csa
@@ -496,7 +508,9 @@ def extract_product_metrics(cursor: sqlite3.Cursor) -> list[ProductMetrics]:  #
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='spec_authority_acceptance'"
         )
-        if cursor.fetchone():
+        if TRACE.branch(
+            "product_metrics.has_spec_authority_acceptance", cursor.fetchone()
+        ):
             cursor.execute(
                 """
                 SELECT status, COUNT(*)
@@ -544,8 +558,52 @@ def extract_workflow_events_summary(cursor: sqlite3.Cursor) -> dict:
     return summary
 
 
+def _has_workflow_event_rollups(cursor: sqlite3.Cursor) -> bool:
+    cursor.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type='table' AND name='workflow_event_rollups'"
+    )
+    if not cursor.fetchone():
+        return False
+    cursor.execute("SELECT 1 FROM workflow_event_rollups LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def _state_dwell_summary_from_rollups(cursor: sqlite3.Cursor) -> dict:
+    cursor.execute(
+        """
+        SELECT state, SUM(duration_count), SUM(duration_total)
+        FROM workflow_event_rollups
+        WHERE granularity = 'day'
+          AND event_type = 'FSM_STATE_DWELL'
+          AND duration_count > 0
+        GROUP BY state
+        """
+    )
+    totals: dict[str, tuple[int, float]] = {}
+    for state, count, total in cursor.fetchall():
+        state_name = state or "UNKNOWN"
+        prior_count, prior_total = totals.get(state_name, (0, 0.0))
+        totals[state_name] = (prior_count + count, prior_total + total)
+    return {
+        state_name: {
+            "count": count,
+            "avg_duration_sec": round(total / count, 2),
+            "total_duration_sec": round(total, 2),
+        }
+        for state_name, (count, total) in sorted(totals.items())
+    }
+
+
 def extract_state_dwell_summary(cursor: sqlite3.Cursor) -> dict:
-    """Extract per-FSM-state dwell duration summary from workflow events."""
+    """Extract per-FSM-state dwell duration summary from workflow events.
+
+    Reads the daily ``workflow_event_rollups`` when they are populated and
+    falls back to decoding every dwell event's metadata otherwise.
+    """
+    if TRACE.branch("state_dwell.from_rollups", _has_workflow_event_rollups(cursor)):
+        return _state_dwell_summary_from_rollups(cursor)
+
     cursor.execute(
         """
         SELECT event_metadata, duration_seconds
@@ -579,7 +637,7 @@ def extract_state_dwell_summary(cursor: sqlite3.Cursor) -> dict:
 def extract_smoke_run_metrics(artifacts_dir: Path) -> SmokeRunMetrics | None:  # noqa: C901, PLR0912
     """Extract metrics from smoke_runs.jsonl if available."""
     smoke_file = artifacts_dir / "smoke_runs.jsonl"
-    if not smoke_file.exists():
+    if TRACE.branch("smoke_runs.missing_file", not smoke_file.exists()):
         return None
 
     metrics = SmokeRunMetrics()
@@ -590,7 +648,7 @@ def extract_smoke_run_metrics(artifacts_dir: Path) -> SmokeRunMetrics | None:  #
 
     with open(smoke_file, encoding="utf-8") as f:  # noqa: PTH123
         for line in f:
-            if not line.strip():
+            if TRACE.branch("smoke_runs.empty_line", not line.strip()):
                 continue
             run = json.loads(line)
             metrics.total_runs += 1
@@ -605,7 +663,10 @@ def extract_smoke_run_metrics(artifacts_dir: Path) -> SmokeRunMetrics | None:  #
                 metrics.acceptance_blocked_count += 1
 
             # Contract passed
-            if run.get("METRICS", {}).get("contract_passed") is True:
+            if TRACE.branch(
+                "smoke_runs.contract_passed",
+                run.get("METRICS", {}).get("contract_passed") is True,
+            ):
                 metrics.contract_passed_count += 1
 
             # Spec version ID match
@@ -977,7 +1038,13 @@ def main() -> None:
         default="artifacts",
         help="Output directory for extracted files (default: artifacts)",
     )
+    parser.add_argument(
+        "--trace-branches",
+        action="store_true",
+        help="Print a branch-coverage summary of the extraction to stderr.",
+    )
     args = parser.parse_args()
+    TRACE.enable(args.trace_branches)
 
     db_target = resolve_database_target(args.db_path, env_name="AGILEFORGE_DB_URL")
     if db_target.sqlite_path is None:
@@ -1045,6 +1112,9 @@ def main() -> None:
     emit(f"  - {output_dir}/metrics_summary.csv", file=sys.stderr)
     emit(f"  - {output_dir}/metrics_summary.json", file=sys.stderr)
     emit(f"  - {output_dir}/query_results/*.csv", file=sys.stderr)
+    if TRACE.enabled:
+        for line in TRACE.summary_lines():
+            emit(line, file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Generate first story drafts for every pending roadmap requirement."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from services.agent_workbench.story_batch import run_story_batch  # noqa: E402
+from services.phases.story_service import StoryPhaseError  # noqa: E402
+from utils.cli_output import emit  # noqa: E402
+from utils.logging_config import configure_logging  # noqa: E402
+from utils.model_config import get_story_pipeline_max_concurrency  # noqa: E402
+
+
+def _emit_progress(event: dict[str, Any]) -> None:
+    suffix = f" [{event['status']}]" if event.get("status") else ""
+    emit(
+        f"[{event['completed_count']}/{event['total_count']}] "
+        f"{event['event']}: {event['parent_requirement']}{suffix}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the batch, and print the JSON summary."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate story drafts for all pending requirements of a project "
+            "with bounded concurrency."
+        )
+    )
+    parser.add_argument("project_id", type=int, help="Project (product) ID.")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help=(
+            "Maximum concurrent story agent calls. Defaults to "
+            "story_pipeline.max_concurrency from config/models.yaml."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    configure_logging(console=False)
+    max_concurrency = args.max_concurrency or get_story_pipeline_max_concurrency()
+
+    try:
+        result = asyncio.run(
+            run_story_batch(
+                args.project_id,
+                max_concurrency=max_concurrency,
+                report_progress=_emit_progress,
+            )
+        )
+    except StoryPhaseError as exc:
+        emit(json.dumps({"status": "error", "detail": exc.detail}))
+        return 1
+
+    emit(json.dumps({"status": "success", **result}, indent=2))
+    return 0 if result["data"]["failed_count"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
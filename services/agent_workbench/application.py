@@ -7,6 +7,10 @@ from typing import TYPE_CHECKING, Any, Final, Protocol, cast
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
 
+    from services.packets.packet_bundle import BundleFormat
+
+from sqlmodel import Session
+
 from models.db import get_engine
 from services.agent_workbench.authority_projection import AuthorityProjectionService
 from services.agent_workbench.command_registry import installed_command_names
@@ -29,6 +33,9 @@ from services.agent_workbench.schema_readiness import (
     MUTATION_LEDGER_REQUIREMENTS,
     check_schema_readiness,
 )
+from services.agent_workbench.sprint_packets import write_sprint_packet_bundle
+from services.agent_workbench.story_batch import generate_story_batch
+from services.changes import DEFAULT_CHANGE_PAGE_SIZE, list_entity_changes
 
 STATUS_COMMAND: Final[str] = "agileforge status"
 WORKFLOW_NEXT_COMMAND: Final[str] = "agileforge workflow next"
@@ -117,10 +124,60 @@ class AgentWorkbenchApplication:
         """Return story detail projection."""
         return self._get_read_projection().story_show(story_id=story_id)
 
+    def story_generate_batch(
+        self,
+        *,
+        project_id: int,
+        max_concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Draft stories for every pending requirement of a project."""
+        return generate_story_batch(
+            engine=get_engine(),
+            project_id=project_id,
+            max_concurrency=max_concurrency,
+        )
+
     def sprint_candidates(self, *, project_id: int) -> dict[str, Any]:
         """Return sprint candidate projection."""
         return self._get_read_projection().sprint_candidates(project_id=project_id)
 
+    def sprint_packets(
+        self,
+        *,
+        project_id: int,
+        sprint_id: int,
+        output: str | None = None,
+        bundle_format: BundleFormat = "ndjson",
+        flavor: str | None = None,
+    ) -> dict[str, Any]:
+        """Write every story and task packet of a sprint to a bundle file."""
+        return write_sprint_packet_bundle(
+            engine=get_engine(),
+            project_id=project_id,
+            sprint_id=sprint_id,
+            output=output,
+            bundle_format=bundle_format,
+            flavor=flavor,
+        )
+
+    def changes(
+        self,
+        *,
+        since: int = 0,
+        project_id: int | None = None,
+        limit: int = DEFAULT_CHANGE_PAGE_SIZE,
+    ) -> dict[str, Any]:
+        """Return entity change records after a change-log cursor."""
+        with Session(get_engine()) as session:
+            return _data_envelope(
+                list_entity_changes(
+                    session,
+                    since=since,
+                    limit=limit,
+                    project_id=project_id,
+                )
+            )
+
     def context_pack(
         self,
         *,
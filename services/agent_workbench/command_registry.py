@@ -84,6 +84,17 @@ _PHASE_1_COMMANDS: tuple[CommandMetadata, ...] = (
         phase="phase_1",
         input_required=("project_id",),
     ),
+    CommandMetadata(
+        name="agileforge sprint packets",
+        mutates=False,
+        phase="phase_1",
+        input_required=("project_id", "sprint_id"),
+        input_optional=("output", "format", "flavor"),
+        errors=(
+            ErrorCode.PROJECT_NOT_FOUND.value,
+            ErrorCode.SPRINT_NOT_FOUND.value,
+        ),
+    ),
     CommandMetadata(
         name="agileforge context pack",
         mutates=False,
@@ -91,6 +102,12 @@ _PHASE_1_COMMANDS: tuple[CommandMetadata, ...] = (
         input_required=("project_id",),
         input_optional=("phase",),
     ),
+    CommandMetadata(
+        name="agileforge changes",
+        mutates=False,
+        phase="phase_1",
+        input_optional=("since", "project_id", "limit"),
+    ),
 )
 
 _PHASE_2A_COMMANDS: tuple[CommandMetadata, ...] = (
@@ -207,6 +224,17 @@ _PHASE_2B_COMMANDS: tuple[CommandMetadata, ...] = (
             ErrorCode.MUTATION_RESUME_CONFLICT.value,
         ),
     ),
+    CommandMetadata(
+        name="agileforge story generate-batch",
+        mutates=True,
+        phase="phase_2b",
+        input_required=("project_id",),
+        input_optional=("max_concurrency",),
+        errors=(
+            ErrorCode.INVALID_COMMAND.value,
+            ErrorCode.PROJECT_NOT_FOUND.value,
+        ),
+    ),
 )
 
 
@@ -27,6 +27,7 @@ class ErrorCode(StrEnum):
     PROJECT_NOT_FOUND = "PROJECT_NOT_FOUND"
     PROJECT_ALREADY_EXISTS = "PROJECT_ALREADY_EXISTS"
     STORY_NOT_FOUND = "STORY_NOT_FOUND"
+    SPRINT_NOT_FOUND = "SPRINT_NOT_FOUND"
     SPEC_VERSION_NOT_FOUND = "SPEC_VERSION_NOT_FOUND"
     SPEC_FILE_NOT_FOUND = "SPEC_FILE_NOT_FOUND"
     SPEC_FILE_INVALID = "SPEC_FILE_INVALID"
@@ -96,6 +97,12 @@ _ERROR_REGISTRY: dict[ErrorCode, ErrorMetadata] = {
         retryable=False,
         description="The requested story was not found.",
     ),
+    ErrorCode.SPRINT_NOT_FOUND: ErrorMetadata(
+        code=ErrorCode.SPRINT_NOT_FOUND.value,
+        default_exit_code=4,
+        retryable=False,
+        description="The requested sprint was not found.",
+    ),
     ErrorCode.SPEC_VERSION_NOT_FOUND: ErrorMetadata(
         code=ErrorCode.SPEC_VERSION_NOT_FOUND.value,
         default_exit_code=4,
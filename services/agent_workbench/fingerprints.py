@@ -1,10 +1,11 @@
 """Canonical hashing helpers for agent workbench projections."""
 
 import hashlib
-import json
 from collections.abc import Mapping, Sequence
 from datetime import UTC, date, datetime
 
+from utils.json_encoding import canonical_dumps, is_canonical_scalar
+
 
 def _datetime_to_utc_z(value: datetime) -> str:
     """Return a datetime serialized as a UTC ISO string with Z suffix."""
@@ -12,8 +13,8 @@ def _datetime_to_utc_z(value: datetime) -> str:
     return normalized.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
-def normalize_for_hash(value: object) -> object:
-    """Normalize objects into deterministic JSON-compatible values."""
+def _normalize(value: object, odd_leaves: list[object]) -> object:
+    """Normalize ``value``, collecting leaves orjson may spell differently."""
     if isinstance(value, datetime):
         return _datetime_to_utc_z(value)
     if isinstance(value, date):
@@ -25,21 +26,25 @@ def normalize_for_hash(value: object) -> object:
             if canonical_key in normalized:
                 msg = f"Duplicate canonical mapping key {canonical_key!r}."
                 raise ValueError(msg)
-            normalized[canonical_key] = normalize_for_hash(item)
+            normalized[canonical_key] = _normalize(item, odd_leaves)
         return normalized
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
-        return [normalize_for_hash(item) for item in value]
+        return [_normalize(item, odd_leaves) for item in value]
+    if not is_canonical_scalar(value):
+        odd_leaves.append(value)
     return value
 
 
+def normalize_for_hash(value: object) -> object:
+    """Normalize objects into deterministic JSON-compatible values."""
+    return _normalize(value, [])
+
+
 def canonical_json(value: object) -> str:
     """Serialize a normalized value for hashing."""
-    return json.dumps(
-        normalize_for_hash(value),
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=True,
-    )
+    odd_leaves: list[object] = []
+    normalized = _normalize(value, odd_leaves)
+    return canonical_dumps(normalized, plain=not odd_leaves)
 
 
 def canonical_hash(value: object) -> str:
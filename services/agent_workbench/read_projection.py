@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Final, cast
 
 from pydantic import ValidationError
 from sqlalchemy import func
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
 from models import db as model_db
@@ -25,6 +26,7 @@ from services.agent_workbench.schema_readiness import (
 )
 from services.agent_workbench.session_reader import ReadOnlySessionReader
 from services.orchestrator_query_service import fetch_sprint_candidates_from_session
+from services.project_structure import get_project_structure_summary
 from utils.spec_schemas import ValidationEvidence
 
 if TYPE_CHECKING:
@@ -48,6 +50,7 @@ _PRODUCT_REQUIREMENT: Final[SchemaRequirement] = SchemaRequirement(
         "vision",
         "roadmap",
         "spec_file_path",
+        "structure_version",
         "updated_at",
     ),
 )
@@ -87,11 +90,11 @@ _THEME_REQUIREMENT: Final[SchemaRequirement] = SchemaRequirement(
 )
 _EPIC_REQUIREMENT: Final[SchemaRequirement] = SchemaRequirement(
     "epics",
-    ("epic_id", "theme_id", "title", "updated_at"),
+    ("epic_id", "theme_id", "product_id", "title", "updated_at"),
 )
 _FEATURE_REQUIREMENT: Final[SchemaRequirement] = SchemaRequirement(
     "features",
-    ("feature_id", "epic_id", "title", "updated_at"),
+    ("feature_id", "epic_id", "product_id", "title", "updated_at"),
 )
 _SPEC_REQUIREMENT: Final[SchemaRequirement] = SchemaRequirement(
     "spec_registry",
@@ -242,22 +245,6 @@ def _validation_summary(story: UserStory) -> JsonDict:
     }
 
 
-def _latest_approved_spec(session: Session, project_id: int) -> SpecRegistry | None:
-    """Return the latest approved spec for a project."""
-    return session.exec(
-        select(SpecRegistry)
-        .where(
-            SpecRegistry.product_id == project_id,
-            SpecRegistry.status == "approved",
-        )
-        .order_by(
-            cast("Any", SpecRegistry.approved_at).desc(),
-            cast("Any", SpecRegistry.created_at).desc(),
-            cast("Any", SpecRegistry.spec_version_id).desc(),
-        )
-    ).first()
-
-
 def _latest_approved_spec_payload(spec: SpecRegistry | None) -> JsonDict | None:
     """Return JSON-safe latest spec metadata."""
     if spec is None:
@@ -271,12 +258,6 @@ def _latest_approved_spec_payload(spec: SpecRegistry | None) -> JsonDict | None:
     }
 
 
-def _count(session: Session, statement: object) -> int:
-    """Return an integer count from a SQLModel scalar query."""
-    value = session.exec(cast("Any", statement)).one()
-    return int(value or 0)
-
-
 def _sprint_candidate_story_sources(
     session: Session,
     project_id: int,
@@ -389,7 +370,16 @@ class ReadProjectionService:
         with Session(self._engine) as session:
             products = list(
                 session.exec(
-                    select(Product).order_by(cast("Any", Product.product_id))
+                    select(Product)
+                    .options(
+                        load_only(
+                            cast("Any", Product.product_id),
+                            cast("Any", Product.name),
+                            cast("Any", Product.description),
+                            cast("Any", Product.updated_at),
+                        )
+                    )
+                    .order_by(cast("Any", Product.product_id))
                 ).all()
             )
             product_ids = [
@@ -448,40 +438,13 @@ class ReadProjectionService:
             if product is None:
                 return _project_not_found_error(PROJECT_SHOW_COMMAND, project_id)
 
-            counts = {
-                "themes": _count(
-                    session,
-                    select(func.count(cast("Any", Theme.theme_id))).where(
-                        Theme.product_id == project_id
-                    ),
-                ),
-                "epics": _count(
-                    session,
-                    select(func.count(cast("Any", Epic.epic_id)))
-                    .join(Theme)
-                    .where(Theme.product_id == project_id),
-                ),
-                "features": _count(
-                    session,
-                    select(func.count(cast("Any", Feature.feature_id)))
-                    .join(Epic)
-                    .join(Theme)
-                    .where(Theme.product_id == project_id),
-                ),
-                "user_stories": _count(
-                    session,
-                    select(func.count(cast("Any", UserStory.story_id))).where(
-                        UserStory.product_id == project_id
-                    ),
-                ),
-                "sprints": _count(
-                    session,
-                    select(func.count(cast("Any", Sprint.sprint_id))).where(
-                        Sprint.product_id == project_id
-                    ),
-                ),
-            }
-            latest_spec = _latest_approved_spec(session, project_id)
+            summary = get_project_structure_summary(session, product)
+            counts = summary.counts()
+            latest_spec = (
+                session.get(SpecRegistry, summary.latest_spec_version_id)
+                if summary.latest_spec_version_id is not None
+                else None
+            )
             latest_spec_payload = _latest_approved_spec_payload(latest_spec)
             product_payload = {
                 "product_id": product.product_id,
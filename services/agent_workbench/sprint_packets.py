@@ -0,0 +1,106 @@
+"""Write a sprint's story and task packets to a local bundle file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlmodel import Session
+
+from models.core import Product
+from services.agent_workbench.envelope import error_envelope
+from services.agent_workbench.error_codes import ErrorCode, workbench_error
+from services.packet_renderer import render_packet
+from services.packets.packet_builder import (
+    iter_sprint_packets,
+    load_sprint_packet_graph,
+)
+from services.packets.packet_bundle import (
+    BUNDLE_FILE_SUFFIXES,
+    BundleFormat,
+    iter_packet_bundle,
+)
+from services.packets.packet_service import (
+    iter_sprint_packets as iter_rendered_packets,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+SPRINT_PACKETS_COMMAND: Final[str] = "agileforge sprint packets"
+
+
+def default_bundle_path(sprint_id: int, bundle_format: BundleFormat) -> str:
+    """Return the default output file name for a sprint bundle."""
+    return f"sprint-{sprint_id}-packets{BUNDLE_FILE_SUFFIXES[bundle_format]}"
+
+
+def write_sprint_packet_bundle(  # noqa: PLR0913
+    *,
+    engine: Engine,
+    project_id: int,
+    sprint_id: int,
+    output: str | None = None,
+    bundle_format: BundleFormat = "ndjson",
+    flavor: str | None = None,
+) -> dict[str, Any]:
+    """Stream every packet of a sprint into ``output`` and report the counts."""
+    path = Path(output or default_bundle_path(sprint_id, bundle_format))
+    with Session(engine) as session:
+        if session.get(Product, project_id) is None:
+            return error_envelope(
+                command=SPRINT_PACKETS_COMMAND,
+                error=workbench_error(
+                    ErrorCode.PROJECT_NOT_FOUND,
+                    message=f"Project {project_id} was not found.",
+                    details={"project_id": project_id},
+                    remediation=["agileforge project list"],
+                ),
+            )
+        graph = load_sprint_packet_graph(
+            session,
+            project_id=project_id,
+            sprint_id=sprint_id,
+        )
+        if graph is None:
+            return error_envelope(
+                command=SPRINT_PACKETS_COMMAND,
+                error=workbench_error(
+                    ErrorCode.SPRINT_NOT_FOUND,
+                    message=f"Sprint {sprint_id} was not found in project "
+                    f"{project_id}.",
+                    details={"project_id": project_id, "sprint_id": sprint_id},
+                    remediation=[f"agileforge status --project-id {project_id}"],
+                ),
+            )
+
+        bytes_written = 0
+        with path.open("wb") as handle:
+            for chunk in iter_packet_bundle(
+                iter_rendered_packets(
+                    packets=iter_sprint_packets(session, graph),
+                    flavor=flavor,
+                    render_packet=render_packet,
+                ),
+                bundle_format=bundle_format,
+                root=f"sprint-{sprint_id}-packets",
+            ):
+                handle.write(chunk)
+                bytes_written += len(chunk)
+
+    return {
+        "ok": True,
+        "data": {
+            "project_id": project_id,
+            "sprint_id": sprint_id,
+            "format": bundle_format,
+            "flavor": flavor,
+            "path": str(path),
+            "story_count": graph.story_count,
+            "task_count": graph.task_count,
+            "packet_count": graph.story_count + graph.task_count,
+            "bytes_written": bytes_written,
+        },
+        "warnings": [],
+        "errors": [],
+    }
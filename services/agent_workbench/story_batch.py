@@ -0,0 +1,125 @@
+"""Generate first story drafts for every pending roadmap requirement."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlmodel import Session
+
+from models.core import Product
+from services.agent_workbench.envelope import error_envelope
+from services.agent_workbench.error_codes import ErrorCode, workbench_error
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine
+
+    from services.workflow import WorkflowService
+
+STORY_GENERATE_BATCH_COMMAND: Final[str] = "agileforge story generate-batch"
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+async def run_story_batch(
+    project_id: int,
+    *,
+    max_concurrency: int,
+    workflow_service: WorkflowService | None = None,
+    report_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run batch story generation for one project's workflow session.
+
+    The agent runtime is imported only when a batch runs, so the CLI entry
+    point stays free of it.
+    """
+    from services.interview_runtime import (  # noqa: PLC0415
+        append_attempt,
+        mark_feedback_absorbed,
+        promote_reusable_draft,
+        set_request_projection,
+    )
+    from services.phases.story_service import (  # noqa: PLC0415
+        generate_pending_story_drafts,
+    )
+    from services.phases.workflow_state import failure_meta  # noqa: PLC0415
+    from services.story_runtime import run_story_agent_from_state  # noqa: PLC0415
+    from services.workflow import WorkflowService  # noqa: PLC0415
+
+    service = workflow_service or WorkflowService()
+    session_id = str(project_id)
+
+    async def load_state() -> dict[str, Any]:
+        return service.get_session_status(session_id)
+
+    def save_state(updated: dict[str, Any]) -> None:
+        service.update_session_status(session_id, updated)
+
+    return await generate_pending_story_drafts(
+        project_id=project_id,
+        max_concurrency=max_concurrency,
+        load_state=load_state,
+        save_state=save_state,
+        now_iso=_now_iso,
+        run_story_agent_from_state=run_story_agent_from_state,
+        set_request_projection=set_request_projection,
+        append_attempt=append_attempt,
+        promote_reusable_draft=promote_reusable_draft,
+        mark_feedback_absorbed=mark_feedback_absorbed,
+        failure_meta=failure_meta,
+        report_progress=report_progress,
+    )
+
+
+def generate_story_batch(
+    *,
+    engine: Engine,
+    project_id: int,
+    max_concurrency: int | None = None,
+) -> dict[str, Any]:
+    """Draft stories for a project's pending requirements and report each one."""
+    from services.phases.story_service import StoryPhaseError  # noqa: PLC0415
+    from utils.model_config import (  # noqa: PLC0415
+        get_story_pipeline_max_concurrency,
+    )
+
+    with Session(engine) as session:
+        if session.get(Product, project_id) is None:
+            return error_envelope(
+                command=STORY_GENERATE_BATCH_COMMAND,
+                error=workbench_error(
+                    ErrorCode.PROJECT_NOT_FOUND,
+                    message=f"Project {project_id} was not found.",
+                    details={"project_id": project_id},
+                    remediation=["agileforge project list"],
+                ),
+            )
+
+    if max_concurrency is None:
+        max_concurrency = get_story_pipeline_max_concurrency()
+    try:
+        result = asyncio.run(
+            run_story_batch(project_id, max_concurrency=max_concurrency)
+        )
+    except StoryPhaseError as exc:
+        return error_envelope(
+            command=STORY_GENERATE_BATCH_COMMAND,
+            error=workbench_error(
+                ErrorCode.INVALID_COMMAND,
+                message=exc.detail,
+                details={"max_concurrency": max_concurrency},
+                remediation=["Pass a positive --max-concurrency."],
+            ),
+        )
+
+    return {
+        "ok": True,
+        "data": {"project_id": project_id, **result["data"]},
+        "warnings": [],
+        "errors": [],
+    }
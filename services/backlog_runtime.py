@@ -10,13 +10,12 @@ from typing import Any
 
 from pydantic import ValidationError
 
-from orchestrator_agent.agent_tools.backlog_primer.agent import (
-    root_agent as backlog_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.backlog_primer.schemes import (
     InputSchema,
     OutputSchema,
 )
+from services.state_blobs import state_text
 from utils.adk_runner import (
     get_agent_model_info,
     invoke_agent_to_text,
@@ -91,8 +90,8 @@ def build_backlog_input_context(
 
     return {
         "product_vision_statement": vision_stmt,
-        "technical_spec": _as_text(state.get("pending_spec_content")),
-        "compiled_authority": _as_text(state.get("compiled_authority_cached")),
+        "technical_spec": _as_text(state_text(state, "pending_spec_content")),
+        "compiled_authority": _as_text(state_text(state, "compiled_authority_cached")),
         "prior_backlog_state": _normalize_prior_backlog_state(
             state.get("backlog_items")
         ),
@@ -102,7 +101,7 @@ def build_backlog_input_context(
 
 async def _invoke_backlog_agent(payload: InputSchema) -> str:
     return await invoke_agent_to_text(
-        agent=backlog_agent,
+        agent=get_agent("backlog_primer"),
         runner_identity=BACKLOG_RUNNER_IDENTITY,
         payload_json=payload.model_dump_json(),
         no_text_error="Backlog agent returned no text response",
@@ -125,7 +124,7 @@ def _failure(
         raw_output=details.raw_text,
         context={"input_context": input_context},
         model_info={
-            **get_agent_model_info(backlog_agent),
+            **get_agent_model_info(get_agent("backlog_primer")),
             "app_name": BACKLOG_RUNNER_IDENTITY.app_name,
             "user_id": BACKLOG_RUNNER_IDENTITY.user_id,
         },
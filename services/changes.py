@@ -0,0 +1,100 @@
+"""Read and long-poll the ``entity_changes`` change log.
+
+Consumers keep the ``next_since`` cursor of the last page and ask only for
+records after it, so a cache can drop exactly the entities that changed
+instead of re-querying and diffing fingerprints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import func
+from sqlmodel import Session, col, select
+
+from models.changes import EntityChange
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+DEFAULT_CHANGE_PAGE_SIZE: Final[int] = 500
+MAX_CHANGE_PAGE_SIZE: Final[int] = 5000
+MAX_CHANGE_WAIT_SECONDS: Final[float] = 60.0
+_POLL_INTERVAL_SECONDS: Final[float] = 0.25
+
+
+def list_entity_changes(
+    session: Session,
+    *,
+    since: int = 0,
+    limit: int = DEFAULT_CHANGE_PAGE_SIZE,
+    project_id: int | None = None,
+) -> dict[str, Any]:
+    """Return the change records after ``since``, oldest first.
+
+    ``next_since`` is the cursor for the following call; ``has_more`` reports
+    that the page was truncated at ``limit``.
+    """
+    statement = (
+        select(EntityChange)
+        .where(col(EntityChange.seq) > since)
+        .order_by(col(EntityChange.seq))
+        .limit(limit + 1)
+    )
+    if project_id is not None:
+        statement = statement.where(col(EntityChange.product_id) == project_id)
+    rows = list(session.exec(statement))
+    page = rows[:limit]
+    return {
+        "changes": [row.model_dump(mode="json") for row in page],
+        "next_since": page[-1].seq if page else since,
+        "has_more": len(rows) > limit,
+    }
+
+
+def latest_change_seq(session: Session) -> int:
+    """Return the newest change sequence number, or 0 for an empty log."""
+    return session.exec(select(func.max(EntityChange.seq))).one() or 0
+
+
+def _read_changes(
+    engine: Engine,
+    *,
+    since: int,
+    limit: int,
+    project_id: int | None,
+) -> dict[str, Any]:
+    with Session(engine) as session:
+        return list_entity_changes(
+            session, since=since, limit=limit, project_id=project_id
+        )
+
+
+async def wait_for_entity_changes(
+    engine: Engine,
+    *,
+    since: int = 0,
+    limit: int = DEFAULT_CHANGE_PAGE_SIZE,
+    project_id: int | None = None,
+    wait_seconds: float = 0.0,
+) -> dict[str, Any]:
+    """Return changes after ``since``, waiting up to ``wait_seconds`` for one.
+
+    The log is polled rather than signalled in-process so writes from other
+    processes sharing the database (the CLI, workers) wake waiters too.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(wait_seconds, MAX_CHANGE_WAIT_SECONDS)
+    while True:
+        page = await asyncio.to_thread(
+            _read_changes,
+            engine,
+            since=since,
+            limit=limit,
+            project_id=project_id,
+        )
+        remaining = deadline - loop.time()
+        if page["changes"] or remaining <= 0:
+            return page
+        await asyncio.sleep(min(_POLL_INTERVAL_SECONDS, remaining))
@@ -0,0 +1,236 @@
+"""Background job queue for LLM phase generation.
+
+Generate requests are persisted in the ``generation_jobs`` table and executed
+by a small pool of in-process asyncio workers, so a slow provider no longer
+holds an HTTP worker for the whole model call. Submissions with the same
+project, phase and input hash coalesce onto the job that is already queued or
+running instead of starting a second model call.
+
+Each job records the process that owns it (``host:pid``). On startup the API
+fails the queued or running jobs whose owner has exited, leaving jobs of
+other live workers alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from repositories.generation_job import GenerationJobRepository
+from utils.adk_runner import ZdrRetryPolicy, agent_retry_policy
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+type JobOperation = Callable[[], Awaitable[dict[str, Any]]]
+
+_INTERRUPTED_JOB_ERROR = "Job was interrupted by a server restart; resubmit it."
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def process_owner() -> str:
+    """Return the owner tag stored on jobs submitted by this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _pid_exited(pid: int) -> bool:
+    if os.name != "posix":
+        # Signal 0 is not a liveness probe outside POSIX; assume a restart.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def _owner_exited(owner: str | None) -> bool:
+    """Return whether the process that owns a job is known to be gone."""
+    if owner is None:
+        return True
+    host, _, pid_text = owner.rpartition(":")
+    # Another host's process cannot be probed from here.
+    if host != socket.gethostname() or not pid_text.isdigit():
+        return False
+    return int(pid_text) != os.getpid() and _pid_exited(int(pid_text))
+
+
+def hash_job_input(*, project_id: int, phase: str, payload: dict[str, Any]) -> str:
+    """Return the coalescing key for one generate submission."""
+    serialized = json.dumps(
+        {"project_id": project_id, "phase": phase, "payload": payload},
+        sort_keys=True,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class GenerationJobManager:
+    """Queue generate operations and run them on an in-process worker pool."""
+
+    def __init__(
+        self,
+        repository: GenerationJobRepository | None = None,
+        *,
+        max_workers: int = 2,
+        now_iso: Callable[[], str] = _now_iso,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        new_job_id: Callable[[], str] = lambda: uuid4().hex,
+    ) -> None:
+        """Configure the worker pool; workers start on the first submission."""
+        if max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
+        self._repository = repository
+        self._max_workers = max_workers
+        self._now_iso = now_iso
+        self._sleep = sleep
+        self._new_job_id = new_job_id
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, JobOperation]] | None = None
+        self._submit_lock: asyncio.Lock | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def repository(self) -> GenerationJobRepository:
+        """Return the jobs repository, creating the default one on first use."""
+        if self._repository is None:
+            self._repository = GenerationJobRepository()
+        return self._repository
+
+    def recover_interrupted_jobs(self) -> int:
+        """Fail queued or running jobs whose owning process has exited.
+
+        Called once at startup; returns the number of jobs failed.
+        """
+        repository = self.repository
+        exited = {owner for owner in repository.active_owners() if _owner_exited(owner)}
+        if not exited:
+            return 0
+        return repository.fail_incomplete(
+            error=_INTERRUPTED_JOB_ERROR, finished_at=self._now_iso(), owners=exited
+        )
+
+    def _bind_loop(self) -> asyncio.Queue[tuple[str, JobOperation]]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._submit_lock = asyncio.Lock()
+            self._workers = []
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self._max_workers:
+            self._workers.append(asyncio.create_task(self._worker(self._queue)))
+        return self._queue
+
+    async def submit(
+        self,
+        *,
+        project_id: int,
+        phase: str,
+        payload: dict[str, Any],
+        operation: JobOperation,
+    ) -> tuple[dict[str, Any], bool]:
+        """Queue ``operation`` and return ``(job, coalesced)``."""
+        queue = self._bind_loop()
+        input_hash = hash_job_input(project_id=project_id, phase=phase, payload=payload)
+        repository = self.repository
+        assert self._submit_lock is not None  # noqa: S101
+        async with self._submit_lock:
+            existing = repository.find_active(
+                project_id=project_id, phase=phase, input_hash=input_hash
+            )
+            if existing is not None:
+                return existing, True
+            job = repository.insert(
+                job_id=self._new_job_id(),
+                project_id=project_id,
+                phase=phase,
+                input_hash=input_hash,
+                created_at=self._now_iso(),
+                owner=process_owner(),
+            )
+        queue.put_nowait((job["job_id"], operation))
+        return job, False
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return the current status row for one job."""
+        return self.repository.get(job_id)
+
+    async def drain(self) -> None:
+        """Wait until every queued job has finished (used by tests and scripts)."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Cancel the worker pool; unfinished jobs are failed on next startup."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+
+    async def _worker(self, queue: asyncio.Queue[tuple[str, JobOperation]]) -> None:
+        while True:
+            job_id, operation = await queue.get()
+            try:
+                await self._run_job(job_id, operation)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Generation job %s crashed", job_id)
+            finally:
+                queue.task_done()
+
+    async def _run_job(self, job_id: str, operation: JobOperation) -> None:
+        repository = self.repository
+        repository.mark_running(job_id, started_at=self._now_iso())
+        repository.record_attempt(job_id, 1)
+
+        def _on_retry(retry_number: int, exc: BaseException) -> None:
+            logger.warning(
+                "Generation job %s hit a ZDR routing failure (retry %s): %s",
+                job_id,
+                retry_number,
+                exc,
+            )
+            repository.record_attempt(job_id, retry_number + 1)
+
+        policy = ZdrRetryPolicy(sleep=self._sleep, on_retry=_on_retry)
+
+        async def _run_with_policy() -> dict[str, Any]:
+            with agent_retry_policy(policy):
+                return await operation()
+
+        try:
+            # A child task keeps context variables set by one job out of the
+            # long-lived worker task.
+            result = await asyncio.create_task(_run_with_policy())
+        except Exception as exc:  # pylint: disable=broad-except
+            status_code = getattr(exc, "status_code", None)
+            if not isinstance(status_code, int):
+                logger.exception("Generation job %s failed", job_id)
+                status_code = 500
+            repository.mark_failed(
+                job_id,
+                error=str(getattr(exc, "detail", None) or exc),
+                status_code=status_code,
+                finished_at=self._now_iso(),
+            )
+            return
+        repository.mark_succeeded(job_id, result=result, finished_at=self._now_iso())
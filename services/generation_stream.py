@@ -0,0 +1,112 @@
+"""Server-sent event streaming for phase generation requests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from utils.adk_runner import agent_progress_listener
+from utils.runtime_metrics import RuntimeMetrics, runtime_metrics
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_STREAM_DONE = object()
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def format_sse(
+    event: str, payload: dict[str, Any], *, event_id: int | None = None
+) -> str:
+    """Render one server-sent event frame."""
+    data = json.dumps(payload, ensure_ascii=True, default=str)
+    frame = f"event: {event}\ndata: {data}\n\n"
+    return frame if event_id is None else f"id: {event_id}\n{frame}"
+
+
+def _elapsed_ms(started: float, clock: Callable[[], float]) -> float:
+    return (clock() - started) * 1000.0
+
+
+async def stream_generation_events(
+    operation: Callable[[], Awaitable[dict[str, Any]]],
+    *,
+    phase: str,
+    project_id: int,
+    metrics: RuntimeMetrics = runtime_metrics,
+    clock: Callable[[], float] = time.perf_counter,
+) -> AsyncIterator[str]:
+    """Run a generate operation and yield its progress as SSE frames.
+
+    Events, in order: ``queued``, ``invoking_model``, any number of ``token``
+    deltas, ``validating``, then ``persisted`` with the operation result or
+    ``error`` with ``status_code`` and ``detail``. Time to first byte, time to
+    first token and total duration are recorded per phase in ``metrics``.
+
+    The operation keeps running if the client disconnects so a generated
+    draft is still persisted to the workflow session.
+    """
+    started = clock()
+    labels = {"phase": phase}
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    def _listener(event: str, payload: dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (event, payload))
+
+    async def _run() -> dict[str, Any]:
+        try:
+            with agent_progress_listener(_listener):
+                return await operation()
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_DONE)
+
+    task = asyncio.create_task(_run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    yield format_sse("queued", {"phase": phase, "project_id": project_id})
+    metrics.observe_ms(
+        "generation_stream.ttfb_ms", _elapsed_ms(started, clock), labels=labels
+    )
+
+    first_token_seen = False
+    while True:
+        item = await queue.get()
+        if item is _STREAM_DONE:
+            break
+        event, payload = cast("tuple[str, dict[str, Any]]", item)
+        if event == "token" and not first_token_seen:
+            first_token_seen = True
+            metrics.observe_ms(
+                "generation_stream.first_token_ms",
+                _elapsed_ms(started, clock),
+                labels=labels,
+            )
+        yield format_sse(event, payload)
+
+    outcome = "persisted"
+    try:
+        result = task.result()
+    except Exception as exc:  # pylint: disable=broad-except
+        outcome = "error"
+        status_code = getattr(exc, "status_code", None)
+        if not isinstance(status_code, int):
+            logger.exception("Streaming %s generation failed", phase)
+            status_code = 500
+        detail = getattr(exc, "detail", None) or f"{phase} generation failed"
+        yield format_sse("error", {"status_code": status_code, "detail": detail})
+    else:
+        yield format_sse("persisted", {"result": result})
+
+    metrics.observe_ms(
+        "generation_stream.total_ms", _elapsed_ms(started, clock), labels=labels
+    )
+    metrics.increment(
+        "generation_stream.completed", labels={"phase": phase, "outcome": outcome}
+    )
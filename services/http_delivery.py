@@ -0,0 +1,338 @@
+"""Compression, cache validators and cache policies for HTTP responses.
+
+``HttpDeliveryMiddleware`` sits in front of the API and the dashboard:
+
+* ``Cache-Control`` is chosen per route class: API reads may be stored but
+  must be revalidated, API writes are never stored, streamed events keep the
+  ``no-cache`` their routes set, and dashboard files use the policy
+  ``FingerprintedStaticFiles`` sets;
+* single-message ``GET`` API responses get a strong ETag over the body and are
+  answered with ``304 Not Modified`` when ``If-None-Match`` matches;
+* compressible bodies of at least ``MIN_COMPRESS_BYTES`` are encoded with
+  brotli when the optional ``brotli`` package is installed and the client
+  accepts it, otherwise gzip. ETags are left as they are, as they only feed
+  ``If-None-Match`` revalidation; range requests are not offered on encoded
+  bodies.
+
+``FingerprintedStaticFiles`` serves ``frontend/`` with content-hash ETags. HTML
+pages have their local script and stylesheet URLs rewritten to carry
+``?v=<fingerprint>``; a request carrying the current fingerprint is cacheable
+forever, everything else revalidates.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import re
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+from services.packets.packet_cache import etag_matches
+
+if TYPE_CHECKING:
+    import os
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MIN_COMPRESS_BYTES: Final[int] = 1024
+GZIP_LEVEL: Final[int] = 6
+BROTLI_QUALITY: Final[int] = 5
+
+IMMUTABLE_CACHE_CONTROL: Final[str] = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL: Final[str] = "no-cache"
+API_READ_CACHE_CONTROL: Final[str] = "private, no-cache"
+API_WRITE_CACHE_CONTROL: Final[str] = "no-store"
+
+_READ_METHODS: Final = frozenset({"GET", "HEAD"})
+_UNCOMPRESSED_STATUSES: Final = frozenset({204, 206, 304})
+_COMPRESSIBLE_TYPES: Final = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+)
+_STREAMED_TYPE: Final[str] = "text/event-stream"
+_ASSET_URL = re.compile(
+    r'(?P<attr>src|href)="(?P<prefix>/dashboard/)'
+    r'(?P<path>[\w./-]+\.(?:js|css))(?:\?[^"]*)?"'
+)
+
+
+def brotli_available() -> bool:
+    """Return whether the optional ``brotli`` package can be imported."""
+    return importlib.util.find_spec("brotli") is not None
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick ``br`` or ``gzip`` from an ``Accept-Encoding`` header, if any."""
+    if not accept_encoding:
+        return None
+    accepted: set[str] = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if params and quality.replace(".", "", 1).isdigit() and not float(quality):
+            continue
+        accepted.add(coding.strip().lower())
+    if "br" in accepted and brotli_available():
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def cache_control_for(method: str, path: str) -> str | None:
+    """Return the route class ``Cache-Control`` policy, or ``None`` to keep it."""
+    if not path.startswith("/api/"):
+        return None
+    if method in _READ_METHODS:
+        return API_READ_CACHE_CONTROL
+    return API_WRITE_CACHE_CONTROL
+
+
+def body_etag(body: bytes) -> str:
+    """Return a strong ETag derived from a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self) -> None:
+        brotli = importlib.import_module("brotli")
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _encoder_for(encoding: str) -> _Encoder:
+    return _BrotliEncoder() if encoding == "br" else _GzipEncoder()
+
+
+def _is_compressible(headers: MutableHeaders) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        "content-encoding" not in headers
+        and not content_type.startswith(_STREAMED_TYPE)
+        and content_type.startswith(_COMPRESSIBLE_TYPES)
+    )
+
+
+class HttpDeliveryMiddleware:
+    """ASGI middleware applying cache policies, API ETags and compression."""
+
+    def __init__(self, app: ASGIApp, *, minimum_size: int = MIN_COMPRESS_BYTES) -> None:
+        """Wrap ``app``; bodies under ``minimum_size`` bytes stay uncompressed."""
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Rewrite the response start and body messages of HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        responder = _DeliveryResponder(scope, send, minimum_size=self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _DeliveryResponder:
+    def __init__(self, scope: Scope, send: Send, *, minimum_size: int) -> None:
+        request_headers = Headers(scope=scope)
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        self.if_none_match = request_headers.get("if-none-match")
+        self.minimum_size = minimum_size
+        self.downstream = send
+        self.start: Message | None = None
+        self.encoder: _Encoder | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.start is None:
+            await self._send_body(message)
+            return
+
+        start, self.start = self.start, None
+        headers = MutableHeaders(scope=start)
+        policy = cache_control_for(self.method, self.path)
+        if policy is not None and "cache-control" not in headers:
+            headers["Cache-Control"] = policy
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._wants_etag(start, headers, more_body=more_body):
+            etag = body_etag(body)
+            headers["ETag"] = etag
+            if etag_matches(self.if_none_match, etag):
+                await self._send_not_modified(headers)
+                return
+
+        if self._should_compress(start, headers, body, more_body=more_body):
+            self.encoder = _encoder_for(str(self.encoding))
+            headers["Content-Encoding"] = str(self.encoding)
+            headers.add_vary_header("Accept-Encoding")
+            del headers["content-length"]
+            del headers["accept-ranges"]
+            if not more_body:
+                message = {**message, "body": self._encode(body, more_body=False)}
+                headers["Content-Length"] = str(len(message["body"]))
+                self.encoder = None
+                await self.downstream(start)
+                await self.downstream(message)
+                return
+        elif self.encoding is not None and _is_compressible(headers):
+            headers.add_vary_header("Accept-Encoding")
+
+        await self.downstream(start)
+        await self._send_body(message)
+
+    def _wants_etag(
+        self, start: Message, headers: MutableHeaders, *, more_body: bool
+    ) -> bool:
+        return (
+            not more_body
+            and self.method == "GET"
+            and self.path.startswith("/api/")
+            and start["status"] == 200  # noqa: PLR2004
+            and "etag" not in headers
+            and headers.get("content-type", "").startswith("application/json")
+        )
+
+    def _should_compress(
+        self,
+        start: Message,
+        headers: MutableHeaders,
+        body: bytes,
+        *,
+        more_body: bool,
+    ) -> bool:
+        return (
+            self.encoding is not None
+            and self.method != "HEAD"
+            and start["status"] not in _UNCOMPRESSED_STATUSES
+            and _is_compressible(headers)
+            and (more_body or len(body) >= self.minimum_size)
+        )
+
+    def _encode(self, body: bytes, *, more_body: bool) -> bytes:
+        if self.encoder is None:
+            return body
+        encoded = self.encoder.compress(body)
+        return encoded if more_body else encoded + self.encoder.finish()
+
+    async def _send_body(self, message: Message) -> None:
+        if self.encoder is not None and message["type"] == "http.response.body":
+            more_body = message.get("more_body", False)
+            message = {
+                **message,
+                "body": self._encode(message.get("body", b""), more_body=more_body),
+            }
+        await self.downstream(message)
+
+    async def _send_not_modified(self, headers: MutableHeaders) -> None:
+        response = NotModifiedResponse(headers)
+        await self.downstream(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response.raw_headers,
+            }
+        )
+        await self.downstream({"type": "http.response.body", "body": b""})
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """Serve static files with content fingerprints and cache policies."""
+
+    def __init__(
+        self, *, directory: str | os.PathLike[str], html: bool = False
+    ) -> None:
+        """Serve ``directory`` like ``StaticFiles``, caching file digests by stat."""
+        super().__init__(directory=directory, html=html)
+        self._digests: dict[str, tuple[tuple[int, int], str]] = {}
+
+    def fingerprint(self, full_path: str, stat_result: os.stat_result) -> str:
+        """Return the content digest of a file, recomputed only when it changes."""
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._digests.get(full_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        digest = hashlib.sha256(Path(full_path).read_bytes()).hexdigest()[:20]
+        self._digests[full_path] = (key, digest)
+        return digest
+
+    def asset_url(self, prefix: str, path: str) -> str:
+        """Return ``prefix + path`` with the asset's current fingerprint."""
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None:
+            return f"{prefix}{path}"
+        return f"{prefix}{path}?v={self.fingerprint(full_path, stat_result)}"
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Return the file with a content ETag and its ``Cache-Control`` policy."""
+        path = str(full_path)
+        request_headers = Headers(scope=scope)
+        if path.endswith(".html"):
+            body = _ASSET_URL.sub(
+                lambda match: (
+                    f'{match["attr"]}="'
+                    f'{self.asset_url(match["prefix"], match["path"])}"'
+                ),
+                Path(path).read_text(encoding="utf-8"),
+            ).encode("utf-8")
+            response: Response = Response(
+                body, status_code=status_code, media_type="text/html"
+            )
+            digest = hashlib.sha256(body).hexdigest()[:20]
+            cache_control = REVALIDATE_CACHE_CONTROL
+        else:
+            response = FileResponse(
+                path, status_code=status_code, stat_result=stat_result
+            )
+            digest = self.fingerprint(path, stat_result)
+            version = QueryParams(scope.get("query_string", b"")).get("v")
+            cache_control = (
+                IMMUTABLE_CACHE_CONTROL
+                if version == digest
+                else REVALIDATE_CACHE_CONTROL
+            )
+        response.headers["ETag"] = f'"{digest}"'
+        response.headers["Cache-Control"] = cache_control
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
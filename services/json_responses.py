@@ -0,0 +1,150 @@
+"""One-pass JSON responses for the API.
+
+FastAPI serializes an endpoint's return value twice for routes annotated
+``-> dict[str, Any]``: it validates and dumps the value through the response
+model in pydantic JSON mode, then ``JSONResponse`` encodes the resulting tree
+again with the stdlib encoder. ``ORJSONRoute`` skips the first pass for routes
+whose response model is plain JSON (``dict[str, Any]``, ``list[object]``,
+...). It turns the endpoint result straight into an ``ORJSONResponse``, and
+``utils.json_encoding`` applies the same datetime, enum and model conversions
+while encoding. Routes with a real response model, or response model
+include/exclude options, keep FastAPI's path and only get the faster
+renderer.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import types
+import typing
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Final
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.responses import Response
+
+from utils.json_encoding import dumps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from fastapi.dependencies.models import Dependant
+    from starlette.requests import Request
+
+_PLAIN_SCALARS: Final = (str, int, float, bool, types.NoneType)
+_SUB_RESPONSE_PARAM: Final[str] = "_json_sub_response"
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered by the shared one-pass encoder."""
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Encode ``content`` as compact UTF-8 JSON."""
+        return dumps(content)
+
+
+def is_plain_json_annotation(annotation: object) -> bool:
+    """Return whether a response model annotation is plain JSON.
+
+    Plain models (``Any``, ``object``, scalars, and ``dict``/``list`` of those
+    with string keys) validate every JSON-compatible value unchanged, so
+    running the endpoint result through them only converts types.
+    """
+    if annotation in {Any, object} or annotation in _PLAIN_SCALARS:
+        return True
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in {typing.Union, types.UnionType}:
+        return all(is_plain_json_annotation(arg) for arg in args)
+    if origin is list:
+        return all(is_plain_json_annotation(arg) for arg in args)
+    if origin is dict:
+        key, value = args or (str, Any)
+        return key is str and is_plain_json_annotation(value)
+    return annotation in {dict, list}
+
+
+def _respond(content: object, sub_response: Response, status_code: int) -> Response:
+    if isinstance(content, Response):
+        return content
+    current_status = sub_response.status_code or status_code
+    if is_body_allowed_for_status_code(current_status):
+        response: Response = ORJSONResponse(content, status_code=current_status)
+    else:
+        response = Response(status_code=current_status)
+    response.headers.raw.extend(sub_response.headers.raw)
+    return response
+
+
+def _one_pass_dependant(dependant: Dependant, status_code: int) -> Dependant:
+    """Return ``dependant`` with its endpoint returning ``ORJSONResponse``.
+
+    The endpoint always receives FastAPI's sub-response, under a private
+    parameter name when it does not declare one, so status codes and headers
+    set by the endpoint or its dependencies are merged as FastAPI would.
+    """
+    call = dependant.call
+    if call is None:
+        return dependant
+    declared = dependant.response_param_name
+
+    def split(kwargs: dict[str, Any]) -> Response:
+        if declared is not None:
+            return kwargs[declared]
+        return kwargs.pop(_SUB_RESPONSE_PARAM)
+
+    if inspect.iscoroutinefunction(call):
+        coroutine_call = typing.cast("Callable[..., Coroutine[Any, Any, Any]]", call)
+
+        @wraps(call)
+        async def endpoint(**kwargs: Any) -> Response:  # noqa: ANN401
+            sub_response = split(kwargs)
+            return _respond(await coroutine_call(**kwargs), sub_response, status_code)
+
+    else:
+
+        @wraps(call)
+        def endpoint(**kwargs: Any) -> Response:  # noqa: ANN401
+            sub_response = split(kwargs)
+            return _respond(call(**kwargs), sub_response, status_code)
+
+    return dataclasses.replace(
+        dependant,
+        call=endpoint,
+        response_param_name=declared or _SUB_RESPONSE_PARAM,
+    )
+
+
+class ORJSONRoute(APIRoute):
+    """``APIRoute`` that encodes plain JSON results in one pass."""
+
+    def uses_one_pass_encoding(self) -> bool:
+        """Return whether results bypass response model serialization."""
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        return (
+            self.response_field is not None
+            and issubclass(response_class, ORJSONResponse)
+            and is_plain_json_annotation(self.response_model)
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Build the request handler, wrapping the endpoint when eligible."""
+        if not self.uses_one_pass_encoding():
+            return super().get_route_handler()
+        dependant = self.dependant
+        self.dependant = _one_pass_dependant(dependant, self.status_code or 200)
+        try:
+            return super().get_route_handler()
+        finally:
+            self.dependant = dependant
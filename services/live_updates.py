@@ -0,0 +1,238 @@
+"""Push project state, FSM transitions and entity changes to live clients.
+
+``WorkflowService`` publishes a ``state`` event carrying the top-level session
+state keys each write changed, plus an ``fsm_transition`` event when it
+advances the FSM. A shared tailer republishes new ``entity_changes`` records
+(see ``models.changes``) to their owning project, which also covers writes
+from other processes; records without a project are not pushed.
+Subscribers read from bounded per-connection queues; one that falls behind
+gets a single ``resync`` event instead of an unbounded backlog and should
+reload its full state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlmodel import Session
+
+from services.changes import latest_change_seq, wait_for_entity_changes
+from services.generation_stream import format_sse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE: Final[int] = 256
+KEEPALIVE_SECONDS: Final[float] = 15.0
+_TAIL_WAIT_SECONDS: Final[float] = 5.0
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """One event fanned out to a project's subscribers."""
+
+    event: str
+    payload: dict[str, Any]
+    event_id: int | None = None
+
+
+_RESYNC = LiveEvent("resync", {})
+
+
+@dataclass(eq=False)
+class _Subscription:
+    project_id: int
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue[LiveEvent] = field(
+        default_factory=lambda: asyncio.Queue(DEFAULT_QUEUE_SIZE)
+    )
+
+    def offer(self, event: LiveEvent) -> None:
+        """Queue ``event``; on overflow replace the backlog with one resync."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+
+
+class LiveUpdateHub:
+    """Thread-safe fan-out of live events to per-project subscribers."""
+
+    def __init__(self) -> None:
+        """Start with no subscribers and no change tailer."""
+        self._subscriptions: set[_Subscription] = set()
+        self._lock = threading.Lock()
+        self._tailer: asyncio.Task[None] | None = None
+
+    def publish(
+        self,
+        project_id: int,
+        event: str,
+        payload: dict[str, Any],
+        *,
+        event_id: int | None = None,
+    ) -> None:
+        """Deliver an event to the project's subscribers.
+
+        Safe to call from any thread; delivery happens on each subscriber's
+        event loop.
+        """
+        live_event = LiveEvent(event, payload, event_id)
+        with self._lock:
+            targets = [
+                subscription
+                for subscription in self._subscriptions
+                if subscription.project_id == project_id
+            ]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, live_event)
+            except RuntimeError:
+                # The subscriber's loop closed before it unsubscribed.
+                continue
+
+    @contextmanager
+    def subscribe(self, project_id: int) -> Iterator[asyncio.Queue[LiveEvent]]:
+        """Register a subscriber on the running loop for its lifetime."""
+        subscription = _Subscription(project_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.add(subscription)
+        try:
+            yield subscription.queue
+        finally:
+            with self._lock:
+                self._subscriptions.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        """Return the number of open subscriptions."""
+        with self._lock:
+            return len(self._subscriptions)
+
+    def start_change_tailer(self, engine: Engine) -> None:
+        """Start tailing ``entity_changes`` unless a tailer is already running.
+
+        The tailer stops on its own once the last subscriber leaves.
+        """
+        tailer = self._tailer
+        if (
+            tailer is not None
+            and not tailer.done()
+            and tailer.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._tailer = asyncio.create_task(self._tail_changes(engine))
+
+    async def _tail_changes(self, engine: Engine) -> None:
+        try:
+            since = await asyncio.to_thread(_latest_seq, engine)
+            while self.subscriber_count():
+                page = await wait_for_entity_changes(
+                    engine, since=since, wait_seconds=_TAIL_WAIT_SECONDS
+                )
+                for change in page["changes"]:
+                    # Rows outside any project (teams, members) have no
+                    # dashboard to refresh.
+                    if change["product_id"] is None:
+                        continue
+                    self.publish(
+                        change["product_id"],
+                        "entity_change",
+                        change,
+                        event_id=change["seq"],
+                    )
+                since = page["next_since"]
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Entity change tailer stopped")
+
+
+def _latest_seq(engine: Engine) -> int:
+    with Session(engine) as session:
+        return latest_change_seq(session)
+
+
+live_updates = LiveUpdateHub()
+
+
+def state_changes(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Return the top-level keys of ``current`` whose values differ."""
+    return {
+        key: value
+        for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
+
+
+async def iter_project_event_frames(  # noqa: PLR0913
+    hub: LiveUpdateHub,
+    project_id: int,
+    *,
+    engine: Engine,
+    load_state: Callable[[], Awaitable[dict[str, Any]]],
+    shape_state: Callable[[dict[str, Any]], dict[str, Any]],
+    last_event_id: int | None = None,
+    keepalive_seconds: float = KEEPALIVE_SECONDS,
+) -> AsyncGenerator[str]:
+    """Yield a project's live events as SSE frames until the client leaves.
+
+    The stream opens with the full shaped state; later ``state`` events carry
+    only the shaped keys that changed. ``entity_change`` frames carry their
+    change ``seq`` as the event id, so a reconnecting client passing
+    ``Last-Event-ID`` first receives the changes it missed.
+    """
+    with hub.subscribe(project_id) as queue:
+        hub.start_change_tailer(engine)
+        raw_state = await load_state()
+        shaped = shape_state(raw_state)
+        yield format_sse(
+            "state", {"project_id": project_id, "full": True, "state": shaped}
+        )
+
+        if last_event_id is not None:
+            missed = await wait_for_entity_changes(
+                engine, since=last_event_id, project_id=project_id
+            )
+            for change in missed["changes"]:
+                yield format_sse("entity_change", change, event_id=change["seq"])
+
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if item.event == "state":
+                raw_state.update(item.payload["changes"])
+                updated = shape_state(raw_state)
+                changes = state_changes(shaped, updated)
+                shaped = updated
+                if changes:
+                    yield format_sse(
+                        "state",
+                        {
+                            "project_id": project_id,
+                            "full": False,
+                            "version": item.payload.get("version"),
+                            "changes": changes,
+                        },
+                    )
+            elif item.event == _RESYNC.event:
+                raw_state = await load_state()
+                shaped = shape_state(raw_state)
+                yield format_sse(
+                    "state", {"project_id": project_id, "full": True, "state": shaped}
+                )
+                yield format_sse("resync", {"project_id": project_id})
+            else:
+                yield format_sse(item.event, item.payload, event_id=item.event_id)
@@ -3,23 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Protocol, cast
+from typing import Any, Protocol
 
-from sqlalchemy import desc, func
 from sqlmodel import Session, select
 
-from models.core import Epic, Feature, Theme
-from models.core import Product, Sprint, UserStory
+from models.core import Product
 from models.db import get_engine
-from models.specs import (
-    CompiledSpecAuthority,
-    SpecRegistry,
-)
+from models.specs import CompiledSpecAuthority
+from services.project_structure import get_project_structure_summary
 from services.specs.compiler_service import (
     CompileSpecAuthorityForVersionInput,
     compile_spec_authority_for_version,
 )
 from services.specs.lifecycle_service import hydrate_spec_state
+from services.state_blobs import set_state_text
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
@@ -40,45 +37,8 @@ def get_project_details(product_id: int) -> dict[str, Any]:
                 "error": f"Product {product_id} not found",
             }
 
-        theme_count = session.exec(
-            select(func.count(cast("Any", Theme.theme_id))).where(
-                Theme.product_id == product_id
-            )
-        ).one()
-        epic_count = session.exec(
-            select(func.count(cast("Any", Epic.epic_id)))
-            .join(Theme)
-            .where(Theme.product_id == product_id)
-        ).one()
-        feature_count = session.exec(
-            select(func.count(cast("Any", Feature.feature_id)))
-            .join(Epic)
-            .join(Theme)
-            .where(Theme.product_id == product_id)
-        ).one()
-        story_count = session.exec(
-            select(func.count(cast("Any", UserStory.story_id))).where(
-                UserStory.product_id == product_id
-            )
-        ).one()
-        sprint_count = session.exec(
-            select(func.count(cast("Any", Sprint.sprint_id))).where(
-                Sprint.product_id == product_id
-            )
-        ).one()
-
-        latest_spec_version_id = session.exec(
-            select(SpecRegistry.spec_version_id)
-            .where(
-                SpecRegistry.product_id == product_id,
-                SpecRegistry.status == "approved",
-            )
-            .order_by(
-                desc(cast("Any", SpecRegistry.approved_at)),
-                desc(cast("Any", SpecRegistry.spec_version_id)),
-            )
-            .limit(1)
-        ).first()
+        summary = get_project_structure_summary(session, product)
+        latest_spec_version_id = summary.latest_spec_version_id
 
         logger.debug("Loaded project details for '%s'.", product.name)
         return {
@@ -99,13 +59,7 @@ def get_project_details(product_id: int) -> dict[str, Any]:
                 ),
                 "latest_spec_version_id": latest_spec_version_id,
             },
-            "structure": {
-                "themes": theme_count,
-                "epics": epic_count,
-                "features": feature_count,
-                "user_stories": story_count,
-                "sprints": sprint_count,
-            },
+            "structure": summary.counts(),
             "message": f"Loaded details for project '{product.name}'",
         }
 
@@ -125,19 +79,34 @@ def select_project(product_id: int, tool_context: _SupportsState) -> dict[str, A
     state = tool_context.state
     product_details = details["product"]
 
-    state["active_project"] = {
+    previous = state.get("active_project")
+    previous_blobs = previous if isinstance(previous, dict) else {}
+    active_project: dict[str, Any] = {
         "product_id": product_id,
         "name": product_details["name"],
         "description": product_details.get("description"),
         "vision": product_details.get("vision"),
         "roadmap": product_details.get("roadmap"),
-        "technical_spec": product_details.get("technical_spec"),
-        "compiled_authority_json": product_details.get("compiled_authority_json"),
+        # Blob-backed slots carry over so unchanged text is not stored again.
+        "technical_spec": previous_blobs.get("technical_spec"),
+        "compiled_authority_json": previous_blobs.get("compiled_authority_json"),
         "spec_file_path": product_details.get("spec_file_path"),
         "spec_loaded_at": product_details.get("spec_loaded_at"),
         "latest_spec_version_id": product_details.get("latest_spec_version_id"),
         "structure": details["structure"],
     }
+    authority_json = product_details.get("compiled_authority_json")
+    if authority_json is None and product_details.get("latest_spec_version_id"):
+        authority_json = _load_authority_fallback(
+            product_id, product_details["latest_spec_version_id"]
+        )
+    for key, text in (
+        ("technical_spec", product_details.get("technical_spec")),
+        ("compiled_authority_json", authority_json),
+    ):
+        set_state_text(active_project, key, text)
+        active_project.setdefault(key, None)
+    state["active_project"] = active_project
     state["current_project_name"] = product_details["name"]
 
     hydrate_spec_state(
@@ -145,15 +114,7 @@ def select_project(product_id: int, tool_context: _SupportsState) -> dict[str, A
         technical_spec=product_details.get("technical_spec"),
         spec_file_path=product_details.get("spec_file_path"),
     )
-
-    authority_json = product_details.get("compiled_authority_json")
-    if authority_json is None and product_details.get("latest_spec_version_id"):
-        authority_json = _load_authority_fallback(
-            product_id, product_details["latest_spec_version_id"]
-        )
-        if authority_json:
-            state["active_project"]["compiled_authority_json"] = authority_json
-    _set_or_clear(state, "compiled_authority_cached", authority_json)
+    set_state_text(state, "compiled_authority_cached", authority_json)
     _set_or_clear(
         state,
         "latest_spec_version_id",
@@ -8,6 +8,7 @@ from typing import Any, cast
 
 from pydantic import ValidationError
 from sqlalchemy import func
+from sqlalchemy.orm import load_only
 from sqlmodel import Session, select
 
 from models.core import Product, Sprint, SprintStory, UserStory
@@ -37,8 +38,16 @@ def is_projects_cache_fresh(
 
 
 def _query_products(session: Session) -> list[Product]:
-    """Fetch all products."""
-    return list(session.exec(select(Product)).all())
+    """Fetch the columns the projects cache needs, leaving spec blobs unloaded."""
+    statement = select(Product).options(
+        load_only(
+            cast("Any", Product.product_id),
+            cast("Any", Product.name),
+            cast("Any", Product.vision),
+            cast("Any", Product.roadmap),
+        )
+    )
+    return list(session.exec(statement).all())
 
 
 def _story_evaluated_invariant_ids(story: UserStory) -> list[str]:
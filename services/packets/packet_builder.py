@@ -0,0 +1,817 @@
+"""Build story and task execution packets from the sprint graph.
+
+Packets are deterministic JSON documents handed to execution agents. Single
+packets load their story context on demand; sprint bundles load the sprint
+graph once and share one parsed compiled authority per pinned spec version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+
+from models.core import Product, Sprint, SprintStory, Task, UserStory
+from models.specs import CompiledSpecAuthority
+from services.specs.artifacts import (
+    current_story_input_hash as current_story_input_hash_of,
+)
+from services.specs.artifacts import load_compiled_artifact
+from utils.spec_schemas import SpecAuthorityCompilationSuccess, ValidationEvidence
+from utils.task_metadata import (
+    TaskMetadata,
+    hash_task_metadata,
+    parse_task_metadata,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.orm.attributes import QueryableAttribute
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class _SupportsIsoFormat(Protocol):
+    def isoformat(self) -> str: ...
+
+
+def _queryable_attr(attr: object) -> QueryableAttribute[object]:
+    return cast("QueryableAttribute[object]", attr)
+
+
+def serialize_sprint_task(task: Task) -> dict[str, Any]:
+    """Return the task-plan entry for one sprint task."""
+    meta = parse_task_metadata(task.metadata_json)
+    return {
+        "id": task.task_id,
+        "description": task.description,
+        "status": task.status.value if hasattr(task.status, "value") else task.status,
+        "task_kind": meta.task_kind,
+        "artifact_targets": meta.artifact_targets,
+        "workstream_tags": meta.workstream_tags,
+        "checklist_items": meta.checklist_items,
+        "is_executable": bool(meta.checklist_items),
+    }
+
+
+def build_story_task_plan(story: UserStory) -> list[dict[str, Any]]:
+    """Return a story's tasks as a deterministically ordered plan."""
+    return sorted(
+        [serialize_sprint_task(task) for task in story.tasks],
+        key=lambda item: (item["description"].lower(), item["id"]),
+    )
+
+
+def serialize_temporal(value: object) -> str | None:
+    """Return an ISO-8601 string (UTC ``Z`` for aware datetimes) or ``None``."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
+        return value.isoformat()
+    if isinstance(value, _SupportsIsoFormat):
+        return value.isoformat()
+    return str(value)
+
+
+def _hash_payload(payload: object) -> str:
+    serialized = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _truncate_text(text: str, max_length: int) -> str:
+    normalized = " ".join((text or "").split())
+    if len(normalized) <= max_length:
+        return normalized
+    return f"{normalized[: max_length - 3].rstrip()}..."
+
+
+def _build_task_label(description: str) -> str:
+    normalized = _truncate_text(description or "Task", 80)
+    return normalized or "Task"
+
+
+def _extract_vision_excerpt(vision: str | None) -> str | None:
+    if not vision or not vision.strip():
+        return None
+    for paragraph in re.split(r"\n\s*\n", vision.strip()):
+        normalized = " ".join(paragraph.split())
+        if normalized:
+            return _truncate_text(normalized, 500)
+    return None
+
+
+def _normalize_acceptance_criteria(text: str | None) -> list[str]:
+    if not text or not text.strip():
+        return []
+
+    items: list[str] = []
+    for raw_line in text.splitlines():
+        stripped = raw_line.strip()
+        if not stripped:
+            continue
+        normalized = re.sub(r"^\s*(?:[-*•]+|\d+[.)])\s*", "", stripped).strip()
+        if normalized:
+            items.append(normalized)
+
+    if items:
+        return items
+
+    collapsed = " ".join(text.split())
+    return [collapsed] if collapsed else []
+
+
+def _load_validation_evidence(
+    raw_value: str | None,
+) -> ValidationEvidence | None:
+    if not raw_value:
+        return None
+    try:
+        return ValidationEvidence.model_validate_json(raw_value)
+    except ValueError as exc:  # pragma: no cover - legacy malformed evidence
+        logger.warning("Failed to parse validation evidence: %s", exc)
+        return None
+
+
+type _PinnedAuthority = tuple[
+    CompiledSpecAuthority | None, SpecAuthorityCompilationSuccess | None
+]
+
+
+class _PinnedAuthorities:
+    """Compiled authorities and their parsed artifacts, keyed by spec version.
+
+    Each spec version is queried and parsed at most once per instance, so a
+    sprint bundle pays for one artifact parse however many packets cite it.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._loaded: dict[int, _PinnedAuthority] = {}
+
+    def prime(self, spec_version_ids: set[int]) -> None:
+        """Load every missing spec version in one query."""
+        missing = spec_version_ids - self._loaded.keys()
+        if not missing:
+            return
+        rows = self._session.exec(
+            select(CompiledSpecAuthority).where(
+                col(CompiledSpecAuthority.spec_version_id).in_(missing)
+            )
+        ).all()
+        authorities: dict[int, CompiledSpecAuthority] = {}
+        for row in rows:
+            authorities.setdefault(row.spec_version_id, row)
+        for spec_version_id in missing:
+            authority = authorities.get(spec_version_id)
+            self._loaded[spec_version_id] = (
+                authority,
+                load_compiled_artifact(authority) if authority else None,
+            )
+
+    def get(self, spec_version_id: int | None) -> _PinnedAuthority:
+        """Return the authority and parsed artifact pinned to a spec version."""
+        if spec_version_id is None:
+            return None, None
+        self.prime({spec_version_id})
+        return self._loaded[spec_version_id]
+
+
+def _build_packet_findings(
+    evidence: ValidationEvidence | None,
+) -> list[dict[str, str | None]]:
+    if not evidence:
+        return []
+
+    findings: list[dict[str, str | None]] = [
+        {
+            "severity": "failure",
+            "source": "validation_failure",
+            "code": failure.rule,
+            "message": failure.message,
+            "invariant_id": None,
+            "rule": failure.rule,
+            "capability": None,
+        }
+        for failure in evidence.failures
+    ]
+    findings.extend(
+        {
+            "severity": "warning",
+            "source": "validation_warning",
+            "code": warning,
+            "message": warning,
+            "invariant_id": None,
+            "rule": None,
+            "capability": None,
+        }
+        for warning in evidence.warnings
+    )
+    findings.extend(
+        {
+            "severity": finding.severity,
+            "source": "alignment_warning",
+            "code": finding.code,
+            "message": finding.message,
+            "invariant_id": finding.invariant,
+            "rule": None,
+            "capability": finding.capability,
+        }
+        for finding in evidence.alignment_warnings
+    )
+    findings.extend(
+        {
+            "severity": finding.severity,
+            "source": "alignment_failure",
+            "code": finding.code,
+            "message": finding.message,
+            "invariant_id": finding.invariant,
+            "rule": None,
+            "capability": finding.capability,
+        }
+        for finding in evidence.alignment_failures
+    )
+    return findings
+
+
+def _build_story_compliance_boundaries(
+    artifact: SpecAuthorityCompilationSuccess | None,
+    evidence: ValidationEvidence | None,
+) -> list[dict[str, Any]]:
+    if not artifact or not evidence:
+        return []
+
+    referenced_ids = set()
+    if hasattr(evidence, "finding_invariant_ids") and evidence.finding_invariant_ids:
+        referenced_ids.update(evidence.finding_invariant_ids)
+
+    if not referenced_ids:
+        return []
+
+    source_map: dict[str, Any] = {}
+    for entry in artifact.source_map:
+        source_map.setdefault(entry.invariant_id, entry)
+
+    relevant: list[dict[str, Any]] = []
+    for invariant in artifact.invariants:
+        if invariant.id not in referenced_ids:
+            continue
+
+        source_entry = source_map.get(invariant.id)
+        parameters = invariant.parameters.model_dump(mode="json")
+        relevant.append(
+            {
+                "invariant_id": invariant.id,
+                "type": invariant.type.value,
+                "parameters": parameters,
+                "source_excerpt": source_entry.excerpt if source_entry else None,
+                "source_location": source_entry.location if source_entry else None,
+            }
+        )
+    return relevant
+
+
+def _build_task_hard_constraints(
+    artifact: SpecAuthorityCompilationSuccess | None,
+    *,
+    task_metadata: TaskMetadata,
+) -> list[dict[str, Any]]:
+    if not artifact or not task_metadata.relevant_invariant_ids:
+        return []
+
+    source_map: dict[str, Any] = {}
+    for entry in artifact.source_map:
+        source_map.setdefault(entry.invariant_id, entry)
+
+    invariant_map = {invariant.id: invariant for invariant in artifact.invariants}
+    constraints: list[dict[str, Any]] = []
+    for invariant_id in task_metadata.relevant_invariant_ids:
+        invariant = invariant_map.get(invariant_id)
+        if invariant is None:
+            logger.warning(
+                "Ignoring unknown invariant id '%s' while building "
+                "task packet hard constraints.",
+                invariant_id,
+            )
+            continue
+        source_entry = source_map.get(invariant.id)
+        constraints.append(
+            {
+                "invariant_id": invariant.id,
+                "type": invariant.type.value,
+                "parameters": invariant.parameters.model_dump(mode="json"),
+                "source_excerpt": source_entry.excerpt if source_entry else None,
+                "source_location": source_entry.location if source_entry else None,
+            }
+        )
+    return constraints
+
+
+def _load_packet_story_context(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+    story_id: int | None = None,
+    task_id: int | None = None,
+) -> SimpleNamespace | None:
+    task = None
+    if task_id is not None:
+        task = session.exec(
+            select(Task)
+            .options(
+                selectinload(_queryable_attr(Task.assignee)),
+                selectinload(_queryable_attr(Task.story)).selectinload(
+                    _queryable_attr(UserStory.product)
+                ),
+                selectinload(_queryable_attr(Task.story)).selectinload(
+                    _queryable_attr(UserStory.tasks)
+                ),
+            )
+            .where(Task.task_id == task_id)
+        ).first()
+        if not task or not task.story or task.story.product_id != project_id:
+            return None
+        story = task.story
+    else:
+        story = session.exec(
+            select(UserStory)
+            .options(
+                selectinload(_queryable_attr(UserStory.product)),
+                selectinload(_queryable_attr(UserStory.tasks)),
+            )
+            .where(UserStory.story_id == story_id)
+        ).first()
+        if not story or story.product_id != project_id:
+            return None
+
+    sprint = session.exec(
+        select(Sprint)
+        .options(selectinload(_queryable_attr(Sprint.team)))
+        .where(
+            Sprint.product_id == project_id,
+            Sprint.sprint_id == sprint_id,
+        )
+    ).first()
+    if not sprint:
+        return None
+
+    sprint_story = session.exec(
+        select(SprintStory).where(
+            SprintStory.sprint_id == sprint_id,
+            SprintStory.story_id == story.story_id,
+        )
+    ).first()
+    if not sprint_story:
+        return None
+
+    product = story.product
+    if not product or product.product_id != project_id:
+        product = session.get(Product, project_id)
+        if not product:
+            return None
+
+    context = _story_packet_context(
+        story=story,
+        sprint=sprint,
+        sprint_story=sprint_story,
+        product=product,
+        authorities=_PinnedAuthorities(session),
+    )
+    return context if task is None else _task_packet_context(context, task)
+
+
+def _story_packet_context(
+    *,
+    story: UserStory,
+    sprint: Sprint,
+    sprint_story: SprintStory,
+    product: Product,
+    authorities: _PinnedAuthorities,
+) -> SimpleNamespace:
+    evidence = _load_validation_evidence(story.validation_evidence)
+    current_story_input_hash = current_story_input_hash_of(story)
+    validation_input_hash = evidence.input_hash if evidence else None
+    input_hash_matches = (
+        current_story_input_hash == validation_input_hash
+        if validation_input_hash is not None
+        else None
+    )
+    validation_freshness = (
+        "missing"
+        if evidence is None
+        else "current"
+        if input_hash_matches and not story.validation_stale
+        else "stale"
+    )
+
+    authority, compiled_artifact = authorities.get(story.accepted_spec_version_id)
+    spec_binding_status = (
+        "pinned" if story.accepted_spec_version_id is not None else "unpinned"
+    )
+    authority_status = "available" if compiled_artifact is not None else "missing"
+
+    return SimpleNamespace(
+        task=None,
+        task_metadata=None,
+        story=story,
+        sprint=sprint,
+        sprint_story=sprint_story,
+        product=product,
+        evidence=evidence,
+        current_story_input_hash=current_story_input_hash,
+        validation_input_hash=validation_input_hash,
+        input_hash_matches=input_hash_matches,
+        validation_freshness=validation_freshness,
+        authority=authority,
+        compiled_artifact=compiled_artifact,
+        spec_binding_status=spec_binding_status,
+        authority_status=authority_status,
+    )
+
+
+def _task_packet_context(story_context: SimpleNamespace, task: Task) -> SimpleNamespace:
+    return SimpleNamespace(
+        **{
+            **vars(story_context),
+            "task": task,
+            "task_metadata": parse_task_metadata(
+                task.metadata_json,
+                logger=logger,
+                task_id=task.task_id,
+            ),
+        }
+    )
+
+
+def build_story_packet(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+    story_id: int,
+) -> dict[str, Any] | None:
+    """Return the story packet, or ``None`` when the story is not in the sprint."""
+    context = _load_packet_story_context(
+        session,
+        project_id=project_id,
+        sprint_id=sprint_id,
+        story_id=story_id,
+    )
+    if not context:
+        return None
+    return _story_packet(context)
+
+
+def _story_packet(context: SimpleNamespace) -> dict[str, Any]:
+    story = context.story
+    sprint = context.sprint
+    sprint_story = context.sprint_story
+    product = context.product
+    evidence = context.evidence
+    project_id = product.product_id
+    sprint_id = sprint.sprint_id
+    story_id = story.story_id
+    task_plan_tasks = build_story_task_plan(story)
+
+    source_snapshot = {
+        "product_id": project_id,
+        "sprint_id": sprint_id,
+        "story_id": story.story_id,
+        "product_updated_at": serialize_temporal(product.updated_at),
+        "sprint_updated_at": serialize_temporal(sprint.updated_at),
+        "sprint_story_added_at": serialize_temporal(sprint_story.added_at),
+        "story_updated_at": serialize_temporal(story.updated_at),
+        "story_ac_updated_at": serialize_temporal(story.ac_updated_at),
+        "accepted_spec_version_id": story.accepted_spec_version_id,
+        "validation_validated_at": serialize_temporal(
+            evidence.validated_at if evidence else None
+        ),
+        "validation_input_hash": context.validation_input_hash,
+        "compiled_authority_compiled_at": serialize_temporal(
+            context.authority.compiled_at if context.authority else None
+        ),
+        "task_plan_hash": _hash_payload(task_plan_tasks),
+    }
+
+    packet_id_hash = hashlib.sha256(
+        f"story_packet.v1:{sprint_id}:{story_id}".encode()
+    ).hexdigest()[:16]
+
+    return {
+        "schema_version": "story_packet.v1",
+        "metadata": {
+            "packet_id": f"sp_{packet_id_hash}",
+            "generated_at": serialize_temporal(datetime.now(UTC)),
+            "generator_version": "v1",
+            "source_fingerprint": _hash_payload(source_snapshot),
+        },
+        "source_snapshot": source_snapshot,
+        "story": {
+            "story_id": story.story_id,
+            "title": story.title,
+            "persona": story.persona,
+            "story_description": story.story_description,
+            "status": story.status.value,
+            "story_points": story.story_points,
+            "rank": story.rank,
+            "source_requirement": story.source_requirement,
+        },
+        "task_plan": {"tasks": task_plan_tasks},
+        "context": {
+            "sprint": {
+                "sprint_id": sprint.sprint_id,
+                "goal": sprint.goal,
+                "status": sprint.status.value,
+                "started_at": serialize_temporal(sprint.started_at),
+                "start_date": serialize_temporal(sprint.start_date),
+                "end_date": serialize_temporal(sprint.end_date),
+                "team_id": sprint.team_id,
+                "team_name": sprint.team.name if sprint.team else None,
+            },
+            "product": {
+                "product_id": product.product_id,
+                "name": product.name,
+                "vision_excerpt": _extract_vision_excerpt(product.vision),
+            },
+        },
+        "constraints": {
+            "story_acceptance_criteria_text": story.acceptance_criteria,
+            "story_acceptance_criteria_items": _normalize_acceptance_criteria(
+                story.acceptance_criteria
+            ),
+            "spec_binding": {
+                "mode": "pinned_story_authority",
+                "binding_status": context.spec_binding_status,
+                "spec_version_id": story.accepted_spec_version_id,
+                "authority_artifact_status": context.authority_status,
+            },
+            "validation": {
+                "present": evidence is not None,
+                "passed": evidence.passed if evidence else None,
+                "freshness_status": context.validation_freshness,
+                "validated_at": serialize_temporal(
+                    evidence.validated_at if evidence else None
+                ),
+                "validator_version": evidence.validator_version if evidence else None,
+                "current_story_input_hash": context.current_story_input_hash,
+                "validation_input_hash": context.validation_input_hash,
+                "input_hash_matches": context.input_hash_matches,
+                "rules_checked": list(evidence.rules_checked) if evidence else [],
+            },
+            "story_compliance_boundaries": _build_story_compliance_boundaries(
+                context.compiled_artifact,
+                evidence,
+            ),
+            "findings": _build_packet_findings(evidence),
+        },
+    }
+
+
+def build_task_packet(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+    task_id: int,
+) -> dict[str, Any] | None:
+    """Return the task packet, or ``None`` when the task is not in the sprint."""
+    context = _load_packet_story_context(
+        session,
+        project_id=project_id,
+        sprint_id=sprint_id,
+        task_id=task_id,
+    )
+    if not context or context.task is None or context.task_metadata is None:
+        return None
+    return _task_packet(context)
+
+
+def _task_packet(context: SimpleNamespace) -> dict[str, Any]:
+    task = context.task
+    task_metadata = context.task_metadata
+    story = context.story
+    sprint = context.sprint
+    sprint_story = context.sprint_story
+    product = context.product
+    evidence = context.evidence
+    project_id = product.product_id
+    sprint_id = sprint.sprint_id
+    task_id = task.task_id
+
+    source_snapshot = {
+        "product_id": project_id,
+        "sprint_id": sprint_id,
+        "story_id": story.story_id,
+        "task_id": task_id,
+        "product_updated_at": serialize_temporal(product.updated_at),
+        "sprint_updated_at": serialize_temporal(sprint.updated_at),
+        "sprint_story_added_at": serialize_temporal(sprint_story.added_at),
+        "story_updated_at": serialize_temporal(story.updated_at),
+        "story_ac_updated_at": serialize_temporal(story.ac_updated_at),
+        "task_updated_at": serialize_temporal(task.updated_at),
+        "task_metadata_hash": hash_task_metadata(task_metadata),
+        "accepted_spec_version_id": story.accepted_spec_version_id,
+        "validation_validated_at": serialize_temporal(
+            evidence.validated_at if evidence else None
+        ),
+        "validation_input_hash": context.validation_input_hash,
+        "compiled_authority_compiled_at": serialize_temporal(
+            context.authority.compiled_at if context.authority else None
+        ),
+    }
+
+    packet_id_hash = hashlib.sha256(
+        f"task_packet.v2:{sprint_id}:{task_id}".encode()
+    ).hexdigest()[:16]
+
+    return {
+        "schema_version": "task_packet.v2",
+        "metadata": {
+            "packet_id": f"tp_{packet_id_hash}",
+            "generated_at": serialize_temporal(datetime.now(UTC)),
+            "generator_version": "v2",
+            "source_fingerprint": _hash_payload(source_snapshot),
+        },
+        "source_snapshot": source_snapshot,
+        "task": {
+            "task_id": task.task_id,
+            "label": _build_task_label(task.description),
+            "description": task.description,
+            "status": task.status.value,
+            "assignee_member_id": task.assigned_to_member_id,
+            "assignee_name": task.assignee.name if task.assignee else None,
+            "task_kind": task_metadata.task_kind,
+            "artifact_targets": list(task_metadata.artifact_targets),
+            "workstream_tags": list(task_metadata.workstream_tags),
+            "checklist_items": list(task_metadata.checklist_items),
+            "is_executable": bool(task_metadata.checklist_items),
+        },
+        "context": {
+            "story": {
+                "story_id": story.story_id,
+                "title": story.title,
+                "persona": story.persona,
+                "story_description": story.story_description,
+                "status": story.status.value,
+                "story_points": story.story_points,
+                "rank": story.rank,
+                "source_requirement": story.source_requirement,
+            },
+            "sprint": {
+                "sprint_id": sprint.sprint_id,
+                "goal": sprint.goal,
+                "status": sprint.status.value,
+                "started_at": serialize_temporal(sprint.started_at),
+                "start_date": serialize_temporal(sprint.start_date),
+                "end_date": serialize_temporal(sprint.end_date),
+                "team_id": sprint.team_id,
+                "team_name": sprint.team.name if sprint.team else None,
+            },
+            "product": {
+                "product_id": product.product_id,
+                "name": product.name,
+                "vision_excerpt": _extract_vision_excerpt(product.vision),
+            },
+        },
+        "constraints": {
+            "spec_binding": {
+                "mode": "pinned_story_authority",
+                "binding_status": context.spec_binding_status,
+                "spec_version_id": story.accepted_spec_version_id,
+                "authority_artifact_status": context.authority_status,
+            },
+            "validation": {
+                "present": evidence is not None,
+                "passed": evidence.passed if evidence else None,
+                "freshness_status": context.validation_freshness,
+                "validated_at": serialize_temporal(
+                    evidence.validated_at if evidence else None
+                ),
+                "validator_version": evidence.validator_version if evidence else None,
+                "current_story_input_hash": context.current_story_input_hash,
+                "validation_input_hash": context.validation_input_hash,
+                "input_hash_matches": context.input_hash_matches,
+                "rules_checked": list(evidence.rules_checked) if evidence else [],
+            },
+            "task_hard_constraints": _build_task_hard_constraints(
+                context.compiled_artifact,
+                task_metadata=task_metadata,
+            ),
+            "story_compliance_boundaries": _build_story_compliance_boundaries(
+                context.compiled_artifact,
+                evidence,
+            ),
+            "findings": _build_packet_findings(evidence),
+        },
+    }
+
+
+@dataclass(frozen=True)
+class SprintPacketGraph:
+    """A sprint with its product and every selected story, loaded once."""
+
+    product: Product
+    sprint: Sprint
+    entries: list[tuple[SprintStory, UserStory]]
+
+    @property
+    def story_count(self) -> int:
+        """Return the number of stories in the sprint."""
+        return len(self.entries)
+
+    @property
+    def task_count(self) -> int:
+        """Return the number of tasks across the sprint's stories."""
+        return sum(len(story.tasks) for _, story in self.entries)
+
+
+def load_sprint_packet_graph(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+) -> SprintPacketGraph | None:
+    """Load a sprint, its stories, tasks and assignees in a fixed number of queries.
+
+    Returns ``None`` when the project or the sprint does not exist.
+    """
+    product = session.get(Product, project_id)
+    if not product:
+        return None
+    sprint = session.exec(
+        select(Sprint)
+        .options(selectinload(_queryable_attr(Sprint.team)))
+        .where(
+            Sprint.product_id == project_id,
+            Sprint.sprint_id == sprint_id,
+        )
+    ).first()
+    if not sprint:
+        return None
+
+    rows = session.exec(
+        select(SprintStory, UserStory)
+        .join(UserStory, col(UserStory.story_id) == col(SprintStory.story_id))
+        .options(
+            selectinload(_queryable_attr(UserStory.tasks)).selectinload(
+                _queryable_attr(Task.assignee)
+            )
+        )
+        .where(
+            SprintStory.sprint_id == sprint_id,
+            UserStory.product_id == project_id,
+        )
+    ).all()
+    entries = sorted(
+        ((sprint_story, story) for sprint_story, story in rows),
+        key=lambda entry: (entry[1].rank or "", entry[1].story_id or 0),
+    )
+    return SprintPacketGraph(product=product, sprint=sprint, entries=entries)
+
+
+def iter_sprint_packets(
+    session: Session,
+    graph: SprintPacketGraph,
+) -> Iterator[dict[str, Any]]:
+    """Yield each story packet followed by the packets of its tasks.
+
+    Packets are identical to the single-packet builders' output. Pinned
+    authorities for the whole sprint are fetched in one query and each
+    compiled artifact is parsed once.
+    """
+    authorities = _PinnedAuthorities(session)
+    authorities.prime(
+        {
+            story.accepted_spec_version_id
+            for _, story in graph.entries
+            if story.accepted_spec_version_id is not None
+        }
+    )
+    for sprint_story, story in graph.entries:
+        context = _story_packet_context(
+            story=story,
+            sprint=graph.sprint,
+            sprint_story=sprint_story,
+            product=graph.product,
+            authorities=authorities,
+        )
+        yield _story_packet(context)
+        for task in sorted(story.tasks, key=lambda task: task.task_id or 0):
+            yield _task_packet(_task_packet_context(context, task))
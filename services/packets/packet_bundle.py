@@ -0,0 +1,96 @@
+"""Stream sprint packet bundles as NDJSON or a gzipped tarball.
+
+Both encoders consume packets lazily and yield bytes as soon as each packet
+is encoded, so a bundle never has to be held in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+import time
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+type BundleFormat = Literal["ndjson", "tar"]
+
+BUNDLE_FORMATS: Final[tuple[BundleFormat, ...]] = ("ndjson", "tar")
+BUNDLE_MEDIA_TYPES: Final[dict[BundleFormat, str]] = {
+    "ndjson": "application/x-ndjson",
+    "tar": "application/gzip",
+}
+BUNDLE_FILE_SUFFIXES: Final[dict[BundleFormat, str]] = {
+    "ndjson": ".ndjson",
+    "tar": ".tar.gz",
+}
+
+
+def packet_member_name(packet: dict[str, Any]) -> str:
+    """Return the bundle-relative name (without suffix) for one packet."""
+    task = packet.get("task")
+    if isinstance(task, dict):
+        return f"tasks/task-{task['task_id']}"
+    return f"stories/story-{packet['story']['story_id']}"
+
+
+def _packet_bytes(packet: dict[str, Any]) -> bytes:
+    return json.dumps(packet, ensure_ascii=False, sort_keys=True).encode()
+
+
+def iter_ndjson_bundle(packets: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Yield one JSON line per packet."""
+    for packet in packets:
+        yield _packet_bytes(packet) + b"\n"
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
+def _add_member(archive: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    archive.addfile(info, io.BytesIO(data))
+
+
+def iter_tar_bundle(
+    packets: Iterable[dict[str, Any]],
+    *,
+    root: str,
+) -> Iterator[bytes]:
+    """Yield a gzipped tarball with one JSON file per packet under ``root``.
+
+    Packets carrying a ``render`` string also get a sibling ``.md`` file.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w|gz") as archive:
+        for packet in packets:
+            name = f"{root}/{packet_member_name(packet)}"
+            _add_member(archive, f"{name}.json", _packet_bytes(packet))
+            render = packet.get("render")
+            if isinstance(render, str):
+                _add_member(archive, f"{name}.md", render.encode())
+            if chunk := _drain(buffer):
+                yield chunk
+    if chunk := _drain(buffer):
+        yield chunk
+
+
+def iter_packet_bundle(
+    packets: Iterable[dict[str, Any]],
+    *,
+    bundle_format: BundleFormat,
+    root: str,
+) -> Iterator[bytes]:
+    """Encode packets in the requested bundle format."""
+    if bundle_format == "tar":
+        return iter_tar_bundle(packets, root=root)
+    return iter_ndjson_bundle(packets)
@@ -0,0 +1,172 @@
+"""Fingerprint-validated cache for built and rendered packets.
+
+Building a packet loads the story graph, parses the pinned compiled authority
+and may render it for an agent flavor. Each cache entry is stored per packet
+kind, ids and flavor together with the fingerprint it was built for (see
+``services.packets.packet_fingerprint``) and is served only while a fresh
+fingerprint, one lightweight query, still matches. Entries live in a per-engine
+in-process LRU; with ``AGILEFORGE_PACKET_CACHE=sqlite`` they are also persisted
+in ``packet_cache_entries`` so restarts and other workers reuse them, and
+``off`` disables caching. Cached packets keep their original ``generated_at``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+from weakref import WeakKeyDictionary
+
+from models.packets import PacketCacheEntry
+from utils.runtime_config import get_packet_cache_backend, get_packet_cache_size
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlmodel import Session
+
+type PacketKind = Literal["story", "task"]
+type _Entry = tuple[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class PacketCacheKey:
+    """Identify one packet representation apart from its fingerprint."""
+
+    kind: PacketKind
+    project_id: int
+    sprint_id: int
+    entity_id: int
+    flavor: str | None = None
+
+    def storage_key(self) -> str:
+        """Return the primary key used for the persisted entry."""
+        return (
+            f"{self.kind}:{self.project_id}:{self.sprint_id}:"
+            f"{self.entity_id}:{self.flavor or ''}"
+        )
+
+
+class PacketCache:
+    """Thread-safe LRU of built packets per engine, keyed by ``PacketCacheKey``.
+
+    Each key holds only the packet for its latest fingerprint, so superseded
+    builds are replaced rather than accumulated.
+    """
+
+    def __init__(self) -> None:
+        """Start with no cached packets."""
+        self._entries: WeakKeyDictionary[
+            object, OrderedDict[PacketCacheKey, _Entry]
+        ] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        session: Session,
+        key: PacketCacheKey,
+        fingerprint: str,
+        *,
+        persistent: bool = False,
+    ) -> dict[str, Any] | None:
+        """Return the packet cached for ``fingerprint``, or ``None``."""
+        bind = session.get_bind()
+        with self._lock:
+            entries = self._entries.get(bind)
+            cached = entries.get(key) if entries is not None else None
+            if cached is not None and cached[0] == fingerprint:
+                if entries is not None:
+                    entries.move_to_end(key)
+                return cached[1]
+        if not persistent:
+            return None
+
+        row = session.get(PacketCacheEntry, key.storage_key())
+        if row is None or row.fingerprint != fingerprint:
+            return None
+        packet = json.loads(zlib.decompress(row.data))
+        self._remember(bind, key, (fingerprint, packet))
+        return packet
+
+    def put(
+        self,
+        session: Session,
+        key: PacketCacheKey,
+        fingerprint: str,
+        packet: dict[str, Any],
+        *,
+        persistent: bool = False,
+    ) -> None:
+        """Cache ``packet`` as the build for ``fingerprint``."""
+        self._remember(session.get_bind(), key, (fingerprint, packet))
+        if not persistent:
+            return
+        session.merge(
+            PacketCacheEntry(
+                cache_key=key.storage_key(),
+                fingerprint=fingerprint,
+                data=zlib.compress(json.dumps(packet).encode()),
+            )
+        )
+        session.commit()
+
+    def _remember(self, bind: object, key: PacketCacheKey, entry: _Entry) -> None:
+        max_entries = get_packet_cache_size()
+        with self._lock:
+            entries = self._entries.setdefault(bind, OrderedDict())
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every in-process entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+packet_cache = PacketCache()
+
+
+def get_or_build_packet(
+    session: Session,
+    *,
+    key: PacketCacheKey,
+    fingerprint: str | None,
+    build: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return the cached packet for ``fingerprint`` or build and cache it.
+
+    A ``None`` fingerprint (no such packet) always builds, so the builder can
+    report the missing context.
+    """
+    backend = get_packet_cache_backend()
+    if fingerprint is None or backend == "off":
+        return build()
+
+    persistent = backend == "sqlite"
+    cached = packet_cache.get(session, key, fingerprint, persistent=persistent)
+    if cached is not None:
+        return cached
+    packet = build()
+    packet_cache.put(session, key, fingerprint, packet, persistent=persistent)
+    return packet
+
+
+def packet_etag(fingerprint: str) -> str:
+    """Return the strong ETag for a packet fingerprint."""
+    return f'"{fingerprint}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header covers ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag
+        for candidate in candidates
+    )
@@ -0,0 +1,156 @@
+"""Cheap cache fingerprints for story and task packets.
+
+A fingerprint hashes, in one query, every column a packet is built from: the
+``source_snapshot`` inputs (timestamps, metadata, raw validation evidence, the
+pinned authority's identity and compile time) and the row values packets copy
+verbatim (titles, descriptions, statuses, team and assignee names). The
+timestamps alone are not enough: ``onupdate`` stamps have one-second resolution
+in SQLite, and renaming a team or member touches no packet source row.
+
+The compiled artifact itself is never read; ``authority_id`` and
+``compiled_at`` change whenever it is recompiled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlmodel import col, select
+
+from models.core import Product, Sprint, SprintStory, Task, Team, TeamMember, UserStory
+from models.specs import CompiledSpecAuthority
+from services.packets.packet_builder import serialize_temporal
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+    from sqlmodel.sql.expression import Select
+
+# Bump when packet or render output changes for the same source rows, so
+# persisted cache entries and client ETags from older builds stop matching.
+PACKET_FINGERPRINT_VERSION: Final[int] = 1
+
+_SPRINT_STORY_COLUMNS: Final[tuple[Any, ...]] = (
+    col(Product.updated_at),
+    col(Product.name),
+    col(Product.vision),
+    col(Sprint.updated_at),
+    col(Sprint.goal),
+    col(Sprint.status),
+    col(Sprint.started_at),
+    col(Sprint.start_date),
+    col(Sprint.end_date),
+    col(Sprint.team_id),
+    col(Team.name),
+    col(SprintStory.added_at),
+    col(UserStory.updated_at),
+    col(UserStory.ac_updated_at),
+    col(UserStory.title),
+    col(UserStory.persona),
+    col(UserStory.story_description),
+    col(UserStory.status),
+    col(UserStory.story_points),
+    col(UserStory.rank),
+    col(UserStory.source_requirement),
+    col(UserStory.acceptance_criteria),
+    col(UserStory.accepted_spec_version_id),
+    col(UserStory.validation_evidence),
+    col(UserStory.validation_stale),
+    col(CompiledSpecAuthority.authority_id),
+    col(CompiledSpecAuthority.compiled_at),
+)
+
+_TASK_COLUMNS: Final[tuple[Any, ...]] = (
+    col(Task.task_id),
+    col(Task.updated_at),
+    col(Task.description),
+    col(Task.status),
+    col(Task.metadata_json),
+    col(Task.assigned_to_member_id),
+)
+
+
+def _sprint_story_probe(
+    *columns: Any,  # noqa: ANN401
+    project_id: int,
+    sprint_id: int,
+) -> Select[Any]:
+    return (
+        select(*_SPRINT_STORY_COLUMNS, *columns)
+        .select_from(UserStory)
+        .join(Product, col(Product.product_id) == col(UserStory.product_id))
+        .join(SprintStory, col(SprintStory.story_id) == col(UserStory.story_id))
+        .join(Sprint, col(Sprint.sprint_id) == col(SprintStory.sprint_id))
+        .outerjoin(Team, col(Team.team_id) == col(Sprint.team_id))
+        .outerjoin(
+            CompiledSpecAuthority,
+            col(CompiledSpecAuthority.spec_version_id)
+            == col(UserStory.accepted_spec_version_id),
+        )
+        .where(
+            col(UserStory.product_id) == project_id,
+            col(Sprint.product_id) == project_id,
+            col(Sprint.sprint_id) == sprint_id,
+        )
+    )
+
+
+def _hash_rows(schema_version: str, rows: list[tuple[Any, ...]]) -> str:
+    payload = [
+        PACKET_FINGERPRINT_VERSION,
+        schema_version,
+        [[serialize_temporal(value) for value in row] for row in rows],
+    ]
+    serialized = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def story_packet_fingerprint(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+    story_id: int,
+) -> str | None:
+    """Return the story packet fingerprint, or ``None`` when it has no packet."""
+    rows = session.exec(
+        _sprint_story_probe(
+            *_TASK_COLUMNS,
+            project_id=project_id,
+            sprint_id=sprint_id,
+        )
+        .outerjoin(Task, col(Task.story_id) == col(UserStory.story_id))
+        .where(col(UserStory.story_id) == story_id)
+        .order_by(col(Task.task_id))
+    ).all()
+    if not rows:
+        return None
+    return _hash_rows("story_packet.v1", [tuple(row) for row in rows])
+
+
+def task_packet_fingerprint(
+    session: Session,
+    *,
+    project_id: int,
+    sprint_id: int,
+    task_id: int,
+) -> str | None:
+    """Return the task packet fingerprint, or ``None`` when it has no packet."""
+    row = session.exec(
+        _sprint_story_probe(
+            *_TASK_COLUMNS,
+            col(TeamMember.name),
+            project_id=project_id,
+            sprint_id=sprint_id,
+        )
+        .join(Task, col(Task.story_id) == col(UserStory.story_id))
+        .outerjoin(
+            TeamMember,
+            col(TeamMember.member_id) == col(Task.assigned_to_member_id),
+        )
+        .where(col(Task.task_id) == task_id)
+    ).first()
+    if row is None:
+        return None
+    return _hash_rows("task_packet.v2", [tuple(row)])
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 
@@ -45,3 +45,18 @@ def get_story_packet(
     if flavor:
         payload["render"] = render_packet(packet, flavor)
     return payload
+
+
+def iter_sprint_packets(
+    *,
+    packets: Iterable[dict[str, Any]],
+    flavor: str | None,
+    render_packet: Callable[[dict[str, Any], str], str],
+) -> Iterator[dict[str, Any]]:
+    for packet in packets:
+        if not flavor:
+            yield packet
+            continue
+        payload = dict(packet)
+        payload["render"] = render_packet(packet, flavor)
+        yield payload
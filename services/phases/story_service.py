@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import re
@@ -490,59 +491,19 @@ def _normalize_fsm_state(value: str | None) -> str:
     return OrchestratorState.SETUP_REQUIRED.value
 
 
-async def get_story_pending(
-    *,
-    load_state: Callable[[], Awaitable[dict[str, Any]]],
-) -> dict[str, Any]:
-    state = await load_state()
-    return _story_pending_items(state)
-
-
-async def generate_story_draft(
+def _record_generated_story_attempt(
+    runtime: dict[str, Any],
     *,
-    project_id: int,
-    parent_requirement: str,
-    user_input: str | None,
-    load_state: Callable[[], Awaitable[dict[str, Any]]],
-    save_state: Callable[[dict[str, Any]], None],
+    story_result: dict[str, Any],
+    trigger: str,
+    included_feedback_ids: list[str],
     now_iso: Callable[[], str],
-    run_story_agent_from_state: Callable[..., Awaitable[dict[str, Any]]],
-    append_feedback_entry: Callable[[dict[str, Any], str, str], dict[str, Any]],
     set_request_projection: Callable[..., dict[str, Any]],
     append_attempt: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]],
     promote_reusable_draft: Callable[..., dict[str, Any]],
     mark_feedback_absorbed: Callable[..., list[dict[str, Any]]],
     failure_meta: Callable[..., dict[str, Any]],
-) -> dict[str, Any]:
-    state = await load_state()
-    normalized_parent_requirement = _normalize_story_requirement(
-        state,
-        parent_requirement,
-    )
-    runtime = ensure_story_runtime(
-        state,
-        parent_requirement=normalized_parent_requirement,
-    )
-
-    has_attempts = story_has_working_state(runtime)
-    normalized_user_input = user_input.strip() if isinstance(user_input, str) else None
-    if has_attempts and not normalized_user_input:
-        raise StoryPhaseError(
-            "User input is required to refine an existing story.",
-            status_code=400,
-        )
-
-    if normalized_user_input:
-        append_feedback_entry(runtime, normalized_user_input, now_iso())
-
-    included_feedback_ids = story_unabsorbed_feedback_ids(runtime)
-    story_result = await run_story_agent_from_state(
-        state,
-        project_id=project_id,
-        parent_requirement=normalized_parent_requirement,
-        user_input=None if included_feedback_ids else user_input,
-    )
-
+) -> str:
     request_payload = _story_request_payload(story_result.get("request_payload"))
     created_at = now_iso()
     draft_basis_attempt_id = (runtime.get("draft_projection") or {}).get(
@@ -569,7 +530,7 @@ async def generate_story_draft(
         {
             "attempt_id": attempt_id,
             "created_at": created_at,
-            "trigger": "manual_refine" if normalized_user_input else "auto_transition",
+            "trigger": trigger,
             "request_snapshot_id": request_projection.get("request_snapshot_id"),
             "draft_basis_attempt_id": request_projection.get("draft_basis_attempt_id"),
             "included_feedback_ids": list(included_feedback_ids),
@@ -597,6 +558,74 @@ async def generate_story_draft(
             feedback_ids=included_feedback_ids,
             attempt_id=attempt_id,
         )
+    return attempt_id
+
+
+async def get_story_pending(
+    *,
+    load_state: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    state = await load_state()
+    return _story_pending_items(state)
+
+
+async def generate_story_draft(
+    *,
+    project_id: int,
+    parent_requirement: str,
+    user_input: str | None,
+    load_state: Callable[[], Awaitable[dict[str, Any]]],
+    save_state: Callable[[dict[str, Any]], None],
+    now_iso: Callable[[], str],
+    run_story_agent_from_state: Callable[..., Awaitable[dict[str, Any]]],
+    append_feedback_entry: Callable[[dict[str, Any], str, str], dict[str, Any]],
+    set_request_projection: Callable[..., dict[str, Any]],
+    append_attempt: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]],
+    promote_reusable_draft: Callable[..., dict[str, Any]],
+    mark_feedback_absorbed: Callable[..., list[dict[str, Any]]],
+    failure_meta: Callable[..., dict[str, Any]],
+) -> dict[str, Any]:
+    state = await load_state()
+    normalized_parent_requirement = _normalize_story_requirement(
+        state,
+        parent_requirement,
+    )
+    runtime = ensure_story_runtime(
+        state,
+        parent_requirement=normalized_parent_requirement,
+    )
+
+    has_attempts = story_has_working_state(runtime)
+    normalized_user_input = user_input.strip() if isinstance(user_input, str) else None
+    if has_attempts and not normalized_user_input:
+        raise StoryPhaseError(
+            "User input is required to refine an existing story.",
+            status_code=400,
+        )
+
+    if normalized_user_input:
+        append_feedback_entry(runtime, normalized_user_input, now_iso())
+
+    included_feedback_ids = story_unabsorbed_feedback_ids(runtime)
+    story_result = await run_story_agent_from_state(
+        state,
+        project_id=project_id,
+        parent_requirement=normalized_parent_requirement,
+        user_input=None if included_feedback_ids else user_input,
+    )
+
+    _record_generated_story_attempt(
+        runtime,
+        story_result=story_result,
+        trigger="manual_refine" if normalized_user_input else "auto_transition",
+        included_feedback_ids=included_feedback_ids,
+        now_iso=now_iso,
+        set_request_projection=set_request_projection,
+        append_attempt=append_attempt,
+        promote_reusable_draft=promote_reusable_draft,
+        mark_feedback_absorbed=mark_feedback_absorbed,
+        failure_meta=failure_meta,
+    )
 
     sync_story_legacy_mirrors(
         state,
@@ -614,6 +643,165 @@ async def generate_story_draft(
     }
 
 
+def pending_story_requirements(state: dict[str, Any]) -> list[str]:
+    """Return roadmap requirements without saved stories or working state."""
+    pending = _story_pending_items(state)
+    return [
+        item["requirement"]
+        for group in pending["grouped_items"]
+        for item in group["requirements"]
+        if item["status"] == "Pending"
+    ]
+
+
+def _story_batch_item(
+    parent_requirement: str,
+    *,
+    attempt_id: str,
+    story_result: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "parent_requirement": parent_requirement,
+        "status": "generated" if story_result.get("is_reusable") else "failed",
+        "attempt_id": attempt_id,
+        "classification": story_result.get("classification"),
+        "is_complete": bool(story_result.get("is_complete", False)),
+        "error": story_result.get("error"),
+        "failure_artifact_id": story_result.get("failure_artifact_id"),
+    }
+
+
+def _story_batch_failure(parent_requirement: str, exc: Exception) -> dict[str, Any]:
+    return {
+        "parent_requirement": parent_requirement,
+        "status": "failed",
+        "attempt_id": None,
+        "classification": None,
+        "is_complete": False,
+        "error": str(exc) or type(exc).__name__,
+        "failure_artifact_id": None,
+    }
+
+
+async def generate_pending_story_drafts(
+    *,
+    project_id: int,
+    max_concurrency: int,
+    load_state: Callable[[], Awaitable[dict[str, Any]]],
+    save_state: Callable[[dict[str, Any]], None],
+    now_iso: Callable[[], str],
+    run_story_agent_from_state: Callable[..., Awaitable[dict[str, Any]]],
+    set_request_projection: Callable[..., dict[str, Any]],
+    append_attempt: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]],
+    promote_reusable_draft: Callable[..., dict[str, Any]],
+    mark_feedback_absorbed: Callable[..., list[dict[str, Any]]],
+    failure_meta: Callable[..., dict[str, Any]],
+    report_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Generate first drafts for every pending requirement concurrently.
+
+    Agent calls run under a semaphore bounded by ``max_concurrency``, each on
+    its own snapshot of the session state. Each result is merged into the
+    shared state and persisted under one lock, so a requirement's attempt is
+    saved as soon as it finishes and a failure in a later requirement never
+    discards earlier drafts. A requirement whose agent call raises is
+    reported as a failed item while the others keep running.
+    """
+    if max_concurrency < 1:
+        raise StoryPhaseError(
+            "max_concurrency must be a positive integer.",
+            status_code=400,
+        )
+
+    state = await load_state()
+    requirements = pending_story_requirements(state)
+    total_count = len(requirements)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    state_lock = asyncio.Lock()
+    items: dict[str, dict[str, Any]] = {}
+
+    def emit(event: str, parent_requirement: str, **extra: Any) -> None:
+        if report_progress is None:
+            return
+        report_progress(
+            {
+                "event": event,
+                "parent_requirement": parent_requirement,
+                "completed_count": len(items),
+                "total_count": total_count,
+                **extra,
+            }
+        )
+
+    async def generate_one(parent_requirement: str) -> None:
+        async with semaphore:
+            emit("started", parent_requirement)
+            story_result = await run_story_agent_from_state(
+                dict(state),
+                project_id=project_id,
+                parent_requirement=parent_requirement,
+                user_input=None,
+            )
+
+        async with state_lock:
+            runtime = ensure_story_runtime(
+                state,
+                parent_requirement=parent_requirement,
+            )
+            attempt_id = _record_generated_story_attempt(
+                runtime,
+                story_result=story_result,
+                trigger="batch_generate",
+                included_feedback_ids=[],
+                now_iso=now_iso,
+                set_request_projection=set_request_projection,
+                append_attempt=append_attempt,
+                promote_reusable_draft=promote_reusable_draft,
+                mark_feedback_absorbed=mark_feedback_absorbed,
+                failure_meta=failure_meta,
+            )
+            sync_story_legacy_mirrors(
+                state,
+                parent_requirement=parent_requirement,
+                runtime=runtime,
+            )
+            save_state(state)
+            items[parent_requirement] = _story_batch_item(
+                parent_requirement,
+                attempt_id=attempt_id,
+                story_result=story_result,
+            )
+            emit(
+                "finished",
+                parent_requirement,
+                status=items[parent_requirement]["status"],
+            )
+
+    results = await asyncio.gather(
+        *(generate_one(req) for req in requirements),
+        return_exceptions=True,
+    )
+    for parent_requirement, result in zip(requirements, results, strict=True):
+        if not isinstance(result, BaseException):
+            continue
+        if not isinstance(result, Exception):
+            raise result
+        items[parent_requirement] = _story_batch_failure(parent_requirement, result)
+        emit("finished", parent_requirement, status="failed")
+
+    ordered_items = [items[req] for req in requirements]
+    generated_count = sum(1 for item in ordered_items if item["status"] == "generated")
+    return {
+        "data": {
+            "items": ordered_items,
+            "total_count": total_count,
+            "generated_count": generated_count,
+            "failed_count": total_count - generated_count,
+            "max_concurrency": max_concurrency,
+        },
+    }
+
+
 async def retry_story_draft(
     *,
     project_id: int,
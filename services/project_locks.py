@@ -0,0 +1,91 @@
+"""Per-project write serialization for workflow session mutations.
+
+Session state is mutated read-modify-write: hydrate, change ``context.state``,
+save. A process-wide ``ProjectLockManager`` orders those writes per project
+while requests for different projects keep running concurrently. The
+optimistic ``state_version`` check in ``WorkflowSessionRepository`` covers
+writers outside this process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+_PROJECT_PATH = re.compile(r"^/api/projects/(\d+)(?:/|$)")
+# Routes that wait on a model between loading and saving session state.
+_MODEL_BACKED_PATH = re.compile(r"/(?:(?:generate|generate_batch)(?:/stream)?|retry)$")
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ProjectLockManager:
+    """Hand out one ``asyncio.Lock`` per project, dropping idle locks."""
+
+    def __init__(self) -> None:
+        """Start with no project locks; they are created on demand."""
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._holders: dict[int, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, project_id: int) -> AsyncIterator[None]:
+        """Serialize the enclosed block with other writers of ``project_id``."""
+        lock = self._locks.get(project_id)
+        if lock is None:
+            lock = self._locks[project_id] = asyncio.Lock()
+        self._holders[project_id] = self._holders.get(project_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._holders[project_id] -= 1
+            if not self._holders[project_id]:
+                del self._holders[project_id]
+                del self._locks[project_id]
+
+    def is_locked(self, project_id: int) -> bool:
+        """Return whether a writer currently holds the project's lock."""
+        lock = self._locks.get(project_id)
+        return lock is not None and lock.locked()
+
+    def active_project_count(self) -> int:
+        """Return the number of projects with a holder or waiter."""
+        return len(self._locks)
+
+
+class ProjectWriteLockMiddleware:
+    """ASGI middleware holding the project lock for mutating project routes.
+
+    Those requests are one session read-modify-write each, so the lock covers
+    exactly hydrate, mutate and save. Model-backed routes (generate, stream,
+    batch and retry) are left unlocked: holding the lock across a model call
+    would queue every other write to the project behind it. Their save still
+    runs the version compare-and-swap and answers 409 when another write got
+    in first.
+    """
+
+    def __init__(self, app: ASGIApp, *, locks: ProjectLockManager) -> None:
+        """Wrap ``app`` and serialize writes through ``locks``."""
+        self.app = app
+        self.locks = locks
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Lock POST/PUT/PATCH/DELETE project routes that make no model call."""
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        match = _PROJECT_PATH.match(scope["path"])
+        if match is None or _MODEL_BACKED_PATH.search(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        async with self.locks.hold(int(match.group(1))):
+            await self.app(scope, receive, send)
+
+
+project_locks = ProjectLockManager()
@@ -0,0 +1,136 @@
+"""Shared project structure summary for every project detail surface.
+
+``get_project_details``, the CLI ``project show`` projection and the API's
+project selection all report the same structure counts. The summary is
+computed in one round trip (scalar subqueries) and memoized per engine and
+product. ``Product.structure_version`` is bumped in the same transaction as any
+theme, epic, feature, story, sprint or spec write (see ``models.core``), so a
+cached entry is reused only while the product row still carries the version it
+was computed for, across processes sharing the database.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from models.core import Epic, Feature, Sprint, Theme, UserStory
+from models.specs import SpecRegistry
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from models.core import Product
+
+
+@dataclass(frozen=True)
+class ProjectStructureSummary:
+    """Hierarchy counts and the latest approved spec for one product."""
+
+    themes: int
+    epics: int
+    features: int
+    user_stories: int
+    sprints: int
+    latest_spec_version_id: int | None
+
+    def counts(self) -> dict[str, int]:
+        """Return the counts keyed as the detail payloads expose them."""
+        return {
+            "themes": self.themes,
+            "epics": self.epics,
+            "features": self.features,
+            "user_stories": self.user_stories,
+            "sprints": self.sprints,
+        }
+
+
+def _count_for_product(model: Any, id_column: Any, product_id: int) -> Any:  # noqa: ANN401
+    return (
+        select(func.count(id_column))
+        .where(model.product_id == product_id)
+        .scalar_subquery()
+    )
+
+
+def load_project_structure_summary(
+    session: Session, product_id: int
+) -> ProjectStructureSummary:
+    """Compute the structure summary for ``product_id`` in one query."""
+    spec = cast("Any", SpecRegistry)
+    latest_spec = (
+        select(spec.spec_version_id)
+        .where(spec.product_id == product_id, spec.status == "approved")
+        .order_by(
+            spec.approved_at.desc(),
+            spec.created_at.desc(),
+            spec.spec_version_id.desc(),
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    # SQLModel's select() overloads stop at four columns.
+    columns: tuple[Any, ...] = (
+        _count_for_product(Theme, Theme.theme_id, product_id),
+        _count_for_product(Epic, Epic.epic_id, product_id),
+        _count_for_product(Feature, Feature.feature_id, product_id),
+        _count_for_product(UserStory, UserStory.story_id, product_id),
+        _count_for_product(Sprint, Sprint.sprint_id, product_id),
+        latest_spec,
+    )
+    row = session.exec(select(*columns)).one()
+    themes, epics, features, stories, sprints, latest_spec_version_id = row
+    return ProjectStructureSummary(
+        themes=int(themes or 0),
+        epics=int(epics or 0),
+        features=int(features or 0),
+        user_stories=int(stories or 0),
+        sprints=int(sprints or 0),
+        latest_spec_version_id=latest_spec_version_id,
+    )
+
+
+class ProjectStructureCache:
+    """Memoize structure summaries per engine and product version."""
+
+    def __init__(self) -> None:
+        """Start with no cached summaries."""
+        self._entries: WeakKeyDictionary[
+            object, dict[int, tuple[int, ProjectStructureSummary]]
+        ] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, product: Product) -> ProjectStructureSummary:
+        """Return the summary for ``product``, recomputing it on a version bump."""
+        product_id = cast("int", product.product_id)
+        version = product.structure_version
+        bind = session.get_bind()
+        with self._lock:
+            cached = self._entries.get(bind, {}).get(product_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        summary = load_project_structure_summary(session, product_id)
+        with self._lock:
+            self._entries.setdefault(bind, {})[product_id] = (version, summary)
+        return summary
+
+    def clear(self) -> None:
+        """Drop every cached summary."""
+        with self._lock:
+            self._entries.clear()
+
+
+project_structure_cache = ProjectStructureCache()
+
+
+def get_project_structure_summary(
+    session: Session, product: Product
+) -> ProjectStructureSummary:
+    """Return the (memoized) structure summary for a loaded product row."""
+    return project_structure_cache.get(session, product)
@@ -10,13 +10,12 @@ from typing import Any
 
 from pydantic import ValidationError
 
-from orchestrator_agent.agent_tools.roadmap_builder.agent import (
-    root_agent as roadmap_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.roadmap_builder.schemes import (
     RoadmapBuilderInput,
     RoadmapBuilderOutput,
 )
+from services.state_blobs import state_text
 from utils.adk_runner import (
     get_agent_model_info,
     invoke_agent_to_text,
@@ -95,8 +94,8 @@ def build_roadmap_input_context(
     return {
         "backlog_items": backlog_items,
         "product_vision": vision_stmt,
-        "technical_spec": _as_text(state.get("pending_spec_content")),
-        "compiled_authority": _as_text(state.get("compiled_authority_cached")),
+        "technical_spec": _as_text(state_text(state, "pending_spec_content")),
+        "compiled_authority": _as_text(state_text(state, "compiled_authority_cached")),
         "time_increment": "Milestone-based",
         "prior_roadmap_state": _normalize_prior_roadmap_state(
             state.get("roadmap_releases")
@@ -107,7 +106,7 @@ def build_roadmap_input_context(
 
 async def _invoke_roadmap_agent(payload: RoadmapBuilderInput) -> str:
     return await invoke_agent_to_text(
-        agent=roadmap_agent,
+        agent=get_agent("roadmap_builder"),
         runner_identity=ROADMAP_RUNNER_IDENTITY,
         payload_json=payload.model_dump_json(),
         no_text_error="Roadmap agent returned no text response",
@@ -130,7 +129,7 @@ def _failure(
         raw_output=details.raw_text,
         context={"input_context": input_context},
         model_info={
-            **get_agent_model_info(roadmap_agent),
+            **get_agent_model_info(get_agent("roadmap_builder")),
             "app_name": ROADMAP_RUNNER_IDENTITY.app_name,
             "user_id": ROADMAP_RUNNER_IDENTITY.user_id,
         },
@@ -9,15 +9,16 @@ _EXPORT_MODULES: dict[str, str] = {
     "check_spec_authority_status": "services.specs.compiler_service",
     "compile_spec_authority": "services.specs.compiler_service",
     "compile_spec_authority_for_version": "services.specs.compiler_service",
-    "compute_story_input_hash": "services.specs.story_validation_service",
+    "compute_story_input_hash": "services.specs.artifacts",
     "ensure_accepted_spec_authority": "services.specs.compiler_service",
     "ensure_spec_authority_accepted": "services.specs.compiler_service",
     "get_compiled_authority_by_version": "services.specs.compiler_service",
     "link_spec_to_product": "services.specs.lifecycle_service",
-    "load_compiled_artifact": "services.specs.compiler_service",
+    "load_compiled_artifact": "services.specs.artifacts",
     "preview_spec_authority": "services.specs.compiler_service",
     "read_project_specification": "services.specs.lifecycle_service",
     "register_spec_version": "services.specs.lifecycle_service",
+    "revalidate_stale_stories": "services.specs.revalidation",
     "save_project_specification": "services.specs.lifecycle_service",
     "update_spec_and_compile_authority": "services.specs.compiler_service",
     "validate_story_with_spec_authority": "services.specs.story_validation_service",
@@ -37,6 +38,7 @@ __all__: list[str] = [
     "preview_spec_authority",
     "read_project_specification",
     "register_spec_version",
+    "revalidate_stale_stories",
     "save_project_specification",
     "update_spec_and_compile_authority",
     "validate_story_with_spec_authority",
@@ -0,0 +1,45 @@
+"""Dependency-light spec helpers shared by services and read-only transports.
+
+These live apart from the compiler and validation services so packet
+builders and the CLI can parse compiled artifacts and hash story inputs
+without importing the agent runtime.
+"""
+
+from __future__ import annotations
+
+from pydantic import ValidationError
+
+from utils.spec_schemas import (
+    SpecAuthorityCompilationFailure,
+    SpecAuthorityCompilationSuccess,
+    SpecAuthorityCompilerOutput,
+)
+from utils.story_inputs import compute_story_input_hash
+
+__all__ = [
+    "compute_story_input_hash",
+    "current_story_input_hash",
+    "load_compiled_artifact",
+]
+
+
+def load_compiled_artifact(
+    authority: object,
+) -> SpecAuthorityCompilationSuccess | None:
+    """Load normalized compiled artifact JSON if present and valid."""
+    artifact_json = getattr(authority, "compiled_artifact_json", None)
+    if not artifact_json:
+        return None
+    try:
+        parsed = SpecAuthorityCompilerOutput.model_validate_json(artifact_json)
+    except (ValidationError, ValueError):
+        return None
+    if isinstance(parsed.root, SpecAuthorityCompilationFailure):
+        return None
+    return parsed.root
+
+
+def current_story_input_hash(story: object) -> str:
+    """Return the story's maintained input hash, computing it for legacy rows."""
+    stored = getattr(story, "story_input_hash", None)
+    return stored if isinstance(stored, str) else compute_story_input_hash(story)
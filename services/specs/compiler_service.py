@@ -25,17 +25,17 @@ from models.specs import (
     SpecAuthorityAcceptance,
     SpecRegistry,
 )
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.spec_authority_compiler_agent import (
     compiler_contract,
     instructions_source,
 )
-from orchestrator_agent.agent_tools.spec_authority_compiler_agent.agent import (
-    root_agent as spec_authority_compiler_agent,
-)
 from orchestrator_agent.agent_tools.spec_authority_compiler_agent.normalizer import (
     normalize_compiler_output,
 )
 from services.specs._engine_resolution import resolve_spec_engine
+from services.specs.artifacts import load_compiled_artifact
+from services.state_blobs import set_state_text, state_text
 from utils.adk_runner import get_agent_model_info, invoke_agent_to_text
 from utils.failure_artifacts import (
     AgentInvocationError,
@@ -310,22 +310,6 @@ def _normalize_input_params(params: object) -> dict[str, Any]:
     return {}
 
 
-def load_compiled_artifact(
-    authority: object,
-) -> SpecAuthorityCompilationSuccess | None:
-    """Load normalized compiled artifact JSON if present and valid."""
-    artifact_json = getattr(authority, "compiled_artifact_json", None)
-    if not artifact_json:
-        return None
-    try:
-        parsed = SpecAuthorityCompilerOutput.model_validate_json(artifact_json)
-    except (ValidationError, ValueError):
-        return None
-    if isinstance(parsed.root, SpecAuthorityCompilationFailure):
-        return None
-    return parsed.root
-
-
 def _load_acceptance_context(
     session: Session,
     *,
@@ -425,7 +409,7 @@ def _resolve_gate_path_used(
         tool_context
         and tool_context.state
         and (
-            tool_context.state.get("pending_spec_content") == spec_content
+            state_text(tool_context.state, "pending_spec_content") == spec_content
             or tool_context.state.get("pending_spec_path") == content_ref
         )
     ):
@@ -723,7 +707,7 @@ async def _invoke_spec_authority_compiler_async(
 ) -> str:
     """Invoke the spec authority compiler agent and return raw JSON text."""
     return await invoke_agent_to_text(
-        agent=spec_authority_compiler_agent,
+        agent=get_agent("spec_authority_compiler"),
         runner_identity=SPEC_AUTHORITY_COMPILER_IDENTITY,
         payload_json=input_payload.model_dump_json(),
         no_text_error="Compiler agent returned no text response",
@@ -807,7 +791,9 @@ def preview_spec_authority(
 
         compiled_json = normalized.root.model_dump_json()
         if tool_context and tool_context.state is not None:
-            tool_context.state["compiled_authority_cached"] = compiled_json
+            set_state_text(
+                tool_context.state, "compiled_authority_cached", compiled_json
+            )
     except RuntimeError as exc:
         logger.exception("preview_spec_authority failed")
         return {"success": False, "error": str(exc)}
@@ -845,7 +831,7 @@ def _compiler_failure_result(
             "content_ref": details.content_ref,
         },
         model_info={
-            **get_agent_model_info(spec_authority_compiler_agent),
+            **get_agent_model_info(get_agent("spec_authority_compiler")),
             "app_name": SPEC_AUTHORITY_COMPILER_IDENTITY.app_name,
             "user_id": SPEC_AUTHORITY_COMPILER_IDENTITY.user_id,
         },
@@ -1196,8 +1182,10 @@ def _cached_compilation_result(
     if cache_error is not None:
         return cache_error
     if tool_context and tool_context.state is not None:
-        tool_context.state["compiled_authority_cached"] = (
-            existing_authority.compiled_artifact_json
+        set_state_text(
+            tool_context.state,
+            "compiled_authority_cached",
+            existing_authority.compiled_artifact_json,
         )
 
     return {
@@ -1444,8 +1432,10 @@ def _compile_spec_authority_for_version_in_session(  # noqa: PLR0913
         return cast("dict[str, Any]", persisted_result)
     persisted = cast("_PersistedCompilation", persisted_result)
     if tool_context and tool_context.state is not None:
-        tool_context.state["compiled_authority_cached"] = (
-            persisted.compiled_artifact_json
+        set_state_text(
+            tool_context.state,
+            "compiled_authority_cached",
+            persisted.compiled_artifact_json,
         )
 
     return {
@@ -21,6 +21,7 @@ from services.specs.compiler_service import (
     _resolve_update_spec_and_compile_authority,
     update_spec_and_compile_authority,
 )
+from services.state_blobs import set_state_text
 
 if TYPE_CHECKING:
     from google.adk.tools import ToolContext
@@ -184,10 +185,7 @@ def hydrate_spec_state(
     elif "pending_spec_path" in state:
         del state["pending_spec_path"]
 
-    if spec_content is not None:
-        state["pending_spec_content"] = spec_content
-    elif "pending_spec_content" in state:
-        del state["pending_spec_content"]
+    set_state_text(state, "pending_spec_content", spec_content)
 
 
 def _load_spec_text_from_file(path_str: str) -> tuple[str, float] | dict[str, Any]:
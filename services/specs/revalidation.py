@@ -0,0 +1,117 @@
+"""Background sweep that re-validates stories flagged ``validation_stale``.
+
+The ``UserStory`` write listener and the ``CompiledSpecAuthority`` listener
+set the flag whenever story text or the pinned authority moves past the
+stored evidence, so finding the work is one indexed column filter.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+from sqlmodel import Session, col, select
+
+from models import db as model_db
+from models.core import UserStory
+from services.specs.story_validation_service import validate_story_with_spec_authority
+from utils.spec_schemas import ValidationEvidence
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+def _revalidation_spec_version_id(story: UserStory) -> int | None:
+    """Return the pinned spec version, else the one the evidence was run on."""
+    if story.accepted_spec_version_id is not None:
+        return story.accepted_spec_version_id
+    if not story.validation_evidence:
+        return None
+    try:
+        evidence = ValidationEvidence.model_validate_json(story.validation_evidence)
+    except (ValidationError, ValueError):
+        return None
+    return evidence.spec_version_id
+
+
+def find_stale_story_ids(
+    session: Session,
+    *,
+    project_id: int | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    """Return ids of stories whose validation evidence is stale."""
+    statement = (
+        select(UserStory.story_id)
+        .where(col(UserStory.validation_stale).is_(True))
+        .order_by(col(UserStory.story_id))
+    )
+    if project_id is not None:
+        statement = statement.where(col(UserStory.product_id) == project_id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return [story_id for story_id in session.exec(statement) if story_id is not None]
+
+
+def revalidate_stale_stories(
+    *,
+    project_id: int | None = None,
+    mode: str | None = None,
+    limit: int | None = None,
+    engine: Engine | None = None,
+    validate: Callable[[dict[str, Any]], dict[str, Any]] = (
+        validate_story_with_spec_authority
+    ),
+) -> dict[str, Any]:
+    """Re-run spec validation for every stale story and report the outcome.
+
+    Each story is validated against its pinned spec version, falling back to
+    the version its stale evidence names. Fresh evidence clears the flag.
+    """
+    with Session(engine or model_db.get_engine()) as session:
+        targets: list[tuple[int, int | None]] = []
+        for story_id in find_stale_story_ids(
+            session, project_id=project_id, limit=limit
+        ):
+            story = session.get(UserStory, story_id)
+            if story is not None:
+                targets.append((story_id, _revalidation_spec_version_id(story)))
+
+    passed: list[int] = []
+    failed: list[int] = []
+    skipped: list[int] = []
+    for story_id, spec_version_id in targets:
+        if spec_version_id is None:
+            skipped.append(story_id)
+            continue
+        params: dict[str, Any] = {
+            "story_id": story_id,
+            "spec_version_id": spec_version_id,
+        }
+        if mode is not None:
+            params["mode"] = mode
+        result = validate(params)
+        if result.get("passed"):
+            passed.append(story_id)
+        else:
+            failed.append(story_id)
+            if not result.get("success"):
+                logger.warning(
+                    "Re-validation of story %s failed: %s",
+                    story_id,
+                    result.get("error") or result.get("message"),
+                )
+
+    return {
+        "status": "success",
+        "project_id": project_id,
+        "checked_count": len(targets),
+        "passed_story_ids": passed,
+        "failed_story_ids": failed,
+        "skipped_story_ids": skipped,
+    }
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import logging
 import re
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, Unpack, cast
@@ -18,14 +19,12 @@ from sqlmodel import Session, select
 from models.core import Feature, UserStory
 from models.db import get_engine
 from models.specs import CompiledSpecAuthority, SpecRegistry
-from orchestrator_agent.agent_tools.spec_validator_agent.agent import (
-    root_agent as spec_validator_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.spec_validator_agent.schemes import (
     SpecValidationResult,
 )
 from services.specs._engine_resolution import resolve_spec_engine
-from services.specs.compiler_service import load_compiled_artifact
+from services.specs.artifacts import compute_story_input_hash, load_compiled_artifact
 from utils.adk_runner import invoke_agent_to_text
 from utils.failure_artifacts import AgentInvocationError
 from utils.runtime_config import SPEC_VALIDATOR_IDENTITY, get_default_validation_mode
@@ -39,7 +38,7 @@ from utils.spec_schemas import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Awaitable, Callable, Coroutine, Iterator
 
     from sqlalchemy.engine import Connection, Engine
 
@@ -220,21 +219,6 @@ class ValidateStoryInput(BaseModel):
     )
 
 
-def compute_story_input_hash(story: object) -> str:
-    """Compute deterministic SHA-256 hash of story content."""
-    content = json.dumps(
-        {
-            "title": getattr(story, "title", "") or "",
-            "description": getattr(story, "story_description", "") or "",
-            "acceptance_criteria": getattr(story, "acceptance_criteria", "") or "",
-        },
-        sort_keys=True,
-        ensure_ascii=True,
-        separators=(",", ":"),
-    )
-    return hashlib.sha256(content.encode()).hexdigest()
-
-
 def resolve_default_validation_mode() -> str:
     """Resolve default validation mode from environment with safe fallback."""
     raw_value = get_default_validation_mode("deterministic").strip().lower()
@@ -262,11 +246,56 @@ def persist_validation_evidence(
     session.commit()
 
 
+@dataclass(frozen=True)
+class _ValidatorLoop:
+    """Event loop that sync validation code hands its LLM calls to."""
+
+    loop: asyncio.AbstractEventLoop
+    before_call: Callable[[], Awaitable[None]] | None = None
+
+    async def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        if self.before_call is not None:
+            await self.before_call()
+        return await coro
+
+
+_validator_loop: ContextVar[_ValidatorLoop | None] = ContextVar(
+    "story_validation_validator_loop",
+    default=None,
+)
+
+
+@contextmanager
+def shared_validator_loop(
+    loop: asyncio.AbstractEventLoop,
+    *,
+    before_call: Callable[[], Awaitable[None]] | None = None,
+) -> Iterator[None]:
+    """Run LLM validator calls on ``loop`` for the current context.
+
+    Validation is synchronous, so each LLM call normally gets a fresh event
+    loop. Batch callers that validate from worker threads (started with
+    ``asyncio.to_thread``, which copies this context) install their own
+    running loop here instead. Every call is then scheduled on that loop, after
+    awaiting ``before_call`` (e.g. a rate limiter).
+    """
+    token = _validator_loop.set(_ValidatorLoop(loop=loop, before_call=before_call))
+    try:
+        yield
+    finally:
+        _validator_loop.reset(token)
+
+
 def _run_async_task[T](coro: Coroutine[Any, Any, T]) -> T:
     """Run an async coroutine from sync code, even if a loop is already running."""
     try:
-        asyncio.get_running_loop()
+        running = asyncio.get_running_loop()
     except RuntimeError:
+        running = None
+    shared = _validator_loop.get()
+    if shared is not None and shared.loop is not running and shared.loop.is_running():
+        return asyncio.run_coroutine_threadsafe(shared.run(coro), shared.loop).result()
+    if running is None:
         return asyncio.run(coro)
 
     with ThreadPoolExecutor(max_workers=1) as executor:
@@ -587,7 +616,7 @@ def run_deterministic_alignment_checks(
 async def invoke_spec_validator_async(payload_text: str) -> str:
     """Invoke spec_validator_agent and return response text."""
     return await invoke_agent_to_text(
-        agent=spec_validator_agent,
+        agent=get_agent("spec_validator"),
         runner_identity=SPEC_VALIDATOR_IDENTITY,
         payload_json=payload_text,
         no_text_error="Spec validator agent returned no text response",
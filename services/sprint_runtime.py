@@ -9,9 +9,7 @@ from typing import TYPE_CHECKING, Any, TypedDict, Unpack
 
 from pydantic import ValidationError
 
-from orchestrator_agent.agent_tools.sprint_planner_tool.agent import (
-    root_agent as sprint_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.sprint_planner_tool.schemes import (
     SprintPlannerInput,
     SprintPlannerOutput,
@@ -87,7 +85,7 @@ class _PreparedSprintPayload:
 
 async def _invoke_sprint_agent(payload: SprintPlannerInput) -> str:
     return await invoke_agent_to_text(
-        agent=sprint_agent,
+        agent=get_agent("sprint_planner"),
         runner_identity=SPRINT_RUNNER_IDENTITY,
         payload_json=payload.model_dump_json(),
         no_text_error="Sprint agent returned no text response",
@@ -246,7 +244,7 @@ def _failure(
             "input_context": input_context,
         },
         model_info={
-            **get_agent_model_info(sprint_agent),
+            **get_agent_model_info(get_agent("sprint_planner")),
             "app_name": SPRINT_RUNNER_IDENTITY.app_name,
             "user_id": SPRINT_RUNNER_IDENTITY.user_id,
         },
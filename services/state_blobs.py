@@ -0,0 +1,150 @@
+"""Session-state slots holding content-blob references instead of large text.
+
+The spec text (``pending_spec_content``) and compiled authority
+(``compiled_authority_cached``), plus their ``active_project`` copies, used to
+ride along in every session read and write. They are now stored once in the
+``content_blobs`` table and the state keeps ``blob:sha256:<digest>``. Readers
+resolve a slot through an in-process LRU only when the text is needed; plain
+strings (sessions written before this change, test fixtures) pass through.
+
+Setting a slot only stores the blob; nothing is released when a slot changes,
+because the state dict may be a copy that is never saved. Instead
+``sweep_unreferenced_blobs`` (run at startup) deletes blobs no saved session
+state references, once they are older than a grace period that covers
+writes still in flight.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+from models.blobs import blob_ref, blob_ref_digest, content_digest
+
+if TYPE_CHECKING:
+    from repositories.content_blobs import ContentBlobRepository
+    from repositories.session import WorkflowSessionRepository
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SIZE = 64
+SWEEP_GRACE: Final[timedelta] = timedelta(hours=1)
+
+
+class BlobTextCache:
+    """Thread-safe LRU of resolved blob text keyed by digest.
+
+    Entries never go stale: a digest always names the same text.
+    """
+
+    def __init__(self, max_entries: int = _CACHE_SIZE) -> None:
+        """Start empty, holding at most ``max_entries`` texts."""
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> str | None:
+        """Return cached text for ``digest`` and mark it recently used."""
+        with self._lock:
+            text = self._entries.get(digest)
+            if text is not None:
+                self._entries.move_to_end(digest)
+            return text
+
+    def put(self, digest: str, text: str) -> None:
+        """Cache ``text`` under ``digest``, evicting the least recently used."""
+        with self._lock:
+            self._entries[digest] = text
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached text."""
+        with self._lock:
+            self._entries.clear()
+
+
+blob_text_cache = BlobTextCache()
+
+
+class StateSlots(Protocol):
+    """The part of a state mapping the slot helpers use (dicts and ADK ``State``)."""
+
+    def get(self, key: str, /) -> Any:  # noqa: ANN401
+        """Return the value under ``key``, or None."""
+        ...
+
+    def __setitem__(self, key: str, value: Any, /) -> None:  # noqa: ANN401
+        """Store ``value`` under ``key``."""
+        ...
+
+
+def _repository() -> ContentBlobRepository:
+    # Imported on use so runtimes reading state stay free of DB configuration.
+    from repositories.content_blobs import (  # noqa: PLC0415
+        ContentBlobRepository,
+    )
+
+    return ContentBlobRepository()
+
+
+def resolve_blob_text(value: object) -> object:
+    """Return the text behind a blob reference; other values pass through."""
+    digest = blob_ref_digest(value)
+    if digest is None:
+        return value
+    text = blob_text_cache.get(digest)
+    if text is None:
+        text = _repository().get(digest)
+        if text is None:
+            logger.warning("Session state references missing blob %s", digest)
+            return None
+        blob_text_cache.put(digest, text)
+    return text
+
+
+def state_text(state: StateSlots, key: str) -> object:
+    """Return the resolved value of a blob-backed state slot."""
+    return resolve_blob_text(state.get(key))
+
+
+def set_state_text(state: StateSlots, key: str, text: str | None) -> None:
+    """Point ``state[key]`` at ``text`` stored as a blob, or clear it on None.
+
+    Clearing drops the key; ADK ``State`` cannot drop keys, so there the
+    slot holds None instead.
+    """
+    if text is None:
+        pop = getattr(state, "pop", None)
+        if pop is not None:
+            pop(key, None)
+        elif state.get(key) is not None:
+            state[key] = None
+        return
+    if blob_ref_digest(state.get(key)) == content_digest(text):
+        return
+    digest = _repository().put(text)
+    blob_text_cache.put(digest, text)
+    state[key] = blob_ref(digest)
+
+
+def sweep_unreferenced_blobs(
+    *,
+    grace: timedelta = SWEEP_GRACE,
+    sessions: WorkflowSessionRepository | None = None,
+) -> int:
+    """Delete blobs no saved session references and untouched for ``grace``."""
+    if sessions is None:
+        from repositories.session import (  # noqa: PLC0415
+            WorkflowSessionRepository,
+        )
+
+        sessions = WorkflowSessionRepository()
+    referenced = sessions.referenced_blob_digests()
+    return _repository().delete_unreferenced(
+        referenced, touched_before=datetime.now(UTC) - grace
+    )
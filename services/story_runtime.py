@@ -9,14 +9,13 @@ from typing import Any, TypedDict
 
 from pydantic import ValidationError
 
-from orchestrator_agent.agent_tools.user_story_writer_tool.agent import (
-    root_agent as story_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.user_story_writer_tool.schemes import (
     UserStoryWriterInput,
     UserStoryWriterOutput,
 )
 from services.interview_runtime import hydrate_story_runtime_from_legacy
+from services.state_blobs import state_text
 from utils.adk_runner import (
     get_agent_model_info,
     invoke_agent_to_text,
@@ -197,8 +196,8 @@ def build_story_input_context(
         "requirement_context": _build_requirement_context(
             roadmap_releases, parent_requirement=parent_requirement
         ),
-        "technical_spec": _as_text(state.get("pending_spec_content")),
-        "compiled_authority": _as_text(state.get("compiled_authority_cached")),
+        "technical_spec": _as_text(state_text(state, "pending_spec_content")),
+        "compiled_authority": _as_text(state_text(state, "compiled_authority_cached")),
         "global_roadmap_context": _build_global_roadmap_context(roadmap_releases),
         "already_generated_milestone_stories": already_generated.strip(),
         "artifact_registry": artifact_registry,
@@ -207,7 +206,7 @@ def build_story_input_context(
 
 async def _invoke_story_agent(payload: UserStoryWriterInput) -> str:
     return await invoke_agent_to_text(
-        agent=story_agent,
+        agent=get_agent("user_story_writer"),
         runner_identity=STORY_RUNNER_IDENTITY,
         payload_json=payload.model_dump_json(),
         no_text_error="Story agent returned no text response",
@@ -235,7 +234,7 @@ def _failure(
             "input_context": input_context,
         },
         model_info={
-            **get_agent_model_info(story_agent),
+            **get_agent_model_info(get_agent("user_story_writer")),
             "app_name": STORY_RUNNER_IDENTITY.app_name,
             "user_id": STORY_RUNNER_IDENTITY.user_id,
         },
@@ -10,13 +10,12 @@ from typing import Any
 
 from pydantic import ValidationError
 
-from orchestrator_agent.agent_tools.product_vision_tool.agent import (
-    root_agent as vision_agent,
-)
+from orchestrator_agent.agent_registry import get_agent
 from orchestrator_agent.agent_tools.product_vision_tool.schemes import (
     InputSchema,
     OutputSchema,
 )
+from services.state_blobs import state_text
 from utils.adk_runner import (
     get_agent_model_info,
     invoke_agent_to_text,
@@ -91,14 +90,14 @@ def build_vision_input_context(
         "prior_vision_state": _normalize_prior_vision_state(
             state.get("vision_components")
         ),
-        "specification_content": _as_text(state.get("pending_spec_content")),
-        "compiled_authority": _as_text(state.get("compiled_authority_cached")),
+        "specification_content": _as_text(state_text(state, "pending_spec_content")),
+        "compiled_authority": _as_text(state_text(state, "compiled_authority_cached")),
     }
 
 
 async def _invoke_vision_agent(payload: InputSchema) -> str:
     return await invoke_agent_to_text(
-        agent=vision_agent,
+        agent=get_agent("product_vision"),
         runner_identity=VISION_RUNNER_IDENTITY,
         payload_json=payload.model_dump_json(),
         no_text_error="Vision agent returned no text response",
@@ -121,7 +120,7 @@ def _failure(
         raw_output=details.raw_text,
         context={"input_context": input_context},
         model_info={
-            **get_agent_model_info(vision_agent),
+            **get_agent_model_info(get_agent("product_vision")),
             "app_name": VISION_RUNNER_IDENTITY.app_name,
             "user_id": VISION_RUNNER_IDENTITY.user_id,
         },
@@ -13,6 +13,7 @@ from orchestrator_agent.fsm.controller import FSMController
 from orchestrator_agent.fsm.states import OrchestratorState
 from repositories.product import ProductRepository
 from repositories.session import WorkflowSessionRepository
+from services.live_updates import live_updates
 from services.orchestrator_query_service import get_real_business_state
 from utils.runtime_config import WORKFLOW_RUNNER_IDENTITY, RunnerIdentity
 
@@ -68,6 +69,16 @@ class WorkflowService:
             session_id=session_id,
         )
 
+    def get_session_status_with_version(
+        self, session_id: str
+    ) -> tuple[dict[str, Any], int]:
+        """Return the session state payload and its compare-and-swap version."""
+        return self.session_repo.get_session_state_with_version(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=session_id,
+        )
+
     def get_session_statuses(self, session_ids: list[str]) -> dict[str, dict[str, Any]]:
         """Return current session state payloads keyed by session ID."""
         return self.session_repo.get_session_states_batch(
@@ -77,15 +88,29 @@ class WorkflowService:
         )
 
     def update_session_status(
-        self, session_id: str, partial_update: dict[str, Any]
-    ) -> None:
-        """Apply partial update to session state."""
-        self.session_repo.update_session_state(
+        self,
+        session_id: str,
+        partial_update: dict[str, Any],
+        *,
+        expected_version: int | None = None,
+    ) -> int:
+        """Apply partial update to session state and return the new version.
+
+        Project sessions (keyed by the product id) publish the changed keys to
+        live subscribers.
+        """
+        version, changes = self.session_repo.update_session_state_with_changes(
             app_name=self.app_name,
             user_id=self.user_id,
             session_id=session_id,
             partial_update=partial_update,
+            expected_version=expected_version,
         )
+        if changes and session_id.isdigit():
+            live_updates.publish(
+                int(session_id), "state", {"version": version, "changes": changes}
+            )
+        return version
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a workflow session state from the database."""
@@ -174,6 +199,16 @@ class WorkflowService:
                 .replace("+00:00", "Z"),
             },
         )
+        if session_id.isdigit():
+            live_updates.publish(
+                int(session_id),
+                "fsm_transition",
+                {
+                    "from": current_state.value,
+                    "to": next_state.value,
+                    "trigger": trigger_tool_name,
+                },
+            )
         return next_state.value
 
     async def trigger_agent_turn(
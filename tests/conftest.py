@@ -25,6 +25,16 @@ os.environ.setdefault(
     f"sqlite:///{_TEST_SESSION_DB_PATH.as_posix()}",
 )
 
+# Keep log files and failure artifacts out of the repository's logs/ directory.
+_TEST_LOGS_DIR = Path(tempfile.mkdtemp(prefix="agileforge-test-logs-"))
+failure_artifacts = importlib.import_module("utils.failure_artifacts")
+logging_config = importlib.import_module("utils.logging_config")
+failure_artifacts.LOGS_DIR = _TEST_LOGS_DIR
+failure_artifacts.FAILURES_DIR = _TEST_LOGS_DIR / "failures"
+logging_config.LOGS_DIR = _TEST_LOGS_DIR
+logging_config.APP_LOG_PATH = _TEST_LOGS_DIR / "app.log"
+logging_config.ERROR_LOG_PATH = _TEST_LOGS_DIR / "error.log"
+
 from models.core import Team, TeamMember  # noqa: E402
 
 model_config = importlib.import_module("utils.model_config")
@@ -102,6 +112,7 @@ def patch_get_engine_globally(
     # These need explicit patching because they import at module load time
     modules_to_patch = [
         "api",
+        "repositories.content_blobs",
         "repositories.product",
         "repositories.story",
         "orchestrator_agent.agent_tools.product_vision_tool.tools",
@@ -131,3 +142,15 @@ def session(engine: Engine) -> Iterator[Session]:  # pylint: disable=redefined-o
     # Use _session to avoid redefining the 'session' fixture name
     with Session(engine) as _session:
         yield _session
+
+
+@pytest.fixture(autouse=True)
+def _isolate_failure_artifacts(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Write each test's failure artifacts under its own ``tmp_path``."""
+    monkeypatch.setattr(failure_artifacts, "LOGS_DIR", tmp_path / "logs")
+    monkeypatch.setattr(
+        failure_artifacts, "FAILURES_DIR", tmp_path / "logs" / "failures"
+    )
@@ -0,0 +1,104 @@
+"""Tests for the lazy agent registry."""
+
+from __future__ import annotations
+
+import ast
+import sys
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from orchestrator_agent.agent_registry import (
+    AgentRegistry,
+    UnknownAgentError,
+    root_agent_getattr,
+)
+from utils.runtime_metrics import RuntimeMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def fake_agent_module() -> Iterator[list[object]]:
+    """Register an importable module whose factory records each build."""
+    built: list[object] = []
+    module = types.ModuleType("fake_agent_module")
+
+    def create_fake_agent() -> object:
+        agent = types.SimpleNamespace(name=f"fake-{len(built)}")
+        built.append(agent)
+        return agent
+
+    module.__dict__["create_fake_agent"] = create_fake_agent
+    sys.modules["fake_agent_module"] = module
+    yield built
+    del sys.modules["fake_agent_module"]
+
+
+def _registry(metrics: RuntimeMetrics | None = None) -> AgentRegistry:
+    return AgentRegistry(
+        {"fake": "fake_agent_module:create_fake_agent"},
+        metrics=metrics or RuntimeMetrics(),
+    )
+
+
+def test_get_builds_once_and_caches(fake_agent_module: list[object]) -> None:
+    """Verify the factory runs on first use only."""
+    metrics = RuntimeMetrics()
+    registry = _registry(metrics)
+
+    assert registry.is_built("fake") is False
+    first = registry.get("fake")
+
+    assert registry.get("fake") is first
+    assert fake_agent_module == [first]
+    assert "agent_registry.build_ms{agent=fake}" in metrics.snapshot()["timings"]
+
+
+def test_prewarm_builds_requested_agents(fake_agent_module: list[object]) -> None:
+    """Verify prewarm builds eagerly and reports per-agent timings."""
+    registry = _registry()
+
+    timings = registry.prewarm()
+
+    assert set(timings) == {"fake"}
+    assert registry.is_built("fake") is True
+    assert len(fake_agent_module) == 1
+    registry.reset()
+    assert registry.is_built("fake") is False
+
+
+def test_unknown_agent_name_raises() -> None:
+    """Verify typos surface as a registry error instead of a late import error."""
+    with pytest.raises(UnknownAgentError, match="Unknown agent 'nope'"):
+        _registry().get("nope")
+
+
+def test_root_agent_getattr_resolves_only_root_agent() -> None:
+    """Verify the module hook keeps other missing attributes as AttributeError."""
+    getattr_hook = root_agent_getattr("fake", "some.module")
+
+    with pytest.raises(AttributeError, match=r"some\.module"):
+        getattr_hook("model")
+
+
+def test_services_do_not_import_agent_singletons() -> None:
+    """Verify module-level imports never pull in an eagerly built agent."""
+    paths = [
+        *(ROOT / "services").rglob("*.py"),
+        *(ROOT / "orchestrator_agent" / "fsm").rglob("*.py"),
+        ROOT / "api.py",
+    ]
+    offenders = [
+        str(path.relative_to(ROOT))
+        for path in paths
+        for node in ast.parse(path.read_text(encoding="utf-8")).body
+        if isinstance(node, ast.ImportFrom)
+        and any(alias.name == "root_agent" for alias in node.names)
+    ]
+    assert offenders == []
@@ -7,11 +7,12 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import create_engine, text
-from sqlmodel import SQLModel
+from sqlmodel import Session, SQLModel
 
 import services.agent_workbench.application as application_mod
 from db.migrations import ensure_schema_current
 from models import db as model_db
+from models.core import Product
 from services.agent_workbench.application import AgentWorkbenchApplication
 from services.agent_workbench.mutation_ledger import (
     MutationLedgerRepository,
@@ -764,3 +765,50 @@ def test_mutation_ledger_repository_reports_missing_recovery_linkage_columns(
             "superseded_by_mutation_event_id",
         ]
     }
+
+
+class _FakeStoryWorkflow:
+    """Workflow service serving one pending roadmap requirement."""
+
+    def get_session_status(self, session_id: str) -> dict[str, Any]:
+        """Return a roadmap with one requirement and no stories."""
+        assert session_id == str(PROJECT_ID)
+        return {
+            "roadmap_releases": [{"theme": "M1", "items": ["Requirement A"]}],
+            "story_saved": {},
+        }
+
+    def update_session_status(self, session_id: str, state: dict[str, Any]) -> None:
+        """Accept persisted state."""
+
+
+def test_application_story_generate_batch_reports_each_requirement(
+    engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Report agent errors per requirement and reject unknown projects."""
+    with Session(engine) as session:
+        session.add(Product(product_id=PROJECT_ID, name="Batch"))
+        session.commit()
+
+    async def failing_story_agent(*_args: object, **_kwargs: object) -> None:
+        message = "provider unavailable"
+        raise RuntimeError(message)
+
+    monkeypatch.setattr(application_mod, "get_engine", lambda: engine)
+    monkeypatch.setattr("services.workflow.WorkflowService", _FakeStoryWorkflow)
+    monkeypatch.setattr(
+        "services.story_runtime.run_story_agent_from_state",
+        failing_story_agent,
+    )
+    app = AgentWorkbenchApplication()
+
+    result = app.story_generate_batch(project_id=PROJECT_ID, max_concurrency=2)
+    missing = app.story_generate_batch(project_id=PROJECT_ID + 1)
+
+    assert result["ok"] is True
+    assert result["data"]["failed_count"] == 1
+    assert result["data"]["items"][0]["parent_requirement"] == "Requirement A"
+    assert result["data"]["items"][0]["error"] == "provider unavailable"
+    assert missing["ok"] is False
+    assert missing["errors"][0]["code"] == "PROJECT_NOT_FOUND"
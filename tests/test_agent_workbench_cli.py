@@ -180,6 +180,20 @@ class _FakeApplication:
             "errors": [],
         }
 
+    def story_generate_batch(
+        self,
+        *,
+        project_id: int,
+        max_concurrency: int | None = None,
+    ) -> JsonObject:
+        """Return a batch story generation payload."""
+        call: JsonObject = {
+            "project_id": project_id,
+            "max_concurrency": max_concurrency,
+        }
+        self.calls.append(("story_generate_batch", call))
+        return {"ok": True, "data": call, "warnings": [], "errors": []}
+
     def sprint_candidates(self, *, project_id: int) -> JsonObject:
         """Return a sprint candidates payload."""
         self.calls.append(("sprint_candidates", {"project_id": project_id}))
@@ -190,6 +204,38 @@ class _FakeApplication:
             "errors": [],
         }
 
+    def sprint_packets(
+        self,
+        *,
+        project_id: int,
+        sprint_id: int,
+        output: str | None = None,
+        bundle_format: str = "ndjson",
+        flavor: str | None = None,
+    ) -> JsonObject:
+        """Return a sprint packet bundle payload."""
+        call: JsonObject = {
+            "project_id": project_id,
+            "sprint_id": sprint_id,
+            "output": output,
+            "bundle_format": bundle_format,
+            "flavor": flavor,
+        }
+        self.calls.append(("sprint_packets", call))
+        return {"ok": True, "data": call, "warnings": [], "errors": []}
+
+    def changes(
+        self,
+        *,
+        since: int = 0,
+        project_id: int | None = None,
+        limit: int = 500,
+    ) -> JsonObject:
+        """Return a change-log page payload."""
+        call: JsonObject = {"since": since, "project_id": project_id, "limit": limit}
+        self.calls.append(("changes", call))
+        return {"ok": True, "data": call, "warnings": [], "errors": []}
+
     def context_pack(
         self,
         *,
@@ -1021,11 +1067,54 @@ def test_packaged_project_exposes_api_module_from_other_cwd(
             "agileforge story show",
             ("story_show", {"story_id": STORY_ID}),
         ),
+        (
+            [
+                "story",
+                "generate-batch",
+                "--project-id",
+                str(PROJECT_ID),
+                "--max-concurrency",
+                "3",
+            ],
+            "agileforge story generate-batch",
+            (
+                "story_generate_batch",
+                {"project_id": PROJECT_ID, "max_concurrency": 3},
+            ),
+        ),
         (
             ["sprint", "candidates", "--project-id", str(PROJECT_ID)],
             "agileforge sprint candidates",
             ("sprint_candidates", {"project_id": PROJECT_ID}),
         ),
+        (
+            [
+                "sprint",
+                "packets",
+                "--project-id",
+                str(PROJECT_ID),
+                "--sprint-id",
+                "2",
+                "--format",
+                "tar",
+            ],
+            "agileforge sprint packets",
+            (
+                "sprint_packets",
+                {
+                    "project_id": PROJECT_ID,
+                    "sprint_id": 2,
+                    "output": None,
+                    "bundle_format": "tar",
+                    "flavor": None,
+                },
+            ),
+        ),
+        (
+            ["changes", "--since", "42", "--project-id", str(PROJECT_ID)],
+            "agileforge changes",
+            ("changes", {"since": 42, "project_id": PROJECT_ID, "limit": 500}),
+        ),
         (
             [
                 "context",
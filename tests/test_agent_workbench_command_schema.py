@@ -40,6 +40,7 @@ EXPECTED_PHASE_2A_COMMAND_NAMES = {
 EXPECTED_PHASE_2B_COMMAND_NAMES = {
     "agileforge project create",
     "agileforge project setup retry",
+    "agileforge story generate-batch",
 }
 
 EXPECTED_PHASE_1_INPUTS = {
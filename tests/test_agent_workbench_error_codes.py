@@ -17,6 +17,7 @@ EXPECTED_ERROR_METADATA = {
     ErrorCode.PROJECT_NOT_FOUND: (4, False),
     ErrorCode.PROJECT_ALREADY_EXISTS: (2, False),
     ErrorCode.STORY_NOT_FOUND: (4, False),
+    ErrorCode.SPRINT_NOT_FOUND: (4, False),
     ErrorCode.SPEC_VERSION_NOT_FOUND: (4, False),
     ErrorCode.SPEC_FILE_NOT_FOUND: (2, False),
     ErrorCode.SPEC_FILE_INVALID: (2, False),
@@ -7,6 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 import api as api_module
+from utils.runtime_metrics import RuntimeMetrics
 
 HTTP_OK = 200
 HTTP_TEMP_REDIRECT = 307
@@ -50,6 +51,10 @@ class DummyProductRepository:
         """Return all known products."""
         return list(self.products)
 
+    def list_summaries(self) -> list[DummyProduct]:
+        """Return all known products as list-view rows."""
+        return list(self.products)
+
     def get_by_id(self, product_id: int) -> DummyProduct | None:
         """Return the product matching the provided ID."""
         for product in self.products:
@@ -80,6 +85,7 @@ class DummyWorkflowService:
         self.states: dict[str, dict[str, object]] = {}
         self.single_calls: list[str] = []
         self.batch_calls: list[list[str]] = []
+        self.update_calls: list[dict[str, object]] = []
 
     async def initialize_session(self, session_id: str | None = None) -> str:
         """Create a session with the setup-required FSM state."""
@@ -104,16 +110,27 @@ class DummyWorkflowService:
             for session_id in normalized
         }
 
+    def get_session_status_with_version(
+        self, session_id: str
+    ) -> tuple[dict[str, object], int]:
+        """Return the stored state with a fixed compare-and-swap version."""
+        return self.get_session_status(session_id), 0
+
     def update_session_status(
         self,
         session_id: str,
         partial_update: dict[str, object],
-    ) -> None:
+        *,
+        expected_version: int | None = None,
+    ) -> int:
         """Merge a partial state update into the stored session state."""
+        del expected_version
+        self.update_calls.append(dict(partial_update))
         sid = str(session_id)
         current = dict(self.states.get(sid, {}))
         current.update(partial_update)
         self.states[sid] = current
+        return 0
 
     def migrate_legacy_setup_state(self) -> int:
         """Normalize legacy routing-mode sessions to setup-required."""
@@ -449,6 +466,32 @@ def test_state_forces_setup_required_when_product_missing_spec(
     assert payload["data"]["setup_status"] == "failed"
 
 
+def test_get_project_state_writes_only_changed_normalization(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Polling the state endpoint must not rewrite unchanged session state."""
+    client, repo, workflow = _build_client(monkeypatch)
+    metrics = RuntimeMetrics()
+    monkeypatch.setattr(api_module, "runtime_metrics", metrics)
+
+    product = repo.create("Legacy")
+    workflow.states[str(product.product_id)] = {
+        "fsm_state": "VISION_REVIEW",
+        "setup_status": "passed",
+    }
+
+    first = client.get(f"/api/projects/{product.product_id}/state")
+    second = client.get(f"/api/projects/{product.product_id}/state")
+
+    assert first.json() == second.json()
+    assert len(workflow.update_calls) == 1
+    assert workflow.update_calls[0]["fsm_state"] == "SETUP_REQUIRED"
+    assert "setup_failure_artifact_id" in workflow.update_calls[0]
+    counters = metrics.snapshot()["counters"]
+    assert counters["session_state.writes{source=project_state}"] == 1
+    assert counters["session_state.writes_skipped{source=project_state}"] == 1
+
+
 def test_create_project_auto_vision_failure_is_recorded(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -404,3 +404,41 @@ async def test_delete_project_story(
     assert reset_attempt["classification"] == "reset_marker"
     assert "state reset by user" in reset_attempt["summary"]
     assert "another_req" in final_state
+
+
+@pytest.mark.asyncio
+async def test_delete_project_story_bumps_structure_version(
+    session: Session,
+    setup_test_data: DeleteStoryData,
+    monkeypatch: pytest.MonkeyPatch,
+    engine: Engine,
+) -> None:
+    """The bulk story delete invalidates the project structure summary."""
+    monkeypatch.setattr(api_module, "get_engine", lambda: engine)
+    monkeypatch.setattr(api_module.product_repo, "_get_session", lambda: session)
+    monkeypatch.setattr("agile_sqlmodel.get_engine", lambda: engine)
+
+    async def mock_ensure_session(_sid: str) -> dict[str, Any]:
+        return {}
+
+    monkeypatch.setattr(api_module, "_ensure_session", mock_ensure_session)
+    monkeypatch.setattr(api_module, "_save_session_state", lambda _sid, _state: None)
+    product_id = setup_test_data.product_id
+    product = session.get(Product, product_id)
+    assert product is not None
+    version = product.structure_version
+
+    async with AsyncClient(
+        transport=httpx.ASGITransport(app=api_module.app),
+        base_url="http://test",
+    ) as client:
+        response = await client.delete(
+            f"/api/projects/{product_id}/story",
+            params={"parent_requirement": setup_test_data.parent_requirement},
+        )
+
+    assert response.status_code == HTTP_OK
+    session.expire_all()
+    product = session.get(Product, product_id)
+    assert product is not None
+    assert product.structure_version == version + 1
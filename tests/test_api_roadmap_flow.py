@@ -84,16 +84,26 @@ class DummyWorkflowService:
         """Return a shallow copy of the stored session state."""
         return dict(self.states.get(str(session_id), {}))
 
+    def get_session_status_with_version(
+        self, session_id: str
+    ) -> tuple[dict[str, object], int]:
+        """Return the stored state with a fixed compare-and-swap version."""
+        return self.get_session_status(session_id), 0
+
     def update_session_status(
         self,
         session_id: str,
         partial_update: dict[str, object],
-    ) -> None:
+        *,
+        expected_version: int | None = None,
+    ) -> int:
         """Merge a partial state update into the stored session state."""
+        del expected_version
         sid = str(session_id)
         current = dict(self.states.get(sid, {}))
         current.update(partial_update)
         self.states[sid] = current
+        return 0
 
     def migrate_legacy_setup_state(self) -> int:
         """Pretend there are no legacy sessions to migrate."""
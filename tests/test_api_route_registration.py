@@ -26,6 +26,7 @@ def test_manual_sprint_execution_and_packet_routes_are_registered() -> None:
             "/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet",
             ("GET",),
         ),
+        ("/api/projects/{project_id}/sprints/{sprint_id}/packets", ("GET",)),
         (
             "/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/execution",
             ("GET",),
@@ -68,6 +69,7 @@ def test_manual_sprint_router_module_registers_routes() -> None:
         post_sprint_close=_sync_stub,
         get_project_task_packet=_async_stub,
         get_project_story_packet=_async_stub,
+        get_project_sprint_packet_bundle=_async_stub,
         get_task_execution=_sync_stub,
         post_task_execution=_sync_stub,
         get_story_close=_sync_stub,
@@ -91,6 +93,7 @@ def test_manual_sprint_router_module_registers_routes() -> None:
             "/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet",
             ("GET",),
         ),
+        ("/api/projects/{project_id}/sprints/{sprint_id}/packets", ("GET",)),
         (
             "/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/execution",
             ("GET",),
@@ -121,6 +124,8 @@ def test_sprint_router_module_registers_full_sprint_surface() -> None:
         app,
         get_project_sprint_candidates=_async_stub,
         generate_project_sprint=_async_stub,
+        stream_project_sprint_generation=_async_stub,
+        submit_project_sprint_job=_async_stub,
         get_project_sprint_history=_async_stub,
         reset_project_sprint_planner=_async_stub,
         list_project_sprints=_async_stub,
@@ -131,6 +136,7 @@ def test_sprint_router_module_registers_full_sprint_surface() -> None:
         post_sprint_close=_sync_stub,
         get_project_task_packet=_async_stub,
         get_project_story_packet=_async_stub,
+        get_project_sprint_packet_bundle=_async_stub,
         get_task_execution=_sync_stub,
         post_task_execution=_sync_stub,
         get_story_close=_sync_stub,
@@ -146,6 +152,8 @@ def test_sprint_router_module_registers_full_sprint_surface() -> None:
     expected = {
         ("/api/projects/{project_id}/sprint/candidates", ("GET",)),
         ("/api/projects/{project_id}/sprint/generate", ("POST",)),
+        ("/api/projects/{project_id}/sprint/generate/stream", ("POST",)),
+        ("/api/projects/{project_id}/sprint/generate/jobs", ("POST",)),
         ("/api/projects/{project_id}/sprint/history", ("GET",)),
         ("/api/projects/{project_id}/sprint/planner/reset", ("POST",)),
         ("/api/projects/{project_id}/sprint/save", ("POST",)),
@@ -162,6 +170,7 @@ def test_sprint_router_module_registers_full_sprint_surface() -> None:
             "/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet",
             ("GET",),
         ),
+        ("/api/projects/{project_id}/sprints/{sprint_id}/packets", ("GET",)),
         (
             "/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/execution",
             ("GET",),
@@ -1,12 +1,18 @@
 """API tests for sprint setup, candidates, and generation flow."""
 
+import io
+import json
+import tarfile
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
 import api as api_module
@@ -24,6 +30,11 @@ from agile_sqlmodel import (
     WorkflowEventType,
 )
 from models.core import Team
+from models.packets import PacketCacheEntry
+from services.agent_workbench.sprint_packets import write_sprint_packet_bundle
+from services.packets import packet_builder
+from services.packets.packet_builder import build_story_task_plan
+from services.packets.packet_cache import packet_cache
 from tools.spec_tools import _compute_story_input_hash
 from utils.spec_schemas import (
     AlignmentFinding,
@@ -42,6 +53,7 @@ from utils.task_metadata import (
 )
 
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
 HTTP_CONFLICT = 409
 HTTP_NOT_FOUND = 404
 HTTP_UNPROCESSABLE = 422
@@ -142,15 +154,24 @@ class DummyWorkflowService:  # noqa: D101
     def get_session_status(self, session_id: str) -> dict[str, object]:  # noqa: D102
         return dict(self.states.get(str(session_id), {}))
 
+    def get_session_status_with_version(  # noqa: D102
+        self, session_id: str
+    ) -> tuple[dict[str, object], int]:
+        return self.get_session_status(session_id), 0
+
     def update_session_status(  # noqa: D102
         self,
         session_id: str,
         partial_update: dict[str, object],
-    ) -> None:
+        *,
+        expected_version: int | None = None,
+    ) -> int:
+        del expected_version
         sid = str(session_id)
         current = dict(self.states.get(sid, {}))
         current.update(partial_update)
         self.states[sid] = current
+        return 0
 
     def migrate_legacy_setup_state(self) -> int:  # noqa: D102
         return 0
@@ -1251,6 +1272,53 @@ def test_list_sprints_returns_saved_sprints_newest_first(session, monkeypatch):
     assert "selected_stories" not in payload["data"]["items"][0]
 
 
+def test_list_sprints_counts_stories_and_tasks_without_loading_graph(  # noqa: D103
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id = _seed_saved_sprint(
+        session,
+        repo,
+        started=True,
+        created_title="Aggregate Sprint",
+    )
+    story = session.exec(
+        select(UserStory).where(UserStory.product_id == project_id)
+    ).first()
+    assert story is not None
+    for description, status in (
+        ("Done task", TaskStatus.DONE),
+        ("Cancelled task", TaskStatus.CANCELLED),
+        ("Open task", TaskStatus.TO_DO),
+    ):
+        session.add(
+            Task(description=description, story_id=story.story_id, status=status)
+        )
+    session.commit()
+
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        list_response = client.get(f"/api/projects/{project_id}/sprints")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    detail_response = client.get(f"/api/projects/{project_id}/sprints/{sprint_id}")
+
+    assert list_response.status_code == 200  # noqa: PLR2004
+    item = list_response.json()["data"]["items"][0]
+    assert item["story_count"] == 1
+    assert item["task_progress"] == {"total": 3, "done": 1, "cancelled": 1}
+    detail = detail_response.json()["data"]["sprint"]
+    assert detail["task_progress"] == item["task_progress"]
+    assert detail["story_count"] == item["story_count"]
+    assert not [sql for sql in statements if "FROM user_stories" in sql]
+
+
 def test_start_sprint_sets_started_at_once_and_logs_event(session, monkeypatch):  # noqa: ANN001, ANN201, D103
     client, repo, _workflow = _build_client(monkeypatch)
     project_id, sprint_id = _seed_saved_sprint(
@@ -1664,8 +1732,8 @@ def test_build_story_task_plan_orders_identical_descriptions_by_task_id(  # noqa
         SimpleNamespace(tasks=[first_task, second_task]),
     )
 
-    reversed_plan = api_module._build_story_task_plan(reversed_story)
-    forward_plan = api_module._build_story_task_plan(forward_story)
+    reversed_plan = build_story_task_plan(reversed_story)
+    forward_plan = build_story_task_plan(forward_story)
     payload = client.get(
         f"/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet"
     ).json()["data"]
@@ -1675,7 +1743,7 @@ def test_build_story_task_plan_orders_identical_descriptions_by_task_id(  # noqa
         second_task.task_id,
     ]
     assert reversed_plan == forward_plan
-    assert api_module._hash_payload(reversed_plan) == api_module._hash_payload(
+    assert packet_builder._hash_payload(reversed_plan) == packet_builder._hash_payload(
         forward_plan
     )
     assert [item["id"] for item in payload["task_plan"]["tasks"]] == [
@@ -2077,3 +2145,236 @@ def test_get_sprint_detail_returns_task_objects(session, monkeypatch):  # noqa:
     assert isinstance(non_executable_task, dict)
     assert non_executable_task["checklist_items"] == []
     assert non_executable_task["is_executable"] is False
+
+
+def _without_generated_at(packet: dict[str, Any]) -> dict[str, Any]:
+    metadata = {
+        key: value
+        for key, value in packet["metadata"].items()
+        if key != "generated_at"
+    }
+    return {**packet, "metadata": metadata}
+
+
+def test_sprint_packet_bundle_streams_every_packet_with_one_artifact_parse(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the NDJSON bundle matches single packets and parses authority once."""
+    client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id, story_id, task_id = _seed_task_packet_context(
+        session,
+        repo,
+        pinned=True,
+        task_metadata=TaskMetadata(
+            task_kind="implementation",
+            artifact_targets=["payload validator"],
+            workstream_tags=["backend"],
+            relevant_invariant_ids=["INV-0123456789abcdef"],
+            checklist_items=["Reject missing user_id"],
+        ),
+    )
+    second_task = Task(
+        description="Document payload validation contract",
+        story_id=story_id,
+        metadata_json=serialize_task_metadata(canonical_task_metadata()),
+    )
+    session.add(second_task)
+    session.commit()
+    second_task_id = _require_id(second_task.task_id, "task_id")
+
+    parses: list[object] = []
+    real_load = packet_builder.load_compiled_artifact
+
+    def counting_load(authority: object) -> object:
+        parses.append(authority)
+        return real_load(authority)
+
+    monkeypatch.setattr(packet_builder, "load_compiled_artifact", counting_load)
+
+    response = client.get(f"/api/projects/{project_id}/sprints/{sprint_id}/packets")
+
+    assert response.status_code == HTTP_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    packets = [json.loads(line) for line in response.text.splitlines()]
+    assert [packet["schema_version"] for packet in packets] == [
+        "story_packet.v1",
+        "task_packet.v2",
+        "task_packet.v2",
+    ]
+    assert [packet["task"]["task_id"] for packet in packets[1:]] == [
+        task_id,
+        second_task_id,
+    ]
+    assert len(parses) == 1
+    assert packets[1]["constraints"]["task_hard_constraints"][0]["invariant_id"] == (
+        "INV-0123456789abcdef"
+    )
+
+    story_packet = client.get(
+        f"/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet"
+    ).json()["data"]
+    task_packet = client.get(
+        f"/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/packet"
+    ).json()["data"]
+    assert _without_generated_at(packets[0]) == _without_generated_at(story_packet)
+    assert _without_generated_at(packets[1]) == _without_generated_at(task_packet)
+
+
+def test_sprint_packet_bundle_tarball_includes_rendered_prompts(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the tarball holds packet JSON plus rendered prompts per packet."""
+    client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id, story_id, task_id = _seed_task_packet_context(
+        session, repo, pinned=False
+    )
+
+    response = client.get(
+        f"/api/projects/{project_id}/sprints/{sprint_id}/packets",
+        params={"format": "tar", "flavor": "cursor"},
+    )
+
+    assert response.status_code == HTTP_OK
+    assert response.headers["content-type"] == "application/gzip"
+    root = f"sprint-{sprint_id}-packets"
+    with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as archive:
+        names = set(archive.getnames())
+        task_member = archive.extractfile(f"{root}/tasks/task-{task_id}.json")
+        assert task_member is not None
+        task_packet = json.loads(task_member.read())
+    assert names == {
+        f"{root}/stories/story-{story_id}.json",
+        f"{root}/stories/story-{story_id}.md",
+        f"{root}/tasks/task-{task_id}.json",
+        f"{root}/tasks/task-{task_id}.md",
+    }
+    assert task_packet["task"]["task_id"] == task_id
+    assert "render" in task_packet
+
+    missing = client.get(f"/api/projects/{project_id}/sprints/999999/packets")
+    assert missing.status_code == HTTP_NOT_FOUND
+    assert missing.json()["detail"] == "Sprint not found"
+
+
+def test_workbench_sprint_packets_writes_bundle_file(
+    engine: Engine,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify the workbench command writes the bundle and reports its counts."""
+    _client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id, story_id, _task_id = _seed_task_packet_context(
+        session, repo, pinned=True
+    )
+    output = tmp_path / "bundle.ndjson"
+
+    result = write_sprint_packet_bundle(
+        engine=engine,
+        project_id=project_id,
+        sprint_id=sprint_id,
+        output=str(output),
+    )
+
+    assert result["ok"] is True
+    assert result["data"]["packet_count"] == 2  # noqa: PLR2004
+    assert result["data"]["bytes_written"] == output.stat().st_size
+    first = json.loads(output.read_text(encoding="utf-8").splitlines()[0])
+    assert first["story"]["story_id"] == story_id
+
+    missing = write_sprint_packet_bundle(
+        engine=engine,
+        project_id=project_id,
+        sprint_id=999999,
+        output=str(tmp_path / "missing.ndjson"),
+    )
+    assert missing["ok"] is False
+    assert missing["errors"][0]["code"] == "SPRINT_NOT_FOUND"
+
+
+def test_task_packet_is_cached_and_revalidated_by_fingerprint(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify task packets are reused until a source row changes, with 304s."""
+    client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id, _story_id, task_id = _seed_task_packet_context(
+        session, repo, pinned=True
+    )
+    builds: list[int] = []
+    real_build = api_module._build_task_packet
+
+    def counting_build(*args: Any, **kwargs: Any) -> dict[str, Any] | None:  # noqa: ANN401
+        builds.append(kwargs["task_id"])
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(api_module, "_build_task_packet", counting_build)
+    url = f"/api/projects/{project_id}/sprints/{sprint_id}/tasks/{task_id}/packet"
+
+    first = client.get(url)
+    second = client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == HTTP_OK
+    assert second.json() == first.json()
+    assert second.headers["etag"] == etag
+    assert len(builds) == 1
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == HTTP_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert len(builds) == 1
+
+    task = session.get(Task, task_id)
+    assert task is not None
+    task.description = "Validate payloads before they reach the handler"
+    session.add(task)
+    session.commit()
+
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == HTTP_OK
+    assert changed.headers["etag"] != etag
+    assert changed.json()["data"]["task"]["description"] == task.description
+    assert len(builds) == 2  # noqa: PLR2004
+
+    client.get(url, params={"flavor": "cursor"})
+    assert len(builds) == 3  # noqa: PLR2004
+
+
+def test_story_packet_cache_tracks_team_rename_and_persists_to_sqlite(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify denormalized names invalidate the cache and the SQLite tier reloads."""
+    monkeypatch.setenv("AGILEFORGE_PACKET_CACHE", "sqlite")
+    client, repo, _workflow = _build_client(monkeypatch)
+    project_id, sprint_id, story_id, _task_id = _seed_task_packet_context(
+        session, repo, pinned=False
+    )
+    builds: list[int] = []
+    real_build = api_module._build_story_packet
+
+    def counting_build(*args: Any, **kwargs: Any) -> dict[str, Any] | None:  # noqa: ANN401
+        builds.append(kwargs["story_id"])
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(api_module, "_build_story_packet", counting_build)
+    url = f"/api/projects/{project_id}/sprints/{sprint_id}/stories/{story_id}/packet"
+
+    first = client.get(url)
+    assert first.status_code == HTTP_OK
+    entry = session.exec(select(PacketCacheEntry)).one()
+    assert first.headers["etag"] == f'"{entry.fingerprint}"'
+
+    packet_cache.clear()
+    assert client.get(url).json() == first.json()
+    assert len(builds) == 1
+
+    team = session.exec(select(Team)).one()
+    team.name = "Renamed Packet Team"
+    session.add(team)
+    session.commit()
+
+    renamed = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert renamed.status_code == HTTP_OK
+    assert renamed.json()["data"]["context"]["sprint"]["team_name"] == (
+        "Renamed Packet Team"
+    )
+    assert len(builds) == 2  # noqa: PLR2004
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any
@@ -51,10 +52,21 @@ class DummyWorkflowService:  # noqa: D101
     def get_session_status(self, session_id: str):  # noqa: ANN201, D102
         return dict(self.states.get(str(session_id), {}))
 
-    def update_session_status(self, session_id: str, partial_update):  # noqa: ANN001, ANN201, D102
+    def get_session_status_with_version(self, session_id: str):  # noqa: ANN201, D102
+        return self.get_session_status(session_id), 0
+
+    def update_session_status(  # noqa: ANN201, D102
+        self,
+        session_id: str,
+        partial_update,  # noqa: ANN001
+        *,
+        expected_version: int | None = None,
+    ):
+        del expected_version
         current = dict(self.states.get(str(session_id), {}))
         current.update(partial_update)
         self.states[str(session_id)] = current
+        return 0
 
     def migrate_legacy_setup_state(self) -> int:  # noqa: D102
         return 0
@@ -1260,3 +1272,121 @@ def test_story_pending_returns_pending_after_reset_clears_working_state(monkeypa
     assert requirement["requirement"] == "Requirement A"
     assert requirement["status"] == "Pending"
     assert requirement["attempt_count"] == 1
+
+
+def test_story_generate_batch_drafts_all_pending_requirements(monkeypatch):  # noqa: ANN001, ANN201, D103
+    client, repo, workflow = _build_client(monkeypatch)
+    product = repo.create("Story Project")
+    workflow.states[str(product.product_id)] = {
+        "fsm_state": "STORY_INTERVIEW",
+        "roadmap_releases": [{"items": ["Requirement A", "Requirement B"]}],
+        "story_saved": {"Requirement A": True},
+    }
+    called: list[str] = []
+
+    async def fake_run_story_agent_from_state(  # noqa: ANN202
+        state,  # noqa: ANN001, ARG001
+        *,
+        project_id,  # noqa: ANN001, ARG001
+        parent_requirement,  # noqa: ANN001
+        user_input,  # noqa: ANN001, ARG001
+    ):
+        called.append(parent_requirement)
+        return {
+            "success": True,
+            "input_context": {},
+            "output_artifact": _story_artifact(parent_requirement, "Story B"),
+            "classification": "reusable_content_result",
+            "draft_kind": "complete_draft",
+            "is_reusable": True,
+            "is_complete": True,
+            "request_payload": {"parent_requirement": parent_requirement},
+            "error": None,
+        }
+
+    monkeypatch.setattr(
+        api_module, "run_story_agent_from_state", fake_run_story_agent_from_state
+    )
+
+    response = client.post(
+        f"/api/projects/{product.product_id}/story/generate_batch",
+        json={"max_concurrency": 2},
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    data = response.json()["data"]
+    assert called == ["Requirement B"]
+    assert data["max_concurrency"] == 2  # noqa: PLR2004
+    assert data["items"][0]["parent_requirement"] == "Requirement B"
+    assert data["items"][0]["status"] == "generated"
+    state = workflow.states[str(product.product_id)]
+    assert state["story_outputs"]["Requirement B"]["user_stories"]
+
+
+def test_story_generate_batch_stream_reports_each_requirement(monkeypatch):  # noqa: ANN001, ANN201, D103
+    client, repo, workflow = _build_client(monkeypatch)
+    product = repo.create("Story Project")
+    workflow.states[str(product.product_id)] = {
+        "fsm_state": "STORY_INTERVIEW",
+        "roadmap_releases": [{"items": ["Requirement A", "Requirement B"]}],
+    }
+
+    async def fake_run_story_agent_from_state(  # noqa: ANN202
+        state,  # noqa: ANN001, ARG001
+        *,
+        project_id,  # noqa: ANN001, ARG001
+        parent_requirement,  # noqa: ANN001
+        user_input,  # noqa: ANN001, ARG001
+    ):
+        return {
+            "success": True,
+            "input_context": {},
+            "output_artifact": _story_artifact(parent_requirement, "Story"),
+            "classification": "reusable_content_result",
+            "draft_kind": "complete_draft",
+            "is_reusable": True,
+            "is_complete": True,
+            "request_payload": {"parent_requirement": parent_requirement},
+            "error": None,
+        }
+
+    monkeypatch.setattr(
+        api_module, "run_story_agent_from_state", fake_run_story_agent_from_state
+    )
+
+    response = client.post(
+        f"/api/projects/{product.product_id}/story/generate_batch/stream",
+        json={"max_concurrency": 1},
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    events = [
+        (lines["event"], json.loads(lines["data"]))
+        for lines in (
+            dict(line.split(": ", 1) for line in frame.splitlines())
+            for frame in response.text.strip().split("\n\n")
+        )
+    ]
+    progress = [data for name, data in events if name == "story_batch_progress"]
+    assert [(event["event"], event["parent_requirement"]) for event in progress] == [
+        ("started", "Requirement A"),
+        ("finished", "Requirement A"),
+        ("started", "Requirement B"),
+        ("finished", "Requirement B"),
+    ]
+    assert progress[-1]["completed_count"] == 2  # noqa: PLR2004
+    name, payload = events[-1]
+    assert name == "persisted"
+    assert payload["result"]["data"]["generated_count"] == 2  # noqa: PLR2004
+
+
+def test_story_generate_batch_rejects_out_of_range_concurrency(monkeypatch):  # noqa: ANN001, ANN201, D103
+    client, repo, _workflow = _build_client(monkeypatch)
+    product = repo.create("Story Project")
+
+    response = client.post(
+        f"/api/projects/{product.product_id}/story/generate_batch",
+        json={"max_concurrency": 0},
+    )
+
+    assert response.status_code == 422  # noqa: PLR2004
@@ -1,5 +1,7 @@
 """API tests for vision interview endpoints."""
 
+import json
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Never, Protocol, cast
@@ -9,7 +11,10 @@ from fastapi.testclient import TestClient
 
 import api as api_module
 from orchestrator_agent.agent_tools.product_vision_tool.tools import SaveVisionInput
+from repositories.generation_job import GenerationJobRepository
+from services.generation_jobs import GenerationJobManager
 from utils import failure_artifacts
+from utils.runtime_config import DatabaseTarget
 
 
 @dataclass
@@ -76,14 +81,26 @@ class DummyWorkflowService:
         """Return get session status."""
         return dict(self.states.get(str(session_id), {}))
 
+    def get_session_status_with_version(
+        self, session_id: str
+    ) -> tuple[dict[str, object], int]:
+        """Return the stored state with a fixed compare-and-swap version."""
+        return self.get_session_status(session_id), 0
+
     def update_session_status(
-        self, session_id: str, partial_update: dict[str, object]
-    ) -> None:
+        self,
+        session_id: str,
+        partial_update: dict[str, object],
+        *,
+        expected_version: int | None = None,
+    ) -> int:
         """Return update session status."""
+        del expected_version
         sid = str(session_id)
         current = dict(self.states.get(sid, {}))
         current.update(partial_update)
         self.states[sid] = current
+        return 0
 
     def migrate_legacy_setup_state(self) -> int:
         """Return migrate legacy setup state."""
@@ -331,6 +348,129 @@ def test_generate_error_records_attempt_and_stays_interview(
     assert first_attempt["raw_output_preview"] == '{"partial": true}'
 
 
+def _parse_sse(body: str) -> list[tuple[str, dict[str, object]]]:
+    events: list[tuple[str, dict[str, object]]] = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_generate_stream_emits_progress_and_persisted_result(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the streaming generate route ends with the persisted payload."""
+    client, repo, workflow = _build_client(monkeypatch)
+    project_id = _seed_setup_passed_project(repo, workflow)
+
+    response = client.post(
+        f"/api/projects/{project_id}/vision/generate/stream",
+        json={"user_input": "complete this vision"},
+    )
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(response.text)
+    assert events[0] == ("queued", {"phase": "vision", "project_id": project_id})
+    name, payload = events[-1]
+    assert name == "persisted"
+    result = cast("dict[str, dict[str, object]]", payload["result"])
+    assert result["status"] == "success"
+    assert result["data"]["fsm_state"] == "VISION_REVIEW"
+    assert (
+        len(cast("list[object]", workflow.states[str(project_id)]["vision_attempts"]))
+        == 1
+    )
+
+    metrics = client.get("/api/metrics").json()["data"]
+    assert metrics["timings"]["generation_stream.ttfb_ms{phase=vision}"]["count"] >= 1
+
+
+def test_generate_stream_reports_phase_errors_as_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify phase errors surface as an SSE error event with status."""
+    client, repo, workflow = _build_client(monkeypatch)
+    project_id = _seed_setup_passed_project(repo, workflow)
+    client.post(f"/api/projects/{project_id}/vision/generate", json={})
+
+    response = client.post(
+        f"/api/projects/{project_id}/vision/generate/stream",
+        json={},
+    )
+    assert response.status_code == 200  # noqa: PLR2004
+
+    name, payload = _parse_sse(response.text)[-1]
+    assert name == "error"
+    assert payload["status_code"] == 409  # noqa: PLR2004
+    assert "Feedback is required" in str(payload["detail"])
+
+
+def test_generate_stream_returns_404_for_missing_project(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the streaming route rejects unknown projects before streaming."""
+    client, _repo, _workflow = _build_client(monkeypatch)
+
+    response = client.post("/api/projects/999/vision/generate/stream", json={})
+    assert response.status_code == 404  # noqa: PLR2004
+
+
+def _install_job_manager(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    repository = GenerationJobRepository(
+        DatabaseTarget(
+            source="test",
+            sqlite_url=f"sqlite:///{path.as_posix()}",
+            sqlite_path=path,
+        )
+    )
+    monkeypatch.setattr(
+        api_module, "generation_jobs", GenerationJobManager(repository, max_workers=1)
+    )
+
+
+def test_generate_job_returns_job_id_and_reports_result(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify the job route queues generation and the status route reports it."""
+    client, repo, workflow = _build_client(monkeypatch)
+    _install_job_manager(monkeypatch, tmp_path)
+    project_id = _seed_setup_passed_project(repo, workflow)
+
+    with client:
+        response = client.post(
+            f"/api/projects/{project_id}/vision/generate/jobs",
+            json={"user_input": "complete this vision"},
+        )
+        assert response.status_code == 202  # noqa: PLR2004
+        job = response.json()["data"]
+        assert job["phase"] == "vision"
+        assert job["coalesced"] is False
+
+        status = client.get(f"/api/jobs/{job['job_id']}").json()["data"]
+        for _ in range(100):
+            if status["status"] == "succeeded":
+                break
+            time.sleep(0.01)
+            status = client.get(f"/api/jobs/{job['job_id']}").json()["data"]
+
+    assert status["status"] == "succeeded"
+    assert status["result"]["data"]["fsm_state"] == "VISION_REVIEW"
+    assert workflow.states[str(project_id)]["fsm_state"] == "VISION_REVIEW"
+
+
+def test_get_job_returns_404_for_unknown_job(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify unknown job ids return 404."""
+    client, _repo, _workflow = _build_client(monkeypatch)
+    _install_job_manager(monkeypatch, tmp_path)
+
+    response = client.get("/api/jobs/missing")
+    assert response.status_code == 404  # noqa: PLR2004
+
+
 def test_generate_error_history_stays_compact(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify generate error history stays compact."""
     client, repo, workflow = _build_client(monkeypatch)
@@ -469,6 +609,36 @@ def test_debug_failure_endpoint_returns_full_artifact(
     assert payload["raw_output"] == '{"broken": '
 
 
+def test_debug_failures_endpoint_lists_project_artifacts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify debug failures endpoint pages a project's artifact summaries."""
+    client, repo, workflow = _build_client(monkeypatch)
+    project_id = _seed_setup_passed_project(repo, workflow)
+    monkeypatch.setattr(failure_artifacts, "LOGS_DIR", tmp_path / "logs")
+    monkeypatch.setattr(
+        failure_artifacts, "FAILURES_DIR", tmp_path / "logs" / "failures"
+    )
+    persisted = failure_artifacts.write_failure_artifact(
+        phase="vision",
+        project_id=project_id,
+        failure_stage="invalid_json",
+        failure_summary="Vision response is not valid JSON",
+        raw_output='{"broken": ',
+    )
+
+    response = client.get(f"/api/projects/{project_id}/debug/failures?limit=10")
+    assert response.status_code == 200  # noqa: PLR2004
+    page = response.json()["data"]
+    assert page["total"] == 1
+    artifact_id = persisted["metadata"]["failure_artifact_id"]
+    assert page["items"][0]["artifact_id"] == artifact_id
+    assert "raw_output" not in page["items"][0]
+
+    invalid = client.get(f"/api/projects/{project_id}/debug/failures?limit=0")
+    assert invalid.status_code == 400  # noqa: PLR2004
+
+
 def test_debug_failure_endpoint_rejects_other_project_artifact(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
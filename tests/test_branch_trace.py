@@ -0,0 +1,40 @@
+"""Tests for aggregated branch tracing."""
+
+from __future__ import annotations
+
+from utils.branch_trace import BranchTracer
+
+
+def test_disabled_tracer_passes_conditions_through_without_counting() -> None:
+    """Verify a disabled tracer returns the condition and records nothing."""
+    tracer = BranchTracer()
+
+    assert tracer.enabled is False
+    assert tracer.branch("a", 1) is True
+    assert tracer.branch("a", []) is False
+    assert tracer.counts() == {}
+
+
+def test_enabled_tracer_aggregates_outcomes_into_coverage_summary() -> None:
+    """Verify counts per outcome and the coverage report."""
+    tracer = BranchTracer(enabled=True)
+    for value in (True, True, False):
+        tracer.branch("both", value)
+    tracer.branch("only_true", True)
+    tracer.branch("only_false", False)
+
+    assert tracer.counts() == {
+        "both": (2, 1),
+        "only_false": (0, 1),
+        "only_true": (1, 0),
+    }
+    lines = tracer.summary_lines()
+    assert lines[0] == "Branch coverage: 1/3 branches saw both outcomes"
+    assert any("only_false" in line and "(never true)" in line for line in lines)
+    assert any("only_true" in line and "(never false)" in line for line in lines)
+
+    tracer.enable(False)
+    tracer.branch("both", True)
+    tracer.reset()
+    assert tracer.counts() == {}
+    assert tracer.summary_lines() == ["Branch coverage: no branches recorded"]
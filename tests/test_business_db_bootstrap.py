@@ -11,6 +11,7 @@ from sqlmodel import create_engine
 
 import api as api_module
 from agile_sqlmodel import ensure_business_db_ready
+from utils import failure_artifacts
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -41,7 +42,9 @@ def test_ensure_business_db_ready_creates_core_tables(tmp_path: Path) -> None:
     assert spec_registry is not None
 
 
-def test_api_startup_bootstraps_business_db(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_api_startup_bootstraps_business_db(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     """Verify api startup bootstraps business db."""
     called = {"value": False}
 
@@ -49,6 +52,7 @@ def test_api_startup_bootstraps_business_db(monkeypatch: pytest.MonkeyPatch) ->
         called["value"] = True
 
     monkeypatch.setattr(api_module, "ensure_business_db_ready", _fake_bootstrap)
+    monkeypatch.setattr(failure_artifacts, "FAILURES_DIR", tmp_path / "failures")
 
     with TestClient(api_module.app):
         pass
@@ -5,7 +5,11 @@ from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 from sqlmodel import create_engine
 
-from db.migrations import migrate_performance_indexes
+from db.migrations import (
+    migrate_performance_indexes,
+    migrate_roadmap_hierarchy,
+    migrate_workflow_event_rollups,
+)
 
 
 def _create_min_user_stories_schema(engine: Engine) -> None:
@@ -69,3 +73,94 @@ def test_migrate_performance_indexes_fails_on_non_canonical_equivalent_index() -
     message = str(exc_info.value)
     assert "legacy_user_stories_product_id" in message
     assert "ix_user_stories_product_id" in message
+
+
+def test_migrate_performance_indexes_adds_sprint_product_status_index() -> None:
+    """Verify the sprint list index is created when the sprints table exists."""
+    engine = create_engine("sqlite:///:memory:")
+    _create_min_user_stories_schema(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE sprints (sprint_id INTEGER PRIMARY KEY, "
+                "product_id INTEGER NOT NULL, status VARCHAR NOT NULL)"
+            )
+        )
+
+    actions = migrate_performance_indexes(engine)
+
+    assert "created index: ix_sprints_product_id_status" in actions
+    assert {
+        idx["name"]: idx["column_names"]
+        for idx in inspect(engine).get_indexes("sprints")
+    } == {"ix_sprints_product_id_status": ["product_id", "status"]}
+
+
+def test_migrate_workflow_event_rollups_adds_composite_index_and_table() -> None:
+    """Verify workflow events get the metric index and a rollup table."""
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE workflow_events (event_id INTEGER PRIMARY KEY, "
+                "event_type VARCHAR NOT NULL, timestamp DATETIME NOT NULL, "
+                "duration_seconds FLOAT, turn_count INTEGER, product_id INTEGER, "
+                "event_metadata TEXT)"
+            )
+        )
+
+    actions = migrate_workflow_event_rollups(engine)
+
+    assert actions == [
+        "created index: ix_workflow_events_product_type_timestamp",
+        "created table: workflow_event_rollups",
+        "created index: ix_workflow_event_rollups_product_bucket",
+    ]
+    assert {
+        idx["name"]: idx["column_names"]
+        for idx in inspect(engine).get_indexes("workflow_events")
+    } == {
+        "ix_workflow_events_product_type_timestamp": [
+            "product_id",
+            "event_type",
+            "timestamp",
+        ]
+    }
+    assert migrate_workflow_event_rollups(engine) == []
+
+
+def test_migrate_roadmap_hierarchy_backfills_product_ids_and_indexes() -> None:
+    """Verify legacy epics/features gain product_id and hierarchy indexes."""
+    engine = create_engine("sqlite:///:memory:")
+    _create_min_user_stories_schema(engine)
+    with engine.begin() as conn:
+        for statement in (
+            "CREATE TABLE themes (theme_id INTEGER PRIMARY KEY, "
+            "product_id INTEGER NOT NULL)",
+            "CREATE TABLE epics (epic_id INTEGER PRIMARY KEY, "
+            "theme_id INTEGER NOT NULL)",
+            "CREATE TABLE features (feature_id INTEGER PRIMARY KEY, "
+            "epic_id INTEGER NOT NULL)",
+            "ALTER TABLE user_stories ADD COLUMN feature_id INTEGER",
+            "INSERT INTO themes VALUES (1, 7), (2, 8)",
+            "INSERT INTO epics VALUES (10, 1), (20, 2)",
+            "INSERT INTO features VALUES (100, 10), (200, 20), (201, 20)",
+        ):
+            conn.execute(text(statement))
+
+    actions = migrate_roadmap_hierarchy(engine)
+
+    assert actions == [
+        "added column: epics.product_id",
+        "added column: features.product_id",
+        "backfilled epics.product_id on 2 row(s)",
+        "backfilled features.product_id on 3 row(s)",
+        "created index: ix_epics_product_id",
+        "created index: ix_features_product_id",
+        "created index: ix_user_stories_feature_id",
+    ]
+    with engine.connect() as conn:
+        assert conn.execute(
+            text("SELECT feature_id, product_id FROM features ORDER BY feature_id")
+        ).all() == [(100, 7), (200, 8), (201, 8)]
+    assert migrate_roadmap_hierarchy(engine) == []
@@ -9,6 +9,7 @@ Run with: pytest tests/test_db_tools.py -v.
 import sys
 from pathlib import Path
 
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from sqlmodel import Session, select
 
@@ -117,9 +118,59 @@ def test_persist_roadmap(engine: Engine) -> None:
         epics = session.exec(select(Epic)).all()
         assert len(epics) == 1
         assert epics[0].theme_id == themes[0].theme_id
+        assert epics[0].product_id == product_id
 
         features = session.exec(select(Feature)).all()
         assert len(features) == 2  # noqa: PLR2004
+        assert {feature.product_id for feature in features} == {product_id}
+
+
+def test_roadmap_rows_inherit_product_id_on_flush(engine: Engine) -> None:
+    """Epics and features written without product_id inherit it from the theme."""
+    with Session(engine) as session:
+        product = Product(name="Denormalized")
+        session.add(product)
+        session.flush()
+        theme = Theme(title="Theme", product_id=product.product_id)
+        epic = Epic(title="Epic", theme=theme)
+        feature = Feature(title="Feature", epic=epic)
+        session.add(feature)
+        session.commit()
+
+        assert epic.product_id == product.product_id
+        assert feature.product_id == product.product_id
+
+
+def test_relationship_linked_roadmap_rows_store_product_id(engine: Engine) -> None:
+    """Relationship-linked inserts and moves store the owning product_id."""
+    with Session(engine) as session:
+        product = Product(name="Linked")
+        other = Product(name="Other")
+        epic = Epic(title="Epic", theme=Theme(title="Theme", product=product))
+        session.add(Feature(title="Feature", epic=epic))
+        session.add(other)
+        session.commit()
+        product_id, other_id = product.product_id, other.product_id
+        versions = (product.structure_version, other.structure_version)
+
+        epic.theme = Theme(title="Moved", product=other)
+        session.commit()
+
+        assert product.structure_version > versions[0]
+        assert other.structure_version > versions[1]
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT 'epic', product_id FROM epics "
+                "UNION ALL SELECT 'feature', product_id FROM features"
+            )
+        ).all()
+    assert sorted(tuple(row) for row in rows) == [
+        ("epic", other_id),
+        ("feature", other_id),
+    ]
+    assert product_id != other_id
 
 
 def test_create_user_story(engine: Engine) -> None:
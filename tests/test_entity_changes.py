@@ -0,0 +1,204 @@
+"""Tests for the entity change log and its readers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import date
+from typing import TYPE_CHECKING
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+import api as api_module
+from models.changes import EntityChange
+from models.core import Product, Sprint, SprintStory, Task, Team, UserStory
+from models.specs import CompiledSpecAuthority, SpecRegistry
+from repositories.story import StoryRepository
+from services.changes import list_entity_changes, wait_for_entity_changes
+from utils.story_inputs import compute_story_input_hash
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+def _changes(session: Session) -> list[tuple[str, str, str, int, int | None]]:
+    rows = session.exec(select(EntityChange).order_by(col(EntityChange.seq)))
+    return [
+        (row.entity, row.entity_id, row.op, row.version, row.product_id) for row in rows
+    ]
+
+
+def test_flushes_append_one_versioned_record_per_written_row(
+    session: Session,
+) -> None:
+    """Verify inserts, real updates and deletes are logged; no-op writes are not."""
+    product = Product(name="CDC")
+    session.add(product)
+    session.commit()
+    pid = product.product_id
+    assert pid is not None
+    story = UserStory(product_id=pid, title="Log me")
+    session.add(story)
+    session.commit()
+    sid = str(story.story_id)
+
+    story.title = "Log me"
+    session.add(story)
+    session.commit()
+    story.story_points = 5
+    session.add(story)
+    session.commit()
+
+    session.add(UserStory(product_id=pid, title="Rolled back"))
+    session.flush()
+    session.rollback()
+
+    session.delete(story)
+    session.commit()
+
+    assert _changes(session) == [
+        ("products", str(pid), "insert", 1, pid),
+        ("user_stories", sid, "insert", 1, pid),
+        ("user_stories", sid, "update", 2, pid),
+        ("user_stories", sid, "delete", 3, pid),
+    ]
+
+
+def test_child_rows_bulk_deletes_and_raw_updates_carry_their_product(
+    session: Session,
+) -> None:
+    """Verify owners are resolved and writes outside the unit of work logged."""
+    product = Product(name="Owned")
+    team = Team(name="Owners")
+    session.add(product)
+    session.add(team)
+    session.commit()
+    pid, team_id = product.product_id, team.team_id
+    assert pid is not None
+    assert team_id is not None
+    spec = SpecRegistry(product_id=pid, spec_hash="h", content="spec")
+    session.add(spec)
+    session.commit()
+    story = UserStory(
+        product_id=pid,
+        title="Pinned",
+        source_requirement="req",
+        accepted_spec_version_id=spec.spec_version_id,
+    )
+    story.validation_evidence = json.dumps(
+        {"input_hash": compute_story_input_hash(story)}
+    )
+    sprint = Sprint(
+        product_id=pid,
+        team_id=team_id,
+        start_date=date(2026, 1, 5),
+        end_date=date(2026, 1, 19),
+    )
+    session.add(story)
+    session.add(sprint)
+    session.commit()
+    assert story.story_id is not None
+    assert sprint.sprint_id is not None
+    session.add(Task(story_id=story.story_id, description="Build"))
+    session.add(SprintStory(sprint_id=sprint.sprint_id, story_id=story.story_id))
+    session.add(
+        CompiledSpecAuthority(
+            spec_version_id=spec.spec_version_id or 0,
+            compiler_version="1",
+            prompt_hash="p",
+            scope_themes="[]",
+            invariants="[]",
+            eligible_feature_ids="[]",
+        )
+    )
+    session.commit()
+
+    StoryRepository(session).delete_by_requirement(
+        product_id=pid, normalized_requirement="req"
+    )
+
+    changes = _changes(session)
+    assert {change[4] for change in changes} == {None, pid}
+    assert [change[0] for change in changes if change[4] is None] == ["teams"]
+    assert [
+        (entity, op)
+        for entity, _, op, _, _ in changes
+        if entity in {"tasks", "sprint_stories", "compiled_spec_authority"}
+        or (entity == "user_stories" and op != "insert")
+    ] == [
+        ("tasks", "insert"),
+        ("sprint_stories", "insert"),
+        ("user_stories", "update"),
+        ("compiled_spec_authority", "insert"),
+        ("sprint_stories", "delete"),
+        ("tasks", "delete"),
+        ("user_stories", "delete"),
+    ]
+
+
+def test_change_pages_resume_from_the_cursor(session: Session) -> None:
+    """Verify cursor paging, truncation and the project filter."""
+    first = Product(name="First")
+    second = Product(name="Second")
+    session.add(first)
+    session.add(second)
+    session.commit()
+    assert first.product_id is not None
+    for title in ("a", "b"):
+        session.add(UserStory(product_id=first.product_id, title=title))
+    session.commit()
+
+    page = list_entity_changes(session, limit=3)
+    assert len(page["changes"]) == 3  # noqa: PLR2004
+    assert page["has_more"] is True
+
+    rest = list_entity_changes(session, since=page["next_since"])
+    assert [change["entity"] for change in rest["changes"]] == ["user_stories"]
+    assert rest["has_more"] is False
+
+    empty = list_entity_changes(session, since=rest["next_since"])
+    assert empty == {
+        "changes": [],
+        "next_since": rest["next_since"],
+        "has_more": False,
+    }
+
+    scoped = list_entity_changes(session, project_id=first.product_id)
+    assert {change["product_id"] for change in scoped["changes"]} == {first.product_id}
+    assert len(scoped["changes"]) == 3  # noqa: PLR2004
+
+
+def test_long_poll_returns_when_another_writer_commits(engine: Engine) -> None:
+    """Verify a waiting reader wakes up on a write from another session."""
+
+    def write_later() -> None:
+        with Session(engine) as writer:
+            writer.add(Product(name="Late"))
+            writer.commit()
+
+    timer = threading.Timer(0.3, write_later)
+    timer.start()
+    try:
+        page = asyncio.run(wait_for_entity_changes(engine, wait_seconds=10))
+    finally:
+        timer.join()
+
+    assert [change["entity"] for change in page["changes"]] == ["products"]
+
+
+def test_changes_endpoint_serves_the_log(session: Session) -> None:
+    """Verify ``GET /api/changes`` pages the log and validates the cursor."""
+    session.add(Product(name="Served"))
+    session.commit()
+    client = TestClient(api_module.app)
+
+    response = client.get("/api/changes", params={"since": 0})
+    assert response.status_code == 200  # noqa: PLR2004
+    data = response.json()["data"]
+    assert [change["op"] for change in data["changes"]] == ["insert"]
+
+    response = client.get("/api/changes", params={"since": data["next_since"]})
+    assert response.json()["data"]["changes"] == []
+    assert client.get("/api/changes", params={"since": -1}).status_code == 422  # noqa: PLR2004
@@ -1,6 +1,8 @@
 """Tests for eval spec validation."""
 
+import json
 import time
+from pathlib import Path
 from typing import Any, Never
 
 import pytest
@@ -125,6 +127,45 @@ def test_bootstrap_ci_shape() -> None:
     assert eval_script._bootstrap_ci([], n_resamples=10) is None
 
 
+def _labeled_rows(count: int) -> list[JsonDict]:
+    return [
+        {EXPECTED_OUTCOME_FIELD: index % 3 != 0, "predicted_fail": index % 4 == 0}
+        for index in range(count)
+    ]
+
+
+def test_bootstrap_confusion_matches_row_confusion_per_resample() -> None:
+    """Verify the vectorized confusion counts agree with the per-row helper."""
+    rows = _labeled_rows(50)
+    cm = eval_script._bootstrap_confusion(rows, n_resamples=20, seed=7)
+    indices = eval_script._resample_indices(len(rows), n_resamples=20, seed=7)
+
+    for resample, sample_indices in enumerate(indices):
+        expected = eval_script._confusion_from_rows([rows[i] for i in sample_indices])
+        assert {key: int(cm[key][resample]) for key in cm} == expected
+
+
+def test_bootstrap_metric_cis_are_deterministic_and_bounded() -> None:
+    """Verify metric CIs repeat for a seed and stay inside [0, 1]."""
+    rows = _labeled_rows(200)
+    metrics = ("precision_fail", "recall_fail", "f1_fail", "accuracy")
+
+    first = eval_script._bootstrap_metric_cis(rows, metrics, seed=11)
+    second = eval_script._bootstrap_metric_cis(rows, metrics, seed=11)
+
+    assert first == second
+    for metric in metrics:
+        ci = first[metric]
+        assert ci is not None
+        assert 0.0 <= ci[0] <= ci[1] <= 1.0
+    assert (
+        eval_script._bootstrap_metric_ci(rows, "f1_fail", seed=11) == first["f1_fail"]
+    )
+    assert eval_script._bootstrap_metric_cis([], metrics) == dict.fromkeys(metrics)
+    with pytest.raises(ValueError, match="Unsupported metric"):
+        eval_script._bootstrap_metric_ci(rows, "specificity")
+
+
 def test_stratified_sampling() -> None:
     """Verify stratified sampling."""
     cases: list[JsonDict] = [
@@ -368,3 +409,88 @@ def test_run_case_mode_does_not_retry_non_retryable_errors(
     assert sleep_calls == []
     assert row["success"] is False
     assert row["error_class"] == "execution_error"
+
+
+def _stub_row(case: JsonDict, mode: str) -> JsonDict:
+    return {
+        "case_id": case["case_id"],
+        "mode": mode,
+        "story_id": case["story_id"],
+        "spec_version_id": case["spec_version_id"],
+        EXPECTED_OUTCOME_FIELD: case[EXPECTED_OUTCOME_FIELD],
+        "expected_fail_reasons": case["expected_fail_reasons"],
+        "success": True,
+        "predicted_pass": True,
+        "predicted_fail": False,
+        "predicted_reason_codes": [],
+        "error_class": "semantic",
+        "latency_ms": 1.0,
+        "result": {"success": True, "passed": True},
+    }
+
+
+def test_evaluate_cases_resumes_from_checkpoint(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify rows stream to the checkpoint and a rerun skips finished keys."""
+    cases: list[JsonDict] = [
+        {
+            "case_id": case_id,
+            "story_id": index,
+            "spec_version_id": 1,
+            EXPECTED_OUTCOME_FIELD: True,
+            "expected_fail_reasons": [],
+        }
+        for index, case_id in enumerate(["c1", "c2", "c3"], start=1)
+    ]
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    calls: list[tuple[str, str]] = []
+
+    def _crashing_run(case: JsonDict, mode: str, consensus_runs: int) -> JsonDict:
+        del consensus_runs
+        if case["case_id"] == "c2" and mode == "llm":
+            msg = "worker died"
+            raise RuntimeError(msg)
+        calls.append((case["case_id"], mode))
+        return _stub_row(case, mode)
+
+    monkeypatch.setattr(eval_script, "_run_case_mode", _crashing_run)
+    with pytest.raises(RuntimeError, match="worker died"):
+        eval_script.evaluate_cases(
+            cases, ["deterministic", "llm"], checkpoint_path=checkpoint
+        )
+    assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 3  # noqa: PLR2004
+
+    # A shard file left by a killed worker, plus a half-written line.
+    shard_row = {**_stub_row(cases[2], "deterministic"), "consensus_runs": 1}
+    (tmp_path / "checkpoint.shard0.jsonl").write_text(
+        json.dumps(shard_row) + "\n", encoding="utf-8"
+    )
+    with checkpoint.open("a", encoding="utf-8") as handle:
+        handle.write('{"case_id": "c2", "mo')
+
+    calls.clear()
+
+    def _run(case: JsonDict, mode: str, consensus_runs: int) -> JsonDict:
+        del consensus_runs
+        calls.append((case["case_id"], mode))
+        return _stub_row(case, mode)
+
+    monkeypatch.setattr(eval_script, "_run_case_mode", _run)
+    evaluated = eval_script.evaluate_cases(
+        cases, ["deterministic", "llm"], max_concurrency=2, checkpoint_path=checkpoint
+    )
+
+    assert sorted(calls) == [("c2", "llm"), ("c3", "llm")]
+    assert [(row["case_id"], row["mode"]) for row in evaluated["raw_rows"]] == [
+        (case["case_id"], mode) for case in cases for mode in ["deterministic", "llm"]
+    ]
+    assert not list(tmp_path.glob("checkpoint.shard*"))
+    stored = eval_script._load_checkpoint(checkpoint)
+    assert len(stored) == 6  # noqa: PLR2004
+
+    calls.clear()
+    eval_script.evaluate_cases(
+        cases, ["deterministic", "llm"], consensus_runs=3, checkpoint_path=checkpoint
+    )
+    assert len(calls) == 6  # noqa: PLR2004
@@ -0,0 +1,136 @@
+"""Tests for the incremental workflow metrics exporter."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from sqlmodel import SQLModel, create_engine
+
+from scripts import export_workflow_metrics as exporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _create_db(path: Path) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+
+def _add_events(
+    path: Path, rows: list[tuple[str, str, float | None, str | None]]
+) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO workflow_events "
+            "(event_type, timestamp, duration_seconds, product_id, event_metadata) "
+            "VALUES (?, ?, ?, 1, ?)",
+            rows,
+        )
+
+
+def _dwell(state: str, seconds: float, at: str) -> tuple[str, str, float, str]:
+    return ("FSM_STATE_DWELL", at, seconds, json.dumps({"from_state": state}))
+
+
+def test_export_is_incremental_and_since_summarizes_only_the_delta(
+    tmp_path: Path,
+) -> None:
+    """Verify reruns copy only new rows and --since limits summaries to them."""
+    db_path = tmp_path / "business.db"
+    store = tmp_path / "store"
+    _create_db(db_path)
+    _add_events(
+        db_path,
+        [
+            ("VISION_SAVED", "2026-01-01 10:00:00", None, None),
+            _dwell("VISION_REVIEW", 30.0, "2026-01-01 10:05:00"),
+            _dwell("VISION_REVIEW", 90.0, "2026-01-01 10:10:00"),
+        ],
+    )
+
+    first = exporter.export_metrics(db_path, store, store_format="csv")
+
+    assert first.exported_rows["workflow_events"] == 3  # noqa: PLR2004
+    assert first.high_water["workflow_events"] == 3  # noqa: PLR2004
+    dwell = first.summaries["state_dwell"].set_index("from_state")
+    assert dwell.loc["VISION_REVIEW", "count"] == 2  # noqa: PLR2004
+    assert dwell.loc["VISION_REVIEW", "avg_duration_sec"] == 60.0  # noqa: PLR2004
+
+    _add_events(
+        db_path,
+        [
+            ("SPEC_COMPILED", "2026-01-01 12:30:00", None, None),
+            _dwell("SPEC_REVIEW", 15.0, "2026-01-01 12:40:00"),
+        ],
+    )
+    delta = exporter.export_metrics(db_path, store, store_format="csv", since=True)
+
+    assert delta.exported_rows["workflow_events"] == 2  # noqa: PLR2004
+    assert delta.high_water["workflow_events"] == 5  # noqa: PLR2004
+    assert list(delta.summaries["state_dwell"]["from_state"]) == ["SPEC_REVIEW"]
+
+    full = exporter.export_metrics(db_path, store, store_format="csv")
+    assert full.exported_rows["workflow_events"] == 0
+    counts = full.summaries["event_types"].set_index("event_type")["count"]
+    assert counts.to_dict() == {
+        "FSM_STATE_DWELL": 3,
+        "SPEC_COMPILED": 1,
+        "VISION_SAVED": 1,
+    }
+    phases = full.summaries["phase_durations"].set_index("product_id")
+    assert phases.loc[1, "spec_compiled_hours"] == 2.5  # noqa: PLR2004
+    manifest = exporter.load_manifest(store)
+    assert len(manifest["tables"]["workflow_events"]["parts"]) == 2  # noqa: PLR2004
+
+
+def test_task_cycle_times_are_grouped_by_sprint() -> None:
+    """Verify task cycle time runs from first In Progress to first Done."""
+    logs = pd.DataFrame(
+        {
+            "log_id": [1, 2, 3, 4, 5, 6],
+            "task_id": [1, 1, 1, 2, 2, 3],
+            "sprint_id": [7, 7, 7, 7, 7, 8],
+            "new_status": [
+                "IN_PROGRESS",
+                "TO_DO",
+                "DONE",
+                "IN_PROGRESS",
+                "DONE",
+                "IN_PROGRESS",
+            ],
+            "changed_at": [
+                "2026-01-01T00:00:00",
+                "2026-01-01T01:00:00",
+                "2026-01-01T04:00:00",
+                "2026-01-02T00:00:00",
+                "2026-01-02T02:00:00",
+                "2026-01-03T00:00:00",
+            ],
+        }
+    )
+
+    summary = exporter.summarize_task_cycle_times(logs)
+
+    assert summary.to_dict("records") == [
+        {"sprint_id": 7, "count": 2, "mean": 3.0, "median": 3.0, "max": 4.0}
+    ]
+
+
+def test_auto_format_logs_the_csv_fallback(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verify the gzip-CSV fallback is announced when pyarrow is missing."""
+    monkeypatch.setattr(exporter.importlib.util, "find_spec", lambda _name: None)
+
+    with caplog.at_level(logging.WARNING, logger=exporter.__name__):
+        assert exporter.resolve_store_format("auto") == "csv"
+
+    assert "pyarrow is not installed" in caplog.text
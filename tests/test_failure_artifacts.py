@@ -1,5 +1,7 @@
 """Tests for failure artifacts."""
 
+import json
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -42,3 +44,98 @@ def test_write_and_read_failure_artifact_preserves_full_raw_output(
     assert loaded["project_id"] == 17  # noqa: PLR2004
     assert loaded["raw_output"] == raw_output
     assert loaded["raw_output_length"] == len(raw_output)
+
+
+def _isolate_failures_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    failures_dir = tmp_path / "logs" / "failures"
+    monkeypatch.setattr(failure_artifacts, "LOGS_DIR", tmp_path / "logs")
+    monkeypatch.setattr(failure_artifacts, "FAILURES_DIR", failures_dir)
+    return failures_dir
+
+
+def _write(project_id: int, summary: str) -> str:
+    persisted = failure_artifacts.write_failure_artifact(
+        phase="story",
+        project_id=project_id,
+        failure_stage="invalid_json",
+        failure_summary=summary,
+        raw_output=summary * 50,
+    )
+    return persisted["metadata"]["failure_artifact_id"]
+
+
+def test_list_failure_artifacts_pages_one_project_newest_first(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify listing comes from the index, per project, newest first."""
+    _isolate_failures_dir(monkeypatch, tmp_path)
+    first = _write(1, "first")
+    second = _write(1, "second")
+    _write(2, "other project")
+
+    page = failure_artifacts.list_failure_artifacts(1, limit=1)
+    assert page["total"] == 2  # noqa: PLR2004
+    assert [item["artifact_id"] for item in page["items"]] == [second]
+    assert page["items"][0]["size_bytes"] > 0
+
+    next_page = failure_artifacts.list_failure_artifacts(1, limit=1, offset=1)
+    assert [item["artifact_id"] for item in next_page["items"]] == [first]
+
+
+def test_existing_uncompressed_artifacts_are_indexed_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify legacy ``.json`` artifacts stay readable after the upgrade."""
+    failures_dir = _isolate_failures_dir(monkeypatch, tmp_path)
+    legacy_path = failures_dir / "vision" / "vision-legacy.json"
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_text(
+        json.dumps(
+            {
+                "artifact_id": "vision-legacy",
+                "created_at": "2025-01-01T00:00:00Z",
+                "phase": "vision",
+                "project_id": 3,
+                "failure_stage": "invalid_json",
+                "failure_summary": "legacy",
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    loaded = failure_artifacts.read_failure_artifact("vision-legacy")
+    assert loaded is not None
+    assert loaded["failure_summary"] == "legacy"
+    assert failure_artifacts.list_failure_artifacts(3)["total"] == 1
+
+
+def test_sweep_removes_expired_then_oldest_over_budget(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify retention drops artifacts by age first, then by total size."""
+    _isolate_failures_dir(monkeypatch, tmp_path)
+    oldest = _write(1, "oldest")
+    middle = _write(1, "middle")
+    newest = _write(1, "newest")
+    sizes = {
+        item["artifact_id"]: item["size_bytes"]
+        for item in failure_artifacts.list_failure_artifacts(1)["items"]
+    }
+
+    nothing = failure_artifacts.sweep_failure_artifacts(
+        max_age_days=30, max_total_bytes=sum(sizes.values())
+    )
+    assert nothing == {"removed": 0, "freed_bytes": 0}
+
+    by_size = failure_artifacts.sweep_failure_artifacts(
+        max_total_bytes=sizes[middle] + sizes[newest]
+    )
+    assert by_size == {"removed": 1, "freed_bytes": sizes[oldest]}
+    assert failure_artifacts.read_failure_artifact(oldest) is None
+
+    by_age = failure_artifacts.sweep_failure_artifacts(
+        max_age_days=1, now=datetime.now(UTC) + timedelta(days=2)
+    )
+    assert by_age["removed"] == 2  # noqa: PLR2004
+    assert failure_artifacts.list_failure_artifacts(1)["total"] == 0
+    assert not list((tmp_path / "logs" / "failures" / "story").iterdir())
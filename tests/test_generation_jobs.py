@@ -0,0 +1,233 @@
+"""Tests for the background generation job queue."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import subprocess
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from repositories.generation_job import GenerationJobRepository
+from services.generation_jobs import (
+    GenerationJobManager,
+    hash_job_input,
+    process_owner,
+)
+from utils import adk_runner
+from utils.failure_artifacts import AgentInvocationError
+from utils.runtime_config import DatabaseTarget
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _repository(tmp_path: Path) -> GenerationJobRepository:
+    path = tmp_path / "jobs.sqlite3"
+    return GenerationJobRepository(
+        DatabaseTarget(
+            source="test",
+            sqlite_url=f"sqlite:///{path.as_posix()}",
+            sqlite_path=path,
+        )
+    )
+
+
+async def _no_sleep(_seconds: float) -> None:
+    return None
+
+
+def _manager(repository: GenerationJobRepository) -> GenerationJobManager:
+    counter = iter(range(1, 100))
+    return GenerationJobManager(
+        repository,
+        max_workers=2,
+        now_iso=lambda: "2026-01-01T00:00:00Z",
+        sleep=_no_sleep,
+        new_job_id=lambda: f"job-{next(counter)}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_job_and_stores_result(tmp_path: Path) -> None:
+    """Verify a submitted job runs on a worker and persists its result."""
+    manager = _manager(_repository(tmp_path))
+
+    async def operation() -> dict[str, Any]:
+        return {"status": "success", "data": {"ok": True}}
+
+    job, coalesced = await manager.submit(
+        project_id=1, phase="vision", payload={"user_input": "x"}, operation=operation
+    )
+    assert coalesced is False
+    assert job["status"] == "queued"
+
+    await manager.drain()
+
+    finished = manager.get("job-1")
+    assert finished is not None
+    assert finished["status"] == "succeeded"
+    assert finished["attempts"] == 1
+    assert finished["result"] == {"status": "success", "data": {"ok": True}}
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_submission_coalesces_onto_active_job(tmp_path: Path) -> None:
+    """Verify same project/phase/input reuses the queued or running job."""
+    manager = _manager(_repository(tmp_path))
+    release = asyncio.Event()
+    calls = 0
+
+    async def operation() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"status": "success"}
+
+    first, _ = await manager.submit(
+        project_id=1, phase="story", payload={"a": 1}, operation=operation
+    )
+    second, coalesced = await manager.submit(
+        project_id=1, phase="story", payload={"a": 1}, operation=operation
+    )
+    other, other_coalesced = await manager.submit(
+        project_id=1, phase="story", payload={"a": 2}, operation=operation
+    )
+
+    assert coalesced is True
+    assert second["job_id"] == first["job_id"]
+    assert other_coalesced is False
+    assert other["job_id"] != first["job_id"]
+
+    release.set()
+    await manager.drain()
+    assert calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_job_records_http_style_failure(tmp_path: Path) -> None:
+    """Verify phase errors are stored with their status code and detail."""
+    manager = _manager(_repository(tmp_path))
+
+    class PhaseError(Exception):
+        status_code = 409
+        detail = "Feedback is required"
+
+    async def operation() -> dict[str, Any]:
+        raise PhaseError
+
+    await manager.submit(project_id=2, phase="vision", payload={}, operation=operation)
+    await manager.drain()
+
+    job = manager.get("job-1")
+    assert job is not None
+    assert job["status"] == "failed"
+    assert job["status_code"] == 409  # noqa: PLR2004
+    assert job["error"] == "Feedback is required"
+
+
+@pytest.mark.asyncio
+async def test_job_retries_zdr_routing_failures_inside_agent_invocation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify workers retry ZDR routing misses before the runtime sees them."""
+    attempts = 0
+
+    async def fake_invoke_once(**_kwargs: object) -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:  # noqa: PLR2004
+            msg = "No ZDR provider available"
+            raise AgentInvocationError(msg) from RuntimeError(msg)
+        return '{"ok": true}'
+
+    monkeypatch.setattr(adk_runner, "_invoke_agent_once", fake_invoke_once)
+    manager = _manager(_repository(tmp_path))
+
+    async def operation() -> dict[str, Any]:
+        text = await adk_runner.invoke_agent_to_text(
+            agent=SimpleNamespace(name="vision"),
+            runner_identity=SimpleNamespace(app_name="app", user_id="user"),
+            payload_json="{}",
+            no_text_error="missing",
+        )
+        return {"status": "success", "text": text}
+
+    await manager.submit(project_id=3, phase="vision", payload={}, operation=operation)
+    await manager.drain()
+
+    job = manager.get("job-1")
+    assert job is not None
+    assert job["status"] == "succeeded"
+    assert job["attempts"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_invoke_without_retry_policy_raises_zdr_failure_immediately(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify request-path invocations keep failing fast on ZDR errors."""
+    calls = 0
+
+    async def fake_invoke_once(**_kwargs: object) -> str:
+        nonlocal calls
+        calls += 1
+        msg = "No ZDR provider available"
+        raise AgentInvocationError(msg) from RuntimeError(msg)
+
+    monkeypatch.setattr(adk_runner, "_invoke_agent_once", fake_invoke_once)
+
+    with pytest.raises(AgentInvocationError):
+        await adk_runner.invoke_agent_to_text(
+            agent=SimpleNamespace(name="vision"),
+            runner_identity=SimpleNamespace(app_name="app", user_id="user"),
+            payload_json="{}",
+            no_text_error="missing",
+        )
+    assert calls == 1
+
+
+def test_startup_recovery_fails_only_jobs_of_exited_processes(tmp_path: Path) -> None:
+    """Verify recovery is explicit and spares jobs owned by live processes."""
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    repository = _repository(tmp_path)
+    owners = {
+        "legacy": None,
+        "exited": f"{socket.gethostname()}:{exited.pid}",
+        "live": process_owner(),
+        "remote": "other-host:1",
+    }
+    for job_id, owner in owners.items():
+        repository.insert(
+            job_id=job_id,
+            project_id=1,
+            phase="roadmap",
+            input_hash=job_id,
+            created_at="2026-01-01T00:00:00Z",
+            owner=owner,
+        )
+    manager = _manager(_repository(tmp_path))
+
+    assert manager.get("legacy") == repository.get("legacy")
+    assert manager.recover_interrupted_jobs() == 2  # noqa: PLR2004
+
+    jobs = {job_id: manager.get(job_id) or {} for job_id in owners}
+    assert {job_id: job["status"] for job_id, job in jobs.items()} == {
+        "legacy": "failed",
+        "exited": "failed",
+        "live": "queued",
+        "remote": "queued",
+    }
+    assert jobs["exited"]["status_code"] == 503  # noqa: PLR2004
+
+
+def test_hash_job_input_is_key_order_independent() -> None:
+    """Verify coalescing keys ignore payload key order."""
+    assert hash_job_input(
+        project_id=1, phase="sprint", payload={"a": 1, "b": 2}
+    ) == hash_job_input(project_id=1, phase="sprint", payload={"b": 2, "a": 1})
@@ -0,0 +1,167 @@
+"""Tests for SSE generation streaming and the ADK runner progress hook."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from services.generation_stream import format_sse, stream_generation_events
+from utils import adk_runner
+from utils.runtime_metrics import RuntimeMetrics
+
+
+class _FakeSessionService:
+    async def create_session(self, *, app_name: object, user_id: object) -> object:
+        del app_name, user_id
+        return SimpleNamespace(id="session-1")
+
+
+def _text_event(text: str, *, partial: bool) -> object:
+    return SimpleNamespace(
+        partial=partial,
+        content=SimpleNamespace(parts=[SimpleNamespace(text=text)]),
+    )
+
+
+def _install_fake_runner(
+    monkeypatch: pytest.MonkeyPatch, calls: list[dict[str, Any]]
+) -> None:
+    class FakeRunner:
+        def __init__(self, **kwargs: object) -> None:
+            del kwargs
+
+        async def run_async(self, **kwargs: object) -> Any:  # noqa: ANN401
+            calls.append(kwargs)
+            yield _text_event('{"ok": ', partial=True)
+            yield _text_event("true}", partial=True)
+            yield _text_event('{"ok": true}', partial=False)
+
+    monkeypatch.setattr(adk_runner, "InMemorySessionService", _FakeSessionService)
+    monkeypatch.setattr(adk_runner, "Runner", FakeRunner)
+
+
+async def _invoke() -> str:
+    return await adk_runner.invoke_agent_to_text(
+        agent=SimpleNamespace(name="vision"),
+        runner_identity=SimpleNamespace(app_name="app", user_id="user"),
+        payload_json="{}",
+        no_text_error="missing",
+    )
+
+
+def _parse(frames: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    parsed = []
+    for frame in frames:
+        event_line, data_line = frame.strip().split("\n")
+        parsed.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+    return parsed
+
+
+@pytest.mark.asyncio
+async def test_invoke_without_listener_keeps_non_streaming_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify callers without a listener do not request SSE streaming."""
+    calls: list[dict[str, Any]] = []
+    _install_fake_runner(monkeypatch, calls)
+
+    assert await _invoke() == '{"ok": true}'
+    assert "run_config" not in calls[0]
+
+
+@pytest.mark.asyncio
+async def test_invoke_with_listener_streams_partial_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify partial deltas reach the listener but not the final text."""
+    calls: list[dict[str, Any]] = []
+    _install_fake_runner(monkeypatch, calls)
+    received: list[tuple[str, dict[str, Any]]] = []
+
+    with adk_runner.agent_progress_listener(
+        lambda event, payload: received.append((event, payload))
+    ):
+        text = await _invoke()
+
+    assert text == '{"ok": true}'
+    assert calls[0]["run_config"].streaming_mode == adk_runner.StreamingMode.SSE
+    assert received == [
+        ("invoking_model", {"agent_name": "vision"}),
+        ("token", {"text": '{"ok": '}),
+        ("token", {"text": "true}"}),
+        ("validating", {"response_chars": 12}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_generation_events_orders_progress_and_records_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the SSE stream wraps runner progress between queued and persisted."""
+    _install_fake_runner(monkeypatch, [])
+    metrics = RuntimeMetrics()
+
+    async def operation() -> dict[str, Any]:
+        return {"status": "success", "data": {"text": await _invoke()}}
+
+    frames = [
+        frame
+        async for frame in stream_generation_events(
+            operation, phase="vision", project_id=3, metrics=metrics
+        )
+    ]
+
+    assert [name for name, _ in _parse(frames)] == [
+        "queued",
+        "invoking_model",
+        "token",
+        "token",
+        "validating",
+        "persisted",
+    ]
+    assert _parse(frames)[-1][1] == {
+        "result": {"status": "success", "data": {"text": '{"ok": true}'}}
+    }
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {
+        "generation_stream.completed{outcome=persisted,phase=vision}": 1
+    }
+    assert set(snapshot["timings"]) == {
+        "generation_stream.ttfb_ms{phase=vision}",
+        "generation_stream.first_token_ms{phase=vision}",
+        "generation_stream.total_ms{phase=vision}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_generation_events_reports_http_style_errors() -> None:
+    """Verify errors carrying status_code/detail become an SSE error event."""
+
+    class PhaseError(Exception):
+        status_code = 409
+        detail = "Feedback is required"
+
+    async def operation() -> dict[str, Any]:
+        raise PhaseError
+
+    frames = [
+        frame
+        async for frame in stream_generation_events(
+            operation, phase="story", project_id=1, metrics=RuntimeMetrics()
+        )
+    ]
+
+    assert _parse(frames)[-1] == (
+        "error",
+        {"status_code": 409, "detail": "Feedback is required"},
+    )
+
+
+def test_format_sse_renders_event_and_json_data() -> None:
+    """Verify SSE frames use the event/data wire format."""
+    assert format_sse("token", {"text": "hi"}) == (
+        'event: token\ndata: {"text": "hi"}\n\n'
+    )
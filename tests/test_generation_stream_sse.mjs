@@ -0,0 +1,30 @@
+import assert from 'node:assert/strict';
+import fs from 'node:fs';
+import path from 'node:path';
+import test from 'node:test';
+
+const projectJsPath = path.resolve(import.meta.dirname, '../frontend/project.js');
+const projectJsSource = fs.readFileSync(projectJsPath, 'utf8');
+
+function loadParseSseFrame() {
+    const match = projectJsSource.match(
+        /function parseSseFrame\(frame\) \{[\s\S]*?\n\}/,
+    );
+    assert.ok(match, 'parseSseFrame should exist in frontend/project.js');
+    return new Function(`${match[0]}; return parseSseFrame;`)();
+}
+
+test('parseSseFrame reads the event name and JSON data', () => {
+    const parseSseFrame = loadParseSseFrame();
+
+    assert.deepEqual(
+        parseSseFrame('event: token\ndata: {"text": "Hel"}'),
+        { event: 'token', data: { text: 'Hel' } },
+    );
+});
+
+test('parseSseFrame ignores frames without data lines', () => {
+    const parseSseFrame = loadParseSseFrame();
+
+    assert.equal(parseSseFrame(': keep-alive'), null);
+});
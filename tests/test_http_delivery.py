@@ -0,0 +1,136 @@
+"""Tests for response compression, cache validators and cache policies."""
+
+from __future__ import annotations
+
+import gzip
+import re
+from typing import TYPE_CHECKING
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.http_delivery import (
+    API_READ_CACHE_CONTROL,
+    API_WRITE_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    FingerprintedStaticFiles,
+    HttpDeliveryMiddleware,
+    brotli_available,
+    negotiate_encoding,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _app(static_dir: Path) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(HttpDeliveryMiddleware, minimum_size=64)
+
+    @app.get("/api/items")
+    def list_items() -> dict[str, list[str]]:
+        return {"items": [f"item-{index}" for index in range(200)]}
+
+    @app.get("/api/tiny")
+    def tiny() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/api/items")
+    def create_item() -> dict[str, bool]:
+        return {"ok": True}
+
+    app.mount(
+        "/dashboard",
+        FingerprintedStaticFiles(directory=static_dir, html=True),
+        name="frontend",
+    )
+    return app
+
+
+def _client(tmp_path: Path) -> TestClient:
+    (tmp_path / "app.js").write_text("console.log('x');\n" * 200, encoding="utf-8")
+    (tmp_path / "index.html").write_text(
+        '<html><script src="/dashboard/app.js?v=3"></script></html>',
+        encoding="utf-8",
+    )
+    return TestClient(_app(tmp_path))
+
+
+def test_negotiate_encoding_honours_client_preferences() -> None:
+    """Verify refused codings and the brotli fallback to gzip."""
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("br, gzip") == ("br" if brotli_available() else "gzip")
+
+
+def test_api_reads_are_compressed_validated_and_revalidated(tmp_path: Path) -> None:
+    """Verify gzip above the threshold, the body ETag and the 304 answer."""
+    client = _client(tmp_path)
+
+    response = client.get("/api/items", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"] == API_READ_CACHE_CONTROL
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()["items"]) == 200  # noqa: PLR2004
+
+    etag = response.headers["etag"]
+    not_modified = client.get("/api/items", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304  # noqa: PLR2004
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    tiny = client.get("/api/tiny", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in tiny.headers
+    write = client.post("/api/items")
+    assert write.headers["cache-control"] == API_WRITE_CACHE_CONTROL
+    assert "etag" not in write.headers
+
+
+def test_static_assets_are_fingerprinted_and_cached_forever(tmp_path: Path) -> None:
+    """Verify HTML asset URL rewriting and the per-fingerprint cache policy."""
+    client = _client(tmp_path)
+
+    page = client.get("/dashboard/", headers={"Accept-Encoding": "identity"})
+    assert page.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    match = re.search(r'src="/dashboard/app\.js\?v=(\w+)"', page.text)
+    assert match is not None
+    fingerprint = match.group(1)
+
+    asset = client.get(
+        f"/dashboard/app.js?v={fingerprint}", headers={"Accept-Encoding": "gzip"}
+    )
+    assert asset.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert asset.headers["etag"] == f'"{fingerprint}"'
+    assert asset.headers["content-encoding"] == "gzip"
+    assert "accept-ranges" not in asset.headers
+    assert asset.text == "console.log('x');\n" * 200
+
+    unversioned = client.get("/dashboard/app.js")
+    assert unversioned.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    revalidated = client.get(
+        "/dashboard/app.js", headers={"If-None-Match": f'"{fingerprint}"'}
+    )
+    assert revalidated.status_code == 304  # noqa: PLR2004
+
+    (tmp_path / "app.js").write_text("console.log('y');\n", encoding="utf-8")
+    updated = client.get("/dashboard/index.html")
+    assert fingerprint not in updated.text
+
+
+def test_streamed_bodies_are_compressed_incrementally(tmp_path: Path) -> None:
+    """Verify a multi-chunk file response decodes to the original bytes."""
+    payload = "".join(f"line {index}\n" for index in range(40_000))
+    (tmp_path / "big.js").write_text(payload, encoding="utf-8")
+    client = TestClient(_app(tmp_path))
+
+    with client.stream(
+        "GET", "/dashboard/big.js", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw).decode("utf-8") == payload
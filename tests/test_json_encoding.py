@@ -0,0 +1,180 @@
+"""Tests for the shared JSON encoder and one-pass API responses."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import IntEnum, StrEnum
+from typing import Any
+from uuid import UUID
+
+from fastapi import BackgroundTasks, Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, TypeAdapter
+
+from services.agent_workbench.fingerprints import canonical_json, normalize_for_hash
+from services.json_responses import (
+    ORJSONResponse,
+    ORJSONRoute,
+    is_plain_json_annotation,
+)
+from utils.json_encoding import dumps
+
+
+class _Status(StrEnum):
+    OPEN = "open"
+
+
+class _Rank(IntEnum):
+    HIGH = 3
+
+
+class _Story(BaseModel):
+    title: str
+    status: _Status
+    updated_at: datetime
+
+
+@dataclass
+class _Attempt:
+    number: int
+    started_at: datetime
+
+
+def _rich_payload() -> dict[str, Any]:
+    return {
+        "utc": datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=UTC),
+        "naive": datetime(2026, 1, 2, 3, 4, 5),  # noqa: DTZ001
+        "offset": datetime(2026, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+        "day": date(2026, 1, 2),
+        "status": _Status.OPEN,
+        "rank": _Rank.HIGH,
+        "id": UUID(int=7),
+        "points": Decimal("1.50"),
+        "elapsed": timedelta(seconds=90),
+        "story": _Story(
+            title="Café",
+            status=_Status.OPEN,
+            updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+        ),
+        "attempts": [_Attempt(1, datetime(2026, 1, 1, tzinfo=UTC))],
+        "pair": (1, 2),
+        "missing": float("nan"),
+        "by_id": {1: "one"},
+        "huge": 2**70,
+    }
+
+
+def _fastapi_bytes(value: object) -> bytes:
+    """Encode ``value`` as a ``-> dict[str, Any]`` route did before."""
+    adapter = TypeAdapter(dict[str, Any])
+    content = adapter.dump_python(adapter.validate_python(value), mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_dumps_matches_pydantic_json_mode() -> None:
+    """Verify datetime, enum, model and key conversions match FastAPI."""
+    payload = _rich_payload()
+
+    assert dumps(payload) == _fastapi_bytes(payload)
+    assert json.loads(dumps(payload, sort_keys=True)) == json.loads(dumps(payload))
+
+
+def test_canonical_json_is_byte_identical_to_stdlib() -> None:
+    """Verify hashes never change with the encoder that produced them."""
+    for value in (
+        {"b": [0.1, -0.0, 1.5], "a": datetime(2026, 1, 1, tzinfo=UTC), "n": None},
+        {"floats": [1e-05, 1e16, 123.456], "text": "Café", "big": 2**70},
+        {"text": "delete \x7f", "nested": {2: "two", "1": ["x", True]}},
+        {"status": _Status.OPEN, "rank": _Rank.HIGH, "ids": (1, 2**63)},
+    ):
+        assert canonical_json(value) == json.dumps(
+            normalize_for_hash(value),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=True,
+        )
+
+
+def test_plain_json_annotations() -> None:
+    """Verify only models that leave JSON values unchanged are bypassed."""
+    assert is_plain_json_annotation(dict[str, Any])
+    assert is_plain_json_annotation(dict[str, object])
+    assert is_plain_json_annotation(list[dict[str, str | int | None]])
+    assert not is_plain_json_annotation(dict[int, Any])
+    assert not is_plain_json_annotation(_Story)
+    assert not is_plain_json_annotation(list[_Story])
+
+
+def _tag_response(response: Response) -> None:
+    response.headers["X-Dependency"] = "set"
+
+
+def _routes(app: FastAPI) -> FastAPI:
+    @app.get("/rich")
+    async def rich() -> dict[str, Any]:
+        return _rich_payload()
+
+    @app.post("/accepted", status_code=202)
+    def accepted(background_tasks: BackgroundTasks) -> dict[str, object]:
+        background_tasks.add_task(lambda: None)
+        return {"queued": True}
+
+    @app.get("/injected", dependencies=[Depends(_tag_response)])
+    def injected(response: Response) -> dict[str, Any]:
+        response.status_code = 201
+        response.headers["X-Endpoint"] = "set"
+        return {"created": datetime(2026, 1, 1, tzinfo=UTC)}
+
+    @app.get("/dependency-only", dependencies=[Depends(_tag_response)])
+    async def dependency_only() -> dict[str, Any]:
+        return {"ok": True}
+
+    @app.get("/not-modified", response_model=dict[str, Any])
+    def not_modified() -> Response:
+        return Response(status_code=304, headers={"ETag": '"abc"'})
+
+    @app.get("/model")
+    def model() -> _Story:
+        return _Story(
+            title="Story",
+            status=_Status.OPEN,
+            updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+
+    return app
+
+
+def test_one_pass_routes_match_fastapi_responses() -> None:
+    """Verify bodies, statuses and headers match the default route class."""
+    fast_app = FastAPI(default_response_class=ORJSONResponse)
+    fast_app.router.route_class = ORJSONRoute
+    fast = TestClient(_routes(fast_app))
+    default = TestClient(_routes(FastAPI()))
+
+    for method, path in (
+        ("GET", "/rich"),
+        ("POST", "/accepted"),
+        ("GET", "/injected"),
+        ("GET", "/dependency-only"),
+        ("GET", "/not-modified"),
+        ("GET", "/model"),
+    ):
+        expected = default.request(method, path)
+        actual = fast.request(method, path)
+        assert actual.status_code == expected.status_code, path
+        assert actual.content == expected.content, path
+        assert dict(actual.headers) == dict(expected.headers), path
+
+    one_pass = {
+        route.path: route.uses_one_pass_encoding()
+        for route in fast_app.routes
+        if isinstance(route, ORJSONRoute)
+    }
+    assert one_pass["/rich"]
+    assert one_pass["/injected"]
+    assert not one_pass["/model"]
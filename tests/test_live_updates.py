@@ -0,0 +1,193 @@
+"""Tests for live project event fan-out and its SSE frames."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+from sqlmodel import Session
+
+from models.core import Product, Team
+from repositories.session import WorkflowSessionRepository
+from services import live_updates as live_updates_module
+from services.live_updates import LiveUpdateHub, iter_project_event_frames
+from services.workflow import WorkflowService
+from utils.runtime_config import resolve_database_target
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from sqlalchemy.engine import Engine
+
+
+def _frame(raw: str) -> tuple[str | None, str, dict[str, Any]]:
+    lines = dict(line.split(": ", 1) for line in raw.strip().splitlines())
+    return lines.get("id"), lines["event"], json.loads(lines["data"])
+
+
+def test_hub_routes_events_by_project_and_resyncs_on_overflow(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify project scoping and the bounded-queue resync."""
+    monkeypatch.setattr(live_updates_module, "DEFAULT_QUEUE_SIZE", 2)
+    hub = LiveUpdateHub()
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        with hub.subscribe(1) as first, hub.subscribe(2) as second:
+            hub.publish(1, "state", {"n": 1})
+            hub.publish(2, "entity_change", {"n": 2})
+            hub.publish(1, "state", {"n": 3})
+            hub.publish(1, "state", {"n": 4})
+            await asyncio.sleep(0)
+            firsts = [first.get_nowait().event for _ in range(first.qsize())]
+            seconds = [second.get_nowait().event for _ in range(second.qsize())]
+        assert hub.subscriber_count() == 0
+        return firsts, seconds
+
+    firsts, seconds = asyncio.run(scenario())
+
+    assert firsts == ["resync"]
+    assert seconds == ["entity_change"]
+
+
+def test_event_frames_open_with_full_state_then_send_shaped_deltas(
+    engine: Engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the stream snapshot, delta shaping and pass-through events."""
+    hub = LiveUpdateHub()
+    monkeypatch.setattr(hub, "start_change_tailer", lambda _engine: None)
+
+    async def load_state() -> dict[str, Any]:
+        return {"fsm_state": "VISION_INTERVIEW", "attempts": [1, 2]}
+
+    def shape_state(raw: dict[str, Any]) -> dict[str, Any]:
+        return {**raw, "phase": raw["fsm_state"].split("_")[0].lower()}
+
+    async def scenario() -> list[tuple[str | None, str, dict[str, Any]]]:
+        frames = iter_project_event_frames(
+            hub,
+            7,
+            engine=engine,
+            load_state=load_state,
+            shape_state=shape_state,
+        )
+        received = [await anext(frames)]
+        hub.publish(7, "state", {"version": 3, "changes": {"attempts": [1, 2]}})
+        hub.publish(
+            7, "state", {"version": 4, "changes": {"fsm_state": "BACKLOG_REVIEW"}}
+        )
+        hub.publish(7, "entity_change", {"seq": 11}, event_id=11)
+        received.extend([await anext(frames), await anext(frames)])
+        await frames.aclose()
+        return [_frame(raw) for raw in received]
+
+    snapshot, delta, change = asyncio.run(scenario())
+
+    assert snapshot == (
+        None,
+        "state",
+        {
+            "project_id": 7,
+            "full": True,
+            "state": {
+                "fsm_state": "VISION_INTERVIEW",
+                "attempts": [1, 2],
+                "phase": "vision",
+            },
+        },
+    )
+    assert delta == (
+        None,
+        "state",
+        {
+            "project_id": 7,
+            "full": False,
+            "version": 4,
+            "changes": {"fsm_state": "BACKLOG_REVIEW", "phase": "backlog"},
+        },
+    )
+    assert change == ("11", "entity_change", {"seq": 11})
+
+
+def test_change_tailer_fans_out_new_entity_changes(engine: Engine) -> None:
+    """Verify committed rows reach only their project's subscribers."""
+    hub = LiveUpdateHub()
+
+    async def scenario() -> tuple[dict[str, Any], int]:
+        with hub.subscribe(1) as queue, hub.subscribe(2) as other:
+            hub.start_change_tailer(engine)
+            await asyncio.sleep(0.1)
+            with Session(engine) as session:
+                session.add(Team(name="Unscoped"))
+                session.commit()
+                session.add(Product(name="Pushed"))
+                session.commit()
+            event = await asyncio.wait_for(queue.get(), timeout=5)
+            await asyncio.sleep(0.1)
+            received = {"event": event.event, "id": event.event_id, **event.payload}
+            return received, other.qsize()
+
+    received, other_count = asyncio.run(scenario())
+
+    assert received["event"] == "entity_change"
+    assert received["entity"] == "products"
+    assert received["product_id"] == 1
+    assert received["id"] == received["seq"]
+    assert other_count == 0
+
+
+def test_workflow_service_publishes_changed_keys_and_transitions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify session writes publish only changed keys for project sessions."""
+    db_path = tmp_path / "sessions.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE sessions (app_name VARCHAR, user_id VARCHAR, id VARCHAR, "
+            "state TEXT, create_time DATETIME, update_time DATETIME, "
+            "PRIMARY KEY (app_name, user_id, id))"
+        )
+    service = WorkflowService()
+    service.session_repo = WorkflowSessionRepository(
+        db_target=resolve_database_target(
+            str(db_path), env_name="AGILEFORGE_SESSION_DB_URL"
+        )
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO sessions VALUES (?, ?, '5', ?, '', '')",
+            (
+                service.app_name,
+                service.user_id,
+                json.dumps({"fsm_state": "VISION_INTERVIEW", "attempts": [1]}),
+            ),
+        )
+    hub = LiveUpdateHub()
+    monkeypatch.setattr("services.workflow.live_updates", hub)
+
+    async def scenario() -> list[tuple[str, dict[str, Any]]]:
+        with hub.subscribe(5) as queue:
+            service.update_session_status("5", {"attempts": [1], "note": "x"})
+            service.update_session_status("5", {"attempts": [1]})
+            service.advance_fsm_to_next_phase(
+                "5", "unknown_tool", {"success": False}, ""
+            )
+            await asyncio.sleep(0)
+            events = [queue.get_nowait() for _ in range(queue.qsize())]
+        return [(event.event, event.payload) for event in events]
+
+    events = asyncio.run(scenario())
+
+    assert events[0] == ("state", {"version": 1, "changes": {"note": "x"}})
+    assert events[-1] == (
+        "fsm_transition",
+        {
+            "from": "VISION_INTERVIEW",
+            "to": "VISION_INTERVIEW",
+            "trigger": "unknown_tool",
+        },
+    )
+    assert [name for name, _ in events].count("state") == 2  # noqa: PLR2004
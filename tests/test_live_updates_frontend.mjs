@@ -0,0 +1,47 @@
+import assert from 'node:assert/strict';
+import fs from 'node:fs';
+import path from 'node:path';
+import test from 'node:test';
+
+const projectJsPath = path.resolve(import.meta.dirname, '../frontend/project.js');
+const projectJsSource = fs.readFileSync(projectJsPath, 'utf8');
+
+function loadMergeProjectStateEvent() {
+    const match = projectJsSource.match(
+        /function mergeProjectStateEvent\(snapshot, payload\) \{[\s\S]*?\n\}/,
+    );
+    assert.ok(match, 'mergeProjectStateEvent should exist in frontend/project.js');
+    return new Function(`${match[0]}; return mergeProjectStateEvent;`)();
+}
+
+test('mergeProjectStateEvent replaces the snapshot on a full state event', () => {
+    const mergeProjectStateEvent = loadMergeProjectStateEvent();
+    const merged = mergeProjectStateEvent(
+        { fsm_state: 'VISION_INTERVIEW', stale: true },
+        { full: true, state: { fsm_state: 'BACKLOG_REVIEW' } },
+    );
+
+    assert.deepEqual(merged, { fsm_state: 'BACKLOG_REVIEW' });
+});
+
+test('mergeProjectStateEvent overlays delta keys without mutating the snapshot', () => {
+    const mergeProjectStateEvent = loadMergeProjectStateEvent();
+    const snapshot = { fsm_state: 'VISION_INTERVIEW', setup_status: 'passed' };
+    const merged = mergeProjectStateEvent(snapshot, {
+        full: false,
+        version: 4,
+        changes: { fsm_state: 'BACKLOG_REVIEW' },
+    });
+
+    assert.deepEqual(merged, { fsm_state: 'BACKLOG_REVIEW', setup_status: 'passed' });
+    assert.equal(snapshot.fsm_state, 'VISION_INTERVIEW');
+});
+
+test('mergeProjectStateEvent starts from an empty snapshot before the first event', () => {
+    const mergeProjectStateEvent = loadMergeProjectStateEvent();
+
+    assert.deepEqual(
+        mergeProjectStateEvent(null, { full: false, changes: { setup_status: 'failed' } }),
+        { setup_status: 'failed' },
+    );
+});
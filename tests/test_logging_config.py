@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
+import logging.handlers
+import queue
 from contextlib import redirect_stderr
 from typing import TYPE_CHECKING
 
 import pytest
-
-from utils.logging_config import configure_logging
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils import logging_config
+from utils.logging_config import (
+    CorrelationIdMiddleware,
+    configure_logging,
+    correlation_scope,
+    file_log_queue,
+    get_correlation_id,
+)
 from utils.runtime_config import clear_runtime_config_cache
+from utils.runtime_metrics import runtime_metrics
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
 
 
 def _remove_console_handlers() -> None:
@@ -35,6 +49,15 @@ def _reset_console_logging() -> Iterator[None]:
     yield
     _remove_console_handlers()
     clear_runtime_config_cache()
+    # Runs after monkeypatch teardown: restart the file pipeline on real paths.
+    configure_logging()
+
+
+def _use_log_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(logging_config, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(logging_config, "APP_LOG_PATH", tmp_path / "app.log")
+    monkeypatch.setattr(logging_config, "ERROR_LOG_PATH", tmp_path / "error.log")
+    return tmp_path / "app.log"
 
 
 def test_console_logging_hides_file_only_messages_and_sql(
@@ -80,3 +103,86 @@ def test_console_logging_allows_sql_when_echo_is_enabled(
         logging.getLogger("sqlalchemy.engine.Engine").info("SELECT 42")
 
     assert "SELECT 42" in stream.getvalue()
+
+
+def test_file_logging_is_queued_json_lines_with_correlation_id(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify file records go through the queue as JSON lines with the ID."""
+    monkeypatch.setenv("AGILEFORGE_LOG_FORMAT", "json")
+    app_log = _use_log_dir(monkeypatch, tmp_path)
+    configure_logging()
+
+    assert any(
+        isinstance(handler, logging.handlers.QueueHandler)
+        for handler in logging.getLogger().handlers
+    )
+    with correlation_scope("req-42"):
+        logging.getLogger("tests.queued").info("queued %s", "line")
+    file_log_queue.stop()
+
+    records = [json.loads(line) for line in app_log.read_text().splitlines()]
+    queued = [record for record in records if record["logger"] == "tests.queued"]
+    assert queued == [
+        {
+            "ts": queued[0]["ts"],
+            "level": "INFO",
+            "logger": "tests.queued",
+            "message": "queued line",
+            "correlation_id": "req-42",
+        }
+    ]
+
+
+def test_full_queue_drops_and_counts_records() -> None:
+    """Verify the drop policy never blocks the caller on a full queue."""
+    runtime_metrics.reset()
+    handler = logging_config._BoundedQueueHandler(queue.Queue(maxsize=1), block=False)
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "x", None, None)
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.queue.qsize() == 1
+    assert runtime_metrics.snapshot()["counters"]["log_records_dropped"] == 1
+
+
+def test_sampling_thins_only_low_level_records_of_sampled_loggers() -> None:
+    """Verify sampling keeps warnings and other loggers untouched."""
+    sampler = logging_config._SamplingFilter(logger_prefixes=("sqlalchemy",), rate=0.25)
+
+    def make(name: str, level: int) -> logging.LogRecord:
+        return logging.LogRecord(name, level, __file__, 1, "x", None, None)
+
+    kept = [
+        sampler.filter(make("sqlalchemy.engine.Engine", logging.INFO))
+        for _ in range(16)
+    ]
+    assert kept.count(True) == 4  # noqa: PLR2004
+    assert sampler.filter(make("sqlalchemy.engine.Engine", logging.WARNING))
+    assert sampler.filter(make("api", logging.INFO))
+
+    record = make("sqlalchemy.pool", logging.INFO)
+    while not sampler.filter(record):
+        record = make("sqlalchemy.pool", logging.INFO)
+    assert sampler.filter(record)  # a kept record passes the handler copy too
+
+
+def test_correlation_middleware_reuses_or_generates_request_id() -> None:
+    """Verify each request gets a correlation ID echoed on the response."""
+    app = FastAPI()
+    app.add_middleware(CorrelationIdMiddleware)
+
+    @app.get("/id")
+    async def current_id() -> dict[str, str | None]:
+        return {"correlation_id": get_correlation_id()}
+
+    client = TestClient(app)
+    reused = client.get("/id", headers={"X-Request-ID": "req-7"})
+    assert reused.json() == {"correlation_id": "req-7"}
+    assert reused.headers["x-request-id"] == "req-7"
+
+    generated = client.get("/id", headers={"X-Request-ID": "bad id\n"})
+    correlation_id = generated.json()["correlation_id"]
+    assert correlation_id != "bad id\n"
+    assert generated.headers["x-request-id"] == correlation_id
@@ -648,6 +648,10 @@ def test_runtime_modules_import_new_core_product_boundary() -> None:
         root / "services" / "orchestrator_context_service.py",
         "agile_sqlmodel",
     )
+    project_structure_core_imports = _imported_names_from(
+        root / "services" / "project_structure.py",
+        "models.core",
+    )
     compiler_core_imports = _imported_names_from(
         root / "services" / "specs" / "compiler_service.py",
         "models.core",
@@ -667,7 +671,8 @@ def test_runtime_modules_import_new_core_product_boundary() -> None:
 
     assert {"Product", "SprintStory"} <= orchestrator_query_core_imports
     assert "Product" not in orchestrator_query_agile_imports
-    assert {"Product", "Epic", "Feature", "Theme"} <= orchestrator_context_core_imports
+    assert {"Product"} <= orchestrator_context_core_imports
+    assert {"Epic", "Feature", "Theme"} <= project_structure_core_imports
     assert "Product" not in orchestrator_context_agile_imports
     assert {"Product"} <= compiler_core_imports
     assert "Product" not in compiler_agile_imports
@@ -702,15 +707,14 @@ def test_runtime_modules_import_new_core_link_boundary() -> None:
 def test_runtime_modules_import_new_core_hierarchy_boundary() -> None:
     """Verify runtime modules import new core hierarchy boundary."""
     root = Path(__file__).resolve().parents[1]
-    orchestrator_context_text = (
-        root / "services" / "orchestrator_context_service.py"
-    ).read_text(encoding="utf-8")
     story_validation_text = (
         root / "services" / "specs" / "story_validation_service.py"
     ).read_text(encoding="utf-8")
     db_tools_text = (root / "tools" / "db_tools.py").read_text(encoding="utf-8")  # noqa: F841
 
-    assert "from models.core import Epic, Feature, Theme" in orchestrator_context_text
+    assert {"Epic", "Feature", "Theme"} <= _imported_names_from(
+        root / "services" / "project_structure.py", "models.core"
+    )
     assert "from models.core import Feature" in story_validation_text
     assert {"Epic", "Feature", "ProductPersona", "Theme"} <= _imported_names_from(
         root / "tools" / "db_tools.py", "models.core"
@@ -778,6 +782,9 @@ def test_runtime_modules_import_new_spec_and_event_boundaries() -> None:
     """Verify runtime modules import new spec and event boundaries."""
     root = Path(__file__).resolve().parents[1]
     api_text = (root / "api.py").read_text(encoding="utf-8")
+    packet_builder_text = (
+        root / "services" / "packets" / "packet_builder.py"
+    ).read_text(encoding="utf-8")
     orchestrator_context_text = (
         root / "services" / "orchestrator_context_service.py"
     ).read_text(encoding="utf-8")
@@ -792,7 +799,7 @@ def test_runtime_modules_import_new_spec_and_event_boundaries() -> None:
         "from models.events import StoryCompletionLog, TaskExecutionLog, WorkflowEvent"
         in api_text
     )
-    assert "from models.specs import CompiledSpecAuthority" in api_text
+    assert "from models.specs import CompiledSpecAuthority" in packet_builder_text
     assert "from models.specs import " in orchestrator_context_text
     assert "from models.specs import " in compiler_service_text
     assert "from models.specs import " in story_validation_text
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, TypedDict, Unpack
 
 from agile_sqlmodel import Product, SpecRegistry
+from services.state_blobs import resolve_blob_text, state_text
 from tests.typing_helpers import require_id
 
 JsonDict = dict[str, Any]
@@ -129,9 +130,9 @@ def test_context_service_select_project_hydrates_spec_and_authority(
     result = select_project(require_id(product.product_id, "product_id"), context)
 
     assert result["success"] is True
-    assert context.state["pending_spec_content"] == "Spec body"
+    assert state_text(context.state, "pending_spec_content") == "Spec body"
     assert context.state["pending_spec_path"] == "specs/spec.md"
-    assert context.state["compiled_authority_cached"] == '{"compiled":true}'
+    assert state_text(context.state, "compiled_authority_cached") == '{"compiled":true}'
     assert context.state["latest_spec_version_id"] == require_id(
         spec.spec_version_id, "spec_version_id"
     )
@@ -139,8 +140,11 @@ def test_context_service_select_project_hydrates_spec_and_authority(
 
     active_project = context.state["active_project"]
     assert active_project["description"] == "Desc"
-    assert active_project["technical_spec"] == "Spec body"
-    assert active_project["compiled_authority_json"] == '{"compiled":true}'
+    assert resolve_blob_text(active_project["technical_spec"]) == "Spec body"
+    assert (
+        resolve_blob_text(active_project["compiled_authority_json"])
+        == '{"compiled":true}'
+    )
     assert active_project["spec_file_path"] == "specs/spec.md"
     expected_loaded_at = spec_loaded_at.replace(tzinfo=None).isoformat()
     assert active_project["spec_loaded_at"] == expected_loaded_at
@@ -96,9 +96,11 @@ def test_orchestrator_query_service_import_boundary() -> None:
 def test_orchestrator_context_service_import_boundary() -> None:
     """Verify orchestrator context service import boundary."""
     module_path = ROOT / "services/orchestrator_context_service.py"
+    # Structure counts (the Sprint consumer) live in the shared summary service.
+    structure_path = ROOT / "services/project_structure.py"
 
-    core_imports = _imported_names_from(module_path, "models.core")
-    core_bound_imports = _bound_import_names_from(module_path, "models.core")
+    core_imports = _imported_names_from(structure_path, "models.core")
+    core_bound_imports = _bound_import_names_from(structure_path, "models.core")
     db_imports = _imported_names_from(module_path, "models.db")
     db_bound_imports = _bound_import_names_from(module_path, "models.db")
     agile_imports = _imported_names_from(module_path, "agile_sqlmodel")
@@ -0,0 +1,51 @@
+"""Tests for the fingerprint-validated packet cache."""
+
+import pytest
+from sqlmodel import Session
+
+from services.packets.packet_cache import (
+    PacketCacheKey,
+    etag_matches,
+    get_or_build_packet,
+    packet_cache,
+    packet_etag,
+)
+
+
+def test_entries_hold_only_the_latest_fingerprint_and_are_bounded(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a new fingerprint rebuilds and the LRU keeps its size bound."""
+    monkeypatch.setenv("AGILEFORGE_PACKET_CACHE_SIZE", "2")
+    builds: list[str] = []
+
+    def packet_for(key: PacketCacheKey, fingerprint: str) -> dict[str, object]:
+        def build() -> dict[str, object]:
+            builds.append(fingerprint)
+            return {"fingerprint": fingerprint}
+
+        return get_or_build_packet(
+            session, key=key, fingerprint=fingerprint, build=build
+        )
+
+    first = PacketCacheKey("task", 1, 2, 3)
+    assert packet_for(first, "a") == {"fingerprint": "a"}
+    assert packet_for(first, "a") == {"fingerprint": "a"}
+    assert packet_for(first, "b") == {"fingerprint": "b"}
+    assert packet_cache.get(session, first, "a") is None
+
+    packet_for(PacketCacheKey("task", 1, 2, 4), "c")
+    packet_for(PacketCacheKey("story", 1, 2, 3, "cursor"), "d")
+    packet_for(first, "b")
+    assert builds == ["a", "b", "c", "d", "b"]
+
+
+def test_etag_matches_if_none_match_lists() -> None:
+    """Verify strong, weak, listed and wildcard validators are honoured."""
+    etag = packet_etag("abc")
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"zzz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"zzz"', etag)
+    assert not etag_matches(None, etag)
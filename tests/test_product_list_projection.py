@@ -0,0 +1,71 @@
+"""Tests for column-projected project list queries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import inspect
+
+from agile_sqlmodel import Product
+from repositories.product import ProductRepository, ProductSummary
+from services.orchestrator_query_service import _query_products
+from tests.typing_helpers import require_id
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+_LARGE_SPEC = "x" * 50_000
+
+
+def _seed(session: Session) -> tuple[int, int]:
+    compiled = Product(
+        name="Compiled",
+        description="Has authority",
+        vision="Vision",
+        technical_spec=_LARGE_SPEC,
+        spec_file_path="specs/compiled.md",
+        compiled_authority_json='{"invariants": []}',
+    )
+    bare = Product(name="Bare", description=None, technical_spec=_LARGE_SPEC)
+    session.add(compiled)
+    session.add(bare)
+    session.commit()
+    return (
+        require_id(compiled.product_id, "product_id"),
+        require_id(bare.product_id, "product_id"),
+    )
+
+
+def test_list_summaries_returns_list_columns_only(session: Session) -> None:
+    """Verify summaries carry list fields and derive the authority flag in SQL."""
+    compiled_id, bare_id = _seed(session)
+
+    summaries = ProductRepository().list_summaries()
+
+    assert [summary.product_id for summary in summaries] == [compiled_id, bare_id]
+    assert summaries[0] == ProductSummary(
+        product_id=compiled_id,
+        name="Compiled",
+        description="Has authority",
+        spec_file_path="specs/compiled.md",
+        has_compiled_authority=True,
+        updated_at=summaries[0].updated_at,
+    )
+    assert summaries[1].has_compiled_authority is False
+    assert summaries[1].spec_file_path is None
+
+
+def test_query_products_defers_spec_blobs(session: Session) -> None:
+    """Verify the projects cache query leaves large text columns unloaded."""
+    _seed(session)
+    session.expunge_all()
+
+    products = _query_products(session)
+
+    assert {product.name for product in products} == {"Compiled", "Bare"}
+    for product in products:
+        state = inspect(product)
+        assert state is not None
+        unloaded = state.unloaded
+        assert {"technical_spec", "compiled_authority_json"} <= unloaded
+        assert "vision" not in unloaded
@@ -0,0 +1,80 @@
+"""Tests for the shared project structure summary."""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from models.core import Epic, Feature, Product, Theme, UserStory
+from services.project_structure import (
+    ProjectStructureSummary,
+    get_project_structure_summary,
+)
+
+
+def _seed_product(session: Session) -> int:
+    product = Product(name="Structure")
+    theme = Theme(title="Theme", product=product)
+    epic = Epic(title="Epic", theme=theme)
+    session.add(Feature(title="Feature", epic=epic))
+    session.commit()
+    assert product.product_id is not None
+    return product.product_id
+
+
+def _summary_with_query_count(
+    engine: Engine, product_id: int
+) -> tuple[ProjectStructureSummary, int]:
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as session:
+            product = session.get(Product, product_id)
+            assert product is not None
+            summary = get_project_structure_summary(session, product)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return summary, len(statements)
+
+
+def test_structure_summary_is_one_query_and_memoized(engine: Engine) -> None:
+    """Verify counts come from one query and are reused until nothing changes."""
+    with Session(engine) as session:
+        product_id = _seed_product(session)
+
+    summary, queries = _summary_with_query_count(engine, product_id)
+    assert summary.counts() == {
+        "themes": 1,
+        "epics": 1,
+        "features": 1,
+        "user_stories": 0,
+        "sprints": 0,
+    }
+    assert queries == 2  # product row + structure summary  # noqa: PLR2004
+
+    cached, queries = _summary_with_query_count(engine, product_id)
+    assert cached is summary
+    assert queries == 1
+
+
+def test_structure_writes_bump_version_and_refresh_summary(engine: Engine) -> None:
+    """Verify a story write invalidates the memoized summary."""
+    with Session(engine) as session:
+        product_id = _seed_product(session)
+    _summary_with_query_count(engine, product_id)
+
+    with Session(engine) as session:
+        product = session.get(Product, product_id)
+        assert product is not None
+        version = product.structure_version
+        session.add(UserStory(title="Story", product_id=product_id))
+        session.commit()
+        session.refresh(product)
+        assert product.structure_version == version + 1
+
+    summary, queries = _summary_with_query_count(engine, product_id)
+    assert summary.counts()["user_stories"] == 1
+    assert queries == 2  # noqa: PLR2004
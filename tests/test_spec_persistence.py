@@ -20,6 +20,7 @@ from sqlalchemy.engine import Engine
 from sqlmodel import Session
 
 from agile_sqlmodel import Product
+from services.state_blobs import state_text
 from tests.typing_helpers import make_tool_context, require_id
 from tools.spec_tools import (
     read_project_specification,
@@ -568,7 +569,10 @@ class TestReadProjectSpecification:
         assert result["success"] is True
         assert result["spec_content"] == "# DB Spec\n\nDatabase body"
         assert result["spec_path"] == str(spec_path)
-        assert context.state["pending_spec_content"] == "# DB Spec\n\nDatabase body"
+        assert (
+            state_text(context.state, "pending_spec_content")
+            == "# DB Spec\n\nDatabase body"
+        )
         assert context.state["pending_spec_path"] == str(spec_path)
 
     def test_read_spec_falls_back_to_file_when_db_blob_is_empty(
@@ -606,7 +610,10 @@ class TestReadProjectSpecification:
         assert result["success"] is True
         assert result["spec_content"] == "# File Spec\n\nFile body"
         assert result["spec_path"] == str(spec_path)
-        assert context.state["pending_spec_content"] == "# File Spec\n\nFile body"
+        assert (
+            state_text(context.state, "pending_spec_content")
+            == "# File Spec\n\nFile body"
+        )
         assert context.state["pending_spec_path"] == str(spec_path)
 
 
@@ -18,6 +18,7 @@ from agile_sqlmodel import (
     SpecRegistry,
 )
 from db.migrations import ensure_schema_current
+from services.state_blobs import state_text
 from tests.typing_helpers import make_tool_context, require_id
 from utils import failure_artifacts
 from utils.failure_artifacts import AgentInvocationError
@@ -416,7 +417,8 @@ def test_preview_spec_authority_returns_success_and_updates_cache(
     assert result["success"] is True
     assert result["compiled_authority"] is not None
     assert (
-        tool_context.state["compiled_authority_cached"] == result["compiled_authority"]
+        state_text(tool_context.state, "compiled_authority_cached")
+        == result["compiled_authority"]
     )
 
 
@@ -500,7 +502,8 @@ def test_preview_spec_authority_honors_legacy_tool_compiler_monkeypatch(
 
     assert result["success"] is True
     assert (
-        tool_context.state["compiled_authority_cached"] == result["compiled_authority"]
+        state_text(tool_context.state, "compiled_authority_cached")
+        == result["compiled_authority"]
     )
 
 
@@ -910,7 +913,7 @@ def test_compile_spec_authority_for_version_returns_cached_authority(
     assert result["authority_id"] == require_id(existing.authority_id, "authority_id")
     assert result["content_source"] == "content"
     assert (
-        tool_context.state["compiled_authority_cached"]
+        state_text(tool_context.state, "compiled_authority_cached")
         == existing.compiled_artifact_json
     )
     session.refresh(sample_product)
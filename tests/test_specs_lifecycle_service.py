@@ -9,6 +9,7 @@ from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from agile_sqlmodel import Product, SpecRegistry
+from services.state_blobs import state_text
 from tests.typing_helpers import make_tool_context
 
 
@@ -310,7 +311,7 @@ def test_read_project_specification_prefers_db_blob_and_updates_context_state(
     assert result["success"] is True
     assert result["spec_content"] == "# DB Spec\n\nDatabase body"
     assert result["spec_path"] == str(spec_path)
-    assert ctx.state["pending_spec_content"] == "# DB Spec\n\nDatabase body"
+    assert state_text(ctx.state, "pending_spec_content") == "# DB Spec\n\nDatabase body"
     assert ctx.state["pending_spec_path"] == str(spec_path)
     assert "DB Spec" in result["sections"][0]
 
@@ -348,7 +349,7 @@ def test_read_project_specification_falls_back_to_file_when_db_blob_is_empty(
     assert result["success"] is True
     assert result["spec_content"] == "# File Spec\n\nFile body"
     assert result["spec_path"] == str(spec_path)
-    assert ctx.state["pending_spec_content"] == "# File Spec\n\nFile body"
+    assert state_text(ctx.state, "pending_spec_content") == "# File Spec\n\nFile body"
     assert ctx.state["pending_spec_path"] == str(spec_path)
 
 
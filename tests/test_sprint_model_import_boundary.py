@@ -77,7 +77,7 @@ def test_sprint_runtime_consumers_import_sprint_from_models_core_only() -> None:
     module_names = [
         "api",
         "services.orchestrator_query_service",
-        "services.orchestrator_context_service",
+        "services.project_structure",
         "tools.export_snapshot",
         "orchestrator_agent.agent_tools.sprint_planner_tool.tools",
     ]
@@ -0,0 +1,140 @@
+"""Tests for blob-backed session state slots."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text, update
+from sqlmodel import Session, create_engine, select
+
+from db.migrations import migrate_content_blob_sweep
+from models.blobs import ContentBlob, content_digest
+from repositories.content_blobs import ContentBlobRepository
+from repositories.session import WorkflowSessionRepository
+from services.state_blobs import (
+    blob_text_cache,
+    set_state_text,
+    state_text,
+    sweep_unreferenced_blobs,
+)
+from utils.runtime_config import DatabaseTarget
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _stored_digests(session: Session) -> set[str]:
+    session.expire_all()
+    return set(session.exec(select(ContentBlob.digest)).all())
+
+
+def _sessions(tmp_path: Path, state: dict[str, object]) -> WorkflowSessionRepository:
+    db_path = tmp_path / "sessions.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE sessions (app_name TEXT NOT NULL, user_id TEXT NOT NULL, "
+            "id TEXT NOT NULL, state TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO sessions VALUES ('agileforge', 'user', '1', ?)",
+            (json.dumps(state),),
+        )
+    return WorkflowSessionRepository(
+        DatabaseTarget(
+            source="test",
+            sqlite_url=f"sqlite:///{db_path.as_posix()}",
+            sqlite_path=db_path,
+        )
+    )
+
+
+def _age_blobs(session: Session, hours: int) -> None:
+    session.exec(
+        update(ContentBlob).values(
+            touched_at=datetime.now(UTC) - timedelta(hours=hours)
+        )
+    )
+    session.commit()
+
+
+def test_state_holds_reference_and_resolves_lazily(session: Session) -> None:
+    """Verify state stores only a hash that resolves back to the text."""
+    state: dict[str, object] = {}
+    spec = "# Spec\n\n" + "requirement line\n" * 200
+
+    set_state_text(state, "pending_spec_content", spec)
+
+    digest = content_digest(spec)
+    assert state["pending_spec_content"] == f"blob:sha256:{digest}"
+    blob = session.get(ContentBlob, digest)
+    assert blob is not None
+    assert blob.size_bytes == len(spec.encode("utf-8"))
+    assert len(blob.data) < blob.size_bytes
+
+    blob_text_cache.clear()
+    assert state_text(state, "pending_spec_content") == spec
+    legacy = {"pending_spec_content": "legacy text"}
+    assert state_text(legacy, "pending_spec_content") == "legacy text"
+
+
+def test_unsaved_state_copies_never_delete_saved_blobs(session: Session) -> None:
+    """Verify replacing or clearing a slot on a copy keeps the saved text."""
+    saved: dict[str, object] = {}
+    set_state_text(saved, "pending_spec_content", "spec v1")
+    copy = dict(saved)
+
+    set_state_text(copy, "pending_spec_content", "spec v2")
+    set_state_text(copy, "compiled_authority_cached", None)
+    blob_text_cache.clear()
+
+    assert state_text(saved, "pending_spec_content") == "spec v1"
+    assert _stored_digests(session) == {
+        content_digest("spec v1"),
+        content_digest("spec v2"),
+    }
+
+
+def test_sweep_deletes_only_old_unreferenced_blobs(
+    session: Session, tmp_path: Path
+) -> None:
+    """Verify saved references and recently touched blobs survive the sweep."""
+    saved: dict[str, object] = {}
+    set_state_text(saved, "pending_spec_content", "saved spec")
+    set_state_text({}, "pending_spec_content", "abandoned spec")
+    sessions = _sessions(tmp_path, {"active_project": saved})
+
+    assert sweep_unreferenced_blobs(sessions=sessions) == 0
+    _age_blobs(session, hours=2)
+    set_state_text({}, "pending_spec_content", "in-flight spec")
+
+    assert sweep_unreferenced_blobs(sessions=sessions) == 1
+    assert _stored_digests(session) == {
+        content_digest("saved spec"),
+        content_digest("in-flight spec"),
+    }
+
+
+def test_migration_replaces_reference_counts_with_touch_marker() -> None:
+    """Verify blob tables created with ``ref_count`` accept new rows."""
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE content_blobs (digest VARCHAR(64) PRIMARY KEY, "
+                "compression VARCHAR(16) NOT NULL, size_bytes INTEGER NOT NULL, "
+                "data BLOB NOT NULL, ref_count INTEGER NOT NULL, "
+                "created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL)"
+            )
+        )
+
+    assert migrate_content_blob_sweep(engine) == [
+        "added column: content_blobs.touched_at",
+        "dropped column: content_blobs.ref_count",
+    ]
+    assert migrate_content_blob_sweep(engine) == []
+    with Session(engine) as session:
+        ContentBlobRepository(session).put("text")
+        assert _stored_digests(session) == {content_digest("text")}
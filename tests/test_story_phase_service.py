@@ -1,5 +1,6 @@
 """Tests for story phase service."""
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any
 
@@ -9,6 +10,7 @@ from services.phases.story_service import (
     StoryPhaseError,
     complete_story_phase,
     delete_story_requirement,
+    generate_pending_story_drafts,
     generate_story_draft,
     get_story_history,
     get_story_pending,
@@ -1008,6 +1010,206 @@ async def test_delete_story_requirement_rejects_unknown_requirement_before_repo_
     assert delete_called is False
 
 
+def _batch_state(requirements: list[str]) -> JsonDict:
+    return {
+        "roadmap_releases": [{"theme": "Milestone 1", "items": requirements}],
+        "story_saved": {},
+    }
+
+
+def _batch_story_result(parent_requirement: str, *, success: bool) -> JsonDict:
+    return {
+        "success": success,
+        "input_context": {"parent_requirement": parent_requirement},
+        "output_artifact": (
+            _story_artifact(parent_requirement, f"Story for {parent_requirement}")
+            if success
+            else {"error": "STORY_GENERATION_FAILED"}
+        ),
+        "classification": (
+            "reusable_content_result" if success else "nonreusable_provider_failure"
+        ),
+        "draft_kind": "complete_draft" if success else None,
+        "is_reusable": success,
+        "is_complete": success,
+        "request_payload": {"parent_requirement": parent_requirement},
+        "error": None if success else "provider down",
+        "failure_artifact_id": None if success else "artifact-1",
+    }
+
+
+def _batch_kwargs() -> JsonDict:
+    return {
+        "now_iso": lambda: "2026-04-04T12:00:00Z",
+        "set_request_projection": lambda runtime, **kwargs: (
+            runtime.setdefault("request_projection", {}).update(kwargs)
+            or runtime["request_projection"]
+        ),
+        "append_attempt": lambda runtime, attempt: runtime.setdefault(
+            "attempt_history", []
+        ).append(attempt),
+        "promote_reusable_draft": lambda runtime, **kwargs: runtime.update(
+            {
+                "draft_projection": {
+                    "latest_reusable_attempt_id": kwargs["attempt_id"],
+                    "kind": kwargs["kind"],
+                    "is_complete": kwargs["is_complete"],
+                }
+            }
+        ),
+        "mark_feedback_absorbed": lambda runtime, **kwargs: [],  # noqa: ARG005
+        "failure_meta": lambda story_result, fallback_summary: {  # noqa: ARG005
+            "failure_artifact_id": story_result.get("failure_artifact_id"),
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_pending_story_drafts_bounds_concurrency_and_persists_each() -> (
+    None
+):
+    """Verify batch generation respects the semaphore and saves every result."""
+    requirements = [f"Requirement {index}" for index in range(6)]
+    state = _batch_state(requirements)
+    saved_snapshots: list[set[str]] = []
+    progress: list[JsonDict] = []
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_run_story_agent_from_state(
+        state_arg: JsonDict,
+        *,
+        project_id: int,
+        parent_requirement: str,
+        user_input: str | None,
+    ) -> JsonDict:
+        nonlocal in_flight, peak_in_flight
+        # Each call reads its own snapshot, never the state being merged into.
+        assert state_arg is not state
+        assert state_arg["roadmap_releases"] == state["roadmap_releases"]
+        assert project_id == 7  # noqa: PLR2004
+        assert user_input is None
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _batch_story_result(
+            parent_requirement,
+            success=parent_requirement != "Requirement 3",
+        )
+
+    payload = await generate_pending_story_drafts(
+        project_id=7,
+        max_concurrency=2,
+        load_state=lambda: _async_value(state),
+        save_state=lambda updated: saved_snapshots.append(
+            set(updated.get("story_attempts", {}))
+        ),
+        run_story_agent_from_state=fake_run_story_agent_from_state,
+        report_progress=progress.append,
+        **_batch_kwargs(),
+    )
+
+    data = payload["data"]
+    assert peak_in_flight == 2  # noqa: PLR2004
+    assert [item["parent_requirement"] for item in data["items"]] == requirements
+    assert data["total_count"] == 6  # noqa: PLR2004
+    assert data["generated_count"] == 5  # noqa: PLR2004
+    assert data["failed_count"] == 1
+    assert data["items"][3]["status"] == "failed"
+    assert data["items"][3]["failure_artifact_id"] == "artifact-1"
+    assert len(saved_snapshots) == 6  # noqa: PLR2004
+    assert saved_snapshots[-1] == set(requirements)
+    assert set(state["story_outputs"]) == set(requirements) - {"Requirement 3"}
+    runtime = state["interview_runtime"]["story"]["Requirement 0"]
+    assert runtime["attempt_history"][0]["trigger"] == "batch_generate"
+    finished = [event for event in progress if event["event"] == "finished"]
+    assert [event["completed_count"] for event in finished] == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_generate_pending_story_drafts_skips_saved_and_attempted() -> None:
+    """Verify only requirements without working state are generated."""
+    state = _pending_state()
+    state["roadmap_releases"][0]["items"].append("Requirement C")
+    called: list[str] = []
+
+    async def fake_run_story_agent_from_state(
+        _state: JsonDict,
+        *,
+        project_id: int,  # noqa: ARG001
+        parent_requirement: str,
+        user_input: str | None,  # noqa: ARG001
+    ) -> JsonDict:
+        called.append(parent_requirement)
+        return _batch_story_result(parent_requirement, success=True)
+
+    payload = await generate_pending_story_drafts(
+        project_id=7,
+        max_concurrency=4,
+        load_state=lambda: _async_value(state),
+        save_state=lambda updated: None,  # noqa: ARG005
+        run_story_agent_from_state=fake_run_story_agent_from_state,
+        **_batch_kwargs(),
+    )
+
+    assert called == ["Requirement C"]
+    assert payload["data"]["total_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_pending_story_drafts_fails_only_raising_requirements() -> None:
+    """Verify an agent call that raises fails only its own requirement."""
+    state = _batch_state(["Requirement A", "Requirement B", "Requirement C"])
+    saves: list[list[str]] = []
+
+    async def fake_run_story_agent_from_state(
+        _state: JsonDict,
+        *,
+        project_id: int,  # noqa: ARG001
+        parent_requirement: str,
+        user_input: str | None,  # noqa: ARG001
+    ) -> JsonDict:
+        if parent_requirement == "Requirement B":
+            msg = "connection reset"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0)
+        return _batch_story_result(parent_requirement, success=True)
+
+    payload = await generate_pending_story_drafts(
+        project_id=7,
+        max_concurrency=3,
+        load_state=lambda: _async_value(state),
+        save_state=lambda updated: saves.append(sorted(updated["story_attempts"])),
+        run_story_agent_from_state=fake_run_story_agent_from_state,
+        **_batch_kwargs(),
+    )
+
+    items = payload["data"]["items"]
+    assert [item["status"] for item in items] == ["generated", "failed", "generated"]
+    assert items[1]["error"] == "connection reset"
+    assert items[1]["attempt_id"] is None
+    assert payload["data"]["generated_count"] == 2  # noqa: PLR2004
+    assert payload["data"]["failed_count"] == 1
+    assert saves[-1] == ["Requirement A", "Requirement C"]
+
+
+@pytest.mark.asyncio
+async def test_generate_pending_story_drafts_rejects_non_positive_concurrency() -> None:
+    """Verify an invalid concurrency bound is rejected before any work starts."""
+    with pytest.raises(StoryPhaseError) as exc_info:
+        await generate_pending_story_drafts(
+            project_id=7,
+            max_concurrency=0,
+            load_state=lambda: _async_value(_batch_state(["Requirement A"])),
+            save_state=lambda updated: None,  # noqa: ARG005
+            run_story_agent_from_state=lambda *args, **kwargs: _async_value({}),  # noqa: ARG005
+            **_batch_kwargs(),
+        )
+
+    assert exc_info.value.status_code == 400  # noqa: PLR2004
+
+
 def _reset_subject_working_set(
     runtime: JsonDict, *, created_at: str, summary: str
 ) -> JsonDict:
@@ -3,7 +3,11 @@
 import pytest
 
 from utils import model_config
-from utils.model_config import get_story_pipeline_mode
+from utils.model_config import (
+    StoryPipelineConcurrencyError,
+    get_story_pipeline_max_concurrency,
+    get_story_pipeline_mode,
+)
 
 
 def test_get_story_pipeline_mode_defaults_to_batch(
@@ -22,3 +26,29 @@ def test_get_story_pipeline_mode_reads_single(monkeypatch: pytest.MonkeyPatch) -
         lambda: {"story_pipeline": {"mode": "single"}},
     )
     assert get_story_pipeline_mode() == "single"
+
+
+def test_get_story_pipeline_max_concurrency_defaults_when_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Default to the module constant when config omits the key."""
+    monkeypatch.setattr(model_config, "_load_config", dict)
+    assert (
+        get_story_pipeline_max_concurrency()
+        == model_config.DEFAULT_STORY_PIPELINE_MAX_CONCURRENCY
+    )
+
+
+@pytest.mark.parametrize("value", [0, -1, "many", True])
+def test_get_story_pipeline_max_concurrency_rejects_invalid_values(
+    monkeypatch: pytest.MonkeyPatch,
+    value: object,
+) -> None:
+    """Reject non-positive or non-integer concurrency bounds."""
+    monkeypatch.setattr(
+        model_config,
+        "_load_config",
+        lambda: {"story_pipeline": {"max_concurrency": value}},
+    )
+    with pytest.raises(StoryPipelineConcurrencyError):
+        get_story_pipeline_max_concurrency()
@@ -0,0 +1,234 @@
+"""Tests for write-time story input hashing and validation staleness."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import create_engine, text
+from sqlmodel import Session
+
+from db.migrations import migrate_story_validation_freshness
+from models.core import Product, UserStory
+from models.specs import CompiledSpecAuthority, SpecRegistry
+from services.specs.revalidation import find_stale_story_ids, revalidate_stale_stories
+from utils.story_inputs import compute_story_input_hash
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.engine import Engine
+
+
+def _evidence(input_hash: str, spec_version_id: int = 1) -> str:
+    return json.dumps(
+        {
+            "spec_version_id": spec_version_id,
+            "validated_at": datetime.now(UTC).isoformat(),
+            "input_hash": input_hash,
+        }
+    )
+
+
+def _seed_story(session: Session) -> tuple[UserStory, SpecRegistry]:
+    product = Product(name="Freshness")
+    session.add(product)
+    session.commit()
+    assert product.product_id is not None
+    spec = SpecRegistry(
+        product_id=product.product_id,
+        spec_hash="a" * 64,
+        content="# Spec",
+        status="approved",
+    )
+    story = UserStory(
+        product_id=product.product_id,
+        title="Export report",
+        story_description="As a user I want to export a report.",
+        acceptance_criteria="- CSV download works",
+    )
+    session.add(spec)
+    session.add(story)
+    session.commit()
+    return story, spec
+
+
+def _validate(story: UserStory, session: Session, spec_version_id: int) -> None:
+    story.validation_evidence = _evidence(
+        compute_story_input_hash(story), spec_version_id
+    )
+    story.accepted_spec_version_id = spec_version_id
+    session.add(story)
+    session.commit()
+
+
+def test_story_text_edits_mark_evidence_stale_until_revalidated(
+    session: Session,
+) -> None:
+    """Verify the write listener keeps the hash and stale flag current."""
+    story, spec = _seed_story(session)
+    assert spec.spec_version_id is not None
+    assert story.story_input_hash == compute_story_input_hash(story)
+    assert story.validation_stale is False
+
+    _validate(story, session, spec.spec_version_id)
+    assert story.validation_stale is False
+
+    story.title = "Export report as PDF"
+    session.add(story)
+    session.commit()
+    assert story.story_input_hash == compute_story_input_hash(story)
+    assert story.validation_stale is True
+    assert find_stale_story_ids(session) == [story.story_id]
+
+    story.story_points = 3
+    session.add(story)
+    session.commit()
+    assert story.validation_stale is True
+
+    story.acceptance_criteria = "- PDF download works"
+    _validate(story, session, spec.spec_version_id)
+    assert story.validation_stale is False
+
+    story.validation_evidence = _evidence("0" * 64, spec.spec_version_id)
+    session.add(story)
+    session.commit()
+    assert story.validation_stale is True
+
+
+def test_repinning_or_recompiling_the_authority_marks_stories_stale(
+    session: Session,
+) -> None:
+    """Verify authority changes flag stories pinned to the affected version."""
+    story, spec = _seed_story(session)
+    assert spec.spec_version_id is not None
+    _validate(story, session, spec.spec_version_id)
+
+    authority = CompiledSpecAuthority(
+        spec_version_id=spec.spec_version_id,
+        compiler_version="1",
+        prompt_hash="b" * 64,
+        scope_themes="[]",
+        invariants="[]",
+        eligible_feature_ids="[]",
+    )
+    session.add(authority)
+    session.commit()
+    session.refresh(story)
+    assert story.validation_stale is True
+
+    _validate(story, session, spec.spec_version_id)
+    assert story.validation_stale is False
+    authority.compiler_version = "2"
+    session.add(authority)
+    session.commit()
+    session.refresh(story)
+    assert story.validation_stale is True
+
+    other_spec = SpecRegistry(
+        product_id=story.product_id,
+        spec_hash="c" * 64,
+        content="# Spec v2",
+        status="approved",
+    )
+    session.add(other_spec)
+    session.commit()
+    _validate(story, session, spec.spec_version_id)
+    story.accepted_spec_version_id = other_spec.spec_version_id
+    session.add(story)
+    session.commit()
+    assert story.validation_stale is True
+
+
+def test_revalidation_sweep_validates_only_stale_stories(
+    engine: Engine, session: Session
+) -> None:
+    """Verify the sweeper targets flagged stories and fresh evidence clears them."""
+    story, spec = _seed_story(session)
+    assert spec.spec_version_id is not None
+    _validate(story, session, spec.spec_version_id)
+    fresh = UserStory(product_id=story.product_id, title="Untouched story")
+    session.add(fresh)
+    session.commit()
+    story.title = "Export report as PDF"
+    session.add(story)
+    session.commit()
+    calls: list[dict[str, Any]] = []
+
+    def validate(params: dict[str, Any]) -> dict[str, Any]:
+        calls.append(params)
+        with Session(engine) as validation_session:
+            target = validation_session.get(UserStory, params["story_id"])
+            assert target is not None
+            _validate(target, validation_session, params["spec_version_id"])
+        return {"success": True, "passed": True}
+
+    result = revalidate_stale_stories(
+        project_id=story.product_id,
+        mode="deterministic",
+        engine=engine,
+        validate=validate,
+    )
+
+    assert calls == [
+        {
+            "story_id": story.story_id,
+            "spec_version_id": spec.spec_version_id,
+            "mode": "deterministic",
+        }
+    ]
+    assert result["checked_count"] == 1
+    assert result["passed_story_ids"] == [story.story_id]
+    assert find_stale_story_ids(session) == []
+
+
+def test_migration_backfills_hashes_and_flags_outdated_evidence(
+    tmp_path: Path,
+) -> None:
+    """Verify legacy stories get a hash and a stale flag from their evidence."""
+    engine = create_engine(f"sqlite:///{(tmp_path / 'legacy.sqlite3').as_posix()}")
+    current = {"title": "A", "story_description": "B", "acceptance_criteria": "C"}
+    current_hash = compute_story_input_hash(type("Row", (), current)())
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE user_stories (
+                    story_id INTEGER PRIMARY KEY,
+                    title VARCHAR NOT NULL,
+                    story_description TEXT,
+                    acceptance_criteria TEXT,
+                    validation_evidence TEXT
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO user_stories VALUES
+                    (1, 'A', 'B', 'C', :fresh),
+                    (2, 'A', 'B', 'C', :outdated),
+                    (3, 'A', 'B', 'C', NULL)
+                """
+            ),
+            {"fresh": _evidence(current_hash), "outdated": _evidence("0" * 64)},
+        )
+
+    actions = migrate_story_validation_freshness(engine)
+
+    assert "backfilled user_stories.story_input_hash rows: 3" in actions
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT story_id, story_input_hash, validation_stale "
+                "FROM user_stories ORDER BY story_id"
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        (1, current_hash, 0),
+        (2, current_hash, 1),
+        (3, current_hash, 0),
+    ]
+    assert migrate_story_validation_freshness(engine) == []
@@ -423,3 +423,36 @@ def test_validate_story_with_spec_authority_uses_service_owned_defaults(
     assert persisted["story"].story_id == story.story_id
     assert persisted["passed"] is True
     assert persisted["evidence"].spec_version_id == spec_version_id
+
+
+@pytest.mark.asyncio
+async def test_run_async_task_uses_shared_validator_loop_from_worker_threads() -> None:
+    """Verify worker-thread validator calls run on the bound loop, rate limited."""
+    import asyncio  # noqa: PLC0415
+
+    from services.specs.story_validation_service import (  # noqa: PLC0415
+        _run_async_task,
+        shared_validator_loop,
+    )
+
+    loop = asyncio.get_running_loop()
+    gate_calls: list[str] = []
+
+    async def gate() -> None:
+        gate_calls.append("gate")
+
+    async def which_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def call_from_thread() -> asyncio.AbstractEventLoop:
+        return _run_async_task(which_loop())
+
+    with shared_validator_loop(loop, before_call=gate):
+        used = await asyncio.gather(
+            asyncio.to_thread(call_from_thread), asyncio.to_thread(call_from_thread)
+        )
+    unbound = await asyncio.to_thread(call_from_thread)
+
+    assert used == [loop, loop]
+    assert gate_calls == ["gate", "gate"]
+    assert unbound is not loop
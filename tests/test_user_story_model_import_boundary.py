@@ -49,7 +49,7 @@ def test_task3_user_story_consumers_import_user_story_from_models_core_only() ->
             "models.core": {"Product", "Sprint", "SprintStory", "UserStory"},
             "agile_sqlmodel": set(),
         },
-        "services.orchestrator_context_service": {
+        "services.project_structure": {
             "models.core": {
                 "Epic",
                 "Feature",
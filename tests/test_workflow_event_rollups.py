@@ -0,0 +1,221 @@
+"""Tests for hourly/daily workflow event rollups."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from db.migrations import migrate_workflow_event_rollups
+from models.core import Product
+from models.enums import WorkflowEventType
+from models.events import WorkflowEvent, WorkflowEventRollup
+from repositories.workflow_metrics import WorkflowMetricsRepository
+
+
+def _seed_events(session: Session) -> int:
+    product = Product(name="Rollups")
+    session.add(product)
+    session.commit()
+    assert product.product_id is not None
+    base = datetime(2025, 3, 4, 10, 15, tzinfo=UTC)
+    session.add_all(
+        [
+            WorkflowEvent(
+                event_type=WorkflowEventType.FSM_STATE_DWELL,
+                product_id=product.product_id,
+                timestamp=base.replace(minute=minute),
+                duration_seconds=duration,
+                event_metadata=json.dumps({"from_state": "VISION_INTERVIEW"}),
+            )
+            for minute, duration in ((1, 4.0), (20, 40.0), (40, 400.0))
+        ]
+    )
+    session.commit()
+    session.add_all(
+        [
+            WorkflowEvent(
+                event_type=WorkflowEventType.FSM_STATE_DWELL,
+                product_id=product.product_id,
+                timestamp=base.replace(hour=14),
+                duration_seconds=8.0,
+                event_metadata=json.dumps({"from_state": "VISION_INTERVIEW"}),
+            ),
+            WorkflowEvent(
+                event_type=WorkflowEventType.SPRINT_PLAN_SAVED,
+                product_id=product.product_id,
+                timestamp=base,
+                turn_count=3,
+            ),
+        ]
+    )
+    session.commit()
+    return product.product_id
+
+
+def _rollup_rows(engine: Engine) -> list[tuple[object, ...]]:
+    with engine.connect() as conn:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                text(
+                    "SELECT granularity, bucket_start, product_id, event_type, "
+                    "state, event_count, duration_count, duration_total, "
+                    "duration_min, duration_max, duration_histogram, "
+                    "turn_count_total, turn_count_events "
+                    "FROM workflow_event_rollups ORDER BY granularity, "
+                    "bucket_start, event_type, state"
+                )
+            )
+        ]
+
+
+def test_inserted_events_update_hourly_and_daily_rollups(session: Session) -> None:
+    """Verify each insert is folded into its hour and day buckets."""
+    product_id = _seed_events(session)
+
+    rollups = session.exec(
+        select(WorkflowEventRollup).where(
+            WorkflowEventRollup.event_type == WorkflowEventType.FSM_STATE_DWELL
+        )
+    ).all()
+    by_bucket = {(row.granularity, row.bucket_start): row for row in rollups}
+
+    assert set(by_bucket) == {
+        ("hour", datetime(2025, 3, 4, 10)),  # noqa: DTZ001
+        ("hour", datetime(2025, 3, 4, 14)),  # noqa: DTZ001
+        ("day", datetime(2025, 3, 4)),  # noqa: DTZ001
+    }
+    day = by_bucket[("day", datetime(2025, 3, 4))]  # noqa: DTZ001
+    assert day.product_id == product_id
+    assert day.state == "VISION_INTERVIEW"
+    assert day.event_count == 4  # noqa: PLR2004
+    assert day.duration_total == 452.0  # noqa: PLR2004
+    assert (day.duration_min, day.duration_max) == (4.0, 400.0)
+
+
+def test_repository_summary_reports_counts_and_percentiles(session: Session) -> None:
+    """Verify the query API merges buckets into per-type metrics."""
+    product_id = _seed_events(session)
+
+    metrics = {
+        metric.event_type: metric
+        for metric in WorkflowMetricsRepository(session).summary(
+            product_id=product_id, granularity="hour"
+        )
+    }
+
+    dwell = metrics[WorkflowEventType.FSM_STATE_DWELL.value]
+    assert dwell.event_count == 4  # noqa: PLR2004
+    assert dwell.avg_duration_sec == 113.0  # noqa: PLR2004
+    assert dwell.p50_duration_sec == 10.0  # noqa: PLR2004
+    assert dwell.p95_duration_sec == 400.0  # noqa: PLR2004
+    saved = metrics[WorkflowEventType.SPRINT_PLAN_SAVED.value]
+    assert saved.duration_count == 0
+    assert saved.p50_duration_sec is None
+    assert saved.avg_turn_count == 3.0  # noqa: PLR2004
+
+
+def test_backfill_rebuilds_rollups_from_existing_events(
+    engine: Engine, session: Session
+) -> None:
+    """Verify the migration backfill matches the incrementally kept rollups."""
+    _seed_events(session)
+    expected = _rollup_rows(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM workflow_event_rollups"))
+
+    actions = migrate_workflow_event_rollups(engine)
+
+    assert f"backfilled {len(expected)} workflow_event_rollups row(s)" in actions
+    assert _rollup_rows(engine) == expected
+    assert migrate_workflow_event_rollups(engine) == []
+
+
+def test_concurrent_writers_opening_one_bucket_both_commit(tmp_path: Path) -> None:
+    """Verify a writer waiting on another's new bucket folds into the same row."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'rollups.db'}",
+        connect_args={"check_same_thread": False, "timeout": 10},
+    )
+    SQLModel.metadata.create_all(engine)
+    timestamp = datetime(2025, 3, 4, 10, 5, tzinfo=UTC)
+
+    with Session(engine) as first, Session(engine) as second:
+        first.add(
+            WorkflowEvent(
+                event_type=WorkflowEventType.SPRINT_PLAN_SAVED,
+                timestamp=timestamp,
+                turn_count=1,
+            )
+        )
+        first.flush()
+        second.add(
+            WorkflowEvent(
+                event_type=WorkflowEventType.SPRINT_PLAN_SAVED,
+                timestamp=timestamp,
+                turn_count=2,
+            )
+        )
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(second.commit)
+            time.sleep(0.2)
+            first.commit()
+            pending.result(timeout=10)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                "SELECT granularity, product_id, event_count, turn_count_total "
+                "FROM workflow_event_rollups ORDER BY granularity"
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [("day", 0, 2, 3), ("hour", 0, 2, 3)]
+
+
+def test_migration_rebuilds_rollups_keyed_on_null_product(engine: Engine) -> None:
+    """Verify split NULL-product rows are rebuilt under one sentinel key."""
+    with Session(engine) as session:
+        session.add(
+            WorkflowEvent(
+                event_type=WorkflowEventType.SPRINT_PLAN_SAVED,
+                timestamp=datetime(2025, 3, 4, 10, tzinfo=UTC),
+            )
+        )
+        session.commit()
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE workflow_event_rollups"))
+        conn.execute(
+            text(
+                "CREATE TABLE workflow_event_rollups (rollup_id INTEGER PRIMARY KEY, "
+                "granularity VARCHAR(8) NOT NULL, bucket_start DATETIME NOT NULL, "
+                "product_id INTEGER, event_type VARCHAR(20) NOT NULL, "
+                "state VARCHAR(100) NOT NULL DEFAULT '', event_count INTEGER, "
+                "duration_count INTEGER, duration_total FLOAT, duration_min FLOAT, "
+                "duration_max FLOAT, duration_histogram TEXT, "
+                "turn_count_total INTEGER, turn_count_events INTEGER, "
+                "UNIQUE (granularity, bucket_start, product_id, event_type, state))"
+            )
+        )
+        for _ in range(2):
+            conn.execute(
+                text(
+                    "INSERT INTO workflow_event_rollups (granularity, bucket_start, "
+                    "product_id, event_type, state, event_count, duration_count, "
+                    "duration_total, duration_histogram, turn_count_total, "
+                    "turn_count_events) VALUES ('day', '2025-03-04 00:00:00.000000', "
+                    "NULL, 'SPRINT_PLAN_SAVED', '', 1, 0, 0, '{}', 0, 0)"
+                )
+            )
+
+    actions = migrate_workflow_event_rollups(engine)
+
+    assert "cleared workflow_event_rollups keyed on NULL product_id" in actions
+    assert [row[2:6] for row in _rollup_rows(engine)] == [
+        (0, "SPRINT_PLAN_SAVED", "", 1),
+        (0, "SPRINT_PLAN_SAVED", "", 1),
+    ]
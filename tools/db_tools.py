@@ -241,6 +241,7 @@ def persist_roadmap(
                     title=epic_data.get("epic_title", "Unnamed Epic"),
                     summary=epic_data.get("epic_summary", ""),
                     theme_id=theme.theme_id,
+                    product_id=product_id,
                 )
                 session.add(epic)
                 session.flush()
@@ -255,6 +256,7 @@ def persist_roadmap(
                         title=feature_data.get("title", "Unnamed Feature"),
                         description=feature_data.get("description", ""),
                         epic_id=epic.epic_id,
+                        product_id=product_id,
                     )
                     session.add(feature)
                     session.flush()
@@ -395,10 +397,8 @@ def query_product_structure(product_id: int) -> dict[str, Any]:
                 "error": f"Product {product_id} not found",
             }
         themes = _load_product_themes(session, product_id)
-        theme_ids = [theme.theme_id for theme in themes if theme.theme_id is not None]
-        epics = _load_epics_for_theme_ids(session, theme_ids)
-        epic_ids = [epic.epic_id for epic in epics if epic.epic_id is not None]
-        features = _load_features_for_epic_ids(session, epic_ids)
+        epics = _load_product_epics(session, product_id)
+        features = _load_product_features(session, product_id)
         feature_ids = [
             feature.feature_id for feature in features if feature.feature_id is not None
         ]
@@ -418,23 +418,13 @@ def _load_product_themes(session: Session, product_id: int) -> list[Theme]:
     return list(session.exec(select(Theme).where(Theme.product_id == product_id)).all())
 
 
-def _load_epics_for_theme_ids(session: Session, theme_ids: list[int]) -> list[Epic]:
-    if not theme_ids:
-        return []
-    return list(
-        session.exec(
-            select(Epic).where(cast("Any", Epic.theme_id).in_(theme_ids))
-        ).all()
-    )
+def _load_product_epics(session: Session, product_id: int) -> list[Epic]:
+    return list(session.exec(select(Epic).where(Epic.product_id == product_id)).all())
 
 
-def _load_features_for_epic_ids(session: Session, epic_ids: list[int]) -> list[Feature]:
-    if not epic_ids:
-        return []
+def _load_product_features(session: Session, product_id: int) -> list[Feature]:
     return list(
-        session.exec(
-            select(Feature).where(cast("Any", Feature.epic_id).in_(epic_ids))
-        ).all()
+        session.exec(select(Feature).where(Feature.product_id == product_id)).all()
     )
 
 
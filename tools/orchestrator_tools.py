@@ -47,6 +47,7 @@ from services.orchestrator_query_service import (
 from services.orchestrator_query_service import (
     utc_now_iso as _utc_now_iso_service,
 )
+from services.state_blobs import set_state_text
 
 if TYPE_CHECKING:
     from google.adk.tools import ToolContext
@@ -433,7 +434,7 @@ def load_specification_from_file(
         state: dict[str, Any] = cast("dict[str, Any]", tool_context.state)
         # Primary keys for authority gate fallback (must match keys used elsewhere)
         state["pending_spec_path"] = str(path.absolute())
-        state["pending_spec_content"] = content
+        set_state_text(state, "pending_spec_content", content)
 
     logger.debug(
         "Loaded specification file '%s' (%0.1fKB).",
@@ -168,14 +168,8 @@ def _load_themes(session: Session, product_id: int) -> list[Theme]:
     return list(session.exec(select(Theme).where(Theme.product_id == product_id)).all())
 
 
-def _load_epics(session: Session, theme_ids: list[int]) -> list[Epic]:
-    if not theme_ids:
-        return []
-    return list(
-        session.exec(
-            select(Epic).where(cast("Any", Epic.theme_id).in_(theme_ids))
-        ).all()
-    )
+def _load_epics(session: Session, product_id: int) -> list[Epic]:
+    return list(session.exec(select(Epic).where(Epic.product_id == product_id)).all())
 
 
 def _index_epics(
@@ -194,13 +188,9 @@ def _index_epics(
     return epics_by_theme, epic_to_theme, epic_ids
 
 
-def _load_features(session: Session, epic_ids: list[int]) -> list[Feature]:
-    if not epic_ids:
-        return []
+def _load_features(session: Session, product_id: int) -> list[Feature]:
     return list(
-        session.exec(
-            select(Feature).where(cast("Any", Feature.epic_id).in_(epic_ids))
-        ).all()
+        session.exec(select(Feature).where(Feature.product_id == product_id)).all()
     )
 
 
@@ -401,9 +391,9 @@ def query_features_for_stories(
 
             themes = _load_themes(session, query_input.product_id)
             theme_ids = [t.theme_id for t in themes if t.theme_id is not None]
-            epics = _load_epics(session, theme_ids)
+            epics = _load_epics(session, query_input.product_id)
             epics_by_theme, epic_to_theme, epic_ids = _index_epics(theme_ids, epics)
-            features = _load_features(session, epic_ids)
+            features = _load_features(session, query_input.product_id)
             features_by_epic, features_by_theme, feature_ids = _index_features(
                 theme_ids=theme_ids,
                 epic_ids=epic_ids,
@@ -4,16 +4,50 @@ from __future__ import annotations
 
 import json
 import re
+import secrets
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 from utils.failure_artifacts import AgentInvocationError
+from utils.model_config import (
+    ZDR_MAX_BACKOFF_SECONDS,
+    ZDR_MAX_RETRIES,
+    is_zdr_routing_error,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+
+type ProgressListener = Callable[[str, dict[str, Any]], None]
+
+_progress_listener: ContextVar[ProgressListener | None] = ContextVar(
+    "adk_runner_progress_listener",
+    default=None,
+)
+_BACKOFF_RANDOM = secrets.SystemRandom()
+
+
+@dataclass(frozen=True)
+class ZdrRetryPolicy:
+    """Retry budget for ZDR/privacy routing failures during agent invocation."""
+
+    sleep: Callable[[float], Awaitable[None]]
+    max_retries: int = ZDR_MAX_RETRIES
+    max_backoff_seconds: float = ZDR_MAX_BACKOFF_SECONDS
+    on_retry: Callable[[int, BaseException], None] | None = None
+
+
+_retry_policy: ContextVar[ZdrRetryPolicy | None] = ContextVar(
+    "adk_runner_retry_policy",
+    default=None,
+)
 
 
 class RunnerIdentityLike(Protocol):
@@ -23,6 +57,60 @@ class RunnerIdentityLike(Protocol):
     user_id: str
 
 
+@contextmanager
+def agent_progress_listener(listener: ProgressListener) -> Iterator[None]:
+    """Route agent progress events to ``listener`` for the current context.
+
+    While a listener is installed, ``invoke_agent_to_text`` runs the agent in
+    SSE streaming mode and reports ``invoking_model``, ``token`` (partial text
+    deltas) and ``validating`` events. Callers without a listener keep the
+    non-streaming behaviour.
+    """
+    token = _progress_listener.set(listener)
+    try:
+        yield
+    finally:
+        _progress_listener.reset(token)
+
+
+@contextmanager
+def agent_retry_policy(policy: ZdrRetryPolicy) -> Iterator[None]:
+    """Retry ZDR routing failures inside ``invoke_agent_to_text``.
+
+    Background workers install a policy so a transient privacy-routing miss
+    is retried with the same random backoff as the agent resilience wrapper,
+    before the runtime records a failed attempt.
+    """
+    token = _retry_policy.set(policy)
+    try:
+        yield
+    finally:
+        _retry_policy.reset(token)
+
+
+def _emit_progress(event: str, **payload: Any) -> None:  # noqa: ANN401
+    report_agent_progress(event, payload)
+
+
+def report_agent_progress(event: str, payload: dict[str, Any]) -> None:
+    """Send a caller-defined event to the listener installed for this context."""
+    listener = _progress_listener.get()
+    if listener is not None:
+        listener(event, payload)
+
+
+def _partial_event_text(event: object) -> str:
+    if not getattr(event, "partial", False):
+        return ""
+    content = getattr(event, "content", None)
+    if not content:
+        return ""
+    return "".join(
+        getattr(part, "text", "") or ""
+        for part in getattr(content, "parts", None) or []
+    )
+
+
 def _iter_exception_chain(exc: BaseException) -> Iterable[BaseException]:
     seen: set[int] = set()
     current: BaseException | None = exc
@@ -129,6 +217,37 @@ async def invoke_agent_to_text(
     no_text_error: str,
 ) -> str:
     """Run an ADK agent with a JSON payload and return the final text response."""
+    policy = _retry_policy.get()
+    zdr_retries = 0
+    while True:
+        try:
+            return await _invoke_agent_once(
+                agent=agent,
+                runner_identity=runner_identity,
+                payload_json=payload_json,
+                no_text_error=no_text_error,
+            )
+        except AgentInvocationError as exc:
+            cause = exc.__cause__ or exc
+            if (
+                policy is None
+                or zdr_retries >= policy.max_retries
+                or not is_zdr_routing_error(cause)
+            ):
+                raise
+            zdr_retries += 1
+            if policy.on_retry is not None:
+                policy.on_retry(zdr_retries, cause)
+            await policy.sleep(_BACKOFF_RANDOM.uniform(0, policy.max_backoff_seconds))
+
+
+async def _invoke_agent_once(
+    *,
+    agent: object,
+    runner_identity: RunnerIdentityLike,
+    payload_json: str,
+    no_text_error: str,
+) -> str:
     session_service = InMemorySessionService()
     runner = Runner(
         agent=cast("Any", agent),
@@ -141,24 +260,34 @@ async def invoke_agent_to_text(
     )
 
     events: list[Any] = []
+    streamed_chunks: list[str] = []
     message = types.Content(
         role="user",
         parts=[types.Part.from_text(text=payload_json)],
     )
+    streaming = _progress_listener.get() is not None
+    run_kwargs: dict[str, Any] = {}
+    if streaming:
+        run_kwargs["run_config"] = RunConfig(streaming_mode=StreamingMode.SSE)
+        _emit_progress("invoking_model", agent_name=getattr(agent, "name", None))
 
     try:
-        events.extend(
-            [
-                event
-                async for event in runner.run_async(
-                    user_id=runner_identity.user_id,
-                    session_id=session.id,
-                    new_message=message,
-                )
-            ]
-        )
+        async for event in runner.run_async(
+            user_id=runner_identity.user_id,
+            session_id=session.id,
+            new_message=message,
+            **run_kwargs,
+        ):
+            delta = _partial_event_text(event)
+            if delta:
+                streamed_chunks.append(delta)
+                _emit_progress("token", text=delta)
+                continue
+            events.append(event)
     except Exception as exc:  # pylint: disable=broad-except
-        partial_output = extract_partial_response_text(events) or None
+        partial_output = (
+            extract_partial_response_text(events) or "".join(streamed_chunks) or None
+        )
         raise AgentInvocationError(
             str(exc),
             partial_output=partial_output,
@@ -169,4 +298,5 @@ async def invoke_agent_to_text(
     response_text = extract_final_response_text(events)
     if not response_text:
         raise ValueError(no_text_error)
+    _emit_progress("validating", response_chars=len(response_text))
     return response_text
@@ -0,0 +1,74 @@
+"""Aggregated branch-coverage counters for the evaluation scripts.
+
+The evaluation scripts mark interesting decisions with ``tracer.branch(name,
+condition)``. While tracing is off, ``branch`` is a bare passthrough: there is
+no message to format and nothing is recorded. While it is on, each call bumps
+one ``(name, outcome)`` counter. ``summary_lines`` turns the counters into a
+branch-coverage report for the end of a run.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _passthrough(_name: str, condition: object) -> bool:
+    return bool(condition)
+
+
+class BranchTracer:
+    """Count how often each named branch was taken and skipped."""
+
+    branch: Callable[[str, object], bool]
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        """Start with empty counters; tracing stays off unless ``enabled``."""
+        self._counts: Counter[tuple[str, bool]] = Counter()
+        self.enable(enabled)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether branch outcomes are being counted."""
+        return self.branch is not _passthrough
+
+    def enable(self, enabled: bool = True) -> None:
+        """Switch counting on or off by swapping the ``branch`` callable."""
+        self.branch = self._count if enabled else _passthrough
+
+    def reset(self) -> None:
+        """Drop every recorded outcome."""
+        self._counts.clear()
+
+    def counts(self) -> dict[str, tuple[int, int]]:
+        """Return ``{name: (times_true, times_false)}`` sorted by name."""
+        names = sorted({name for name, _outcome in self._counts})
+        return {
+            name: (self._counts[(name, True)], self._counts[(name, False)])
+            for name in names
+        }
+
+    def summary_lines(self) -> list[str]:
+        """Render the counters as a branch-coverage report."""
+        counts = self.counts()
+        if not counts:
+            return ["Branch coverage: no branches recorded"]
+        covered = sum(1 for taken, skipped in counts.values() if taken and skipped)
+        width = max(len(name) for name in counts)
+        lines = [f"Branch coverage: {covered}/{len(counts)} branches saw both outcomes"]
+        for name, (taken, skipped) in counts.items():
+            note = ""
+            if not taken:
+                note = " (never true)"
+            elif not skipped:
+                note = " (never false)"
+            lines.append(f"  {name:<{width}}  true={taken:<6} false={skipped}{note}")
+        return lines
+
+    def _count(self, name: str, condition: object) -> bool:
+        outcome = bool(condition)
+        self._counts[(name, outcome)] += 1
+        return outcome
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import gzip
 import hashlib
+import importlib
+import importlib.util
 import json
+import sqlite3
 import traceback
 from collections.abc import Mapping
+from contextlib import closing
 from dataclasses import asdict, dataclass, is_dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TypedDict, Unpack
 
@@ -15,6 +20,32 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 LOGS_DIR = REPO_ROOT / "logs"
 FAILURES_DIR = LOGS_DIR / "failures"
 RAW_OUTPUT_PREVIEW_LIMIT = 500
+INDEX_FILENAME = "index.sqlite3"
+# Bodies are zstd-compressed when the optional ``zstandard`` package is
+# installed, gzip otherwise; legacy uncompressed ``.json`` files stay readable.
+ZSTD_SUFFIX = ".json.zst"
+GZIP_SUFFIX = ".json.gz"
+LEGACY_SUFFIX = ".json"
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS failure_artifacts (
+    artifact_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    project_id INTEGER,
+    phase TEXT NOT NULL,
+    failure_stage TEXT,
+    failure_summary TEXT,
+    created_at TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_failure_artifacts_project_created
+    ON failure_artifacts (project_id, created_at);
+CREATE INDEX IF NOT EXISTS ix_failure_artifacts_created
+    ON failure_artifacts (created_at);
+"""
+_INDEX_COLUMNS = (
+    "artifact_id, path, project_id, phase, failure_stage, failure_summary, "
+    "created_at, size_bytes"
+)
 
 type JsonPrimitive = None | bool | int | float | str
 type JsonValue = JsonPrimitive | list["JsonValue"] | dict[str, "JsonValue"]
@@ -51,6 +82,33 @@ class FailureArtifactResult(TypedDict):
     metadata: FailureMetadataDict
 
 
+class FailureArtifactSummary(TypedDict):
+    """Index row describing one stored artifact, without its body."""
+
+    artifact_id: str
+    phase: str
+    failure_stage: str | None
+    failure_summary: str | None
+    created_at: str
+    size_bytes: int
+
+
+class FailureArtifactPage(TypedDict):
+    """One page of a project's artifact summaries, newest first."""
+
+    items: list[FailureArtifactSummary]
+    total: int
+    limit: int
+    offset: int
+
+
+class FailureSweepResult(TypedDict):
+    """Outcome of a retention sweep."""
+
+    removed: int
+    freed_bytes: int
+
+
 @dataclass(frozen=True)
 class FailureMetadata:
     """Compact metadata attached to phase responses after a failure."""
@@ -139,8 +197,96 @@ def build_failure_metadata(
     )
 
 
+def _zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
 def _artifact_path(phase: str, artifact_id: str) -> Path:
-    return FAILURES_DIR / phase / f"{artifact_id}.json"
+    suffix = ZSTD_SUFFIX if _zstd_available() else GZIP_SUFFIX
+    return FAILURES_DIR / phase / f"{artifact_id}{suffix}"
+
+
+def _compress(path: Path, payload: bytes) -> bytes:
+    if path.name.endswith(ZSTD_SUFFIX):
+        zstandard = importlib.import_module("zstandard")
+        return zstandard.ZstdCompressor().compress(payload)
+    return gzip.compress(payload)
+
+
+def _decompress(path: Path, payload: bytes) -> bytes:
+    if path.name.endswith(ZSTD_SUFFIX):
+        zstandard = importlib.import_module("zstandard")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if path.name.endswith(GZIP_SUFFIX):
+        return gzip.decompress(payload)
+    return payload
+
+
+def _load_artifact_file(path: Path) -> dict[str, JsonValue] | None:
+    loaded = _jsonable(json.loads(_decompress(path, path.read_bytes())))
+    return loaded if isinstance(loaded, dict) else None
+
+
+def _index_row(
+    artifact: Mapping[str, JsonValue], path: Path, size_bytes: int
+) -> tuple[object, ...]:
+    return (
+        artifact["artifact_id"],
+        path.relative_to(FAILURES_DIR).as_posix(),
+        artifact.get("project_id"),
+        artifact.get("phase"),
+        artifact.get("failure_stage"),
+        artifact.get("failure_summary"),
+        artifact.get("created_at"),
+        size_bytes,
+    )
+
+
+def _insert_index_rows(
+    conn: sqlite3.Connection, rows: list[tuple[object, ...]]
+) -> None:
+    conn.executemany(
+        f"INSERT OR REPLACE INTO failure_artifacts ({_INDEX_COLUMNS}) "  # noqa: S608
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _index_existing_files(conn: sqlite3.Connection) -> None:
+    """Index artifacts written before the index existed (one-time scan)."""
+    rows: list[tuple[object, ...]] = []
+    for path in FAILURES_DIR.glob("*/*.json*"):
+        try:
+            artifact = _load_artifact_file(path)
+        except (OSError, ValueError):
+            continue
+        if artifact is not None and isinstance(artifact.get("artifact_id"), str):
+            rows.append(_index_row(artifact, path, path.stat().st_size))
+    _insert_index_rows(conn, rows)
+
+
+def _connect_index() -> sqlite3.Connection:
+    FAILURES_DIR.mkdir(parents=True, exist_ok=True)
+    index_path = FAILURES_DIR / INDEX_FILENAME
+    is_new = not index_path.exists()
+    conn = sqlite3.connect(index_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    with conn:
+        conn.executescript(_INDEX_SCHEMA)
+        if is_new:
+            _index_existing_files(conn)
+    return conn
+
+
+def _summary(row: sqlite3.Row) -> FailureArtifactSummary:
+    return {
+        "artifact_id": row["artifact_id"],
+        "phase": row["phase"],
+        "failure_stage": row["failure_stage"],
+        "failure_summary": row["failure_summary"],
+        "created_at": row["created_at"],
+        "size_bytes": row["size_bytes"],
+    }
 
 
 def _artifact_id(
@@ -224,10 +370,12 @@ def write_failure_artifact(
         "traceback": traceback_text,
         "extra": _jsonable(extra),
     }
-    artifact_path.write_text(
-        json.dumps(artifact, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    body = _compress(
+        artifact_path, json.dumps(artifact, ensure_ascii=False).encode("utf-8")
     )
+    artifact_path.write_bytes(body)
+    with closing(_connect_index()) as conn, conn:
+        _insert_index_rows(conn, [_index_row(artifact, artifact_path, len(body))])
 
     metadata = build_failure_metadata(
         artifact_id=artifact_id,
@@ -247,9 +395,79 @@ def read_failure_artifact(artifact_id: str) -> dict[str, JsonValue] | None:
     if not artifact_id.strip():
         return None
 
-    for path in FAILURES_DIR.glob(f"*/*{artifact_id}.json"):
-        if path.stem == artifact_id:
-            loaded = _jsonable(json.loads(path.read_text(encoding="utf-8")))
-            if isinstance(loaded, dict):
-                return loaded
-    return None
+    with closing(_connect_index()) as conn:
+        row = conn.execute(
+            "SELECT path FROM failure_artifacts WHERE artifact_id = ?",
+            (artifact_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    path = FAILURES_DIR / row["path"]
+    if not path.exists():
+        return None
+    return _load_artifact_file(path)
+
+
+def list_failure_artifacts(
+    project_id: int, *, limit: int = 50, offset: int = 0
+) -> FailureArtifactPage:
+    """Return one page of a project's artifact summaries, newest first."""
+    with closing(_connect_index()) as conn:
+        total = conn.execute(
+            "SELECT COUNT(*) FROM failure_artifacts WHERE project_id = ?",
+            (project_id,),
+        ).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {_INDEX_COLUMNS} FROM failure_artifacts "  # noqa: S608
+            "WHERE project_id = ? "
+            "ORDER BY created_at DESC, artifact_id DESC LIMIT ? OFFSET ?",
+            (project_id, limit, offset),
+        ).fetchall()
+    return {
+        "items": [_summary(row) for row in rows],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+def sweep_failure_artifacts(
+    *,
+    max_age_days: int | None = None,
+    max_total_bytes: int | None = None,
+    now: datetime | None = None,
+) -> FailureSweepResult:
+    """Delete expired artifacts, then the oldest until under the size budget.
+
+    Artifacts older than ``max_age_days`` go first; the oldest remaining ones
+    are then removed while the total exceeds ``max_total_bytes``. ``None``
+    disables either limit.
+    """
+    removed: list[sqlite3.Row] = []
+    with closing(_connect_index()) as conn, conn:
+        rows = conn.execute(
+            "SELECT artifact_id, path, created_at, size_bytes "
+            "FROM failure_artifacts ORDER BY created_at, artifact_id"
+        ).fetchall()
+        kept_bytes = sum(row["size_bytes"] for row in rows)
+        cutoff: str | None = None
+        if max_age_days is not None:
+            cutoff_at = (now or datetime.now(UTC)) - timedelta(days=max_age_days)
+            cutoff = cutoff_at.isoformat().replace("+00:00", "Z")
+        for row in rows:
+            expired = cutoff is not None and row["created_at"] < cutoff
+            over_budget = max_total_bytes is not None and kept_bytes > max_total_bytes
+            if not (expired or over_budget):
+                break
+            removed.append(row)
+            kept_bytes -= row["size_bytes"]
+        conn.executemany(
+            "DELETE FROM failure_artifacts WHERE artifact_id = ?",
+            [(row["artifact_id"],) for row in removed],
+        )
+    for row in removed:
+        (FAILURES_DIR / row["path"]).unlink(missing_ok=True)
+    return {
+        "removed": len(removed),
+        "freed_bytes": sum(row["size_bytes"] for row in removed),
+    }
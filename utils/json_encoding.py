@@ -0,0 +1,141 @@
+"""Shared one-pass JSON encoding for API responses and hashes.
+
+``orjson`` is used when it is installed, otherwise the C-accelerated stdlib
+encoder. Either way a value is encoded in a single walk: types JSON lacks
+(pydantic and SQLModel models, dataclasses, sets, bytes, ...) are converted
+with ``pydantic_core.to_jsonable_python`` only where the encoder meets them.
+That is the conversion FastAPI applies to ``dict[str, Any]`` responses, so
+datetimes keep their ISO form with ``Z`` for UTC and enums encode as their
+value. Values orjson cannot encode (integers beyond 64 bits, say) fall back
+to the stdlib encoder.
+
+orjson never escapes non-ASCII text and spells some floats differently
+(``0.00001`` for ``1e-05``), so the canonical variant only keeps its output
+when it is byte-identical to what the stdlib would produce.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+import math
+import types
+import typing
+from typing import Final
+
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+_ORJSON: Final = (
+    importlib.import_module("orjson")
+    if importlib.util.find_spec("orjson") is not None
+    else None
+)
+# Outside this range orjson and ``repr`` disagree on exponent notation.
+_PLAIN_FLOAT_MIN: Final[float] = 1e-4
+_PLAIN_FLOAT_MAX: Final[float] = 1e16
+_MIN_INT: Final[int] = -(2**63)
+_MAX_INT: Final[int] = 2**64 - 1
+_EXACT_SCALARS: Final = frozenset({str, bool, types.NoneType})
+
+
+def orjson_available() -> bool:
+    """Return whether encoding goes through ``orjson``."""
+    return _ORJSON is not None
+
+
+def _to_jsonable(value: object) -> object:
+    return to_jsonable_python(value, by_alias=True, inf_nan_mode="null")
+
+
+def _default(value: object) -> object:
+    try:
+        return _to_jsonable(value)
+    except PydanticSerializationError as exc:
+        msg = f"Object of type {type(value).__name__} is not JSON serializable"
+        raise TypeError(msg) from exc
+
+
+def _stdlib_dumps(value: object, *, sort_keys: bool) -> str:
+    try:
+        return json.dumps(
+            value,
+            default=_default,
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        # Non-string keys or non-finite floats: convert the tree up front.
+        return json.dumps(
+            _to_jsonable(value),
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+def _orjson_dumps(value: object, *, sort_keys: bool) -> bytes | None:
+    if _ORJSON is None:
+        return None
+    option = (
+        _ORJSON.OPT_NON_STR_KEYS | _ORJSON.OPT_UTC_Z | _ORJSON.OPT_PASSTHROUGH_DATACLASS
+    )
+    if sort_keys:
+        option |= _ORJSON.OPT_SORT_KEYS
+    try:
+        return _ORJSON.dumps(value, default=_default, option=option)
+    except _ORJSON.JSONEncodeError:
+        return None
+
+
+def _is_escaped_ascii(encoded: bytes) -> bool:
+    return encoded.isascii() and b"\x7f" not in encoded
+
+
+def dumps(value: object, *, sort_keys: bool = False) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON."""
+    encoded = _orjson_dumps(value, sort_keys=sort_keys)
+    if encoded is not None:
+        return encoded
+    return _stdlib_dumps(value, sort_keys=sort_keys).encode()
+
+
+def _is_plain_float(value: float) -> bool:
+    return value == 0 or (
+        math.isfinite(value) and _PLAIN_FLOAT_MIN <= abs(value) < _PLAIN_FLOAT_MAX
+    )
+
+
+def is_canonical_scalar(value: object) -> bool:
+    """Return whether both encoders spell the scalar ``value`` identically.
+
+    Only exact ``str``, ``bool`` and ``None`` values, 64-bit integers and
+    floats in the range both encoders write without an exponent qualify;
+    subclasses such as enums do not.
+    """
+    kind = type(value)
+    if kind is float:
+        return _is_plain_float(typing.cast("float", value))
+    if kind is int:
+        return _MIN_INT <= typing.cast("int", value) <= _MAX_INT
+    return kind in _EXACT_SCALARS
+
+
+def canonical_dumps(value: object, *, plain: bool = False) -> str:
+    """Return ``json.dumps(value, sort_keys=True, separators=(",", ":"))``.
+
+    The result is byte-identical to that stdlib call, ASCII escaping included.
+    Pass ``plain=True`` when every leaf of ``value`` is a string-keyed dict or
+    list, or satisfies ``is_canonical_scalar``; only then is orjson used.
+    """
+    if plain and _ORJSON is not None:
+        try:
+            encoded = _ORJSON.dumps(value, option=_ORJSON.OPT_SORT_KEYS)
+        except _ORJSON.JSONEncodeError:
+            pass
+        else:
+            if _is_escaped_ascii(encoded):
+                return encoded.decode("ascii")
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
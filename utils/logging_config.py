@@ -1,22 +1,244 @@
-"""Logging helpers for file and optional console output."""
+"""Logging helpers for file and optional console output.
+
+File logging is non-blocking: loggers only put records on a bounded in-memory
+queue and a ``QueueListener`` thread does the file writes and rotation. When
+the queue is full, records are dropped (counted in ``runtime_metrics``) or the
+caller blocks, per ``AGILEFORGE_LOG_QUEUE_POLICY``. Records carry the current
+correlation ID (the API request's ``X-Request-ID``, or one per CLI run), and
+high-volume loggers below WARNING, SQLAlchemy echo by default, can be sampled.
+"""
 
 from __future__ import annotations
 
+import atexit
+import itertools
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from utils.failure_artifacts import LOGS_DIR
-from utils.runtime_config import get_database_echo
+from utils.runtime_config import (
+    get_database_echo,
+    get_log_format,
+    get_log_queue_policy,
+    get_log_queue_size,
+    get_log_sample_rate,
+    get_log_sampled_loggers,
+)
+from utils.runtime_metrics import runtime_metrics
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 APP_LOG_PATH = LOGS_DIR / "app.log"
 ERROR_LOG_PATH = LOGS_DIR / "error.log"
+CORRELATION_ID_HEADER = "x-request-id"
 _MAX_LOG_BYTES = 5 * 1024 * 1024
 _BACKUP_COUNT = 3
+_FILE_QUEUE_HANDLER_ID = "file-queue"
+_TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+_VALID_CORRELATION_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+_SQL_ECHO_LOGGER = "sqlalchemy.engine.Engine"
+
+_correlation_id: ContextVar[str | None] = ContextVar(
+    "agileforge_correlation_id", default=None
+)
+
+
+def get_correlation_id() -> str | None:
+    """Return the correlation ID bound to the current context, if any."""
+    return _correlation_id.get()
+
+
+def bind_correlation_id(correlation_id: str | None = None) -> str:
+    """Bind ``correlation_id`` (or a new one) to the current context."""
+    value = correlation_id or uuid.uuid4().hex
+    _correlation_id.set(value)
+    return value
+
+
+@contextmanager
+def correlation_scope(correlation_id: str | None = None) -> Iterator[str]:
+    """Bind a correlation ID for the enclosed block only."""
+    value = correlation_id or uuid.uuid4().hex
+    token = _correlation_id.set(value)
+    try:
+        yield value
+    finally:
+        _correlation_id.reset(token)
+
+
+class CorrelationIdMiddleware:
+    """ASGI middleware binding a correlation ID to each HTTP request.
+
+    A well-formed incoming ``X-Request-ID`` is reused, otherwise a new ID is
+    generated; either way it is echoed on the response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap ``app``."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request inside a correlation scope."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        incoming = dict(scope["headers"]).get(CORRELATION_ID_HEADER.encode())
+        candidate = incoming.decode("latin-1") if incoming else ""
+        requested = candidate if _VALID_CORRELATION_ID.match(candidate) else None
+
+        with correlation_scope(requested) as correlation_id:
+
+            async def send_with_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (CORRELATION_ID_HEADER.encode(), correlation_id.encode())
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_id)
+
+
+class _CorrelationIdFilter(logging.Filter):
+    """Stamp records with the producer's correlation ID before queueing."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = _correlation_id.get()
+        return True
+
+
+class _SamplingFilter(logging.Filter):
+    """Keep a deterministic share of sub-WARNING records from chosen loggers.
+
+    The same instance may sit on a logger and on a handler below it; a record
+    kept once is not sampled again.
+    """
+
+    def __init__(self, *, logger_prefixes: tuple[str, ...], rate: float) -> None:
+        super().__init__()
+        self.logger_prefixes = logger_prefixes
+        self.rate = rate
+        self._seen = itertools.count(1)
+
+    def _is_sampled_logger(self, logger_name: str) -> bool:
+        return any(
+            logger_name == prefix or logger_name.startswith(f"{prefix}.")
+            for prefix in self.logger_prefixes
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "log_sampled", False):
+            return True
+        if record.levelno >= logging.WARNING or not self._is_sampled_logger(
+            record.name
+        ):
+            return True
+        seen = next(self._seen)
+        keep = int(seen * self.rate) > int((seen - 1) * self.rate)
+        if keep:
+            record.log_sampled = True
+        return keep
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Render each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record as a JSON line."""
+        payload: dict[str, object] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", None),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops (and counts) or blocks when the queue is full."""
+
+    queue: queue.Queue[logging.LogRecord]
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord], *, block: bool
+    ) -> None:
+        super().__init__(log_queue)
+        self.block = block
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            runtime_metrics.increment("log_records_dropped")
+
+
+class QueuedFileLogging:
+    """Own the bounded queue and listener thread feeding the file handlers."""
+
+    def __init__(self) -> None:
+        """Start idle; ``start`` builds the queue and listener."""
+        self._lock = threading.Lock()
+        self._listener: QueueListener | None = None
+        self._handlers: list[logging.Handler] = []
+
+    def start(
+        self,
+        handlers: Sequence[logging.Handler],
+        *,
+        max_size: int,
+        block: bool,
+        filters: Sequence[logging.Filter] = (),
+    ) -> QueueHandler:
+        """Replace any running listener and return the new queue handler."""
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=max_size)
+        queue_handler = _BoundedQueueHandler(log_queue, block=block)
+        for log_filter in filters:
+            queue_handler.addFilter(log_filter)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        with self._lock:
+            self._stop_locked()
+            listener.start()
+            self._listener = listener
+            self._handlers = list(handlers)
+        return queue_handler
+
+    def _stop_locked(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+
+    def stop(self) -> None:
+        """Flush queued records, stop the listener and close the file handlers."""
+        with self._lock:
+            self._stop_locked()
+
+
+file_log_queue = QueuedFileLogging()
+atexit.register(file_log_queue.stop)
 
 
 class _ConsoleVisibilityFilter(logging.Filter):
@@ -72,7 +294,9 @@ def _ensure_handler(
     logger.addHandler(handler)
 
 
-def _build_handler(path: Path, *, level: int) -> RotatingFileHandler:
+def _build_handler(
+    path: Path, *, level: int, json_lines: bool = False
+) -> RotatingFileHandler:
     handler = RotatingFileHandler(
         path,
         maxBytes=_MAX_LOG_BYTES,
@@ -81,11 +305,20 @@ def _build_handler(path: Path, *, level: int) -> RotatingFileHandler:
     )
     handler.setLevel(level)
     handler.setFormatter(
-        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        JsonLinesFormatter() if json_lines else logging.Formatter(_TEXT_FORMAT)
     )
     return handler
 
 
+def _remove_direct_file_handlers(logger: logging.Logger) -> None:
+    """Drop synchronous file handlers left by an earlier configuration."""
+    for existing in list(logger.handlers):
+        existing_path = getattr(existing, "baseFilename", None)
+        if existing_path and Path(existing_path) in {APP_LOG_PATH, ERROR_LOG_PATH}:
+            logger.removeHandler(existing)
+            existing.close()
+
+
 def _build_console_handler(
     *,
     level: int,
@@ -110,17 +343,34 @@ def configure_logging(
     console_level: int = logging.INFO,
     console_logger_names: tuple[str, ...] = (),
 ) -> None:
-    """Configure rotating file logs and optional filtered console logging."""
+    """Configure queued rotating file logs and optional filtered console logging.
+
+    Calling it again restarts the file pipeline with the current settings.
+    """
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-    app_handler = _build_handler(APP_LOG_PATH, level=logging.INFO)
-    error_handler = _build_handler(ERROR_LOG_PATH, level=logging.WARNING)
+    json_lines = get_log_format() == "json"
+    app_handler = _build_handler(
+        APP_LOG_PATH, level=logging.INFO, json_lines=json_lines
+    )
+    error_handler = _build_handler(
+        ERROR_LOG_PATH, level=logging.WARNING, json_lines=json_lines
+    )
     allow_sql_echo = get_database_echo()
+    sampling_filter = _SamplingFilter(
+        logger_prefixes=get_log_sampled_loggers(), rate=get_log_sample_rate()
+    )
+    queue_handler = file_log_queue.start(
+        [app_handler, error_handler],
+        max_size=get_log_queue_size(),
+        block=get_log_queue_policy() == "block",
+        filters=[sampling_filter, _CorrelationIdFilter()],
+    )
 
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    _ensure_handler(root_logger, app_handler)
-    _ensure_handler(root_logger, error_handler)
+    _remove_direct_file_handlers(root_logger)
+    _ensure_handler(root_logger, queue_handler, handler_id=_FILE_QUEUE_HANDLER_ID)
 
     if console:
         console_handler = _build_console_handler(
@@ -138,8 +388,10 @@ def configure_logging(
     for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         uvicorn_logger = logging.getLogger(logger_name)
         uvicorn_logger.setLevel(logging.INFO)
-        _ensure_handler(uvicorn_logger, app_handler)
-        _ensure_handler(uvicorn_logger, error_handler)
+        _remove_direct_file_handlers(uvicorn_logger)
+        _ensure_handler(
+            uvicorn_logger, queue_handler, handler_id=_FILE_QUEUE_HANDLER_ID
+        )
 
     sqlalchemy_level = logging.INFO if allow_sql_echo else logging.WARNING
     for logger_name in (
@@ -149,3 +401,10 @@ def configure_logging(
         "sqlalchemy.pool",
     ):
         logging.getLogger(logger_name).setLevel(sqlalchemy_level)
+    # ``echo=True`` engines also write to their own stdout handler; sampling on
+    # the logger itself thins that path as well as the queued file copy.
+    echo_logger = logging.getLogger(_SQL_ECHO_LOGGER)
+    for existing in list(echo_logger.filters):
+        if isinstance(existing, _SamplingFilter):
+            echo_logger.removeFilter(existing)
+    echo_logger.addFilter(sampling_filter)
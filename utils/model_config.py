@@ -32,6 +32,8 @@ OPENROUTER_PRIVACY_ERROR_MESSAGE = (
 ZDR_MAX_RETRIES = 5
 ZDR_MAX_BACKOFF_SECONDS = 10.0
 
+DEFAULT_STORY_PIPELINE_MAX_CONCURRENCY = 4
+
 
 class ModelConfigError(RuntimeError):
     """Base error for invalid model configuration data."""
@@ -85,6 +87,14 @@ class StoryPipelineModeError(ValueError):
         super().__init__("story_pipeline.mode must be 'batch' or 'single'")
 
 
+class StoryPipelineConcurrencyError(ValueError):
+    """Raised when story_pipeline.max_concurrency is not a positive integer."""
+
+    def __init__(self) -> None:
+        """Describe the allowed story pipeline concurrency values."""
+        super().__init__("story_pipeline.max_concurrency must be a positive integer")
+
+
 def is_zdr_routing_error(exception: BaseException) -> bool:
     """Check if an exception is a ZDR/privacy routing failure.
 
@@ -199,3 +209,27 @@ def get_story_pipeline_negation_tolerance() -> bool:
 
     enabled = pipeline.get("negation_tolerance_llm", False)
     return bool(enabled)
+
+
+def get_story_pipeline_max_concurrency() -> int:
+    """Return the concurrency bound for batch story generation.
+
+    Defaults to DEFAULT_STORY_PIPELINE_MAX_CONCURRENCY when not configured.
+    """
+    data = _load_config()
+    pipeline = data.get("story_pipeline", {})
+    if pipeline is None:
+        pipeline = {}
+    if not isinstance(pipeline, dict):
+        raise StoryPipelineMappingError
+
+    raw_value = pipeline.get("max_concurrency", DEFAULT_STORY_PIPELINE_MAX_CONCURRENCY)
+    if isinstance(raw_value, bool):
+        raise StoryPipelineConcurrencyError
+    try:
+        max_concurrency = int(raw_value)
+    except (TypeError, ValueError) as exc:
+        raise StoryPipelineConcurrencyError from exc
+    if max_concurrency < 1:
+        raise StoryPipelineConcurrencyError
+    return max_concurrency
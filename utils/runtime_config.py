@@ -243,6 +243,38 @@ def get_database_echo() -> bool:
     return get_bool_env("AGILEFORGE_DB_ECHO", default=False)
 
 
+def get_log_format(default: str = "text") -> str:
+    """Return the file log format: ``text`` or ``json`` (JSON lines)."""
+    value = (get_optional_env("AGILEFORGE_LOG_FORMAT", default) or default).lower()
+    return value if value in {"text", "json"} else default
+
+
+def get_log_queue_size(default: int = 10000) -> int:
+    """Return the bounded size of the in-memory log record queue."""
+    return max(1, get_int_env("AGILEFORGE_LOG_QUEUE_SIZE", default))
+
+
+def get_log_queue_policy(default: str = "drop") -> str:
+    """Return what a full log queue does: ``drop`` the record or ``block``."""
+    value = (
+        get_optional_env("AGILEFORGE_LOG_QUEUE_POLICY", default) or default
+    ).lower()
+    return value if value in {"drop", "block"} else default
+
+
+def get_log_sample_rate(default: float = 1.0) -> float:
+    """Return the share (0-1) of sampled-logger records below WARNING to keep."""
+    value = get_optional_env("AGILEFORGE_LOG_SAMPLE_RATE")
+    rate = default if value is None else float(value)
+    return min(1.0, max(0.0, rate))
+
+
+def get_log_sampled_loggers(default: str = "sqlalchemy") -> tuple[str, ...]:
+    """Return the logger name prefixes subject to log sampling."""
+    value = get_optional_env("AGILEFORGE_LOG_SAMPLED_LOGGERS", default) or ""
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
+
 def get_spec_validator_max_tokens(default: int = 4096) -> int:
     """Return the max token budget for the spec validator."""
     return get_int_env("SPEC_VALIDATOR_MAX_TOKENS", default)
@@ -283,6 +315,46 @@ def get_default_validation_mode(default: str = "deterministic") -> str:
     return get_optional_env("SPEC_VALIDATION_DEFAULT_MODE", default) or default
 
 
+def get_generation_job_workers(default: int = 2) -> int:
+    """Return the number of in-process workers for background generate jobs."""
+    return get_int_env("AGILEFORGE_GENERATION_JOB_WORKERS", default)
+
+
+def get_failure_artifact_max_age_days(default: int = 30) -> int | None:
+    """Return the failure-artifact retention age in days (``None`` keeps all)."""
+    days = get_int_env("AGILEFORGE_FAILURE_ARTIFACT_MAX_AGE_DAYS", default)
+    return days if days > 0 else None
+
+
+def get_failure_artifact_max_bytes(default_mb: int = 256) -> int | None:
+    """Return the failure-artifact size budget in bytes (``None`` is unbounded)."""
+    megabytes = get_int_env("AGILEFORGE_FAILURE_ARTIFACT_MAX_MB", default_mb)
+    return megabytes * 1024 * 1024 if megabytes > 0 else None
+
+
+def get_packet_cache_backend(default: str = "memory") -> str:
+    """Return where built packets are cached: ``memory``, ``sqlite`` or ``off``."""
+    value = (get_optional_env("AGILEFORGE_PACKET_CACHE", default) or default).lower()
+    return value if value in {"memory", "sqlite", "off"} else default
+
+
+def get_packet_cache_size(default: int = 256) -> int:
+    """Return how many packets the in-process packet cache keeps per database."""
+    return max(1, get_int_env("AGILEFORGE_PACKET_CACHE_SIZE", default))
+
+
+def get_prewarm_agents() -> list[str] | None:
+    """Return the agent names to build during API startup.
+
+    AGILEFORGE_PREWARM_AGENTS takes comma-separated registry names or ``all``
+    (returned as ``None``). When unset, every agent is built on first use.
+    """
+    value = get_optional_env("AGILEFORGE_PREWARM_AGENTS") or ""
+    if value.lower() == "all":
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
 def get_api_host(default: str = _DEFAULT_API_HOST) -> str:
     """Return the API host for local runs.
 
@@ -0,0 +1,96 @@
+"""In-process runtime counters and latency timings for the dashboard API."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class _TimingStats:
+    count: int = 0
+    total_ms: float = 0.0
+    min_ms: float | None = None
+    max_ms: float | None = None
+    last_ms: float | None = None
+
+    def observe(self, value_ms: float) -> None:
+        self.count += 1
+        self.total_ms += value_ms
+        self.last_ms = value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": _round(self.min_ms),
+            "max_ms": _round(self.max_ms),
+            "last_ms": _round(self.last_ms),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
+
+
+def _metric_key(name: str, labels: dict[str, str] | None) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{key}={labels[key]}" for key in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+@dataclass
+class RuntimeMetrics:
+    """Thread-safe registry of named counters and timing distributions."""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _counters: dict[str, int] = field(default_factory=dict)
+    _timings: dict[str, _TimingStats] = field(default_factory=dict)
+
+    def increment(
+        self,
+        name: str,
+        amount: int = 1,
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Add ``amount`` to the named counter."""
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe_ms(
+        self,
+        name: str,
+        value_ms: float,
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Record one latency observation in milliseconds."""
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._timings.setdefault(key, _TimingStats()).observe(value_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of every counter and timing."""
+        with self._lock:
+            return {
+                "counters": dict(sorted(self._counters.items())),
+                "timings": {
+                    key: stats.snapshot()
+                    for key, stats in sorted(self._timings.items())
+                },
+            }
+
+    def reset(self) -> None:
+        """Drop all recorded values (used by tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+runtime_metrics = RuntimeMetrics()
@@ -0,0 +1,37 @@
+"""Hashes of the story fields spec validation reads.
+
+Kept free of service imports so the ``UserStory`` write listener and schema
+migrations can maintain ``user_stories.story_input_hash`` themselves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+
+def compute_story_input_hash(story: object) -> str:
+    """Compute deterministic SHA-256 hash of story content."""
+    content = json.dumps(
+        {
+            "title": getattr(story, "title", "") or "",
+            "description": getattr(story, "story_description", "") or "",
+            "acceptance_criteria": getattr(story, "acceptance_criteria", "") or "",
+        },
+        sort_keys=True,
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def evidence_input_hash(validation_evidence: str | None) -> str | None:
+    """Return the ``input_hash`` recorded in serialized validation evidence."""
+    if not validation_evidence:
+        return None
+    try:
+        payload = json.loads(validation_evidence)
+    except ValueError:
+        return None
+    value = payload.get("input_hash") if isinstance(payload, dict) else None
+    return value if isinstance(value, str) else None
@@ -0,0 +1,179 @@
+"""Bucketing helpers shared by workflow event rollup writers and readers.
+
+Rollups aggregate ``workflow_events`` into hourly and daily buckets. Exact
+percentiles cannot be maintained incrementally, so each rollup keeps a small
+histogram of durations over fixed bounds; percentiles are read back as the
+upper bound of the bucket holding the requested rank (the observed maximum
+for the overflow bucket).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+type Granularity = Literal["hour", "day"]
+
+GRANULARITIES: tuple[Granularity, ...] = ("hour", "day")
+# Rollup ``product_id`` of events without a product. SQLite treats NULLs as
+# distinct in unique keys, so the rollup key never stores NULL.
+NO_PRODUCT_ID = 0
+# Upper bounds (seconds) of the duration histogram buckets; one overflow bucket
+# follows the last bound.
+DURATION_BUCKET_BOUNDS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    30,
+    60,
+    120,
+    300,
+    600,
+    1800,
+    3600,
+    7200,
+    14400,
+    28800,
+    86400,
+)
+
+
+def bucket_start(timestamp: datetime, granularity: Granularity) -> datetime:
+    """Return the naive-UTC start of the hour or day containing ``timestamp``."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    start = timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        start = start.replace(hour=0)
+    return start
+
+
+def duration_bucket(seconds: float) -> int:
+    """Return the histogram bucket index for a duration."""
+    for index, bound in enumerate(DURATION_BUCKET_BOUNDS):
+        if seconds <= bound:
+            return index
+    return len(DURATION_BUCKET_BOUNDS)
+
+
+def duration_bucket_sql(column: str) -> str:
+    """Return a SQL ``CASE`` expression computing ``duration_bucket(column)``."""
+    whens = " ".join(
+        f"WHEN {column} <= {bound} THEN {index}"
+        for index, bound in enumerate(DURATION_BUCKET_BOUNDS)
+    )
+    return f"CASE {whens} ELSE {len(DURATION_BUCKET_BOUNDS)} END"
+
+
+def merge_histograms_sql(current: str, incoming: str) -> str:
+    """Return a SQL expression summing two stored histograms per bucket.
+
+    The result is spelled exactly as ``dump_histogram`` spells it.
+    """
+    return (
+        "(SELECT json_group_object(key, total) FROM ("  # noqa: S608
+        "SELECT key, SUM(value) AS total FROM ("
+        f"SELECT key, value FROM json_each({current}) "
+        f"UNION ALL SELECT key, value FROM json_each({incoming})"
+        ") GROUP BY key ORDER BY CAST(key AS INTEGER)))"
+    )
+
+
+def load_histogram(raw: str | None) -> dict[int, int]:
+    """Decode a stored histogram (JSON object of bucket index to count)."""
+    if not raw:
+        return {}
+    return {int(index): int(count) for index, count in json.loads(raw).items()}
+
+
+def dump_histogram(histogram: Mapping[int, int]) -> str:
+    """Encode a histogram with sorted keys so equal histograms compare equal."""
+    return json.dumps(
+        {str(index): histogram[index] for index in sorted(histogram)},
+        separators=(",", ":"),
+    )
+
+
+def merge_histograms(histograms: Iterable[Mapping[int, int]]) -> dict[int, int]:
+    """Sum bucket counts across histograms."""
+    merged: dict[int, int] = {}
+    for histogram in histograms:
+        for index, count in histogram.items():
+            merged[index] = merged.get(index, 0) + count
+    return merged
+
+
+def histogram_percentile(
+    histogram: Mapping[int, int], quantile: float, *, maximum: float | None = None
+) -> float | None:
+    """Return the bucket upper bound at ``quantile`` (0-1), or None if empty."""
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    rank = max(1, round(quantile * total))
+    seen = 0
+    for index in sorted(histogram):
+        seen += histogram[index]
+        if seen >= rank:
+            if index < len(DURATION_BUCKET_BOUNDS):
+                bound = float(DURATION_BUCKET_BOUNDS[index])
+                return min(bound, maximum) if maximum is not None else bound
+            return maximum
+    return maximum
+
+
+def _min_optional(left: float | None, right: float | None) -> float | None:
+    return right if left is None else left if right is None else min(left, right)
+
+
+def _max_optional(left: float | None, right: float | None) -> float | None:
+    return right if left is None else left if right is None else max(left, right)
+
+
+@dataclass
+class RollupTotals:
+    """Additive aggregate of the events falling into one rollup bucket."""
+
+    event_count: int = 0
+    duration_count: int = 0
+    duration_total: float = 0.0
+    duration_min: float | None = None
+    duration_max: float | None = None
+    histogram: dict[int, int] = field(default_factory=dict)
+    turn_count_total: int = 0
+    turn_count_events: int = 0
+
+    def add_event(self, duration: float | None, turn_count: int | None) -> None:
+        """Count one event with its optional duration and turn count."""
+        self.event_count += 1
+        if duration is not None:
+            self.merge(
+                RollupTotals(
+                    duration_count=1,
+                    duration_total=duration,
+                    duration_min=duration,
+                    duration_max=duration,
+                    histogram={duration_bucket(duration): 1},
+                )
+            )
+        if turn_count is not None:
+            self.turn_count_total += turn_count
+            self.turn_count_events += 1
+
+    def merge(self, other: RollupTotals) -> RollupTotals:
+        """Add ``other`` into this aggregate and return it."""
+        self.event_count += other.event_count
+        self.duration_count += other.duration_count
+        self.duration_total += other.duration_total
+        self.duration_min = _min_optional(self.duration_min, other.duration_min)
+        self.duration_max = _max_optional(self.duration_max, other.duration_max)
+        self.histogram = merge_histograms([self.histogram, other.histogram])
+        self.turn_count_total += other.turn_count_total
+        self.turn_count_events += other.turn_count_events
+        return self